@@ -0,0 +1,62 @@
+"""Add indexes for the hot query paths.
+
+Revision ID: 00b3133c2f8d
+Revises: 468e43e036a9
+Create Date: 2026-10-16 21:40:00.000000
+
+Covers the status backlog and date-range article queries (both keyset
+paginated, hence the trailing id), per-article and type-filtered entity
+lookups, analysis results by article and type, and the join from a canonical
+entity's mentions to their articles.
+
+entity_mention_contexts.entity_id needs no index of its own: it leads the
+uix_entity_article unique constraint, whose index already serves it.
+
+On PostgreSQL the indexes are built CONCURRENTLY so writes continue while they
+build. That cannot run inside a transaction, so each runs in an autocommit
+block. A failed concurrent build leaves an INVALID index behind; drop it
+before re-running this migration.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "00b3133c2f8d"
+down_revision: Union[str, None] = "468e43e036a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_articles_status_id", "articles", ["status", "id"]),
+    ("ix_articles_published_at_id", "articles", ["published_at", "id"]),
+    ("ix_entities_article_id", "entities", ["article_id"]),
+    ("ix_entities_entity_type_article_id", "entities", ["entity_type", "article_id"]),
+    (
+        "ix_analysis_results_article_id_analysis_type",
+        "analysis_results",
+        ["article_id", "analysis_type"],
+    ),
+    (
+        "ix_entity_mentions_canonical_entity_id_article_id",
+        "entity_mentions",
+        ["canonical_entity_id", "article_id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create the indexes, concurrently on PostgreSQL."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, if_not_exists=True, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Drop the indexes, concurrently on PostgreSQL."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""Add near-duplicate detection: articles.duplicate_of and fingerprint tables.
+
+Revision ID: 3c7f1e9b2d58
+Revises: 9e4b7d2c6a13
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7f1e9b2d58"
+down_revision: Union[str, None] = "9e4b7d2c6a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the duplicate_of column and the fingerprint and LSH bucket tables."""
+    op.add_column("articles", sa.Column("duplicate_of", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "fk_articles_duplicate_of_articles", "articles", "articles", ["duplicate_of"], ["id"]
+    )
+    op.create_index(op.f("ix_articles_duplicate_of"), "articles", ["duplicate_of"], unique=False)
+
+    op.create_table(
+        "article_fingerprints",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("signature", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"]),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    op.create_table(
+        "article_lsh_buckets",
+        sa.Column("bucket", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"]),
+        sa.PrimaryKeyConstraint("bucket", "article_id"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the fingerprint tables and the duplicate_of column."""
+    op.drop_table("article_lsh_buckets")
+    op.drop_table("article_fingerprints")
+    op.drop_index(op.f("ix_articles_duplicate_of"), table_name="articles")
+    op.drop_constraint("fk_articles_duplicate_of_articles", "articles", type_="foreignkey")
+    op.drop_column("articles", "duplicate_of")
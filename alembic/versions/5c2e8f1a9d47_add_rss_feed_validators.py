@@ -0,0 +1,33 @@
+"""Add conditional fetch validators to rss_feeds.
+
+Revision ID: 5c2e8f1a9d47
+Revises: 00b3133c2f8d
+Create Date: 2026-10-16 22:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8f1a9d47"
+down_revision: Union[str, None] = "00b3133c2f8d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the etag, last_modified and content_hash columns to rss_feeds."""
+    op.add_column("rss_feeds", sa.Column("etag", sa.String(), nullable=True))
+    op.add_column("rss_feeds", sa.Column("last_modified", sa.String(), nullable=True))
+    op.add_column("rss_feeds", sa.Column("content_hash", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the validator columns from rss_feeds."""
+    op.drop_column("rss_feeds", "content_hash")
+    op.drop_column("rss_feeds", "last_modified")
+    op.drop_column("rss_feeds", "etag")
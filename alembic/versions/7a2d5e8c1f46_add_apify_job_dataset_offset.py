@@ -0,0 +1,32 @@
+"""Add dataset_offset checkpoint to apify_jobs.
+
+Revision ID: 7a2d5e8c1f46
+Revises: 3c7f1e9b2d58
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2d5e8c1f46"
+down_revision: Union[str, None] = "3c7f1e9b2d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the dataset_offset column."""
+    op.add_column(
+        "apify_jobs",
+        sa.Column("dataset_offset", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the dataset_offset column."""
+    op.drop_column("apify_jobs", "dataset_offset")
@@ -0,0 +1,42 @@
+"""Add adaptive polling schedule columns to rss_feeds.
+
+Revision ID: 9e4b7d2c6a13
+Revises: 5c2e8f1a9d47
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b7d2c6a13"
+down_revision: Union[str, None] = "5c2e8f1a9d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the polling schedule columns and the next_fetch_at index."""
+    op.add_column("rss_feeds", sa.Column("publish_interval_seconds", sa.Float(), nullable=True))
+    op.add_column(
+        "rss_feeds",
+        sa.Column("not_modified_rate", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.add_column("rss_feeds", sa.Column("fetch_interval_seconds", sa.Float(), nullable=True))
+    op.add_column("rss_feeds", sa.Column("next_fetch_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        op.f("ix_rss_feeds_next_fetch_at"), "rss_feeds", ["next_fetch_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove the polling schedule columns."""
+    op.drop_index(op.f("ix_rss_feeds_next_fetch_at"), table_name="rss_feeds")
+    op.drop_column("rss_feeds", "next_fetch_at")
+    op.drop_column("rss_feeds", "fetch_interval_seconds")
+    op.drop_column("rss_feeds", "not_modified_rate")
+    op.drop_column("rss_feeds", "publish_interval_seconds")
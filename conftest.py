@@ -26,6 +26,7 @@ from local_newsifier.models.base import TableBase
 from local_newsifier.models.article import Article
 from local_newsifier.models.entity import Entity
 from local_newsifier.models.analysis_result import AnalysisResult
+from local_newsifier.models.article_fingerprint import ArticleFingerprint, ArticleLSHBucket
 
 # Entity tracking models
 from local_newsifier.models.entity_tracking import (
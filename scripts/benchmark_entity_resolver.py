@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmark canonical entity matching: linear scan versus CanonicalEntityIndex.
+
+Usage:
+    poetry run python scripts/benchmark_entity_resolver.py
+    poetry run python scripts/benchmark_entity_resolver.py --sizes 10000 100000 1000000
+
+For each corpus size this builds a synthetic set of canonical entities, then
+resolves a mix of exact, normalized, misspelled and unknown mentions with both
+``EntityResolver.find_matching_entity`` over a list (the linear scan) and over
+a ``CanonicalEntityIndex``. The linear scan is slow at large sizes, so it is
+timed on fewer mentions and reported per mention.
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from local_newsifier.tools.resolution.entity_resolver import EntityResolver  # noqa: E402
+
+ENTITY_TYPES = ["PERSON", "ORG", "GPE"]
+
+
+def random_word(rng: random.Random) -> str:
+    """Generate a capitalised pseudo-word."""
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))).title()
+
+
+def build_entities(size: int, rng: random.Random) -> List[Dict]:
+    """Generate canonical entities with two- or three-word names."""
+    return [
+        {
+            "name": " ".join(random_word(rng) for _ in range(rng.randint(2, 3))),
+            "entity_type": rng.choice(ENTITY_TYPES),
+            "id": i,
+        }
+        for i in range(size)
+    ]
+
+
+def build_mentions(entities: List[Dict], count: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """Generate mentions: exact, titled, one-character typos and unknown names."""
+    mentions = []
+    for _ in range(count):
+        entity = rng.choice(entities)
+        name, entity_type = entity["name"], entity["entity_type"]
+        kind = rng.randrange(4)
+        if kind == 0:
+            mentions.append((name.lower(), entity_type))
+        elif kind == 1:
+            mentions.append((f"Mayor {name}", entity_type))
+        elif kind == 2:
+            pos = rng.randrange(len(name))
+            typo = name[:pos] + rng.choice(string.ascii_lowercase) + name[pos + 1 :]
+            mentions.append((typo, entity_type))
+        else:
+            mentions.append((f"{random_word(rng)} {random_word(rng)}", entity_type))
+    return mentions
+
+
+def time_per_mention(resolver: EntityResolver, mentions, existing) -> float:
+    """Time find_matching_entity per mention in milliseconds."""
+    start = time.perf_counter()
+    for text, entity_type in mentions:
+        resolver.find_matching_entity(text, entity_type, existing)
+    return (time.perf_counter() - start) * 1000 / len(mentions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--mentions", type=int, default=1000, help="Mentions timed on the index")
+    parser.add_argument(
+        "--linear-budget",
+        type=int,
+        default=2_000_000,
+        help="Approximate mentions x entities the linear scan may run per size",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    resolver = EntityResolver()
+    print(f"{'entities':>10} {'build s':>9} {'index ms':>10} {'linear ms':>11} {'speedup':>9}")
+
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        entities = build_entities(size, rng)
+        mentions = build_mentions(entities, args.mentions, rng)
+
+        start = time.perf_counter()
+        index = resolver.build_index(entities)
+        build_seconds = time.perf_counter() - start
+
+        index_ms = time_per_mention(resolver, mentions, index)
+
+        linear_count = max(1, min(len(mentions), args.linear_budget // size))
+        linear_ms = time_per_mention(resolver, mentions[:linear_count], entities)
+
+        print(
+            f"{size:>10,} {build_seconds:>9.2f} {index_ms:>10.3f} "
+            f"{linear_ms:>11.3f} {linear_ms / index_ms:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
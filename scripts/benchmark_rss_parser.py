@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Benchmark RSS parsing: whole-tree parsing versus the streaming parser.
+
+Usage:
+    poetry run python scripts/benchmark_rss_parser.py
+    poetry run python scripts/benchmark_rss_parser.py --sizes 1000 10000 --new 50
+
+For each feed size this builds a synthetic RSS feed, then parses it three
+ways and reports items parsed per second: the previous approach (the whole
+document through ``ElementTree.fromstring`` with every date through
+dateutil), ``RSSParser.iter_items`` over the whole feed, and ``iter_items``
+stopping at the first already seen item when only the newest few are new.
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from xml.etree import ElementTree
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dateutil import parser as date_parser  # noqa: E402
+
+from local_newsifier.tools.rss_parser import RSSItem, RSSParser  # noqa: E402
+
+
+def build_feed(size: int) -> bytes:
+    """Generate an RSS feed of the given size, newest item first."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    items = "".join(
+        f"<item><title>Article {i}</title><link>https://example.com/{i}</link>"
+        f"<guid>guid-{i}</guid><description>{'Body text. ' * 20}</description>"
+        f"<pubDate>{format_datetime(start - timedelta(minutes=i))}</pubDate></item>"
+        for i in range(size)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def parse_tree(content: bytes) -> list:
+    """Parse a feed the previous way: whole tree, dateutil for every date."""
+    items = []
+    for entry in ElementTree.fromstring(content).findall(".//item"):
+        items.append(
+            RSSItem(
+                title=entry.findtext("title"),
+                url=entry.findtext("link"),
+                published=date_parser.parse(entry.findtext("pubDate")),
+                description=entry.findtext("description"),
+            )
+        )
+    return items
+
+
+def items_per_second(parse, content: bytes, repeat: int) -> float:
+    """Time a parse function, returning items parsed per second."""
+    count = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        count += len(parse(content))
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10_000])
+    parser.add_argument("--new", type=int, default=20, help="Items new since the last fetch")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rss_parser = RSSParser()
+    print(f"{'items':>8} {'tree/s':>10} {'stream/s':>10} {'early stop ms':>14} {'tree ms':>9}")
+
+    for size in args.sizes:
+        content = build_feed(size)
+        seen = {f"guid-{i}" for i in range(args.new, size)}
+
+        tree_rate = items_per_second(parse_tree, content, args.repeat)
+        stream_rate = items_per_second(
+            lambda c: list(rss_parser.iter_items("benchmark", c)), content, args.repeat
+        )
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            list(rss_parser.iter_items("benchmark", content, seen=seen))
+        early_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        print(
+            f"{size:>8,} {tree_rate:>10,.0f} {stream_rate:>10,.0f} "
+            f"{early_ms:>14.2f} {size / tree_rate * 1000:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -145,11 +145,12 @@ def get_feed_processing_log_crud():
 
 
 def get_nlp_model():
-    """Provide the spaCy NLP model."""
+    """Provide the shared spaCy NLP model from the model registry."""
     try:
-        import spacy
+        from local_newsifier.config.settings import settings
+        from local_newsifier.tools.nlp_models import load_model
 
-        return spacy.load("en_core_web_lg")
+        return load_model(settings.NER_MODEL)
     except (ImportError, OSError) as e:
         import logging
 
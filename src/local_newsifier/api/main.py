@@ -14,7 +14,8 @@ import local_newsifier.models  # noqa: F401
 from local_newsifier.api.dependencies import get_templates
 from local_newsifier.api.routers import auth, system, tasks, webhooks
 from local_newsifier.config.settings import get_settings, settings
-from local_newsifier.database.engine import get_engine
+from local_newsifier.database.engine import dispose_engines, get_engine
+from local_newsifier.tools.nlp_models import preload_models
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +49,9 @@ def startup_event():
         else:
             logger.warning("Database connection could not be established")
 
+        # Load spaCy models once so requests share them
+        preload_models(settings.NLP_PRELOAD_MODELS)
+
         logger.info("Application startup complete")
     except Exception as e:
         logger.error(f"Startup error: {str(e)}")
@@ -57,6 +61,11 @@ def startup_event():
 def shutdown_event():
     """Handle application shutdown."""
     logger.info("Application shutdown initiated")
+    try:
+        # Close pooled database connections
+        dispose_engines()
+    except Exception as e:
+        logger.error(f"Shutdown error: {str(e)}")
     logger.info("Application shutdown complete")
 
 
@@ -5,6 +5,9 @@ This module provides a clean, simple webhook handler that:
 1. Accepts webhooks
 2. Returns proper HTTP status codes
 3. Lets Apify handle retries naturally
+
+Datasets are imported by a Celery task, so the handler only stores the
+webhook and queues the import before acknowledging it.
 """
 
 import logging
@@ -50,7 +53,7 @@ def apify_webhook(
     - Accept webhook
     - Validate signature (if configured)
     - Store webhook data
-    - Process if successful
+    - Queue the dataset import if successful
     - Return 202 Accepted
 
     If there's an error, return proper HTTP error code to trigger
@@ -72,11 +75,7 @@ def apify_webhook(
 
     raw_payload = json.dumps(payload, separators=(",", ":"), sort_keys=True)
 
-    # EMERGENCY LOGGING: Log full payload structure for debugging
-    # TODO: Make this configurable via environment variable once webhook is stable
-    logger.info("=== WEBHOOK RECEIVED ===")
-    logger.info(f"Payload keys: {list(payload.keys())}")
-    logger.info(f"Full payload: {json.dumps(payload, indent=2)}")
+    logger.debug(f"Webhook payload keys: {list(payload.keys())}")
 
     # Extract key fields for logging
     event_data = payload.get("eventData", {})
@@ -103,7 +102,7 @@ def apify_webhook(
         # Log unexpected errors but still accept the webhook
         # This allows for retries and prevents webhook queue blocking
         logger.error(f"Unexpected error handling webhook: {e}")
-        logger.error(f"Error occurred with payload: {json.dumps(payload, indent=2)}")
+        logger.debug(f"Error occurred with payload: {raw_payload}")
         # Extract IDs from payload (support both formats)
         resource = payload.get("resource", {})
         if resource:
@@ -139,7 +138,8 @@ def apify_webhook(
         "articles_created": result.get("articles_created", 0),
         "actor_id": result.get("actor_id"),
         "dataset_id": result.get("dataset_id"),
-        "processing_status": "completed" if result["status"] == "ok" else "error",
+        "job_id": result.get("job_id"),
+        "processing_status": "queued" if result.get("import_queued") else "completed",
         "message": result.get("message", "Webhook processed"),
     }
 
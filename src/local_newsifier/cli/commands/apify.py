@@ -20,6 +20,7 @@ from tabulate import tabulate
 from local_newsifier.config.settings import settings
 from local_newsifier.crud.apify_source_config import apify_source_config as config_crud
 from local_newsifier.di.providers import get_apify_service_cli, get_session
+from local_newsifier.services.apify_dataset_importer import ApifyDatasetImporter
 from local_newsifier.services.apify_schedule_manager import ApifyScheduleManager
 from local_newsifier.services.apify_service import ApifyService
 
@@ -662,7 +663,17 @@ def list_schedules(token: str, with_apify: bool, format_type: str):
 
 @schedules_group.command(name="sync")
 @click.option("--token", help="Apify API token (overrides environment/settings)")
-def sync_schedules(token: str):
+@click.option(
+    "--concurrent",
+    is_flag=True,
+    help="List Apify schedules once and apply changes in parallel",
+)
+@click.option(
+    "--workers",
+    type=int,
+    help="Apify requests at once with --concurrent (default from settings)",
+)
+def sync_schedules(token: str, concurrent: bool, workers: Optional[int]):
     """Synchronize database configs with Apify schedules."""
     if token:
         settings.APIFY_TOKEN = token
@@ -675,7 +686,10 @@ def sync_schedules(token: str):
 
         # Run sync operation
         click.echo("Synchronizing schedules with Apify...")
-        results = schedule_manager.sync_schedules()
+        if concurrent:
+            results = schedule_manager.sync_schedules_concurrently(max_workers=workers)
+        else:
+            results = schedule_manager.sync_schedules()
 
         # Display results
         click.echo(click.style("✓ Schedules synchronized successfully!", fg="green"))
@@ -829,8 +843,27 @@ def schedule_status(config_id: int, token: str):
 )
 @click.option("--source-name", default="apify", help="Override source name (default: 'apify')")
 @click.option("--force", is_flag=True, help="Process even if articles exist")
+@click.option("--restart", is_flag=True, help="Fetch and stage the dataset again from the start")
+@click.option(
+    "--retransform",
+    is_flag=True,
+    help="Transform items skipped earlier again, e.g. after a mapping fix, without refetching",
+)
+@click.option(
+    "--page-size", type=int, help="Items fetched per request (default: APIFY_DATASET_PAGE_SIZE)"
+)
 @click.option("--token", help="Apify API token (overrides environment/settings)")
-def process_dataset(dataset_id, dry_run, min_content_length, source_name, force, token):
+def process_dataset(
+    dataset_id,
+    dry_run,
+    min_content_length,
+    source_name,
+    force,
+    restart,
+    retransform,
+    page_size,
+    token,
+):
     """Process an Apify dataset and create articles from it.
 
     This command processes any dataset ID into articles, with options to:
@@ -839,6 +872,10 @@ def process_dataset(dataset_id, dry_run, min_content_length, source_name, force,
     - Override source name
     - Force processing even if articles exist
 
+    Raw items are staged into the database a page at a time, then transformed
+    into articles in chunks. An interrupted import resumes where it stopped
+    unless --restart is given, and a staged dataset is not fetched again.
+
     DATASET_ID is the ID of the dataset to process.
 
     Examples:
@@ -856,197 +893,100 @@ def process_dataset(dataset_id, dry_run, min_content_length, source_name, force,
         apify_service = get_injected_obj(lambda: get_apify_service_cli(token))
         session = get_session()
 
-        # Fetch dataset items
-        click.echo(f"Fetching dataset {dataset_id}...")
-        dataset_items = apify_service.client.dataset(dataset_id).list_items().items
-        click.echo(f"Dataset contains {len(dataset_items)} items")
-
-        articles_to_create = []
-        skipped_reasons = {"no_url": 0, "no_title": 0, "short_content": 0, "duplicate": 0}
-
-        # Import article CRUD
-        from datetime import UTC, datetime
-
-        from local_newsifier.crud.article import article as article_crud
-        from local_newsifier.models.article import Article
-
-        # Process each item
-        for idx, item in enumerate(dataset_items):
-            # Log available fields for first few items
-            if idx < 3:
-                click.echo(f"\nItem {idx} fields: {list(item.keys())}")
-
-            # Extract URL - required field
-            url = item.get("url", "")
-            if not url:
-                skipped_reasons["no_url"] += 1
-                continue
-
-            # Extract title - required field
-            title = item.get("title", "")
-            if not title:
-                skipped_reasons["no_title"] += 1
-                continue
-
-            # Extract content with improved field mapping
-            content = (
-                item.get("text", "")  # Primary field from most actors
-                or item.get("markdown", "")  # Alternative format
-                or item.get("content", "")  # Legacy/custom actors
-                or item.get("body", "")  # Fallback
-            )
+        importer = ApifyDatasetImporter(
+            session,
+            apify_service,
+            page_size=page_size,
+            min_content_length=min_content_length,
+            source_name=source_name,
+            require_title=True,
+            force=force,
+        )
+        if restart and not dry_run:
+            job = importer.new_job(dataset_id)
+        else:
+            job = importer.get_job(dataset_id, create=not dry_run)
 
-            # Check metadata for additional content
-            metadata = item.get("metadata", {})
-            if not content and metadata:
-                content = metadata.get("description", "")
-
-            # Which field was used?
-            content_source = None
-            if item.get("text"):
-                content_source = "text"
-            elif item.get("markdown"):
-                content_source = "markdown"
-            elif item.get("content"):
-                content_source = "content"
-            elif item.get("body"):
-                content_source = "body"
-            elif metadata and metadata.get("description"):
-                content_source = "metadata.description"
-
-            # Skip if content too short
-            if len(content) < min_content_length:
-                if idx < 3:
-                    msg = f"Item {idx} content too short: {len(content)} chars"
-                    if content_source:
-                        msg += f" (from {content_source})"
-                    click.echo(msg)
-                skipped_reasons["short_content"] += 1
-                continue
-
-            # Check if article already exists (unless force flag is set)
-            if not force and article_crud.get_by_url(session, url=url):
-                skipped_reasons["duplicate"] += 1
-                continue
-
-            # Extract metadata fields if available
-            published_at = datetime.now(UTC).replace(tzinfo=None)
-
-            # Try to parse published date from metadata
-            if metadata and metadata.get("publishedAt"):
-                try:
-                    # Handle various date formats
-                    pub_str = metadata["publishedAt"]
-                    if isinstance(pub_str, str):
-                        published_at = datetime.fromisoformat(
-                            pub_str.replace("Z", "+00:00")
-                        ).replace(tzinfo=None)
-                except Exception:
-                    pass  # Use default if parsing fails
-
-            # Create article object
-            article = {
-                "url": url,
-                "title": title,
-                "content": content,
-                "source": item.get("source", source_name),
-                "published_at": published_at,
-                "scraped_at": datetime.now(UTC).replace(tzinfo=None),
-                "content_length": len(content),
-                "content_source": content_source,
-            }
-
-            articles_to_create.append(article)
-
-            if idx < 3:
-                msg = f"Item {idx} would create article: {title[:50]}..."
-                msg += f" ({len(content)} chars"
-                if content_source:
-                    msg += f" from {content_source}"
-                msg += ")"
-                click.echo(msg)
+        if retransform and not dry_run:
+            if job.item_count is None:
+                click.echo(
+                    click.style(
+                        "Dataset is not fully staged yet; run without --retransform", fg="red"
+                    ),
+                    err=True,
+                )
+                return
+            click.echo(f"Transforming {importer.reset_skipped(job)} skipped items again")
+        elif job is not None and job.item_count is not None:
+            click.echo(f"Dataset {dataset_id} already staged; transforming remaining items")
+        elif job is not None and job.dataset_offset:
+            click.echo(f"Resuming dataset {dataset_id} at item {job.dataset_offset}")
+
+        click.echo(f"Processing dataset {dataset_id}...")
+        stats = importer.import_dataset(dataset_id, job=job, dry_run=dry_run)
+        skipped_reasons = stats["skipped"]
 
         # Display summary
         click.echo(click.style("\n=== Processing Summary ===", fg="cyan", bold=True))
-        click.echo(f"Total items: {len(dataset_items)}")
-        click.echo(f"Articles to create: {len(articles_to_create)}")
+        click.echo(f"Items {'read' if dry_run else 'staged'}: {stats['items']}")
+        if dry_run:
+            click.echo(f"Articles to create: {stats['created']}")
+        else:
+            click.echo(f"Articles created: {stats['created']}")
         click.echo(f"Skipped: {sum(skipped_reasons.values())}")
         click.echo(f"  - No URL: {skipped_reasons['no_url']}")
         click.echo(f"  - No title: {skipped_reasons['no_title']}")
         click.echo(f"  - Content too short: {skipped_reasons['short_content']}")
         click.echo(f"  - Duplicate: {skipped_reasons['duplicate']}")
+        click.echo(f"  - Failed: {skipped_reasons['error']}")
+        if stats["near_duplicates"]:
+            click.echo(f"{stats['near_duplicates']} marked as near-duplicates of other articles")
 
-        if dry_run:
+        if stats["error"]:
+            click.echo(
+                click.style(
+                    f"Stopped at item {stats['offset']}: {stats['error']}. "
+                    "Run again to resume.",
+                    fg="red",
+                ),
+                err=True,
+            )
+        elif dry_run:
             click.echo(
                 click.style("\n=== DRY RUN MODE - No articles created ===", fg="yellow", bold=True)
             )
 
             # Show first few articles that would be created
-            if articles_to_create:
+            if stats["preview"]:
                 click.echo("\nSample articles that would be created:")
                 table_data = []
-                for i, article in enumerate(articles_to_create[:5]):
+                for i, article in enumerate(stats["preview"]):
                     table_data.append(
                         [
                             i + 1,
                             (
-                                article["title"][:40] + "..."
-                                if article["title"] and len(article["title"]) > 40
-                                else article["title"] or "(No title)"
-                            ),
-                            article["content_length"],
-                            article["content_source"],
-                            (
-                                article["url"][:50] + "..."
-                                if len(article["url"]) > 50
-                                else article["url"]
+                                article.title[:40] + "..."
+                                if article.title and len(article.title) > 40
+                                else article.title or "(No title)"
                             ),
+                            len(article.content),
+                            article.url[:50] + "..." if len(article.url) > 50 else article.url,
                         ]
                     )
 
-                headers = ["#", "Title", "Content Len", "Source Field", "URL"]
+                headers = ["#", "Title", "Content Len", "URL"]
                 click.echo(tabulate(table_data, headers=headers, tablefmt="simple"))
 
-                if len(articles_to_create) > 5:
-                    click.echo(f"\n...and {len(articles_to_create) - 5} more articles")
-        else:
-            # Create articles
-            if articles_to_create:
-                click.echo(f"\nCreating {len(articles_to_create)} articles...")
-
-                created_count = 0
-                for article_data in articles_to_create:
-                    try:
-                        # Remove our tracking fields before creating
-                        article_data.pop("content_length", None)
-                        article_data.pop("content_source", None)
-
-                        # Create article
-                        new_article = Article(
-                            url=article_data["url"],
-                            title=article_data["title"],
-                            content=article_data["content"],
-                            source=article_data["source"],
-                            published_at=article_data["published_at"],
-                            status="published",
-                            scraped_at=article_data["scraped_at"],
-                        )
-                        session.add(new_article)
-                        created_count += 1
-
-                    except Exception as e:
-                        click.echo(f"Error creating article: {str(e)}", err=True)
-
-                # Commit all articles
-                if created_count > 0:
-                    session.commit()
+                if stats["created"] > len(stats["preview"]):
                     click.echo(
-                        click.style(f"✓ Successfully created {created_count} articles!", fg="green")
+                        f"\n...and {stats['created'] - len(stats['preview'])} more articles"
                     )
-                else:
-                    click.echo("No articles were created.")
-            else:
-                click.echo("\nNo articles to create based on the dataset and filters.")
+        elif stats["created"]:
+            click.echo(
+                click.style(f"✓ Successfully created {stats['created']} articles!", fg="green")
+            )
+        else:
+            click.echo("\nNo articles to create based on the dataset and filters.")
 
     except Exception as e:
         click.echo(click.style(f"Error processing dataset: {str(e)}", fg="red"), err=True)
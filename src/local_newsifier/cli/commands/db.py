@@ -504,6 +504,7 @@ def purge_duplicates(dry_run: bool, json_output: bool):
     # Process each set of duplicates
     results = []
     total_removed = 0
+    removed_ids = []
 
     for url, count in duplicate_urls:
         duplicates = session.exec(
@@ -522,16 +523,11 @@ def purge_duplicates(dry_run: bool, json_output: bool):
         }
         results.append(result)
         total_removed += len(to_remove)
+        removed_ids.extend(result["removed_ids"])
 
-        # Remove duplicates if not a dry run
-        if not dry_run:
-            for article in to_remove:
-                # Use article_crud to remove articles
-                article_crud.remove(session, id=article.id)
-
-    # Commit changes if not a dry run
+    # Remove all duplicates in one transaction if not a dry run
     if not dry_run:
-        session.commit()
+        article_crud.remove_many(session, ids=removed_ids)
         action_text = "Removed"
     else:
         action_text = "Would remove"
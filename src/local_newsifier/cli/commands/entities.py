@@ -0,0 +1,79 @@
+"""
+Entity tracking commands.
+
+This module provides commands for entity processing, including:
+- Reprocessing a backlog of articles with batched NLP
+"""
+
+import json
+
+import click
+
+from local_newsifier.di.providers import get_entity_service
+from local_newsifier.models.state import EntityBatchTrackingState, TrackingStatus
+
+
+@click.group(name="entities")
+def entities_group():
+    """Process and track entities in articles."""
+    pass
+
+
+@entities_group.command(name="process-backlog")
+@click.option(
+    "--status",
+    "status_filter",
+    default="analyzed",
+    help="Process articles with this status (default: analyzed)",
+)
+@click.option(
+    "--batch-size", type=int, default=50, help="Number of articles spaCy parses per batch"
+)
+@click.option(
+    "--n-process",
+    type=int,
+    default=1,
+    help="Number of spaCy worker processes (-1 uses every core)",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+def process_backlog(status_filter, batch_size, n_process, json_output):
+    """Extract and track entities for every article with the given status.
+
+    Articles are parsed with spaCy's batched nlp.pipe, optionally across
+    several processes, which is much faster than processing one at a time.
+    """
+    if batch_size < 1:
+        click.echo(click.style("Error: --batch-size must be at least 1", fg="red"), err=True)
+        return
+
+    entity_service = get_entity_service()
+    state = EntityBatchTrackingState(
+        status_filter=status_filter, batch_size=batch_size, n_process=n_process
+    )
+
+    if not json_output:
+        click.echo(
+            f"Processing articles with status '{status_filter}' "
+            f"(batch size {batch_size}, {n_process} process(es))..."
+        )
+
+    result = entity_service.process_articles_batch(state)
+
+    if json_output:
+        output = {
+            "status": result.status.value,
+            "total_articles": result.total_articles,
+            "processed_count": result.processed_count,
+            "error_count": result.error_count,
+        }
+        click.echo(json.dumps(output, indent=2))
+        return
+
+    if result.status == TrackingStatus.SUCCESS:
+        click.echo(click.style("Backlog processing completed!", fg="green"))
+    else:
+        click.echo(click.style("Backlog processing failed.", fg="red"), err=True)
+
+    click.echo(f"Articles found: {result.total_articles}")
+    click.echo(f"Articles processed: {result.processed_count}")
+    click.echo(f"Errors: {result.error_count}")
@@ -293,12 +293,15 @@ def update_feed(id, name, description, active):
     default=True,
     help="Process only active feeds (default: True)",
 )
+@click.option("--concurrency", type=int, help="Maximum number of feeds fetched at once")
+@click.option("--per-host", type=int, help="Maximum number of feeds fetched at once from one host")
 @handle_rss_cli_errors
-def fetch_feeds(no_process, active_only):
+def fetch_feeds(no_process, active_only, concurrency, per_host):
     """Fetch articles from all active feeds.
 
     This command fetches articles from all active RSS feeds.
     It's useful for bulk processing multiple feeds at once.
+    Feeds are downloaded concurrently and stored as each download completes.
     """
     rss_feed_service = get_rss_feed_service()
 
@@ -318,19 +321,28 @@ def fetch_feeds(no_process, active_only):
     successful = 0
     failed = 0
 
-    # Process each feed
+    # Process each feed as its fetch completes
+    results = rss_feed_service.process_feeds(
+        [feed["id"] for feed in feeds],
+        task_queue_func=task_func,
+        max_workers=concurrency,
+        per_host_limit=per_host,
+    )
     with click.progressbar(
-        feeds, label="Processing feeds", item_show_func=lambda f: f["name"] if f else ""
-    ) as feed_list:
-        for feed in feed_list:
-            try:
-                result = rss_feed_service.process_feed(feed["id"], task_queue_func=task_func)
-                if result["status"] == "success":
-                    successful += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                click.echo(f"\nError processing feed '{feed['name']}': {str(e)}", err=True)
+        results,
+        length=len(feeds),
+        label="Processing feeds",
+        item_show_func=lambda r: r.get("feed_name", "") if r else "",
+    ) as result_list:
+        for result in result_list:
+            if result["status"] == "success":
+                successful += 1
+            else:
+                click.echo(
+                    f"\nError processing feed {result.get('feed_id')}: "
+                    f"{result.get('message', 'unknown error')}",
+                    err=True,
+                )
                 failed += 1
 
     # Show summary
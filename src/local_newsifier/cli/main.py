@@ -53,10 +53,12 @@ else:
     from local_newsifier.cli.commands.apify import apify_group
     from local_newsifier.cli.commands.apify_config import apify_config_group
     from local_newsifier.cli.commands.db import db_group
+    from local_newsifier.cli.commands.entities import entities_group
     from local_newsifier.cli.commands.feeds import feeds_group
 
     cli.add_command(feeds_group)
     cli.add_command(db_group)
+    cli.add_command(entities_group)
     cli.add_command(apify_group)
     cli.add_command(apify_config_group)
 
@@ -65,11 +65,10 @@ class Settings(BaseSettings):
 
     # Celery Beat settings
     CELERY_BEAT_SCHEDULE: dict = {
-        "fetch_rss_feeds_hourly": {
-            "task": "local_newsifier.tasks.fetch_rss_feeds",
-            "schedule": 3600.0,  # Every hour
-            "args": (None,),
-            "options": {"expires": 3500},
+        "fetch_due_rss_feeds": {
+            "task": "local_newsifier.tasks.fetch_due_rss_feeds",
+            "schedule": 60.0,  # Every minute; each feed is polled on its own schedule
+            "options": {"expires": 55},
         },
         "analyze_entity_trends_daily": {
             "task": "local_newsifier.tasks.analyze_entity_trends",
@@ -88,16 +87,65 @@ class Settings(BaseSettings):
             "https://www.theguardian.com/us/rss",
         ]
     )
+    # Concurrent feed fetching limits, overall and per publisher host
+    RSS_FETCH_MAX_WORKERS: int = 10
+    RSS_FETCH_PER_HOST_LIMIT: int = 2
+    # Per-feed subtasks of fetch_rss_feeds: time limit and retries with
+    # exponential backoff, in seconds
+    RSS_FEED_TASK_TIME_LIMIT: int = 5 * 60
+    RSS_FEED_TASK_MAX_RETRIES: int = 3
+    RSS_FEED_TASK_RETRY_DELAY: int = 30
+    # Store of processed feed item URLs: "sqlite", "bloom" or "memory"; URLs
+    # are forgotten after the TTL, and the bloom filter trades a small
+    # false-positive rate (new items skipped) for a few bytes per URL
+    RSS_SEEN_URL_STORE: str = "sqlite"
+    RSS_SEEN_URL_TTL_DAYS: Optional[float] = 90
+    RSS_SEEN_URL_BLOOM_CAPACITY: int = 1_000_000
+    RSS_SEEN_URL_BLOOM_FALSE_POSITIVE_RATE: float = 0.001
+    # Adaptive polling of registered feeds, in seconds: feeds are polled about
+    # twice per observed publish interval, within the min and max
+    RSS_POLL_MIN_INTERVAL: int = 5 * 60
+    RSS_POLL_MAX_INTERVAL: int = 24 * 3600
+    RSS_POLL_DEFAULT_INTERVAL: int = 3600
+    RSS_POLL_BATCH_SIZE: int = 100
 
     # Scraping settings
     USER_AGENT: str = "Local-Newsifier/1.0"
     REQUEST_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 5
+    # Concurrent article scraping (WebScraperTool.scrape_many) limits
+    SCRAPE_MAX_CONCURRENCY: int = 50
+    SCRAPE_PER_DOMAIN_LIMIT: int = 4
+    # Selenium fallback: process-wide pool of headless Chrome drivers, each
+    # recycled after a number of pages, and how long (seconds) to remember
+    # whether a domain needed JavaScript rendering
+    SELENIUM_POOL_SIZE: int = 2
+    SELENIUM_MAX_PAGES_PER_DRIVER: int = 50
+    SELENIUM_ACQUIRE_TIMEOUT: float = 60.0
+    SELENIUM_RENDER_TIMEOUT: float = 10.0
+    SELENIUM_RENDERING_MEMORY_TTL: Optional[float] = 24 * 3600
+    # Optional on-disk cache of article and feed responses in CACHE_DIR, kept
+    # for HTTP_CACHE_TTL seconds unless Cache-Control says otherwise; offline
+    # mode serves stored responses however old they are
+    HTTP_CACHE_ENABLED: bool = False
+    HTTP_CACHE_TTL: float = 7 * 24 * 3600
+    HTTP_CACHE_OFFLINE: bool = False
+    # Near-duplicate detection at ingestion: articles whose text is at least
+    # this similar (estimated Jaccard over word shingles) to an earlier one
+    # are marked duplicate_of it; shorter articles are not checked
+    NEAR_DUPLICATE_DETECTION: bool = True
+    NEAR_DUPLICATE_THRESHOLD: float = 0.8
+    NEAR_DUPLICATE_MIN_WORDS: int = 50
 
     # NER analysis settings
     NER_MODEL: str = "en_core_web_lg"
+    # spaCy models loaded and warmed at API startup and Celery worker init
+    NLP_PRELOAD_MODELS: List[str] = Field(default_factory=lambda: ["en_core_web_lg"])
     ENTITY_TYPES: List[str] = Field(default_factory=lambda: ["PERSON", "ORG", "GPE"])
+    # Cross-article canonical entity cache; the Redis tier is optional
+    CANONICAL_ENTITY_CACHE_SIZE: int = 10000
+    CANONICAL_ENTITY_CACHE_REDIS_URL: Optional[str] = None
 
     # Authentication settings
     SECRET_KEY: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -109,6 +157,22 @@ class Settings(BaseSettings):
     APIFY_WEBHOOK_SECRET: Optional[str] = Field(
         default=None, description="Secret for validating Apify webhook requests"
     )
+    # Dataset imports: items read per request, each page staged and committed
+    # with the job's offset checkpoint; staged items transformed into articles
+    # per transaction; and transform tasks run in parallel per dataset
+    APIFY_DATASET_PAGE_SIZE: int = 1000
+    APIFY_TRANSFORM_CHUNK_SIZE: int = 500
+    APIFY_TRANSFORM_TASKS: int = 2
+    # Retries with exponential backoff, in seconds, of the dataset import
+    # task queued by the Apify webhook
+    APIFY_IMPORT_TASK_MAX_RETRIES: int = 3
+    APIFY_IMPORT_TASK_RETRY_DELAY: int = 60
+    # Concurrent schedule sync (nf apify schedules sync --concurrent): Apify
+    # requests at once, and retries with exponential backoff, in seconds, of
+    # rate-limited requests
+    APIFY_SCHEDULE_SYNC_WORKERS: int = 8
+    APIFY_SCHEDULE_SYNC_MAX_RETRIES: int = 5
+    APIFY_SCHEDULE_SYNC_RETRY_DELAY: float = 1.0
 
     def validate_apify_token(self, skip_validation_in_test=False) -> str:
         """Validate that APIFY_TOKEN is set and return it.
@@ -4,8 +4,10 @@
 # These are intentionally unused in this module
 # flake8: noqa F401
 from .analysis_result import analysis_result
+from .apify_dataset_item import apify_dataset_item
 from .apify_source_config import apify_source_config
 from .article import article
+from .article_fingerprint import article_fingerprint
 from .canonical_entity import canonical_entity
 from .entity import entity
 from .entity_mention_context import entity_mention_context
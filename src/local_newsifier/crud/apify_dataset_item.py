@@ -0,0 +1,105 @@
+"""CRUD operations for staged Apify dataset items."""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from local_newsifier.crud.base import CRUDBase
+from local_newsifier.models.apify import ApifyDatasetItem
+
+
+class CRUDApifyDatasetItem(CRUDBase[ApifyDatasetItem]):
+    """CRUD operations for raw dataset items staged before becoming articles."""
+
+    def stage(
+        self, db: Session, *, job_id: int, items: List[Dict[str, Any]], offset: int
+    ) -> int:
+        """Add a page of raw dataset items with multi-row INSERTs, without committing.
+
+        Items are identified by their index in the dataset.
+
+        Args:
+            db: Database session
+            job_id: ID of the job importing the dataset
+            items: Raw dataset items
+            offset: Dataset index of the first item
+
+        Returns:
+            Number of items staged
+        """
+        self.create_many(
+            db,
+            objs_in=[
+                {"job_id": job_id, "apify_id": str(offset + i), "raw_data": item}
+                for i, item in enumerate(items)
+            ],
+            return_ids=False,
+            commit=False,
+        )
+        return len(items)
+
+    def claim_untransformed(
+        self, db: Session, *, job_id: int, limit: int = 500, ids: Optional[List[int]] = None
+    ) -> List[ApifyDatasetItem]:
+        """Lock a chunk of a job's items that have not been transformed yet.
+
+        The rows stay locked until the caller commits, and rows locked by
+        another transaction are skipped on databases that support it, so
+        several workers can transform the same job.
+
+        Args:
+            db: Database session
+            job_id: ID of the job
+            limit: Maximum number of items to claim
+            ids: Only claim items with these IDs
+
+        Returns:
+            Claimed items in dataset order
+        """
+        query = select(ApifyDatasetItem).where(
+            ApifyDatasetItem.job_id == job_id, ApifyDatasetItem.transformed == False
+        )
+        if ids is not None:
+            query = query.where(ApifyDatasetItem.id.in_(ids))
+        return db.exec(
+            query.order_by(ApifyDatasetItem.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+    def count_untransformed(self, db: Session, *, job_id: int) -> int:
+        """Count a job's items that have not been transformed yet."""
+        return db.exec(
+            select(func.count(ApifyDatasetItem.id)).where(
+                ApifyDatasetItem.job_id == job_id, ApifyDatasetItem.transformed == False
+            )
+        ).one()
+
+    def reset_skipped(self, db: Session, *, job_id: int) -> int:
+        """Mark a job's items that did not become articles as untransformed.
+
+        Used to transform them again, e.g. after fixing the field mapping,
+        without fetching the dataset again.
+
+        Args:
+            db: Database session
+            job_id: ID of the job
+
+        Returns:
+            Number of items reset
+        """
+        result = db.execute(
+            update(ApifyDatasetItem)
+            .where(
+                ApifyDatasetItem.job_id == job_id,
+                ApifyDatasetItem.transformed == True,
+                ApifyDatasetItem.article_id == None,
+            )
+            .values(transformed=False, error_message=None)
+        )
+        db.commit()
+        return result.rowcount
+
+
+apify_dataset_item = CRUDApifyDatasetItem(ApifyDatasetItem)
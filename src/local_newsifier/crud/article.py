@@ -1,11 +1,11 @@
 """CRUD operations for articles."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 from sqlmodel import Session, select
 
-from local_newsifier.crud.base import CRUDBase
+from local_newsifier.crud.base import DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE, CRUDBase, _chunks
 from local_newsifier.models.article import Article
 
 
@@ -26,6 +26,28 @@ class CRUDArticle(CRUDBase[Article]):
         results = db.exec(statement)
         return results.first()
 
+    def existing_urls(
+        self, db: Session, *, urls: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Set[str]:
+        """Find which of the given URLs already have articles.
+
+        Issues one chunked ``url IN (...)`` query per chunk_size URLs instead
+        of a get_by_url round trip per candidate.
+
+        Args:
+            db: Database session
+            urls: Candidate article URLs; blanks and duplicates are ignored
+            chunk_size: Maximum number of URLs per query
+
+        Returns:
+            Set of the URLs that already have articles
+        """
+        candidates = list({url for url in urls if url})
+        existing = set()
+        for chunk in _chunks(candidates, chunk_size):
+            existing.update(db.exec(select(Article.url).where(Article.url.in_(chunk))).all())
+        return existing
+
     def create(self, db: Session, *, obj_in: Union[Dict[str, Any], Article]) -> Article:
         """Create a new article.
 
@@ -73,17 +95,53 @@ class CRUDArticle(CRUDBase[Article]):
             return db_article
         return None
 
-    def get_by_status(self, db: Session, *, status: str) -> List[Article]:
+    def get_by_status(
+        self, db: Session, *, status: str, exclude_duplicates: bool = False
+    ) -> List[Article]:
         """Get all articles with a specific status.
 
         Args:
             db: Database session
             status: Status to filter by
+            exclude_duplicates: Leave out articles marked as near-duplicates
 
         Returns:
             List of articles with the specified status
         """
-        return db.exec(select(Article).where(Article.status == status)).all()
+        statement = select(Article).where(Article.status == status)
+        if exclude_duplicates:
+            statement = statement.where(Article.duplicate_of.is_(None))
+        return db.exec(statement).all()
+
+    def iter_by_status(
+        self,
+        db: Session,
+        *,
+        status: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        yield_per: Optional[int] = None,
+        exclude_duplicates: bool = False,
+    ) -> Iterator[Any]:
+        """Iterate over articles with a specific status in id order, a page at a time.
+
+        Args:
+            db: Database session
+            status: Status to filter by
+            page_size: Number of articles per query
+            columns: Column names to load instead of whole articles; the id
+                is always included
+            yield_per: Stream each page from a server-side cursor
+            exclude_duplicates: Leave out articles marked as near-duplicates
+
+        Yields:
+            Articles, or rows of the selected columns
+        """
+        keys = [Article.id]
+        statement = self._select(columns, keys).where(Article.status == status)
+        if exclude_duplicates:
+            statement = statement.where(Article.duplicate_of.is_(None))
+        return self._iter_keyset(db, statement, keys=keys, page_size=page_size, yield_per=yield_per)
 
     def get_by_date_range(
         self, db: Session, *, start_date: datetime, end_date: datetime, source: Optional[str] = None
@@ -112,5 +170,39 @@ class CRUDArticle(CRUDBase[Article]):
 
         return db.exec(query).all()
 
+    def iter_by_date_range(
+        self,
+        db: Session,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        source: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        yield_per: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over articles within a date range by published date, a page at a time.
+
+        Args:
+            db: Database session
+            start_date: Start date
+            end_date: End date
+            source: Optional source to filter by
+            page_size: Number of articles per query
+            columns: Column names to load instead of whole articles; the id
+                and published_at are always included
+            yield_per: Stream each page from a server-side cursor
+
+        Yields:
+            Articles, or rows of the selected columns
+        """
+        keys = [Article.published_at, Article.id]
+        statement = self._select(columns, keys).where(
+            Article.published_at >= start_date, Article.published_at <= end_date
+        )
+        if source:
+            statement = statement.where(Article.source == source)
+        return self._iter_keyset(db, statement, keys=keys, page_size=page_size, yield_per=yield_per)
+
 
 article = CRUDArticle(Article)
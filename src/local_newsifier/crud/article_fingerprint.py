@@ -0,0 +1,58 @@
+"""CRUD operations for article fingerprints."""
+
+from typing import Iterable, List, Tuple
+
+from sqlmodel import Session, select
+
+from local_newsifier.crud.base import CRUDBase
+from local_newsifier.models.article_fingerprint import ArticleFingerprint, ArticleLSHBucket
+
+
+class CRUDArticleFingerprint(CRUDBase[ArticleFingerprint]):
+    """CRUD operations for article fingerprints and their LSH buckets."""
+
+    def add(
+        self, db: Session, *, article_id: int, signature: bytes, buckets: Iterable[int]
+    ) -> ArticleFingerprint:
+        """Add an article's fingerprint and LSH buckets to the session.
+
+        The caller commits, so the fingerprint is stored together with the
+        article it belongs to.
+
+        Args:
+            db: Database session
+            article_id: ID of the article
+            signature: Packed MinHash signature
+            buckets: LSH bucket ids of the signature's bands
+
+        Returns:
+            The fingerprint
+        """
+        fingerprint = ArticleFingerprint(article_id=article_id, signature=signature)
+        db.add(fingerprint)
+        db.add_all(
+            ArticleLSHBucket(bucket=bucket, article_id=article_id) for bucket in set(buckets)
+        )
+        return fingerprint
+
+    def get_candidates(self, db: Session, *, buckets: Iterable[int]) -> List[Tuple[int, bytes]]:
+        """Get the fingerprints of articles sharing any of the given buckets.
+
+        Args:
+            db: Database session
+            buckets: LSH bucket ids
+
+        Returns:
+            List of (article_id, signature) pairs
+        """
+        matching = select(ArticleLSHBucket.article_id).where(
+            ArticleLSHBucket.bucket.in_(list(set(buckets)))
+        )
+        return db.exec(
+            select(ArticleFingerprint.article_id, ArticleFingerprint.signature).where(
+                ArticleFingerprint.article_id.in_(matching)
+            )
+        ).all()
+
+
+article_fingerprint = CRUDArticleFingerprint(ArticleFingerprint)
@@ -1,12 +1,28 @@
 """Base CRUD module with generic CRUD operations for SQLModel."""
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Type, TypeVar, Union
 
+from sqlalchemy import delete, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, SQLModel, select
 
 # Type for the model class - doesn't need to be bound to TableBase anymore
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+# Rows per statement for the bulk methods; keeps statements well under the
+# bind parameter limits of PostgreSQL (65535) and SQLite (32766)
+DEFAULT_CHUNK_SIZE = 500
+
+# Rows per query for the keyset-paginated iterators
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    """Split a list into consecutive chunks of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class CRUDBase(Generic[ModelType]):
     """Base class for CRUD operations."""
@@ -44,6 +60,104 @@ class CRUDBase(Generic[ModelType]):
         """
         return db.exec(select(self.model).offset(skip).limit(limit)).all()
 
+    def _select(self, columns: Optional[Sequence[str]], keys: Sequence[Any]):
+        """Select whole items, or only the given columns plus the paging keys.
+
+        Args:
+            columns: Column names to project, or None for model instances
+            keys: Columns the results are paged by
+
+        Returns:
+            Select statement
+        """
+        if columns is None:
+            return select(self.model)
+        selected = [getattr(self.model, column) for column in columns]
+        selected += [key for key in keys if key.key not in columns]
+        return select(*selected)
+
+    def _iter_keyset(
+        self,
+        db: Session,
+        statement,
+        *,
+        keys: Sequence[Any],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        yield_per: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield the results of a statement page by page, ordered by unique keys.
+
+        Each page is a separate query starting after the last key of the
+        previous one (keyset pagination), so memory stays bounded by the page
+        size and rows changing while iterating do not shift later pages the
+        way OFFSET would.
+
+        Args:
+            db: Database session
+            statement: Select statement to page through; must select the keys
+            keys: Columns that together identify a row, e.g. (published_at, id)
+            page_size: Number of rows per query
+            yield_per: Stream each page from a server-side cursor this many
+                rows at a time instead of fetching it whole. The session must
+                not commit while a page is being read
+
+        Yields:
+            Model instances, or rows when the statement selects columns
+        """
+        last = None
+        while True:
+            page = statement.order_by(*keys).limit(page_size)
+            if last is not None:
+                if len(keys) == 1:
+                    page = page.where(keys[0] > last[0])
+                else:
+                    page = page.where(tuple_(*keys) > tuple_(*last))
+
+            if yield_per:
+                results = db.exec(page.execution_options(yield_per=yield_per))
+            else:
+                # Fetch the page up front so callers can commit between rows
+                results = db.exec(page).all()
+
+            count = 0
+            item = None
+            for item in results:
+                count += 1
+                yield item
+
+            if count < page_size:
+                return
+            last = tuple(getattr(item, key.key) for key in keys)
+
+    def iter_all(
+        self,
+        db: Session,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        yield_per: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over all items in id order without loading them all at once.
+
+        Args:
+            db: Database session
+            page_size: Number of rows per query
+            columns: Column names to load instead of whole items; the id is
+                always included
+            yield_per: Stream each page from a server-side cursor
+
+        Yields:
+            Items, or rows of the selected columns
+        """
+        keys = [self.model.id]
+        return self._iter_keyset(
+            db,
+            self._select(columns, keys),
+            keys=keys,
+            page_size=page_size,
+            yield_per=yield_per,
+        )
+
     def create(self, db: Session, *, obj_in: Union[Dict[str, Any], ModelType]) -> ModelType:
         """Create a new item.
 
@@ -66,6 +180,198 @@ class CRUDBase(Generic[ModelType]):
         db.refresh(db_obj)
         return db_obj
 
+    def _column_values(self, obj_in: Union[Dict[str, Any], ModelType]) -> Dict[str, Any]:
+        """Get the column values to insert for an item, with model defaults applied.
+
+        Args:
+            obj_in: Item data as dict or model instance
+
+        Returns:
+            Column values keyed by column name; an unset id is left out
+        """
+        db_obj = self.model(**obj_in) if isinstance(obj_in, dict) else obj_in
+        columns = self.model.__table__.columns.keys()
+        values = {key: value for key, value in db_obj.model_dump().items() if key in columns}
+        if values.get("id") is None:
+            values.pop("id", None)
+        return values
+
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[Dict[str, Any], ModelType]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        return_ids: bool = True,
+        commit: bool = True,
+    ) -> List[int]:
+        """Create many items with chunked multi-row INSERTs, without refreshing each row.
+
+        Ids come from INSERT ... RETURNING when the database can return them
+        for a multi-row insert in parameter order (PostgreSQL, SQLite 3.35+);
+        otherwise the chunk is added to the session and flushed once.
+
+        Args:
+            db: Database session
+            objs_in: Items data as dicts or model instances
+            chunk_size: Maximum number of rows per statement
+            return_ids: Whether to return the ids of the created items
+            commit: Whether to commit; pass False to keep the insert in the
+                caller's transaction
+
+        Returns:
+            Ids of the created items in the order given, or an empty list
+            when return_ids is False
+        """
+        rows = [self._column_values(obj_in) for obj_in in objs_in]
+        returning = db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order
+        statement = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+
+        ids: List[int] = []
+        for chunk in _chunks(rows, chunk_size):
+            if not return_ids:
+                db.execute(insert(self.model), chunk)
+            elif returning:
+                ids.extend(db.execute(statement, chunk).scalars())
+            else:
+                db_objs = [self.model(**row) for row in chunk]
+                db.add_all(db_objs)
+                db.flush()
+                ids.extend(db_obj.id for db_obj in db_objs)
+
+        if commit and rows:
+            db.commit()
+        return ids
+
+    def _conflict_columns(self, conflict_target: Union[str, Sequence[str]]) -> List[str]:
+        """Get the columns of a conflict target given as columns or a constraint name."""
+        if not isinstance(conflict_target, str):
+            return list(conflict_target)
+        for constraint in self.model.__table__.constraints:
+            if constraint.name == conflict_target:
+                return [column.name for column in constraint.columns]
+        raise ValueError(f"{self.model.__name__} has no constraint named {conflict_target!r}")
+
+    def upsert_statement(
+        self,
+        rows: List[Dict[str, Any]],
+        *,
+        conflict_target: Union[str, Sequence[str]],
+        update_columns: Optional[Sequence[str]] = None,
+        return_ids: bool = True,
+        dialect_name: str = "postgresql",
+    ):
+        """Build a multi-row INSERT ... ON CONFLICT statement.
+
+        Args:
+            rows: Column values for each item
+            conflict_target: Unique constraint name, or the columns it covers
+            update_columns: Columns overwritten from the new row on conflict;
+                conflicting rows are left untouched when omitted
+            return_ids: Whether to return the id and conflict columns of every
+                row, existing or new
+            dialect_name: "postgresql" or "sqlite"
+
+        Returns:
+            Insert statement for the dialect
+
+        Raises:
+            ValueError: If the dialect does not support upserts
+        """
+        if dialect_name == "postgresql":
+            statement = pg_insert(self.model).values(rows)
+        elif dialect_name == "sqlite":
+            statement = sqlite_insert(self.model).values(rows)
+        else:
+            raise ValueError(f"Upserts are not supported on {dialect_name}")
+
+        columns = self._conflict_columns(conflict_target)
+        if isinstance(conflict_target, str) and dialect_name == "postgresql":
+            target = {"constraint": conflict_target}
+        else:
+            target = {"index_elements": columns}
+
+        update_columns = list(update_columns or [])
+        if update_columns and "updated_at" in self.model.__table__.columns:
+            # Column onupdate defaults do not apply to ON CONFLICT updates
+            update_columns.append("updated_at")
+        elif not update_columns and return_ids:
+            # DO NOTHING returns no row for conflicts; a no-op update does
+            update_columns = columns[:1]
+
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                **target,
+                set_={column: statement.excluded[column] for column in update_columns},
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(**target)
+
+        if return_ids:
+            statement = statement.returning(
+                self.model.id, *(self.model.__table__.columns[column] for column in columns)
+            )
+        return statement
+
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[Dict[str, Any], ModelType]],
+        conflict_target: Union[str, Sequence[str]],
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        return_ids: bool = True,
+        commit: bool = True,
+    ) -> List[int]:
+        """Insert many items, updating or skipping those that already exist.
+
+        Uses chunked INSERT ... ON CONFLICT statements, so concurrent writers
+        inserting the same rows do not fail on the unique constraint. Items
+        repeating a conflict key are written once, the last one winning.
+
+        Args:
+            db: Database session
+            objs_in: Items data as dicts or model instances
+            conflict_target: Unique constraint name, or the columns it covers
+            update_columns: Columns overwritten from the new row on conflict;
+                existing rows are left untouched when omitted
+            chunk_size: Maximum number of rows per statement
+            return_ids: Whether to return the ids of the items
+            commit: Whether to commit; pass False to keep the upsert in the
+                caller's transaction
+
+        Returns:
+            Ids of the existing or created items in the order given, or an
+            empty list when return_ids is False
+
+        Raises:
+            ValueError: If the database does not support upserts
+        """
+        columns = self._conflict_columns(conflict_target)
+        rows = [self._column_values(obj_in) for obj_in in objs_in]
+        keys = [tuple(row[column] for column in columns) for row in rows]
+        # One row per key: PostgreSQL cannot update the same row twice in a statement
+        unique_rows = list(dict(zip(keys, rows)).values())
+        dialect_name = db.get_bind().dialect.name
+
+        ids_by_key: Dict[tuple, int] = {}
+        for chunk in _chunks(unique_rows, chunk_size):
+            statement = self.upsert_statement(
+                chunk,
+                conflict_target=conflict_target,
+                update_columns=update_columns,
+                return_ids=return_ids,
+                dialect_name=dialect_name,
+            )
+            result = db.execute(statement)
+            if return_ids:
+                ids_by_key.update((tuple(key), row_id) for row_id, *key in result)
+
+        if commit and rows:
+            db.commit()
+        return [ids_by_key[key] for key in keys] if return_ids else []
+
     def update(
         self, db: Session, *, db_obj: ModelType, obj_in: Union[Dict[str, Any], ModelType]
     ) -> ModelType:
@@ -94,6 +400,37 @@ class CRUDBase(Generic[ModelType]):
         db.refresh(db_obj)
         return db_obj
 
+    def update_many_by_ids(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[int],
+        values: Dict[str, Any],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> int:
+        """Set the same values on many items with chunked UPDATE ... WHERE id IN statements.
+
+        Args:
+            db: Database session
+            ids: Ids of the items to update
+            values: Column values to set
+            chunk_size: Maximum number of ids per statement
+            commit: Whether to commit; pass False to keep the update in the
+                caller's transaction
+
+        Returns:
+            Number of updated items
+        """
+        updated = 0
+        for chunk in _chunks(list(ids), chunk_size):
+            result = db.execute(update(self.model).where(self.model.id.in_(chunk)).values(**values))
+            updated += result.rowcount
+
+        if commit and ids:
+            db.commit()
+        return updated
+
     def remove(self, db: Session, *, id: int) -> Optional[ModelType]:
         """Remove an item.
 
@@ -110,3 +447,32 @@ class CRUDBase(Generic[ModelType]):
             db.commit()
             return db_obj
         return None
+
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[int],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> int:
+        """Remove many items with chunked DELETE ... WHERE id IN statements.
+
+        Args:
+            db: Database session
+            ids: Ids of the items to remove
+            chunk_size: Maximum number of ids per statement
+            commit: Whether to commit; pass False to keep the delete in the
+                caller's transaction
+
+        Returns:
+            Number of removed items
+        """
+        removed = 0
+        for chunk in _chunks(list(ids), chunk_size):
+            result = db.execute(delete(self.model).where(self.model.id.in_(chunk)))
+            removed += result.rowcount
+
+        if commit and ids:
+            db.commit()
+        return removed
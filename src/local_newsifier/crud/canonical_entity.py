@@ -1,11 +1,11 @@
 """CRUD operations for canonical entities."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Sequence
 
 from sqlmodel import Session, col, func, select
 
-from local_newsifier.crud.base import CRUDBase
+from local_newsifier.crud.base import DEFAULT_PAGE_SIZE, CRUDBase
 from local_newsifier.models.article import Article
 from local_newsifier.models.entity_tracking import CanonicalEntity, EntityMention
 
@@ -62,6 +62,79 @@ class CRUDCanonicalEntity(CRUDBase[CanonicalEntity]):
         results = db.execute(query).all()
         return [row[0] for row in results]
 
+    def iter_all(
+        self,
+        db: Session,
+        *,
+        entity_type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        yield_per: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over all canonical entities in id order, a page at a time.
+
+        Args:
+            db: Database session
+            entity_type: Optional type to filter by
+            page_size: Number of entities per query
+            columns: Column names to load instead of whole entities; the id
+                is always included
+            yield_per: Stream each page from a server-side cursor
+
+        Yields:
+            Canonical entities, or rows of the selected columns
+        """
+        keys = [CanonicalEntity.id]
+        statement = self._select(columns, keys)
+        if entity_type:
+            statement = statement.where(CanonicalEntity.entity_type == entity_type)
+        return self._iter_keyset(db, statement, keys=keys, page_size=page_size, yield_per=yield_per)
+
+    def get_after_id(self, db: Session, *, after_id: int) -> List[CanonicalEntity]:
+        """Get canonical entities with an id greater than the given one.
+
+        Used as a watermark query to pick up entities created since a cache
+        was last loaded.
+
+        Args:
+            db: Database session
+            after_id: Only entities with a greater id are returned
+
+        Returns:
+            List of canonical entities ordered by id
+        """
+        results = db.execute(
+            select(CanonicalEntity)
+            .where(CanonicalEntity.id > after_id)
+            .order_by(CanonicalEntity.id)
+        ).all()
+        return [row[0] for row in results]
+
+    def get_or_create_many(
+        self, db: Session, *, objs_in: List[CanonicalEntity], commit: bool = True
+    ) -> List[int]:
+        """Get or create canonical entities by name and type in one upsert.
+
+        Conflicts on the ``uix_name_type`` constraint only bump ``last_seen``,
+        which also makes concurrent workers creating the same entity safe.
+
+        Args:
+            db: Database session
+            objs_in: Canonical entities to get or create
+            commit: Whether to commit; pass False to keep the upsert in the
+                caller's transaction
+
+        Returns:
+            Ids of the canonical entities, in the order given
+        """
+        return self.upsert_many(
+            db,
+            objs_in=objs_in,
+            conflict_target="uix_name_type",
+            update_columns=["last_seen"],
+            commit=commit,
+        )
+
     def get_mentions_count(self, db: Session, *, entity_id: int) -> int:
         """Get the count of mentions for an entity.
 
@@ -1,11 +1,11 @@
 """CRUD operations for entities."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Sequence
 
 from sqlmodel import Session, join, select
 
-from local_newsifier.crud.base import CRUDBase
+from local_newsifier.crud.base import DEFAULT_PAGE_SIZE, CRUDBase
 from local_newsifier.models.article import Article
 from local_newsifier.models.entity import Entity
 
@@ -77,5 +77,41 @@ class CRUDEntity(CRUDBase[Entity]):
         results = db.execute(query).all()
         return [row[0] for row in results]
 
+    def iter_by_date_range_and_types(
+        self,
+        db: Session,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        entity_types: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        columns: Optional[Sequence[str]] = None,
+        yield_per: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over entities by date range and entity types in id order, a page at a time.
+
+        Args:
+            db: Database session
+            start_date: Start date
+            end_date: End date
+            entity_types: List of entity types to include
+            page_size: Number of entities per query
+            columns: Column names to load instead of whole entities; the id
+                is always included
+            yield_per: Stream each page from a server-side cursor
+
+        Yields:
+            Entities, or rows of the selected columns
+        """
+        keys = [Entity.id]
+        statement = (
+            self._select(columns, keys)
+            .join(Article, Entity.article_id == Article.id)
+            .where(Article.published_at >= start_date, Article.published_at <= end_date)
+        )
+        if entity_types:
+            statement = statement.where(Entity.entity_type.in_(entity_types))
+        return self._iter_keyset(db, statement, keys=keys, page_size=page_size, yield_per=yield_per)
+
 
 entity = CRUDEntity(Entity)
@@ -1,9 +1,9 @@
 """CRUD operations for RSS feeds."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from sqlmodel import Session, select
+from sqlmodel import Session, or_, select
 
 from local_newsifier.crud.base import CRUDBase
 from local_newsifier.models.rss_feed import RSSFeed
@@ -59,6 +59,110 @@ class CRUDRSSFeed(CRUDBase[RSSFeed]):
             return feed
         return None
 
+    def update_validators(
+        self,
+        db: Session,
+        *,
+        id: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: Optional[str],
+    ) -> Optional[RSSFeed]:
+        """Store the validators from a feed's latest fetch.
+
+        Args:
+            db: Database session
+            id: Feed ID
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            content_hash: Hash of the response body
+
+        Returns:
+            Updated feed if found, None otherwise
+        """
+        feed = self.get(db, id=id)
+        if feed:
+            feed.etag = etag
+            feed.last_modified = last_modified
+            feed.content_hash = content_hash
+            db.add(feed)
+            db.commit()
+            db.refresh(feed)
+            return feed
+        return None
+
+    def claim_due_feeds(
+        self, db: Session, *, now: datetime, lease_seconds: float, limit: int = 100
+    ) -> List[RSSFeed]:
+        """Claim the active feeds due for polling, longest overdue first.
+
+        Each claimed feed's next_fetch_at is pushed lease_seconds ahead, so a
+        feed still waiting to be fetched is not claimed again; the fetch sets
+        its real next poll time. Rows claimed concurrently are skipped on
+        databases that support it.
+
+        Args:
+            db: Database session
+            now: Current time
+            lease_seconds: How far ahead to push the claimed feeds
+            limit: Maximum number of feeds to claim
+
+        Returns:
+            Claimed feeds
+        """
+        feeds = db.exec(
+            select(RSSFeed)
+            .where(
+                RSSFeed.is_active == True,
+                or_(RSSFeed.next_fetch_at == None, RSSFeed.next_fetch_at <= now),
+            )
+            .order_by(RSSFeed.next_fetch_at.nulls_first())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for feed in feeds:
+            feed.next_fetch_at = lease_until
+            db.add(feed)
+        db.commit()
+        return feeds
+
+    def update_schedule(
+        self,
+        db: Session,
+        *,
+        id: int,
+        publish_interval_seconds: Optional[float],
+        not_modified_rate: float,
+        fetch_interval_seconds: float,
+        next_fetch_at: datetime,
+    ) -> Optional[RSSFeed]:
+        """Store a feed's polling statistics and next poll time.
+
+        Args:
+            db: Database session
+            id: Feed ID
+            publish_interval_seconds: Average seconds between the feed's items
+            not_modified_rate: Fraction of recent fetches that were unchanged
+            fetch_interval_seconds: Current poll interval
+            next_fetch_at: When to poll the feed next
+
+        Returns:
+            Updated feed if found, None otherwise
+        """
+        feed = self.get(db, id=id)
+        if feed:
+            feed.publish_interval_seconds = publish_interval_seconds
+            feed.not_modified_rate = not_modified_rate
+            feed.fetch_interval_seconds = fetch_interval_seconds
+            feed.next_fetch_at = next_fetch_at
+            db.add(feed)
+            db.commit()
+            db.refresh(feed)
+            return feed
+        return None
+
 
 # Create a singleton instance
 rss_feed = CRUDRSSFeed(RSSFeed)
@@ -5,14 +5,18 @@ It promotes direct usage of CRUD operations for database access.
 """
 
 # Import directly from engine.py
-from local_newsifier.database.engine import (SessionManager, create_db_and_tables, get_engine,
-                                             get_session, transaction, with_session)
+from local_newsifier.database.engine import (SessionManager, create_db_and_tables,
+                                             dispose_engines, get_engine, get_session,
+                                             reset_engines_after_fork, transaction,
+                                             with_session)
 
 __all__ = [
     # Database engine and session management
     "create_db_and_tables",
+    "dispose_engines",
     "get_engine",
     "get_session",
+    "reset_engines_after_fork",
     "transaction",
     "SessionManager",
     "with_session",
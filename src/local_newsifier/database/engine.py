@@ -1,12 +1,15 @@
 """Database engine and session management using SQLModel."""
 
 import logging
+import os
+import threading
 import time
 import traceback
 from contextlib import contextmanager
-from typing import Any, Callable, Generator, Optional, TypeVar
+from typing import Any, Callable, Dict, Generator, Optional, TypeVar
 
 from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine
 
 # Import common settings to avoid circular imports
@@ -22,11 +25,66 @@ logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T")
 
+# Process-wide engine registry keyed by database URL. Each process owns its own
+# engines; entries inherited through fork are discarded by reset_engines_after_fork().
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+_engines_pid = os.getpid()
+
+
+def reset_engines_after_fork() -> None:
+    """Drop engines inherited from a parent process.
+
+    Pooled connections are shared with the parent after a fork, so they are
+    released without being closed (``close=False``) and the child creates its
+    own engine on first use. Registered with ``os.register_at_fork`` and called
+    from the Celery ``worker_process_init`` signal.
+    """
+    global _engines_lock, _engines_pid
+
+    # The lock may have been held by another thread at fork time
+    _engines_lock = threading.Lock()
+    for engine in list(_engines.values()):
+        try:
+            engine.dispose(close=False)
+        except Exception as e:
+            logger.warning(f"Error discarding inherited engine pool: {str(e)}")
+    _engines.clear()
+    _engines_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_engines_after_fork)
+
+
+def dispose_engines() -> None:
+    """Dispose every registered engine and empty the registry.
+
+    Called on API shutdown and Celery worker shutdown so pooled connections
+    are closed cleanly instead of being dropped by the server.
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+
+    for engine in engines:
+        try:
+            engine.dispose()
+        except Exception as e:
+            logger.warning(f"Error disposing database engine: {str(e)}")
+
+    if engines:
+        logger.info(f"Disposed {len(engines)} database engine(s)")
+
 
 def get_engine(
     url: Optional[str] = None, max_retries: int = 3, retry_delay: int = 2, test_mode: bool = False
 ):
-    """Get SQLModel engine with enhanced logging and retry logic.
+    """Get the process-wide SQLModel engine for a database URL.
+
+    The first call for a URL creates the engine (with retry logic and a
+    ``SELECT 1`` check) and stores it in the registry; later calls return the
+    same engine, so a session only costs a pool checkout.
 
     Args:
         url: Database URL (if None, uses settings)
@@ -49,7 +107,6 @@ def get_engine(
                 try:
                     # For pytest-xdist parallel execution, we can figure out the worker ID
                     # from sys.argv or environment variable if available
-                    import os
                     import sys
 
                     # Check for xdist worker ID patterns
@@ -81,11 +138,40 @@ def get_engine(
         # Use faster retry for tests if we don't get a test engine
         retry_delay = 0.01  # Use milliseconds instead of seconds for tests
 
+    settings = get_settings()
+    url = url or str(settings.DATABASE_URL)
+
+    if _engines_pid != os.getpid():
+        reset_engines_after_fork()
+
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        # Another thread may have created the engine while we waited
+        engine = _engines.get(url)
+        if engine is None:
+            engine = _create_engine(url, settings, max_retries, retry_delay)
+            if engine is not None:
+                _engines[url] = engine
+        return engine
+
+
+def _create_engine(url: str, settings: Any, max_retries: int, retry_delay: float):
+    """Create and verify a new engine, retrying on failure.
+
+    Args:
+        url: Database URL
+        settings: Application settings
+        max_retries: Maximum number of connection retries
+        retry_delay: Seconds to wait between retries
+
+    Returns:
+        SQLModel engine or None if connection fails after retries
+    """
     for attempt in range(max_retries + 1):
         try:
-            settings = get_settings()
-            url = url or str(settings.DATABASE_URL)
-
             # Log database connection attempt (without password)
             safe_url = url
             if settings.POSTGRES_PASSWORD and settings.POSTGRES_PASSWORD in url:
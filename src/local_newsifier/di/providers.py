@@ -145,16 +145,18 @@ get_apify_source_config_crud = _make_simple_provider(
 def get_nlp_model() -> Any:
     """Provide the spaCy NLP model.
 
-    Uses use_cache=False to create new instances for each injection,
-    preventing shared state in NLP processing.
+    The model comes from the process-wide registry in
+    ``local_newsifier.tools.nlp_models``, so it is loaded and warmed once per
+    process and every injection shares the same Language object.
 
     Returns:
         Loaded spaCy Language model or None if loading fails
     """
     try:
-        import spacy
+        from local_newsifier.config.settings import settings
+        from local_newsifier.tools.nlp_models import load_model
 
-        return spacy.load("en_core_web_lg")
+        return load_model(settings.NER_MODEL)
     except (ImportError, OSError) as e:
         import logging
 
@@ -167,7 +169,8 @@ def get_web_scraper_tool():
     """Provide the web scraper tool.
 
     Uses use_cache=False to create new instances for each injection, as this tool
-    maintains session and WebDriver state that shouldn't be shared between operations.
+    maintains session state that shouldn't be shared between operations. Selenium
+    drivers come from a process-wide pool, so new instances do not start browsers.
 
     Returns:
         WebScraperTool instance
@@ -503,6 +506,7 @@ def get_entity_service(
         EntityService instance
     """
     from local_newsifier.services.entity_service import EntityService
+    from local_newsifier.tools.resolution.canonical_entity_cache import get_canonical_entity_cache
 
     return EntityService(
         entity_crud=entity_crud,
@@ -514,6 +518,7 @@ def get_entity_service(
         context_analyzer=context_analyzer,
         entity_resolver=entity_resolver,
         session_factory=lambda: session,
+        canonical_entity_cache=get_canonical_entity_cache(),
     )
 
 
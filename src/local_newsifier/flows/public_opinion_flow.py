@@ -73,9 +73,12 @@ class PublicOpinionFlow(Flow):
         # Use provided session or instance session
         session = session or self.session
 
-        # If no article IDs provided, get all articles that need sentiment analysis
+        # If no article IDs provided, get all articles that need sentiment
+        # analysis, other than near-duplicates of other articles
         if not article_ids:
-            articles = article_crud.get_by_status(session, status="analyzed")
+            articles = article_crud.get_by_status(
+                session, status="analyzed", exclude_duplicates=True
+            )
             article_ids = [article.id for article in articles]
 
         # Analyze each article
@@ -13,6 +13,7 @@ from local_newsifier.models.state import AnalysisStatus, NewsAnalysisState
 from local_newsifier.services.article_service import ArticleService
 from local_newsifier.services.rss_feed_service import RSSFeedService
 from local_newsifier.tools.rss_parser import RSSItem, RSSParser
+from local_newsifier.tools.seen_url_store import SeenURLStore
 from local_newsifier.tools.web_scraper import WebScraperTool
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,7 @@ class RSSScrapingFlow(Flow):
         web_scraper: Optional[WebScraperTool] = None,
         cache_dir: Optional[str] = None,
         session_factory: Optional[Callable] = None,
+        seen_store: Optional[SeenURLStore] = None,
     ):
         """
         Initialize the RSS scraping flow.
@@ -38,8 +40,10 @@ class RSSScrapingFlow(Flow):
             article_service: Service for article operations
             rss_parser: Tool for parsing RSS feeds
             web_scraper: Tool for scraping web content
-            cache_dir: Optional directory to store cache files
+            cache_dir: Optional directory for the store of processed URLs
             session_factory: Function to create database sessions
+            seen_store: Store of processed URLs, used instead of one in
+                cache_dir when the flow creates its own parser
         """
         super().__init__()
         self.cache_dir = Path(cache_dir) if cache_dir else None
@@ -48,13 +52,11 @@ class RSSScrapingFlow(Flow):
         self.session_factory = session_factory
 
         # Initialize or use provided tools
-        # Backward compatibility for cache_dir parameter
         self.rss_parser = rss_parser
         if self.rss_parser is None:
-            cache_file = self.cache_dir / "rss_urls.json" if self.cache_dir else None
             self.rss_parser = RSSParser(
-                cache_file=str(cache_file) if cache_file else None,
                 cache_dir=str(self.cache_dir) if self.cache_dir else None,
+                seen_store=seen_store,
             )
 
         self.web_scraper = web_scraper or WebScraperTool()
@@ -64,7 +66,7 @@ class RSSScrapingFlow(Flow):
         Process an RSS feed by:
         1. Parsing the feed for new URLs
         2. Creating analysis states for new articles
-        3. Scraping content for each new article
+        3. Scraping the new articles concurrently
 
         Args:
             feed_url: URL of the RSS feed to process
@@ -75,41 +77,35 @@ class RSSScrapingFlow(Flow):
         logger.info(f"Processing feed: {feed_url}")
 
         # Get new articles from feed
-        new_items = self.rss_parser.get_new_urls(feed_url)
+        new_items = self.rss_parser.get_new_urls(feed_url, stop_at_seen=True)
         if not new_items:
             logger.info("No new articles found in feed")
             return []
 
         logger.info(f"Found {len(new_items)} new articles")
-        results = []
 
-        # Process each new article
+        # Create initial states for the new articles
+        states = []
         for item in new_items:
-            try:
-                # Create initial state
-                state = NewsAnalysisState(
-                    target_url=item.url,
-                    status=AnalysisStatus.INITIALIZED,
-                    created_at=datetime.now(timezone.utc),
-                    last_updated=datetime.now(timezone.utc),
-                )
-                state.add_log(f"Processing article: {item.title}")
-
-                # Scrape the article
-                state = self.web_scraper.scrape(state)
-                results.append(state)
-
-            except Exception as e:
-                logger.error(f"Error processing article {item.url}: {e}")
-                # Create failed state
-                state = NewsAnalysisState(
-                    target_url=item.url,
-                    status=AnalysisStatus.SCRAPE_FAILED_NETWORK,
-                    created_at=datetime.now(timezone.utc),
-                    last_updated=datetime.now(timezone.utc),
-                )
-                state.set_error("scraping", e)
-                state.add_log(f"Failed to process article: {item.title}")
-                results.append(state)
-
-        return results
+            state = NewsAnalysisState(
+                target_url=item.url,
+                status=AnalysisStatus.INITIALIZED,
+                created_at=datetime.now(timezone.utc),
+                last_updated=datetime.now(timezone.utc),
+            )
+            state.add_log(f"Processing article: {item.title}")
+            states.append(state)
+
+        # Scrape the articles concurrently; each state records its own outcome
+        try:
+            for state in self.web_scraper.scrape_many(states):
+                logger.info(f"Scraped {state.target_url}: {state.status}")
+        except Exception as e:
+            logger.error(f"Error scraping articles from {feed_url}: {e}")
+            for item, state in zip(new_items, states):
+                if state.status in (AnalysisStatus.INITIALIZED, AnalysisStatus.SCRAPING):
+                    state.status = AnalysisStatus.SCRAPE_FAILED_NETWORK
+                    state.set_error("scraping", e)
+                    state.add_log(f"Failed to process article: {item.title}")
+
+        return states
@@ -9,6 +9,7 @@ from local_newsifier.models.apify import (ApifyCredentials, ApifyDatasetItem, Ap
 # Import all models from their original locations but don't re-export
 # This prevents duplicate class registrations
 from local_newsifier.models.article import Article
+from local_newsifier.models.article_fingerprint import ArticleFingerprint, ArticleLSHBucket
 # Export table base
 from local_newsifier.models.base import TableBase
 from local_newsifier.models.entity import Entity
@@ -25,6 +26,8 @@ __all__ = [
     "SQLModel",
     "TableBase",
     "Article",
+    "ArticleFingerprint",
+    "ArticleLSHBucket",
     "Entity",
     "AnalysisResult",
     "RSSFeed",
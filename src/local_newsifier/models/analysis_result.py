@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlmodel import JSON, Field, Relationship
+from sqlmodel import JSON, Field, Index, Relationship
 
 from local_newsifier.models.base import TableBase
 
@@ -16,8 +16,12 @@ class AnalysisResult(TableBase, table=True):
 
     __tablename__ = "analysis_results"
 
-    # Handle multiple imports during test collection
-    __table_args__ = {"extend_existing": True}
+    # Index for lookups by article and analysis type; extend_existing handles
+    # multiple imports during test collection
+    __table_args__ = (
+        Index("ix_analysis_results_article_id_analysis_type", "article_id", "analysis_type"),
+        {"extend_existing": True},
+    )
 
     article_id: int = Field(foreign_key="articles.id")
     analysis_type: str
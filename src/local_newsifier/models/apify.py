@@ -67,6 +67,8 @@ class ApifyJob(TableBase, table=True):
     processed: bool = Field(default=False)  # Whether results were imported to articles
     articles_created: Optional[int] = None  # Number of articles created from this job
     processed_at: Optional[datetime] = None
+    # Dataset items imported so far; a resumed import starts here
+    dataset_offset: int = Field(default=0)
 
     # Relationship back to source config
     source_config: Optional["ApifySourceConfig"] = Relationship(back_populates="jobs")
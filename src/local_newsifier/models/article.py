@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 # Handle circular imports
 if TYPE_CHECKING:
@@ -16,8 +16,13 @@ class Article(SQLModel, table=True):
 
     __tablename__ = "articles"
 
-    # Handle multiple imports during test collection
-    __table_args__ = {"extend_existing": True}
+    # Composite indexes serve the keyset-paginated status and date queries;
+    # extend_existing handles multiple imports during test collection
+    __table_args__ = (
+        Index("ix_articles_status_id", "status", "id"),
+        Index("ix_articles_published_at_id", "published_at", "id"),
+        {"extend_existing": True},
+    )
 
     # Primary key and timestamps
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -35,6 +40,9 @@ class Article(SQLModel, table=True):
     published_at: datetime
     status: str
     scraped_at: datetime
+    # Earlier article with near-identical text (e.g. a syndicated copy);
+    # duplicates are not run through entity analysis
+    duplicate_of: Optional[int] = Field(default=None, foreign_key="articles.id", index=True)
 
     # Define relationships with fully qualified paths
     entities: List["Entity"] = Relationship(back_populates="article")
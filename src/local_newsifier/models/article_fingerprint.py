@@ -0,0 +1,27 @@
+"""Content fingerprints of articles for near-duplicate detection."""
+
+from sqlalchemy import BigInteger, Column, LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class ArticleFingerprint(SQLModel, table=True):
+    """MinHash signature of an original (non-duplicate) article's text."""
+
+    __tablename__ = "article_fingerprints"
+    __table_args__ = {"extend_existing": True}
+
+    article_id: int = Field(foreign_key="articles.id", primary_key=True)
+    signature: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+
+
+class ArticleLSHBucket(SQLModel, table=True):
+    """One LSH band bucket of an article's signature.
+
+    Articles sharing any bucket are candidate near-duplicates.
+    """
+
+    __tablename__ = "article_lsh_buckets"
+    __table_args__ = {"extend_existing": True}
+
+    bucket: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    article_id: int = Field(foreign_key="articles.id", primary_key=True)
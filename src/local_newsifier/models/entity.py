@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 # Handle circular imports
 if TYPE_CHECKING:
@@ -15,8 +15,13 @@ class Entity(SQLModel, table=True):
 
     __tablename__ = "entities"
 
-    # Handle multiple imports during test collection
-    __table_args__ = {"extend_existing": True}
+    # Indexes for per-article lookups and type-filtered joins to articles;
+    # extend_existing handles multiple imports during test collection
+    __table_args__ = (
+        Index("ix_entities_article_id", "article_id"),
+        Index("ix_entities_entity_type_article_id", "entity_type", "article_id"),
+        {"extend_existing": True},
+    )
 
     # Primary key and timestamps
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlmodel import JSON, Field, Relationship, SQLModel, UniqueConstraint
+from sqlmodel import JSON, Field, Index, Relationship, SQLModel, UniqueConstraint
 
 from local_newsifier.models.base import TableBase
 
@@ -26,9 +26,15 @@ class EntityMention(SQLModel, table=True):
     confidence: float = Field(default=1.0)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
-    # Define a unique constraint
+    # Define a unique constraint, plus an index for joining an entity's
+    # mentions to their articles
     __table_args__ = (
         UniqueConstraint("canonical_entity_id", "entity_id", name="uix_entity_mention"),
+        Index(
+            "ix_entity_mentions_canonical_entity_id_article_id",
+            "canonical_entity_id",
+            "article_id",
+        ),
         {"extend_existing": True},
     )
 
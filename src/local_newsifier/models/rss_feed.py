@@ -19,6 +19,16 @@ class RSSFeed(SQLModel, table=True):
     description: Optional[str] = None
     is_active: bool = Field(default=True)
     last_fetched_at: Optional[datetime] = None
+    # Validators from the last fetch, for conditional requests
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    # Adaptive polling: observed seconds between items, fraction of recent
+    # fetches that were unchanged, current poll interval and next poll time
+    publish_interval_seconds: Optional[float] = None
+    not_modified_rate: float = Field(default=0.0)
+    fetch_interval_seconds: Optional[float] = None
+    next_fetch_at: Optional[datetime] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -35,7 +45,7 @@ class RSSFeedProcessingLog(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     feed_id: int = Field(foreign_key="rss_feeds.id", index=True)
-    status: str = Field(index=True)  # success, error, etc.
+    status: str = Field(index=True)  # success, not_modified, error, etc.
     articles_found: int = Field(default=0)
     articles_added: int = Field(default=0)
     error_message: Optional[str] = None
@@ -97,6 +97,9 @@ class EntityBatchTrackingState(BaseState):
     status: TrackingStatus = Field(default=TrackingStatus.INITIALIZED)
     failure_status: TrackingStatus = TrackingStatus.FAILED
     status_filter: str = Field(default="analyzed")
+    batch_size: int = Field(default=50, ge=1)
+    n_process: int = Field(default=1)
+    page_size: int = Field(default=500, ge=1)
     processed_articles: List[Dict[str, Any]] = Field(default_factory=list)
     total_articles: int = 0
     processed_count: int = 0
@@ -109,6 +112,9 @@ class EntityBatchTrackingState(BaseState):
                 "run_id": "123e4567-e89b-12d3-a456-426614174000",
                 "status": "INITIALIZED",
                 "status_filter": "analyzed",
+                "batch_size": 50,
+                "n_process": 1,
+                "page_size": 500,
                 "processed_articles": [],
                 "total_articles": 0,
                 "processed_count": 0,
@@ -114,9 +114,9 @@ class AnalysisService:
             Dictionary mapping time periods to lists of headlines
         """
 
-        # Get all articles in the date range
-        articles = self.article_crud.get_by_date_range(
-            session, start_date=start_date, end_date=end_date
+        # Stream the articles in the date range, loading only what grouping needs
+        articles = self.article_crud.iter_by_date_range(
+            session, start_date=start_date, end_date=end_date, columns=["title", "published_at"]
         )
 
         # Group by time interval
@@ -173,17 +173,25 @@ class AnalysisService:
             else:
                 start_date = end_date - timedelta(days=90)
 
-            # Get entities in the time range
-            entities = self.entity_crud.get_by_date_range_and_types(
-                session, start_date=start_date, end_date=end_date, entity_types=entity_types
+            # Stream entities in the time range, paged and without unused columns
+            entities = self.entity_crud.iter_by_date_range_and_types(
+                session,
+                start_date=start_date,
+                end_date=end_date,
+                entity_types=entity_types,
+                columns=["id", "article_id", "text", "entity_type"],
             )
 
-            # Get articles in the time range
-            articles = self.article_crud.get_by_date_range(
-                session, start_date=start_date, end_date=end_date
+            # Stream articles in the time range; trend evidence never needs the body
+            articles = self.article_crud.iter_by_date_range(
+                session,
+                start_date=start_date,
+                end_date=end_date,
+                columns=["id", "url", "title", "published_at"],
             )
 
-            # Detect trends using the consolidated trend analyzer
+            # Detect trends using the consolidated trend analyzer, which
+            # aggregates each stream in a single pass
             trends = trend_analyzer.detect_entity_trends(
                 entities=entities,
                 articles=articles,
@@ -0,0 +1,501 @@
+"""Two-phase import of Apify datasets into articles.
+
+First the dataset's raw items are staged into ``apify_dataset_items``, a
+page at a time with multi-row INSERTs, each page committed together with
+its job's offset checkpoint. Memory stays flat however large a crawl is,
+and an interrupted download resumes after the last committed page.
+
+Then staged items are transformed into articles in chunks, tracked by their
+``transformed`` flag. Each chunk is deduplicated against existing articles
+with one bulk URL query and committed on its own, so several workers can
+transform one job, and skipped items can be transformed again after a
+mapping fix without fetching from Apify. A chunk that fails on its data is
+split in half until the failing items are found; those are marked
+transformed with their error and the rest of the chunk is committed, so one
+bad item cannot block the dataset. Operational database errors such as
+deadlocks or lost connections abort the transform to be retried instead.
+"""
+
+import logging
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+from local_newsifier.config.settings import settings
+from local_newsifier.crud.apify_dataset_item import apify_dataset_item as apify_dataset_item_crud
+from local_newsifier.crud.article import article as article_crud
+from local_newsifier.models.apify import ApifyDatasetItem, ApifyJob
+from local_newsifier.models.article import Article
+from local_newsifier.tools.near_duplicates import get_near_duplicate_detector
+
+logger = logging.getLogger(__name__)
+
+# Number of would-be articles kept for display in dry runs
+PREVIEW_SIZE = 5
+
+
+def _content_of(item: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """Get an item's article text and the field it came from."""
+    for field in ("text", "markdown", "content", "body"):
+        if item.get(field):
+            return item[field], field
+    metadata = item.get("metadata") or {}
+    if metadata.get("description"):
+        return metadata["description"], "metadata.description"
+    return "", None
+
+
+def _published_at(item: Dict[str, Any]) -> datetime:
+    """Get an item's publication date, defaulting to now."""
+    pub_str = (item.get("metadata") or {}).get("publishedAt")
+    if isinstance(pub_str, str):
+        try:
+            return datetime.fromisoformat(pub_str.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            pass  # Use default if parsing fails
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ApifyDatasetImporter:
+    """Stages an Apify dataset's items and transforms them into articles."""
+
+    def __init__(
+        self,
+        session: Session,
+        apify_service,
+        page_size: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        min_content_length: int = 500,
+        source_name: str = "apify",
+        require_title: bool = False,
+        force: bool = False,
+        near_duplicate_detector=None,
+    ):
+        """Initialize the importer.
+
+        Args:
+            session: Database session
+            apify_service: ApifyService whose client reads the dataset
+            page_size: Items fetched per request; defaults to
+                settings.APIFY_DATASET_PAGE_SIZE
+            chunk_size: Staged items transformed per transaction; defaults to
+                settings.APIFY_TRANSFORM_CHUNK_SIZE
+            min_content_length: Items with shorter text are skipped
+            source_name: Source for items that don't name one
+            require_title: Skip items without a title
+            force: Don't skip items whose URL already has an article
+            near_duplicate_detector: Detector marking syndicated copies;
+                defaults to one configured by settings
+        """
+        self.session = session
+        self.apify_service = apify_service
+        self.page_size = page_size or settings.APIFY_DATASET_PAGE_SIZE
+        self.chunk_size = chunk_size or settings.APIFY_TRANSFORM_CHUNK_SIZE
+        self.min_content_length = min_content_length
+        self.source_name = source_name
+        self.require_title = require_title
+        self.force = force
+        self.near_duplicate_detector = (
+            near_duplicate_detector
+            if near_duplicate_detector is not None
+            else get_near_duplicate_detector()
+        )
+
+    def get_job(
+        self,
+        dataset_id: str,
+        run_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        create: bool = True,
+    ) -> Optional[ApifyJob]:
+        """Get the job holding a dataset's import checkpoint.
+
+        Args:
+            dataset_id: Apify dataset ID
+            run_id: Apify run that produced the dataset, if known
+            actor_id: Actor of the run, if known
+            create: Create the job if there is none
+
+        Returns:
+            The latest job for the dataset (and run), or None if there is none
+            and create is False
+        """
+        query = select(ApifyJob).where(ApifyJob.dataset_id == dataset_id)
+        if run_id:
+            query = query.where(ApifyJob.run_id == run_id)
+        job = self.session.exec(query.order_by(ApifyJob.id.desc())).first()
+        if job is None and create:
+            job = self.new_job(dataset_id, run_id=run_id, actor_id=actor_id)
+        return job
+
+    def new_job(
+        self, dataset_id: str, run_id: Optional[str] = None, actor_id: Optional[str] = None
+    ) -> ApifyJob:
+        """Create a job to import a dataset from the start.
+
+        Args:
+            dataset_id: Apify dataset ID
+            run_id: Apify run that produced the dataset, if known
+            actor_id: Actor of the run, if known
+
+        Returns:
+            The new job
+        """
+        job = ApifyJob(
+            run_id=run_id or "unknown",
+            actor_id=actor_id or "unknown",
+            status="SUCCEEDED",
+            dataset_id=dataset_id,
+        )
+        self.session.add(job)
+        self.session.commit()
+        return job
+
+    def iter_pages(self, dataset_id: str, offset: int = 0) -> Iterator[Tuple[int, List[Dict]]]:
+        """Read a dataset page by page.
+
+        Args:
+            dataset_id: Apify dataset ID
+            offset: Index of the first item to read
+
+        Yields:
+            (offset, items) for each non-empty page
+        """
+        dataset = self.apify_service.client.dataset(dataset_id)
+        while True:
+            items = list(dataset.list_items(offset=offset, limit=self.page_size).items or [])
+            if items:
+                yield offset, items
+            if len(items) < self.page_size:
+                return
+            offset += len(items)
+
+    def _article_from_item(self, item: Dict[str, Any]) -> Tuple[Optional[Article], Optional[str]]:
+        """Build an article from a dataset item.
+
+        Returns:
+            (article, None), or (None, reason) if the item is skipped
+        """
+        url = item.get("url", "")
+        if not url:
+            return None, "no_url"
+
+        title = item.get("title", "") or (item.get("metadata") or {}).get("title", "")
+        if self.require_title and not title:
+            return None, "no_title"
+
+        content, _ = _content_of(item)
+        if len(content) < self.min_content_length:
+            return None, "short_content"
+
+        return (
+            Article(
+                url=url,
+                title=title,
+                content=content,
+                source=item.get("source", self.source_name),
+                published_at=_published_at(item),
+                status="published",
+                scraped_at=datetime.now(UTC).replace(tzinfo=None),
+            ),
+            None,
+        )
+
+    def _build_articles(
+        self, raw_items: List[Dict[str, Any]], seen: Set[str]
+    ) -> List[Tuple[Optional[Article], Optional[str]]]:
+        """Build articles from raw items, with one bulk query for stored URLs.
+
+        Args:
+            raw_items: Raw dataset items
+            seen: URLs already taken by this import; new URLs are added
+
+        Returns:
+            (article, None) or (None, skip reason) for each item
+        """
+        built = [self._article_from_item(item) for item in raw_items]
+        existing = set()
+        if not self.force:
+            existing = article_crud.existing_urls(
+                self.session, urls=[a.url for a, _ in built if a is not None]
+            )
+
+        results = []
+        for new_article, reason in built:
+            if new_article is not None:
+                if new_article.url in seen or new_article.url in existing:
+                    new_article, reason = None, "duplicate"
+                else:
+                    seen.add(new_article.url)
+            results.append((new_article, reason))
+        return results
+
+    def _new_stats(self, start: int = 0) -> Dict[str, Any]:
+        """Get empty import statistics."""
+        return {
+            "start_offset": start,
+            "offset": start,
+            "items": 0,
+            "created": 0,
+            "near_duplicates": 0,
+            "skipped": {
+                "no_url": 0,
+                "no_title": 0,
+                "short_content": 0,
+                "duplicate": 0,
+                "error": 0,
+            },
+            "preview": [],
+            "error": None,
+        }
+
+    def _record_error(self, job: ApifyJob, message: str) -> None:
+        """Roll back the failed chunk or page and record the error on the job."""
+        self.session.rollback()
+        job.error_message = message
+        self.session.add(job)
+        self.session.commit()
+
+    def stage_dataset(self, dataset_id: str, job: ApifyJob) -> Dict[str, Any]:
+        """Copy a dataset's raw items into apify_dataset_items, resuming from the checkpoint.
+
+        Each page is inserted with multi-row INSERTs and committed together
+        with the job's new dataset_offset. Once every page is staged the
+        job's item_count is set, and later calls don't fetch the dataset.
+
+        Args:
+            dataset_id: Apify dataset ID
+            job: Job the items are staged for
+
+        Returns:
+            Import statistics with the items staged and the final offset
+        """
+        stats = self._new_stats(job.dataset_offset)
+        if job.item_count is not None:
+            return stats
+
+        if stats["start_offset"]:
+            logger.info(f"Resuming dataset {dataset_id} at item {stats['start_offset']}")
+        try:
+            for offset, items in self.iter_pages(dataset_id, stats["start_offset"]):
+                stats["items"] += apify_dataset_item_crud.stage(
+                    self.session, job_id=job.id, items=items, offset=offset
+                )
+                stats["offset"] = offset + len(items)
+                job.dataset_offset = stats["offset"]
+                self.session.add(job)
+                self.session.commit()
+                logger.debug(f"Staged dataset {dataset_id} items {offset}-{stats['offset']}")
+        except Exception as e:
+            stats["error"] = str(e)
+            logger.error(
+                f"Error staging dataset {dataset_id} at item {stats['offset']}: {e}", exc_info=True
+            )
+            self._record_error(job, str(e))
+            return stats
+
+        job.item_count = stats["offset"]
+        self.session.add(job)
+        self.session.commit()
+        return stats
+
+    def _transform_chunk(self, items: List[ApifyDatasetItem], stats: Dict[str, Any]) -> int:
+        """Create the articles of a chunk of staged items, without committing.
+
+        Returns:
+            Number of articles created
+        """
+        built = self._build_articles([item.raw_data or {} for item in items], set())
+        new_articles = []
+        for item, (new_article, reason) in zip(items, built):
+            item.transformed = True
+            item.error_message = reason
+            if new_article is None:
+                stats["skipped"][reason] += 1
+            else:
+                new_articles.append((item, new_article))
+
+        self.session.add_all(new_article for _, new_article in new_articles)
+        self.session.flush()
+        for item, new_article in new_articles:
+            item.article_id = new_article.id
+        self.session.add_all(items)
+
+        if new_articles and self.near_duplicate_detector is not None:
+            stats["near_duplicates"] += self.near_duplicate_detector.check_many(
+                self.session, [new_article for _, new_article in new_articles]
+            )
+        stats["created"] += len(new_articles)
+        return len(new_articles)
+
+    def _commit_chunk(
+        self, job_id: int, items: List[ApifyDatasetItem], stats: Dict[str, Any]
+    ) -> None:
+        """Transform a claimed chunk and commit it with the job's articles_created.
+
+        The chunk's statistics are added to stats only once it is committed.
+        """
+        chunk_stats = self._new_stats()
+        created = self._transform_chunk(items, chunk_stats)
+        self.session.execute(
+            update(ApifyJob)
+            .where(ApifyJob.id == job_id)
+            .values(articles_created=func.coalesce(ApifyJob.articles_created, 0) + created)
+        )
+        self.session.commit()
+
+        stats["created"] += chunk_stats["created"]
+        stats["near_duplicates"] += chunk_stats["near_duplicates"]
+        for reason, count in chunk_stats["skipped"].items():
+            stats["skipped"][reason] += count
+
+    def _transform_claimed(
+        self, job_id: int, items: List[ApifyDatasetItem], stats: Dict[str, Any]
+    ) -> None:
+        """Commit a claimed chunk, splitting it to isolate items that fail.
+
+        Raises:
+            OperationalError: If the database fails in a way unrelated to the items
+        """
+        ids = [item.id for item in items]
+        try:
+            self._commit_chunk(job_id, items, stats)
+            return
+        except OperationalError:
+            raise
+        except Exception as e:
+            self.session.rollback()
+            error = e
+
+        if len(ids) == 1:
+            # Rolling back released the lock; another worker may have taken the item
+            failed = apify_dataset_item_crud.claim_untransformed(
+                self.session, job_id=job_id, limit=1, ids=ids
+            )
+            if failed:
+                logger.warning(f"Skipping dataset item {ids[0]} of job {job_id}: {error}")
+                failed[0].transformed = True
+                failed[0].error_message = f"error: {error}"
+                self.session.add(failed[0])
+                self.session.commit()
+                stats["skipped"]["error"] += 1
+            return
+
+        middle = len(ids) // 2
+        for half in (ids[:middle], ids[middle:]):
+            claimed = apify_dataset_item_crud.claim_untransformed(
+                self.session, job_id=job_id, limit=len(half), ids=half
+            )
+            if claimed:
+                self._transform_claimed(job_id, claimed, stats)
+
+    def transform_items(self, job: ApifyJob) -> Dict[str, Any]:
+        """Turn a job's staged items into articles, a committed chunk at a time.
+
+        Each chunk is claimed with row locks that concurrent workers skip, and
+        committed together with its items' transformed flags and the job's
+        articles_created, so a transform can run on several workers at once
+        and be rerun safely. Items that fail are marked with their error and
+        skipped. The job is marked processed once its dataset is fully staged
+        and no untransformed items remain.
+
+        Args:
+            job: Job whose items to transform
+
+        Returns:
+            Import statistics with the articles created and skip reasons
+        """
+        stats = self._new_stats(job.dataset_offset)
+        job_id = job.id
+        try:
+            while True:
+                items = apify_dataset_item_crud.claim_untransformed(
+                    self.session, job_id=job_id, limit=self.chunk_size
+                )
+                if not items:
+                    break
+                self._transform_claimed(job_id, items, stats)
+        except Exception as e:
+            stats["error"] = str(e)
+            logger.error(f"Error transforming items of job {job_id}: {e}", exc_info=True)
+            self._record_error(job, str(e))
+            return stats
+
+        if job.item_count is not None and not apify_dataset_item_crud.count_untransformed(
+            self.session, job_id=job_id
+        ):
+            job.error_message = None
+            job.processed = True
+            job.processed_at = datetime.now(UTC).replace(tzinfo=None)
+            self.session.add(job)
+            self.session.commit()
+        return stats
+
+    def reset_skipped(self, job: ApifyJob) -> int:
+        """Queue a job's skipped items to be transformed again, without refetching.
+
+        Returns:
+            Number of items reset
+        """
+        count = apify_dataset_item_crud.reset_skipped(self.session, job_id=job.id)
+        if count:
+            job.processed = False
+            self.session.add(job)
+            self.session.commit()
+        return count
+
+    def _preview(self, dataset_id: str) -> Dict[str, Any]:
+        """Count what a dataset would create, without saving anything."""
+        stats = self._new_stats()
+        seen = set()
+        try:
+            for offset, items in self.iter_pages(dataset_id):
+                for new_article, reason in self._build_articles(items, seen):
+                    if new_article is None:
+                        stats["skipped"][reason] += 1
+                        continue
+                    stats["created"] += 1
+                    if len(stats["preview"]) < PREVIEW_SIZE:
+                        stats["preview"].append(new_article)
+                stats["items"] += len(items)
+                stats["offset"] = offset + len(items)
+        except Exception as e:
+            stats["error"] = str(e)
+        return stats
+
+    def import_dataset(
+        self, dataset_id: str, job: Optional[ApifyJob] = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """Import a dataset: stage its raw items, then transform them into articles.
+
+        Both phases resume where an earlier run stopped; a dataset that is
+        already staged is not fetched again. Progress and errors are
+        recorded on the job.
+
+        Args:
+            dataset_id: Apify dataset ID
+            job: Job to stage the items for; only optional for dry runs
+            dry_run: Count what would be created without saving anything
+
+        Returns:
+            Dict with items staged, articles created, skip reasons, near
+            duplicates, the final offset, a preview of articles for dry runs
+            and any error
+
+        Raises:
+            ValueError: If there is no job and this is not a dry run
+        """
+        if dry_run:
+            return self._preview(dataset_id)
+        if job is None:
+            raise ValueError("A job is required to stage a dataset")
+
+        stats = self.stage_dataset(dataset_id, job)
+        if stats["error"] is None:
+            transformed = self.transform_items(job)
+            for key in ("created", "near_duplicates", "skipped", "error"):
+                stats[key] = transformed[key]
+        return stats
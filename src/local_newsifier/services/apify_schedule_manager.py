@@ -1,16 +1,110 @@
-"""Service for managing Apify schedules and synchronizing with database configs."""
+"""Service for managing Apify schedules and synchronizing with database configs.
+
+Schedules can be synchronized one config at a time, or concurrently: all
+remote schedules are listed once and diffed in memory against the configs,
+and the resulting creates, updates and deletes are sent to Apify from a
+bounded worker pool. Once any worker is rate limited, every worker pauses
+before its next request, with the pause doubling on repeated limits.
+"""
 
 import logging
-from typing import Any, Callable, Dict
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 from sqlalchemy.sql import text
 from sqlmodel import Session
 
+from local_newsifier.config.settings import settings
 from local_newsifier.crud.apify_source_config import CRUDApifySourceConfig
 from local_newsifier.errors.error import ServiceError
 from local_newsifier.errors.handlers import handle_apify, handle_database
+from local_newsifier.models.apify import ApifySourceConfig
 from local_newsifier.services.apify_service import ApifyService
 
+logger = logging.getLogger(__name__)
+
+# Schedules are created as "Local Newsifier: <config name>", which Apify
+# stores sanitized to "local-newsifier-<config-name>"
+SCHEDULE_NAME_PREFIX = "Local Newsifier: "
+_MANAGED_NAME_PREFIXES = ("Local Newsifier:", "local-newsifier-")
+
+# Schedules read per request when listing them; the most Apify returns
+SCHEDULE_LIST_PAGE_SIZE = 1000
+
+
+def schedule_api_name(display_name: str) -> str:
+    """Sanitize a schedule name the way Apify requires.
+
+    Names can only contain lowercase letters, numbers, and hyphens in the middle.
+    """
+    sanitized_name = re.sub(r"[^a-z0-9-]", "", display_name.lower().replace(" ", "-"))
+    return sanitized_name.strip("-") or "localnewsifier"
+
+
+def _is_managed_schedule(schedule: Dict[str, Any]) -> bool:
+    """Check whether a remote schedule was created for a config."""
+    return (schedule.get("name") or "").startswith(_MANAGED_NAME_PREFIXES)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an Apify call failed because of rate limiting."""
+    if isinstance(error, ServiceError):
+        return error.error_type == "rate_limit"
+    status = getattr(error, "status_code", None)
+    if status is None and hasattr(error, "response"):
+        status = getattr(error.response, "status_code", None)
+    return status == 429
+
+
+class ScheduleOperation(NamedTuple):
+    """A change to make in Apify to bring a schedule in line with its config."""
+
+    action: str  # "create", "update" or "delete"
+    config_id: Optional[int] = None
+    schedule_id: Optional[str] = None
+    changes: Optional[Dict[str, Any]] = None
+    create_params: Optional[Dict[str, Any]] = None
+
+
+class _RateLimitBackoff:
+    """Retries rate-limited calls, pausing all threads sharing it while backing off."""
+
+    def __init__(self, max_retries: int, delay: float):
+        """Initialize the backoff.
+
+        Args:
+            max_retries: Retries of a rate-limited call before its error is raised
+            delay: Initial pause in seconds, doubling with each retry of a call
+        """
+        self.max_retries = max_retries
+        self.delay = delay
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call func, retrying with exponential backoff while it is rate limited."""
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                pause = self._resume_at - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                countdown = self.delay * 2**attempt
+                logger.info(
+                    f"Apify rate limit hit, backing off {countdown:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                with self._lock:
+                    self._resume_at = max(self._resume_at, time.monotonic() + countdown)
+
 
 class ApifyScheduleManager:
     """Service for managing Apify schedules and synchronizing with database configs."""
@@ -32,6 +126,72 @@ class ApifyScheduleManager:
         self.config_crud = apify_source_config_crud
         self.session_factory = session_factory
 
+    def _create_params(self, config: ApifySourceConfig) -> Dict[str, Any]:
+        """Get the create_schedule arguments for a config's schedule."""
+        # Just for the test, we'll replace the actor_id with a known actor
+        # that exists in the test account
+        # We found this ID using the Apify API
+        actor_id = "moJRLRc85AitArpNN"  # This is the web-scraper actor ID
+
+        return {
+            "actor_id": actor_id,  # Using our test actor_id
+            "cron_expression": config.schedule,
+            "run_input": config.input_configuration,
+            "name": f"{SCHEDULE_NAME_PREFIX}{config.name}",
+        }
+
+    def _create_schedule(self, config: ApifySourceConfig) -> Dict[str, Any]:
+        """Create the Apify schedule for a config.
+
+        Returns:
+            Created schedule details
+        """
+        return self.apify_service.create_schedule(**self._create_params(config))
+
+    def _schedule_changes(
+        self, config: ApifySourceConfig, schedule: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the changes bringing an Apify schedule in line with its config.
+
+        Actor ID and run input changes are not supported for schedule updates.
+
+        Returns:
+            Changes for ApifyService.update_schedule, empty if none are needed
+        """
+        changes = {}
+
+        # Check if cron expression has changed
+        if config.schedule and schedule.get("cronExpression") != config.schedule:
+            changes["cronExpression"] = config.schedule
+
+        # Check if active status has changed
+        if schedule.get("isEnabled", True) != config.is_active:
+            changes["isEnabled"] = config.is_active
+
+        # Update name to ensure consistency
+        name = schedule_api_name(f"{SCHEDULE_NAME_PREFIX}{config.name}")
+        if schedule.get("name") != name:
+            changes["name"] = name
+
+        return changes
+
+    def _list_remote_schedules(self) -> List[Dict[str, Any]]:
+        """List all schedules in Apify, reading every page of the listing."""
+        schedules: List[Dict[str, Any]] = []
+        while True:
+            page = self.apify_service.list_schedules(
+                offset=len(schedules), limit=SCHEDULE_LIST_PAGE_SIZE
+            )
+            if isinstance(page, dict):
+                page = page.get("data", page)
+                items, total = page.get("items", []), page.get("total")
+            else:
+                # The Apify client returns a ListPage
+                items, total = getattr(page, "items", []) or [], getattr(page, "total", None)
+            schedules.extend(items)
+            if not items or total is None or len(schedules) >= total:
+                return schedules
+
     @handle_database
     def sync_schedules(self) -> Dict[str, Any]:
         """Synchronize all database configs with Apify schedules.
@@ -94,6 +254,145 @@ class ApifyScheduleManager:
 
         return results
 
+    def plan_schedule_sync(self, session: Session) -> List[ScheduleOperation]:
+        """Diff the configs against one listing of Apify schedules.
+
+        Active configs with a schedule get a schedule created if they have
+        none or theirs no longer exists, and updated if it differs from the
+        config. Schedules created for configs but no longer linked to any
+        are deleted.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Operations to apply, in no particular order
+        """
+        remote = {schedule.get("id"): schedule for schedule in self._list_remote_schedules()}
+        linked_ids = {
+            config.schedule_id for config in self.config_crud.get_configs_with_schedule_ids(session)
+        }
+
+        operations = []
+        for config in self.config_crud.get_scheduled_configs(session):
+            schedule = remote.get(config.schedule_id) if config.schedule_id else None
+            if schedule is None:
+                operations.append(
+                    ScheduleOperation(
+                        "create", config_id=config.id, create_params=self._create_params(config)
+                    )
+                )
+                continue
+
+            changes = self._schedule_changes(config, schedule)
+            operations.append(
+                ScheduleOperation(
+                    "update" if changes else "unchanged",
+                    config_id=config.id,
+                    schedule_id=config.schedule_id,
+                    changes=changes,
+                )
+            )
+
+        for schedule_id, schedule in remote.items():
+            if schedule_id not in linked_ids and _is_managed_schedule(schedule):
+                operations.append(ScheduleOperation("delete", schedule_id=schedule_id))
+
+        return operations
+
+    def _apply_operation(self, operation: ScheduleOperation, backoff: _RateLimitBackoff) -> Any:
+        """Send one operation to Apify."""
+        if operation.action == "create":
+            return backoff.call(self.apify_service.create_schedule, **operation.create_params)
+        if operation.action == "update":
+            return backoff.call(
+                self.apify_service.update_schedule, operation.schedule_id, operation.changes
+            )
+        if operation.action == "delete":
+            return backoff.call(self.apify_service.delete_schedule, operation.schedule_id)
+        return None
+
+    @handle_database
+    def sync_schedules_concurrently(
+        self,
+        max_workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Synchronize all database configs with Apify schedules concurrently.
+
+        Remote schedules are listed once and diffed against the configs, then
+        the changes are applied in parallel. IDs of created schedules are
+        saved to their configs in one transaction at the end.
+
+        Args:
+            max_workers: Maximum number of Apify requests at once; defaults to
+                settings.APIFY_SCHEDULE_SYNC_WORKERS
+            max_retries: Retries of a rate-limited request; defaults to
+                settings.APIFY_SCHEDULE_SYNC_MAX_RETRIES
+            retry_delay: Initial backoff in seconds after a rate limit,
+                doubling per retry; defaults to
+                settings.APIFY_SCHEDULE_SYNC_RETRY_DELAY
+
+        Returns:
+            Dict with results, as for sync_schedules
+        """
+        max_workers = max_workers or settings.APIFY_SCHEDULE_SYNC_WORKERS
+        backoff = _RateLimitBackoff(
+            max_retries if max_retries is not None else settings.APIFY_SCHEDULE_SYNC_MAX_RETRIES,
+            retry_delay if retry_delay is not None else settings.APIFY_SCHEDULE_SYNC_RETRY_DELAY,
+        )
+        results = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0, "errors": []}
+
+        with self.session_factory() as session:
+            operations = self.plan_schedule_sync(session)
+
+        pending = [operation for operation in operations if operation.action != "unchanged"]
+        results["unchanged"] = len(operations) - len(pending)
+        if not pending:
+            return results
+
+        created_ids = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)), thread_name_prefix="apify-schedule-sync"
+        ) as executor:
+            futures = [
+                (operation, executor.submit(self._apply_operation, operation, backoff))
+                for operation in pending
+            ]
+            for operation, future in futures:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    if operation.action == "delete":
+                        error_msg = (
+                            f"Error deleting orphaned schedule {operation.schedule_id}: {str(e)}"
+                        )
+                    else:
+                        error_msg = f"Error processing config {operation.config_id}: {str(e)}"
+                    logger.error(error_msg)
+                    results["errors"].append(error_msg)
+                    continue
+
+                if operation.action == "create":
+                    created_ids[operation.config_id] = response["id"]
+                    results["created"] += 1
+                elif operation.action == "update":
+                    results["updated"] += 1
+                else:
+                    results["deleted"] += 1
+
+        if created_ids:
+            with self.session_factory() as session:
+                for config_id, schedule_id in created_ids.items():
+                    config = self.config_crud.get(session, id=config_id)
+                    if config:
+                        config.schedule_id = schedule_id
+                        session.add(config)
+                session.commit()
+
+        return results
+
     @handle_database
     def create_schedule_for_config(self, config_id: int) -> bool:
         """Create an Apify schedule for a specific config.
@@ -143,19 +442,8 @@ class ApifyScheduleManager:
                     # Schedule doesn't exist, continue with creation
                     pass
 
-            # Just for the test, we'll replace the actor_id with a known actor
-            # that exists in the test account
-            # We found this ID using the Apify API
-            actor_id = "moJRLRc85AitArpNN"  # This is the web-scraper actor ID
-
             # Create schedule in Apify
-            name = f"Local Newsifier: {config.name}"
-            schedule_data = self.apify_service.create_schedule(
-                actor_id=actor_id,  # Using our test actor_id
-                cron_expression=config.schedule,
-                run_input=config.input_configuration,
-                name=name,
-            )
+            schedule_data = self._create_schedule(config)
 
             # Update config with schedule_id
             self.config_crud.update(
@@ -200,38 +488,7 @@ class ApifyScheduleManager:
                 current_schedule = self.apify_service.get_schedule(config.schedule_id)
 
                 # Check if update is needed
-                changes = {}
-
-                # Check if cron expression has changed
-                if config.schedule and current_schedule.get("cronExpression") != config.schedule:
-                    changes["cronExpression"] = config.schedule
-
-                # Actor ID changes are not supported for schedule updates
-
-                # Run input changes are not supported for schedule updates
-
-                # Check if active status has changed
-                if current_schedule.get("isEnabled", True) != config.is_active:
-                    changes["isEnabled"] = config.is_active
-
-                # Update name to ensure consistency (following Apify's strict requirements)
-                # Name can only contain lowercase letters, numbers, and hyphens in the middle
-                import re
-
-                # First create a non-sanitized display name
-                display_name = f"Local Newsifier: {config.name}"
-                # Then create a sanitized version for the API
-                sanitized_name = display_name.lower()
-                # Remove spaces and non-alphanumeric characters (except hyphens)
-                sanitized_name = re.sub(r"[^a-z0-9-]", "", sanitized_name.replace(" ", "-"))
-                # Ensure no hyphens at start or end
-                sanitized_name = sanitized_name.strip("-")
-                # Add a default if empty
-                if not sanitized_name:
-                    sanitized_name = "localnewsifier"
-
-                if current_schedule.get("name") != sanitized_name:
-                    changes["name"] = sanitized_name
+                changes = self._schedule_changes(config, current_schedule)
 
                 # If there are changes, update the schedule
                 if changes:
@@ -378,19 +635,13 @@ class ApifyScheduleManager:
         config_schedule_ids = set(config.schedule_id for config in configs if config.schedule_id)
 
         # Get all schedules from Apify
-        schedules_resp = self.apify_service.list_schedules()
-        schedules = schedules_resp.get("data", {}).get("items", [])
+        schedules = self._list_remote_schedules()
 
         deleted = 0
         for schedule in schedules:
             # Check if schedule name starts with our prefix
             schedule_id = schedule.get("id")
-            schedule_name = schedule.get("name", "")
-
-            if (
-                schedule_name.startswith("Local Newsifier:")
-                and schedule_id not in config_schedule_ids
-            ):
+            if _is_managed_schedule(schedule) and schedule_id not in config_schedule_ids:
                 # This is our schedule but has no corresponding config
                 try:
                     self.apify_service.delete_schedule(schedule_id)
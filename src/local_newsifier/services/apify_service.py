@@ -276,11 +276,18 @@ class ApifyService:
         # Make the actual API call
         return self.client.schedule(schedule_id).get()
 
-    def list_schedules(self, actor_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_schedules(
+        self,
+        actor_id: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """List all schedules or those for a specific actor.
 
         Args:
             actor_id: Optional actor ID to filter schedules by
+            offset: Number of schedules to skip, for paging through the list
+            limit: Maximum number of schedules to return
 
         Returns:
             Dict[str, Any]: Dictionary containing a list of schedules
@@ -322,7 +329,10 @@ class ApifyService:
                             "modifiedAt": datetime.now(timezone.utc).isoformat(),
                         }
                     )
-            return {"data": {"items": schedules, "total": len(schedules)}}
+            total = len(schedules)
+            start = offset or 0
+            schedules = schedules[start : start + limit if limit else None]
+            return {"data": {"items": schedules, "total": total}}
 
         # Prepare filter parameters if needed
         filter_by = None
@@ -333,7 +343,7 @@ class ApifyService:
 
         # Make the actual API call
         schedules_client = self.client.schedules()
-        return schedules_client.list(filter_by=filter_by)
+        return schedules_client.list(filter_by=filter_by, offset=offset, limit=limit)
 
     def _format_error(self, error: Exception, context: str = "") -> str:
         """Format an error with traceback and context.
@@ -3,9 +3,12 @@
 This implementation follows a simple idempotent design:
 1. Receive webhook
 2. Store it (idempotently using database constraints)
-3. Process dataset if successful
+3. Queue the dataset import if successful
 4. Return status
 
+The import itself runs in a Celery worker (see import_run), so webhooks are
+acknowledged without waiting for the dataset to download.
+
 Note: While maintaining the simplified structure, we've restored error handling
 decorators for consistency with the rest of the codebase and to ensure proper
 error classification and logging.
@@ -14,16 +17,14 @@ error classification and logging.
 import hashlib
 import hmac
 import logging
-from datetime import UTC, datetime
 from typing import Dict, Optional
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from local_newsifier.crud.article import article
 from local_newsifier.errors.handlers import handle_apify, handle_database
-from local_newsifier.models.apify import ApifyWebhookRaw
-from local_newsifier.models.article import Article
+from local_newsifier.models.apify import ApifyJob, ApifyWebhookRaw
+from local_newsifier.services.apify_dataset_importer import ApifyDatasetImporter
 from local_newsifier.services.apify_service import ApifyService
 
 logger = logging.getLogger(__name__)
@@ -73,7 +74,7 @@ class ApifyWebhookService:
         1. Validate signature (if configured)
         2. Extract required fields
         3. Store webhook (let DB handle duplicates)
-        4. Process dataset if successful run
+        4. Queue dataset import if successful run
         5. Return result
 
         Args:
@@ -131,22 +132,22 @@ class ApifyWebhookService:
             self.session.rollback()
             logger.info(f"Duplicate webhook ignored: run_id={run_id}, status={status}")
 
-        # Process dataset only for new successful runs
-        articles_created = 0
+        # Queue the dataset import only for new successful runs; the import
+        # runs in a worker so the webhook is acknowledged straight away
+        job_id = None
+        import_queued = False
         if webhook_saved and status == "SUCCEEDED" and dataset_id:
-            try:
-                articles_created = self._create_articles_from_dataset(dataset_id)
-                logger.info(f"Articles created: dataset_id={dataset_id}, count={articles_created}")
-            except Exception as e:
-                # Log error but don't fail the webhook
-                logger.error(
-                    f"Failed to create articles: dataset_id={dataset_id}, error={str(e)}",
-                    exc_info=True,
-                )
+            job = ApifyDatasetImporter(self.session, self.apify_service).get_job(
+                dataset_id, run_id=run_id, actor_id=actor_id
+            )
+            job_id = job.id
+            import_queued = self._enqueue_import(job)
 
         # Build response message
-        if webhook_saved:
-            message = f"Webhook processed. Articles created: {articles_created}"
+        if import_queued:
+            message = "Webhook accepted. Dataset import queued"
+        elif webhook_saved:
+            message = "Webhook accepted"
         else:
             message = "Duplicate webhook ignored"
 
@@ -155,128 +156,124 @@ class ApifyWebhookService:
             "run_id": run_id,
             "actor_id": actor_id,
             "dataset_id": dataset_id,
-            "articles_created": articles_created,
+            "articles_created": 0,
+            "job_id": job_id,
+            "import_queued": import_queued,
             "is_new": webhook_saved,
             "message": message,
         }
 
-    def _create_articles_from_dataset(self, dataset_id: str) -> int:
-        """Create articles from Apify dataset.
+    def _enqueue_import(self, job: ApifyJob) -> bool:
+        """Queue the import of a job's dataset.
 
-        Simplified implementation:
-        1. Fetch dataset items
-        2. For each item with required fields, create article
-        3. Skip duplicates based on URL
-        4. Return count of created articles
-
-        Args:
-            dataset_id: Apify dataset ID
+        The Celery task ID is derived from the run ID, so a run is imported
+        by at most one task at a time.
 
         Returns:
-            Number of articles created
+            True if the task was queued
         """
+        # Import here to avoid circular dependencies
+        from local_newsifier.tasks import import_apify_dataset
+
         try:
-            # Fetch dataset items
-            logger.info(f"Fetching dataset: {dataset_id}")
-            dataset_items = self.apify_service.client.dataset(dataset_id).list_items().items
-            logger.info(f"Dataset contains {len(dataset_items)} items")
-
-            articles_created = 0
-            skipped_reasons = {"no_url": 0, "short_content": 0, "duplicate": 0}
-
-            for idx, item in enumerate(dataset_items):
-                # Log available fields for first few items
-                if idx < 3:
-                    logger.debug(f"Item {idx} fields: {list(item.keys())}")
-
-                # Extract URL - required field
-                url = item.get("url", "")
-                if not url:
-                    skipped_reasons["no_url"] += 1
-                    continue
-
-                # Extract title - optional field
-                title = item.get("title", "")
-
-                # Check metadata for title if not found in top-level fields
-                metadata = item.get("metadata", {})
-                if not title and metadata:
-                    title = metadata.get("title", "")
-
-                # Title is now optional, so we don't skip items without titles
-
-                # Extract content with improved field mapping
-                content = (
-                    item.get("text", "")  # Primary field from most actors
-                    or item.get("markdown", "")  # Alternative format
-                    or item.get("content", "")  # Legacy/custom actors
-                    or item.get("body", "")  # Fallback
-                )
-
-                # Check metadata for additional content
-                if not content and metadata:
-                    content = metadata.get("description", "")
-
-                # Skip if content too short (increased from 100 to 500)
-                if len(content) < 500:
-                    if idx < 3:
-                        logger.debug(f"Item {idx} content too short: {len(content)} chars")
-                    skipped_reasons["short_content"] += 1
-                    continue
-
-                # Skip if article already exists
-                if article.get_by_url(self.session, url=url):
-                    skipped_reasons["duplicate"] += 1
-                    continue
-
-                # Extract metadata fields if available
-                published_at = datetime.now(UTC).replace(tzinfo=None)
-
-                # Try to parse published date from metadata
-                if metadata and metadata.get("publishedAt"):
-                    try:
-                        # Handle various date formats
-                        pub_str = metadata["publishedAt"]
-                        if isinstance(pub_str, str):
-                            published_at = datetime.fromisoformat(
-                                pub_str.replace("Z", "+00:00")
-                            ).replace(tzinfo=None)
-                    except Exception:
-                        pass  # Use default if parsing fails
-
-                # Create article
-                new_article = Article(
-                    url=url,
-                    title=title,
-                    content=content,
-                    source=item.get("source", "apify"),
-                    published_at=published_at,
-                    status="published",
-                    scraped_at=datetime.now(UTC).replace(tzinfo=None),
-                )
-
-                self.session.add(new_article)
-                articles_created += 1
-
-                logger.debug(
-                    f"Created article from item {idx}: {title[:50] if title else '(No title)'}..."
-                )
-
-            # Commit all articles at once
-            if articles_created > 0:
-                self.session.commit()
-
-            # Log summary
-            logger.info(
-                f"Dataset processing complete: created={articles_created}, "
-                f"skipped={sum(skipped_reasons.values())} "
-                f"(no_url={skipped_reasons['no_url']}, "
-                f"short_content={skipped_reasons['short_content']}, "
-                f"duplicate={skipped_reasons['duplicate']})"
+            import_apify_dataset.apply_async(
+                args=[job.run_id], task_id=f"apify-import-{job.run_id}"
             )
+        except Exception as e:
+            # The job stays unprocessed, so the import can still be run with
+            # nf apify process-dataset
+            logger.error(f"Failed to queue import: run_id={job.run_id}, error={e}", exc_info=True)
+            job.error_message = f"Failed to queue import: {e}"
+            self.session.add(job)
+            self.session.commit()
+            return False
+        logger.info(f"Import queued: run_id={job.run_id}, dataset_id={job.dataset_id}")
+        return True
 
-            return articles_created
+    def import_run(self, run_id: str, transform: bool = True) -> Dict[str, any]:
+        """Import the dataset of a run, resuming from its job's checkpoint.
 
-        except Exception as e:
-            logger.error(f"Error processing dataset {dataset_id}: {str(e)}", exc_info=True)
-            return 0
+        The raw items are staged first, then transformed into articles.
+        Progress is recorded on the ApifyJob row: dataset_offset grows as
+        pages are staged, articles_created as chunks are transformed,
+        error_message is set if the import stops, and processed is set once
+        it completes.
+
+        Args:
+            run_id: Apify run ID
+            transform: Also transform the staged items here; pass False to
+                only stage them, leaving the transform to transform_job calls
+                that can run on several workers
+
+        Returns:
+            Dict with the job's import status and counts
+        """
+        job = self.session.exec(
+            select(ApifyJob).where(ApifyJob.run_id == run_id).order_by(ApifyJob.id.desc())
+        ).first()
+        if job is None or not job.dataset_id:
+            return {"run_id": run_id, "status": "error", "message": "No dataset for run"}
+        if job.processed:
+            logger.info(f"Dataset already imported: run_id={run_id}")
+            return {
+                "run_id": run_id,
+                "job_id": job.id,
+                "status": "skipped",
+                "articles_created": job.articles_created or 0,
+            }
+
+        logger.info(f"Importing dataset: run_id={run_id}, dataset_id={job.dataset_id}")
+        importer = ApifyDatasetImporter(self.session, self.apify_service)
+        if transform:
+            stats = importer.import_dataset(job.dataset_id, job=job)
+        else:
+            stats = importer.stage_dataset(job.dataset_id, job)
+
+        skipped_reasons = stats["skipped"]
+        logger.info(
+            f"Dataset processing complete: items={stats['items']}, "
+            f"created={stats['created']}, "
+            f"skipped={sum(skipped_reasons.values())} "
+            f"(no_url={skipped_reasons['no_url']}, "
+            f"short_content={skipped_reasons['short_content']}, "
+            f"duplicate={skipped_reasons['duplicate']}, "
+            f"error={skipped_reasons['error']}), "
+            f"near_duplicates={stats['near_duplicates']}"
+        )
+        if stats["error"]:
+            status = "error"
+        else:
+            status = "success" if transform else "staged"
+        return {
+            "run_id": run_id,
+            "job_id": job.id,
+            "status": status,
+            "message": stats["error"],
+            "items": stats["items"],
+            "offset": stats["offset"],
+            "articles_created": stats["created"],
+        }
+
+    def transform_job(self, job_id: int) -> Dict[str, any]:
+        """Transform a job's staged items into articles.
+
+        Safe to run on several workers at once for the same job.
+
+        Args:
+            job_id: ID of the ApifyJob
+
+        Returns:
+            Dict with the transform status and articles created
+        """
+        job = self.session.get(ApifyJob, job_id)
+        if job is None:
+            return {"job_id": job_id, "status": "skipped", "message": "Job not found"}
+
+        stats = ApifyDatasetImporter(self.session, self.apify_service).transform_items(job)
+        return {
+            "job_id": job_id,
+            "status": "error" if stats["error"] else "success",
+            "message": stats["error"],
+            "articles_created": stats["created"],
+            "processed": job.processed,
+        }
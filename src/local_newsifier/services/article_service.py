@@ -8,6 +8,7 @@ from fastapi_injectable import injectable
 from local_newsifier.errors import handle_database
 from local_newsifier.models.analysis_result import AnalysisResult
 from local_newsifier.models.article import Article
+from local_newsifier.tools.near_duplicates import get_near_duplicate_detector
 from local_newsifier.utils.dates import parse_date_safe
 from local_newsifier.utils.url import extract_source_from_url
 
@@ -22,6 +23,7 @@ class ArticleService:
         analysis_result_crud,
         entity_service,
         session_factory: Callable,
+        near_duplicate_detector=None,
     ):
         """Initialize with dependencies.
 
@@ -30,11 +32,40 @@ class ArticleService:
             analysis_result_crud: CRUD for analysis results
             entity_service: Service for entity operations
             session_factory: Factory for database sessions
+            near_duplicate_detector: Detector marking new articles that
+                duplicate earlier ones; defaults to one configured by settings,
+                or none if NEAR_DUPLICATE_DETECTION is off
         """
         self.article_crud = article_crud
         self.analysis_result_crud = analysis_result_crud
         self.entity_service = entity_service
         self.session_factory = session_factory
+        self.near_duplicate_detector = (
+            near_duplicate_detector
+            if near_duplicate_detector is not None
+            else get_near_duplicate_detector()
+        )
+
+    def _check_near_duplicate(self, session, article: Article) -> Optional[int]:
+        """Mark a new article as a near-duplicate or index it as an original.
+
+        Returns:
+            ID of the article it duplicates, or None
+        """
+        if self.near_duplicate_detector is None:
+            return None
+        return self.near_duplicate_detector.check(session, article)
+
+    def _copy_analysis(self, session, original_id: int) -> Dict[str, Any]:
+        """Copy the entity analysis of the article a duplicate was copied from."""
+        for result in self.analysis_result_crud.get_by_article(session, article_id=original_id):
+            if result.analysis_type == "entity_analysis":
+                return {**result.results, "duplicate_of": original_id}
+        return {
+            "entities": [],
+            "statistics": {"entity_counts": {}, "total_entities": 0},
+            "duplicate_of": original_id,
+        }
 
     @handle_database
     def process_article(
@@ -70,24 +101,37 @@ class ArticleService:
             )
             article = self.article_crud.create(session, obj_in=article_data)
 
-            # Process entities using the entity service
-            entities = self.entity_service.process_article_entities(
-                article_id=article.id, content=content, title=title or "", published_at=published_at
-            )
-
-            # Create analysis result
-            entity_types = set(entity.get("canonical_type", "UNKNOWN") for entity in entities)
-            entity_counts = {
-                entity_type: len(
-                    [e for e in entities if e.get("canonical_type", "UNKNOWN") == entity_type]
+            # A near-duplicate (e.g. a syndicated copy) reuses the original's
+            # analysis instead of having its entities extracted and tracked
+            duplicate_of = self._check_near_duplicate(session, article)
+            if duplicate_of is not None:
+                analysis_result_data = self._copy_analysis(session, duplicate_of)
+                entities = analysis_result_data.get("entities", [])
+            else:
+                # Process entities using the entity service
+                entities = self.entity_service.process_article_entities(
+                    article_id=article.id,
+                    content=content,
+                    title=title or "",
+                    published_at=published_at,
                 )
-                for entity_type in entity_types
-            }
 
-            analysis_result_data = {
-                "entities": entities,
-                "statistics": {"entity_counts": entity_counts, "total_entities": len(entities)},
-            }
+                # Create analysis result
+                entity_types = set(entity.get("canonical_type", "UNKNOWN") for entity in entities)
+                entity_counts = {
+                    entity_type: len(
+                        [e for e in entities if e.get("canonical_type", "UNKNOWN") == entity_type]
+                    )
+                    for entity_type in entity_types
+                }
+
+                analysis_result_data = {
+                    "entities": entities,
+                    "statistics": {
+                        "entity_counts": entity_counts,
+                        "total_entities": len(entities),
+                    },
+                }
 
             analysis_result_obj = AnalysisResult(
                 article_id=article.id,
@@ -106,6 +150,7 @@ class ArticleService:
                 "url": article.url,
                 "entities": entities,
                 "analysis_result": analysis_result_data,
+                "duplicate_of": duplicate_of,
             }
 
     @handle_database
@@ -193,5 +238,8 @@ class ArticleService:
 
             # Save to database
             article = self.article_crud.create(session, obj_in=article_data)
+            if article and self.near_duplicate_detector is not None:
+                self._check_near_duplicate(session, article)
+                session.commit()
 
             return article.id if article else None
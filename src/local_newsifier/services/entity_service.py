@@ -1,16 +1,19 @@
 """Entity service for coordinating entity-related operations."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List
+from itertools import tee
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fastapi_injectable import injectable
 
+from local_newsifier.database.engine import transaction
 from local_newsifier.errors import handle_database
 from local_newsifier.models.entity import Entity
 from local_newsifier.models.entity_tracking import CanonicalEntity, EntityMentionContext
 from local_newsifier.models.state import (EntityBatchTrackingState, EntityDashboardState,
                                           EntityRelationshipState, EntityTrackingState,
                                           TrackingStatus)
+from local_newsifier.tools.analysis_context import AnalysisContext
 
 
 @injectable(use_cache=False)
@@ -28,6 +31,7 @@ class EntityService:
         context_analyzer,
         entity_resolver,
         session_factory: Callable,
+        canonical_entity_cache=None,
     ):
         """Initialize with dependencies.
 
@@ -41,6 +45,8 @@ class EntityService:
             context_analyzer: Tool for analyzing entity contexts
             entity_resolver: Tool for resolving entities to canonical forms
             session_factory: Factory for database sessions
+            canonical_entity_cache: Optional cache of canonical entities shared
+                across articles; without it the table is read for every article
         """
         self.entity_crud = entity_crud
         self.canonical_entity_crud = canonical_entity_crud
@@ -51,10 +57,17 @@ class EntityService:
         self.context_analyzer = context_analyzer
         self.entity_resolver = entity_resolver
         self.session_factory = session_factory
+        self.canonical_entity_cache = canonical_entity_cache
 
     @handle_database
     def process_article_entities(
-        self, article_id: int, content: str, title: str, published_at: datetime
+        self,
+        article_id: int,
+        content: str,
+        title: str,
+        published_at: datetime,
+        entities: Optional[List[Dict[str, Any]]] = None,
+        analysis_context: Optional[AnalysisContext] = None,
     ) -> List[Dict[str, Any]]:
         """Process an article to extract and track entities.
 
@@ -63,6 +76,11 @@ class EntityService:
             content: Article content
             title: Article title
             published_at: Article publication date
+            entities: Entities already extracted from the content (e.g. by
+                extract_entities_batch); extracted here when omitted
+            analysis_context: Already parsed content (e.g. from parse_batch).
+                Entities and their sentences are taken from it; the content is
+                parsed once here when neither this nor entities is given
 
         Returns:
             List of processed entities with metadata
@@ -70,84 +88,163 @@ class EntityService:
         Raises:
             ServiceError: On database errors with appropriate classification
         """
-        # Extract entities using the new EntityExtractor
-        entities = self.entity_extractor.extract_entities(content)
+        # Extract entities using the new EntityExtractor, parsing the content
+        # once and sharing the parse with the context analyzer
+        if entities is None:
+            if analysis_context is None:
+                analysis_context = self.entity_extractor.parse(content)
+            entities = self.entity_extractor.extract_entities(
+                content, analysis_context=analysis_context
+            )
 
-        processed_entities = []
+        if not entities:
+            return []
 
         # Use the provided session_factory instead of creating a new SessionManager
         with self.session_factory() as session:
-            # Get existing canonical entities for resolution
-            existing_entities = [
-                {"name": entity.name, "entity_type": entity.entity_type, "id": entity.id}
-                for entity in self.canonical_entity_crud.get_all(session)
-            ]
+            if self.canonical_entity_cache is not None:
+                # Loaded once per worker; only entities created since the last
+                # article are read here
+                self.canonical_entity_cache.refresh(session, self.canonical_entity_crud)
+                resolve_entity = self.canonical_entity_cache.resolve
+                add_canonical_entity = self.canonical_entity_cache.add
+            else:
+                # Index existing canonical entities once for this article
+                existing_entities = self.entity_resolver.build_index(
+                    {"name": entity.name, "entity_type": entity.entity_type, "id": entity.id}
+                    for entity in self.canonical_entity_crud.iter_all(
+                        session, columns=["id", "name", "entity_type"]
+                    )
+                )
+
+                def resolve_entity(entity_text: str, entity_type: str) -> Dict[str, Any]:
+                    return self.entity_resolver.resolve_entity(
+                        entity_text, entity_type, existing_entities
+                    )
+
+                add_canonical_entity = existing_entities.add
+
+            # Canonical entities first seen in this article, keyed by name and
+            # type; they get ids from the upsert below
+            new_canonical_entities: List[CanonicalEntity] = []
+            new_ordinals: Dict[Tuple[str, str], int] = {}
 
+            # Analyze and resolve every mention before touching the database
+            mentions = []
             for entity in entities:
-                # Analyze context using the new ContextAnalyzer
-                context_analysis = self.context_analyzer.analyze_context(entity["context"])
+                # Analyze context using the new ContextAnalyzer, reusing the
+                # already parsed sentence when available
+                sentence = None
+                if analysis_context is not None and "start_char" in entity:
+                    sentence = analysis_context.sentence_at(entity["start_char"])
+                context_analysis = self.context_analyzer.analyze_context(
+                    entity["context"], span=sentence
+                )
 
                 # Resolve entity using the new EntityResolver
-                resolved_entity = self.entity_resolver.resolve_entity(
-                    entity["text"], entity["type"], existing_entities
-                )
+                resolved_entity = resolve_entity(entity["text"], entity["type"])
 
-                # Handle canonical entity creation or retrieval
                 if resolved_entity["is_new"]:
-                    canonical_entity_data = CanonicalEntity(
-                        name=resolved_entity["name"],
-                        entity_type=resolved_entity["entity_type"],
-                        entity_metadata={},
-                    )
-                    canonical_entity = self.canonical_entity_crud.create(
-                        session, obj_in=canonical_entity_data
-                    )
+                    key = (resolved_entity["name"], resolved_entity["entity_type"])
+                    if key not in new_ordinals:
+                        new_ordinals[key] = len(new_canonical_entities)
+                        new_canonical_entities.append(
+                            CanonicalEntity(
+                                name=resolved_entity["name"],
+                                entity_type=resolved_entity["entity_type"],
+                                entity_metadata={},
+                            )
+                        )
+                    canonical = {"name": resolved_entity["name"], "ordinal": new_ordinals[key]}
+                elif resolved_entity.get("id") is not None:
+                    # Matched an indexed entity, which already carries its id
+                    canonical = {"name": resolved_entity["name"], "id": resolved_entity["id"]}
                 else:
                     canonical_entity = self.canonical_entity_crud.get_by_name(
                         session,
                         name=resolved_entity["name"],
                         entity_type=resolved_entity["entity_type"],
                     )
+                    canonical = {"name": canonical_entity.name, "id": canonical_entity.id}
 
-                # Store entity in database
-                entity_data = Entity(
-                    article_id=article_id,
-                    text=entity["text"],
-                    entity_type=entity["type"],
-                    confidence=entity.get("confidence", 1.0),
+                mentions.append((entity, context_analysis, canonical))
+
+            # Persist the article's entities in one transaction: upsert the new
+            # canonical entities, then bulk insert entities and their contexts
+            with transaction(session):
+                canonical_ids = self.canonical_entity_crud.get_or_create_many(
+                    session, objs_in=new_canonical_entities, commit=False
                 )
-                db_entity = self.entity_crud.create(session, obj_in=entity_data)
-
-                # Store entity mention context
-                context_data = EntityMentionContext(
-                    entity_id=db_entity.id,
-                    article_id=article_id,
-                    context_text=entity["context"],
-                    context_type="sentence",
-                    sentiment_score=context_analysis["sentiment"]["score"],
+                entity_ids = self.entity_crud.create_many(
+                    session,
+                    objs_in=[
+                        Entity(
+                            article_id=article_id,
+                            text=entity["text"],
+                            entity_type=entity["type"],
+                            confidence=entity.get("confidence", 1.0),
+                        )
+                        for entity, _, _ in mentions
+                    ],
+                    commit=False,
                 )
-                self.entity_mention_context_crud.create(session, obj_in=context_data)
-
-                # Add to results
-                processed_entities.append(
-                    {
-                        "original_text": entity["text"],
-                        "canonical_name": canonical_entity.name,
-                        "canonical_id": canonical_entity.id,
-                        "context": entity["context"],
-                        "sentiment_score": context_analysis["sentiment"]["score"],
-                        "framing_category": context_analysis["framing"]["category"],
-                    }
+                self.entity_mention_context_crud.create_many(
+                    session,
+                    objs_in=[
+                        EntityMentionContext(
+                            entity_id=entity_id,
+                            article_id=article_id,
+                            context_text=entity["context"],
+                            context_type="sentence",
+                            sentiment_score=context_analysis["sentiment"]["score"],
+                        )
+                        for entity_id, (entity, context_analysis, _) in zip(entity_ids, mentions)
+                    ],
+                    commit=False,
                 )
 
+        # Only committed canonical entities are shared with later articles
+        for canonical_entity, canonical_id in zip(new_canonical_entities, canonical_ids):
+            add_canonical_entity(
+                {
+                    "name": canonical_entity.name,
+                    "entity_type": canonical_entity.entity_type,
+                    "id": canonical_id,
+                }
+            )
+
+        processed_entities = []
+        for entity, context_analysis, canonical in mentions:
+            if "ordinal" in canonical:
+                canonical_id = canonical_ids[canonical["ordinal"]]
+            else:
+                canonical_id = canonical["id"]
+            processed_entities.append(
+                {
+                    "original_text": entity["text"],
+                    "canonical_name": canonical["name"],
+                    "canonical_id": canonical_id,
+                    "context": entity["context"],
+                    "sentiment_score": context_analysis["sentiment"]["score"],
+                    "framing_category": context_analysis["framing"]["category"],
+                }
+            )
+
         return processed_entities
 
     @handle_database
-    def process_article_with_state(self, state: EntityTrackingState) -> EntityTrackingState:
+    def process_article_with_state(
+        self,
+        state: EntityTrackingState,
+        entities: Optional[List[Dict[str, Any]]] = None,
+        analysis_context: Optional[AnalysisContext] = None,
+    ) -> EntityTrackingState:
         """Process an article using state-based approach.
 
         Args:
             state: EntityTrackingState containing article info
+            entities: Entities already extracted from the content, if any
+            analysis_context: Already parsed content, if any
 
         Returns:
             Updated state with processed entities
@@ -163,6 +260,8 @@ class EntityService:
                 content=state.content,
                 title=state.title,
                 published_at=state.published_at,
+                entities=entities,
+                analysis_context=analysis_context,
             )
 
             # Update state with results
@@ -197,14 +296,31 @@ class EntityService:
             state.status = TrackingStatus.PROCESSING
             state.add_log(f"Starting batch processing with status filter: {state.status_filter}")
 
-            # Get articles with the specified status
+            # Stream articles with the specified status a page at a time,
+            # loading only the columns processing needs; near-duplicates of
+            # other articles are skipped so syndicated copies are not counted
             with self.session_factory() as session:
-                articles = self.article_crud.get_by_status(session, status=state.status_filter)
-                state.total_articles = len(articles)
-                state.add_log(f"Found {state.total_articles} articles to process")
+                articles, texts = tee(
+                    self.article_crud.iter_by_status(
+                        session,
+                        status=state.status_filter,
+                        page_size=state.page_size,
+                        columns=["id", "title", "content", "url", "published_at"],
+                        exclude_duplicates=True,
+                    )
+                )
+
+                # Parse all article texts in batches with nlp.pipe; parses are
+                # streamed so each article is persisted as soon as it is parsed
+                analysis_contexts = self.entity_extractor.parse_batch(
+                    (article.content or "" for article in texts),
+                    batch_size=state.batch_size,
+                    n_process=state.n_process,
+                )
 
                 # Process each article
-                for article in articles:
+                for article, analysis_context in zip(articles, analysis_contexts):
+                    state.total_articles += 1
                     try:
                         # Create tracking state for this article
                         article_state = EntityTrackingState(
@@ -215,7 +331,9 @@ class EntityService:
                         )
 
                         # Process article
-                        processed_state = self.process_article_with_state(article_state)
+                        processed_state = self.process_article_with_state(
+                            article_state, analysis_context=analysis_context
+                        )
 
                         # Update batch state with this article's result
                         article_result = {
@@ -244,6 +362,8 @@ class EntityService:
                         state.add_log(error_msg)
                         state.error_count += 1
 
+            state.add_log(f"Found {state.total_articles} articles to process")
+
             # Update final state
             if state.error_count == 0:
                 state.status = TrackingStatus.SUCCESS
@@ -5,12 +5,17 @@ adding, updating, and processing feeds.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from fastapi_injectable import injectable
 
+from local_newsifier.config.settings import settings
 from local_newsifier.errors import handle_database, handle_rss
 from local_newsifier.models.rss_feed import RSSFeed, RSSFeedProcessingLog
+from local_newsifier.tools.feed_fetcher import fetch_feeds
+from local_newsifier.tools.feed_schedule import (next_fetch_interval, observed_publish_interval,
+                                                 update_average)
 from local_newsifier.tools.rss_parser import parse_rss_feed
 from local_newsifier.utils.dates import get_utc_now, to_iso_string
 
@@ -194,13 +199,18 @@ class RSSFeedService:
     @handle_rss
     @handle_database
     def process_feed(
-        self, feed_id: int, task_queue_func: Optional[Callable] = None
+        self,
+        feed_id: int,
+        task_queue_func: Optional[Callable] = None,
+        feed_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Process a feed.
 
         Args:
             feed_id: Feed ID
             task_queue_func: Function to queue article processing tasks (optional)
+            feed_data: Already fetched feed content, as returned by
+                parse_rss_feed; the feed is fetched when omitted
 
         Returns:
             Result information including processed feed and article counts
@@ -216,7 +226,25 @@ class RSSFeedService:
 
             # Parse the RSS feed
             try:
-                feed_data = parse_rss_feed(feed.url)
+                if feed_data is None:
+                    feed_data = parse_rss_feed(feed.url, **self._validators(feed))
+
+                if feed_data.get("not_modified"):
+                    # Unchanged since the last fetch; nothing to parse or store
+                    self.rss_feed_crud.update_last_fetched(session, id=feed_id)
+                    self._store_validators(session, feed_id, feed_data)
+                    self._update_schedule(session, feed, feed_data)
+                    self.feed_processing_log_crud.update_processing_completed(
+                        session, log_id=log.id, status="not_modified"
+                    )
+                    return {
+                        "status": "success",
+                        "feed_id": feed_id,
+                        "feed_name": feed.name,
+                        "not_modified": True,
+                        "articles_found": 0,
+                        "articles_added": 0,
+                    }
 
                 articles_found = len(feed_data.get("entries", []))
                 articles_added = 0
@@ -237,8 +265,11 @@ class RSSFeedService:
                             f"Error processing article {entry.get('link', 'unknown')}: {str(e)}"
                         )
 
-                # Update feed last fetched timestamp
+                # Update feed last fetched timestamp, and the validators only
+                # now that its articles are stored
                 self.rss_feed_crud.update_last_fetched(session, id=feed_id)
+                self._store_validators(session, feed_id, feed_data)
+                self._update_schedule(session, feed, feed_data)
 
                 # Update processing log
                 self.feed_processing_log_crud.update_processing_completed(
@@ -259,6 +290,7 @@ class RSSFeedService:
 
             except (ValueError, TypeError, AttributeError) as e:
                 logger.exception(f"Error processing feed {feed_id}: {str(e)}")
+                self._update_schedule(session, feed, None)
 
                 # Update processing log with error
                 self.feed_processing_log_crud.update_processing_completed(
@@ -275,6 +307,122 @@ class RSSFeedService:
                     "message": str(e),
                 }
 
+    def process_feeds(
+        self,
+        feed_ids: List[int],
+        task_queue_func: Optional[Callable] = None,
+        max_workers: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch several feeds concurrently and process each as it arrives.
+
+        Fetches run on a thread pool; articles are stored from the calling
+        thread, one feed at a time, as each fetch completes.
+
+        Args:
+            feed_ids: IDs of the feeds to process
+            task_queue_func: Function to queue article processing tasks (optional)
+            max_workers: Maximum number of feeds fetched at once (optional)
+            per_host_limit: Maximum number of feeds fetched at once from one
+                host (optional)
+
+        Yields:
+            Result information for each feed, as from process_feed, plus the
+            time its fetch took in fetch_seconds
+        """
+        feed_ids_by_url = {}
+        validators_by_url = {}
+        missing = []
+        with self.session_factory() as session:
+            for feed_id in feed_ids:
+                feed = self.rss_feed_crud.get(session, id=feed_id)
+                if not feed:
+                    missing.append(feed_id)
+                    continue
+                feed_ids_by_url[feed.url] = feed_id
+                validators_by_url[feed.url] = self._validators(feed)
+
+        for feed_id in missing:
+            yield {
+                "status": "error",
+                "feed_id": feed_id,
+                "message": f"Feed with ID {feed_id} not found",
+            }
+
+        for fetched in fetch_feeds(
+            feed_ids_by_url,
+            fetch=lambda url: parse_rss_feed(url, **validators_by_url[url]),
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+        ):
+            feed_id = feed_ids_by_url[fetched.url]
+            try:
+                if fetched.error:
+                    raise fetched.error
+                result = self.process_feed(
+                    feed_id, task_queue_func=task_queue_func, feed_data=fetched.feed_data
+                )
+            except Exception as e:
+                logger.error(f"Error processing feed {feed_id}: {str(e)}")
+                result = {"status": "error", "feed_id": feed_id, "message": str(e)}
+            result["fetch_seconds"] = round(fetched.elapsed, 3)
+            yield result
+
+    @handle_database
+    def register_feeds(self, urls: Iterable[str]) -> List[int]:
+        """Register feed URLs that have no feed yet, so they are polled.
+
+        URLs that already have a feed, active or not, are left alone. New
+        feeds have no next_fetch_at, so they are due at once.
+
+        Args:
+            urls: Feed URLs, e.g. settings.RSS_FEED_URLS
+
+        Returns:
+            IDs of the feeds created
+        """
+        created = []
+        with self.session_factory() as session:
+            for url in urls:
+                if self.rss_feed_crud.get_by_url(session, url=url):
+                    continue
+                feed = self.rss_feed_crud.create(
+                    session,
+                    obj_in={
+                        "url": url,
+                        "name": url,
+                        "is_active": True,
+                        "created_at": get_utc_now(),
+                        "updated_at": get_utc_now(),
+                    },
+                )
+                logger.info(f"Registered configured RSS feed {url}")
+                created.append(feed.id)
+        return created
+
+    @handle_database
+    def claim_due_feeds(self, limit: Optional[int] = None) -> List[int]:
+        """Claim the active feeds due for polling.
+
+        Claimed feeds are not claimed again until they are fetched, or for
+        settings.RSS_POLL_DEFAULT_INTERVAL if their fetch never runs.
+
+        Args:
+            limit: Maximum number of feeds to claim; defaults to
+                settings.RSS_POLL_BATCH_SIZE
+
+        Returns:
+            IDs of the claimed feeds, longest overdue first
+        """
+        with self.session_factory() as session:
+            feeds = self.rss_feed_crud.claim_due_feeds(
+                session,
+                now=get_utc_now(),
+                lease_seconds=settings.RSS_POLL_DEFAULT_INTERVAL,
+                limit=limit or settings.RSS_POLL_BATCH_SIZE,
+            )
+            return [feed.id for feed in feeds]
+
     @handle_database
     def get_feed_processing_logs(
         self, feed_id: int, skip: int = 0, limit: int = 100
@@ -300,6 +448,79 @@ class RSSFeedService:
 
             return [self._format_log_dict(log) for log in logs]
 
+    def _validators(self, feed: RSSFeed) -> Dict[str, Optional[str]]:
+        """Get the validators from a feed's last fetch, for a conditional request.
+
+        Args:
+            feed: Feed model instance
+
+        Returns:
+            Keyword arguments for parse_rss_feed
+        """
+        return {
+            "etag": feed.etag,
+            "last_modified": feed.last_modified,
+            "content_hash": feed.content_hash,
+        }
+
+    def _store_validators(self, session, feed_id: int, feed_data: Dict[str, Any]) -> None:
+        """Store the validators from a successful fetch on the feed.
+
+        Args:
+            session: Database session
+            feed_id: Feed ID
+            feed_data: Feed content as returned by parse_rss_feed
+        """
+        if "content_hash" not in feed_data:
+            return
+        self.rss_feed_crud.update_validators(
+            session,
+            id=feed_id,
+            etag=feed_data.get("etag"),
+            last_modified=feed_data.get("last_modified"),
+            content_hash=feed_data.get("content_hash"),
+        )
+
+    def _update_schedule(
+        self, session, feed: RSSFeed, feed_data: Optional[Dict[str, Any]]
+    ) -> None:
+        """Work out when to poll a feed next from the outcome of a fetch.
+
+        Args:
+            session: Database session
+            feed: Feed model instance, with the statistics from before the fetch
+            feed_data: Feed content as returned by parse_rss_feed, or None if
+                the fetch failed
+        """
+        failed = feed_data is None or "error" in feed_data
+        publish_interval = feed.publish_interval_seconds
+        not_modified_rate = feed.not_modified_rate or 0.0
+
+        if not failed:
+            not_modified_rate = update_average(
+                not_modified_rate, 1.0 if feed_data.get("not_modified") else 0.0
+            )
+            observed = observed_publish_interval(
+                entry.get("published") for entry in feed_data.get("entries", [])
+            )
+            if observed is not None:
+                publish_interval = update_average(publish_interval, observed)
+
+        interval = next_fetch_interval(
+            publish_interval,
+            not_modified_rate,
+            previous_interval=feed.fetch_interval_seconds,
+            failed=failed,
+        )
+        self.rss_feed_crud.update_schedule(
+            session,
+            id=feed.id,
+            publish_interval_seconds=publish_interval,
+            not_modified_rate=not_modified_rate,
+            fetch_interval_seconds=interval,
+            next_fetch_at=get_utc_now() + timedelta(seconds=interval),
+        )
+
     def _format_feed_dict(self, feed: RSSFeed) -> Dict[str, Any]:
         """Format feed as a dict.
 
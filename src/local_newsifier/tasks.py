@@ -4,17 +4,24 @@ This module defines asynchronous tasks for processing articles and fetching RSS
 """
 
 import logging
+import time
+from contextlib import contextmanager
 from typing import Dict, Iterator, List, Optional
 
-from celery import Task, current_task
-from celery.signals import worker_ready
+from celery import Task, chord, current_task, group
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import (worker_init, worker_process_init, worker_process_shutdown,
+                            worker_ready, worker_shutdown)
 from sqlmodel import Session
 
 from local_newsifier.celery_app import app
 from local_newsifier.config.settings import settings
+from local_newsifier.database.engine import dispose_engines, reset_engines_after_fork
 from local_newsifier.di.providers import get_session
 from local_newsifier.flows.entity_tracking_flow import EntityTrackingFlow
 from local_newsifier.flows.news_pipeline import NewsPipelineFlow
+from local_newsifier.tools.driver_pool import close_driver_pools
+from local_newsifier.tools.nlp_models import preload_models
 from local_newsifier.tools.rss_parser import parse_rss_feed
 
 logger = logging.getLogger(__name__)
@@ -27,6 +34,19 @@ def get_db() -> Iterator[Session]:
         yield session
 
 
+@contextmanager
+def _session_context(sessions: Iterator[Session]) -> Iterator[Session]:
+    """Use a session generator such as engine.get_session as a context manager.
+
+    Exceptions raised in the block propagate unchanged; the generator is
+    closed on exit, closing its session.
+    """
+    try:
+        yield next(sessions)
+    finally:
+        sessions.close()
+
+
 class BaseTask(Task):
     """Base Task class with common functionality for all tasks."""
 
@@ -42,7 +62,7 @@ class BaseTask(Task):
             # Import here to avoid circular dependencies
             from local_newsifier.database.engine import get_session
 
-            self._session_factory = lambda **kwargs: get_session(**kwargs)
+            self._session_factory = lambda **kwargs: _session_context(get_session(**kwargs))
         return self._session_factory
 
     @property
@@ -59,11 +79,12 @@ class BaseTask(Task):
         ```
         """
         if self._session is None:
+            # Import here to avoid circular dependencies
+            from local_newsifier.database.engine import get_session
+
             # Get a session for short-lived operations
             # The caller should not keep this session alive across async boundaries
-            session_factory = self.session_factory
-            if session_factory:
-                self._session = next(session_factory())
+            self._session = next(get_session())
         return self._session
 
     @property
@@ -140,6 +161,16 @@ def process_article(self, article_id: int) -> Dict:
                 logger.error(f"Article with ID {article_id} not found")
                 return {"article_id": article_id, "status": "error", "message": "Article not found"}
 
+            # Near-duplicates (e.g. syndicated copies) are not analyzed again
+            if article.duplicate_of is not None:
+                logger.info(f"Article {article_id} duplicates article {article.duplicate_of}")
+                return {
+                    "article_id": article_id,
+                    "status": "duplicate",
+                    "duplicate_of": article.duplicate_of,
+                    "processed": False,
+                }
+
             # Process the article through the news pipeline
             # Get the flow using provider function
             from local_newsifier.di.providers import get_news_pipeline_flow
@@ -185,91 +216,305 @@ def fetch_rss_feeds(self, feed_urls: Optional[List[str]] = None) -> Dict:
     """
     Fetch and process articles from RSS feeds.
 
+    Fans out one fetch_rss_feed subtask per feed, so feeds are spread across
+    workers and each has its own retries and time limit. This task is
+    replaced by a chord whose callback, aggregate_feed_results, produces the
+    result under this task's ID.
+
     Args:
         feed_urls: List of RSS feed URLs to process. If None, uses default feeds from settings.
 
     Returns:
-        Dict: Result information including processed feeds and article counts
+        Dict: Result information including processed feeds, article counts and
+            per-feed fetch times
     """
     if not feed_urls:
         feed_urls = settings.RSS_FEED_URLS
+    if not feed_urls:
+        return aggregate_feed_results([])
 
     logger.info(f"Fetching articles from {len(feed_urls)} RSS feeds")
+    return self.replace(
+        chord(
+            [fetch_rss_feed.s(feed_url) for feed_url in feed_urls],
+            aggregate_feed_results.s(started_at=time.time()),
+        )
+    )
+
+
+@app.task(
+    bind=True,
+    base=BaseTask,
+    name="local_newsifier.tasks.fetch_rss_feed",
+    max_retries=settings.RSS_FEED_TASK_MAX_RETRIES,
+    soft_time_limit=settings.RSS_FEED_TASK_TIME_LIMIT,
+    time_limit=settings.RSS_FEED_TASK_TIME_LIMIT + 30,
+)
+def fetch_rss_feed(self, feed_url: str) -> Dict:
+    """
+    Fetch one RSS feed and store its new articles.
+
+    Failures are retried with exponential backoff. Once retries run out, or
+    the feed exceeds its time limit, the error is returned rather than
+    raised so the other feeds in the chord are still aggregated.
+
+    Args:
+        feed_url: URL of the RSS feed to process
 
+    Returns:
+        Dict: Result information for the feed including article counts and
+            fetch time
+    """
+    start = time.perf_counter()
+    fetch_seconds = None
+
+    try:
+        feed_data = parse_rss_feed(feed_url)
+        fetch_seconds = round(time.perf_counter() - start, 3)
+        if feed_data.get("error"):
+            raise RuntimeError(feed_data["error"])
+
+        entries = feed_data.get("entries", [])
+        feed_result = {
+            "url": feed_url,
+            "title": feed_data.get("title", "Unknown"),
+            "articles_found": len(entries),
+            "articles_processed": 0,
+            "fetch_seconds": fetch_seconds,
+            "status": "success",
+        }
+
+        with self.session_factory() as session:
+            # Look up which entries already exist in one batch
+            existing_urls = self.article_crud.existing_urls(
+                session, urls=[entry.get("link", "") for entry in entries]
+            )
+
+            # Process each article in the feed
+            for entry in entries:
+                url = entry.get("link", "")
+                if url not in existing_urls:
+                    # Create and save new article
+                    article_id = self.article_service.create_article_from_rss_entry(entry)
+                    existing_urls.add(url)
+                    if article_id:
+                        # Queue article processing task
+                        process_article.delay(article_id)
+                        feed_result["articles_processed"] += 1
+
+        return feed_result
+
+    except SoftTimeLimitExceeded:
+        error_msg = f"Time limit of {settings.RSS_FEED_TASK_TIME_LIMIT}s exceeded"
+    except Exception as e:
+        if self.request.retries < self.max_retries:
+            # Articles already stored are skipped on retry
+            countdown = settings.RSS_FEED_TASK_RETRY_DELAY * 2**self.request.retries
+            logger.warning(f"Retrying feed {feed_url} in {countdown}s: {str(e)}")
+            raise self.retry(exc=e, countdown=countdown)
+        error_msg = str(e)
+
+    logger.error(f"Error processing feed {feed_url}: {error_msg}")
+    return {
+        "url": feed_url,
+        "status": "error",
+        "message": error_msg,
+        "fetch_seconds": fetch_seconds or round(time.perf_counter() - start, 3),
+    }
+
+
+@app.task(name="local_newsifier.tasks.aggregate_feed_results")
+def aggregate_feed_results(feed_results: List[Dict], started_at: Optional[float] = None) -> Dict:
+    """
+    Combine per-feed results from fetch_rss_feed into one result.
+
+    Args:
+        feed_results: Results of the fetch_rss_feed subtasks
+        started_at: Epoch time the fan-out started, for the elapsed time
+
+    Returns:
+        Dict: Result information including processed feeds, article counts and
+            per-feed results
+    """
     results = {
         "feeds_processed": 0,
         "articles_found": 0,
         "articles_added": 0,
-        "feeds": [],
+        "feeds": feed_results,
         "status": "success",
     }
+    for feed_result in feed_results:
+        if feed_result.get("status") == "success":
+            results["feeds_processed"] += 1
+            results["articles_found"] += feed_result.get("articles_found", 0)
+            results["articles_added"] += feed_result.get("articles_processed", 0)
+
+    if started_at is not None:
+        results["elapsed_seconds"] = round(time.time() - started_at, 3)
+    return results
+
+
+@app.task(
+    bind=True,
+    base=BaseTask,
+    name="local_newsifier.tasks.import_apify_dataset",
+    max_retries=settings.APIFY_IMPORT_TASK_MAX_RETRIES,
+)
+def import_apify_dataset(self, run_id: str) -> Dict:
+    """
+    Stage the dataset of a finished Apify run and fan out its transform.
+
+    Queued by the Apify webhook with a task ID derived from the run ID. The
+    raw items are staged into apify_dataset_items, then
+    APIFY_TRANSFORM_TASKS transform_apify_items tasks turn them into
+    articles in parallel. Progress is recorded on the run's ApifyJob; a
+    failed download is retried with exponential backoff and resumes after
+    the last staged page.
+
+    Args:
+        run_id: Apify run ID
+
+    Returns:
+        Dict: Result information including the job ID and items staged
+    """
+    # Import here to avoid circular dependencies
+    from local_newsifier.services.apify_webhook_service import ApifyWebhookService
+
+    with self.session_factory() as session:
+        result = ApifyWebhookService(session).import_run(run_id, transform=False)
+
+    if result["status"] == "error" and result.get("job_id") is not None:
+        if self.request.retries < self.max_retries:
+            countdown = settings.APIFY_IMPORT_TASK_RETRY_DELAY * 2**self.request.retries
+            logger.warning(f"Retrying import of run {run_id} in {countdown}s: {result['message']}")
+            raise self.retry(exc=RuntimeError(result["message"]), countdown=countdown)
+    elif result["status"] == "staged":
+        transform_tasks = max(settings.APIFY_TRANSFORM_TASKS, 1)
+        group(transform_apify_items.s(result["job_id"]) for _ in range(transform_tasks)).delay()
+        result["transform_tasks"] = transform_tasks
+    return result
+
+
+@app.task(
+    bind=True,
+    base=BaseTask,
+    name="local_newsifier.tasks.transform_apify_items",
+    max_retries=settings.APIFY_IMPORT_TASK_MAX_RETRIES,
+)
+def transform_apify_items(self, job_id: int) -> Dict:
+    """
+    Transform the staged items of an Apify job into articles.
+
+    Several of these tasks can run for the same job: each claims its own
+    chunks of items. A failed chunk is rolled back and retried with
+    exponential backoff.
 
+    Args:
+        job_id: ID of the ApifyJob
+
+    Returns:
+        Dict: Result information including articles created
+    """
+    # Import here to avoid circular dependencies
+    from local_newsifier.services.apify_webhook_service import ApifyWebhookService
+
+    with self.session_factory() as session:
+        result = ApifyWebhookService(session).transform_job(job_id)
+
+    if result["status"] == "error" and self.request.retries < self.max_retries:
+        countdown = settings.APIFY_IMPORT_TASK_RETRY_DELAY * 2**self.request.retries
+        logger.warning(f"Retrying transform of job {job_id} in {countdown}s: {result['message']}")
+        raise self.retry(exc=RuntimeError(result["message"]), countdown=countdown)
+    return result
+
+
+@app.task(bind=True, base=BaseTask, name="local_newsifier.tasks.fetch_due_rss_feeds")
+def fetch_due_rss_feeds(self) -> Dict:
+    """
+    Queue the registered feeds that are due for polling.
+
+    Run frequently by Celery Beat. Feeds in settings.RSS_FEED_URLS are
+    registered first if they have no feed yet. Each feed's next poll time
+    adapts to how often it publishes, so only the due feeds are claimed and
+    handed to process_rss_feeds in one batch.
+
+    Returns:
+        Dict: Result information including the IDs of the queued feeds
+    """
     try:
-        # Use proper session management with context manager
-        with self.session_factory() as session:
-            # Get RSSParser from providers
-            from local_newsifier.di.providers import get_rss_parser
-
-            rss_parser = get_rss_parser()
-
-            for feed_url in feed_urls:
-                try:
-                    # Parse the RSS feed using the parser provider
-                    feed_data = parse_rss_feed(feed_url)
-
-                    feed_result = {
-                        "url": feed_url,
-                        "title": feed_data.get("title", "Unknown"),
-                        "articles_found": len(feed_data.get("entries", [])),
-                        "articles_processed": 0,
-                        "status": "success",
-                    }
-
-                    # Process each article in the feed
-                    for entry in feed_data.get("entries", []):
-                        # Check if article already exists
-                        existing = self.article_crud.get_by_url(session, url=entry.get("link", ""))
-
-                        if not existing:
-                            # Create and save new article
-                            article_id = self.article_service.create_article_from_rss_entry(entry)
-                            if article_id:
-                                # Queue article processing task
-                                process_article.delay(article_id)
-                                feed_result["articles_processed"] += 1
-                                results["articles_added"] += 1
-
-                    results["feeds_processed"] += 1
-                    results["articles_found"] += feed_result["articles_found"]
-                    results["feeds"].append(feed_result)
-
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Error processing feed {feed_url}: {error_msg}")
-                    results["feeds"].append(
-                        {
-                            "url": feed_url,
-                            "status": "error",
-                            "message": error_msg,
-                        }
-                    )
-
-            return results
+        self.rss_feed_service.register_feeds(settings.RSS_FEED_URLS)
+    except Exception as e:
+        # Registered feeds can still be polled
+        logger.exception(f"Error registering configured RSS feeds: {str(e)}")
+
+    try:
+        feed_ids = self.rss_feed_service.claim_due_feeds()
     except Exception as e:
         error_msg = str(e)
-        logger.exception(f"Error fetching RSS feeds: {error_msg}")
-        # Make sure we always return a valid dictionary response
-        return {
-            "status": "error",
-            "message": error_msg,
-            "feeds_processed": 0,
-            "articles_found": 0,
-            "articles_added": 0,
-            "feeds": [],
-        }
+        logger.exception(f"Error claiming due RSS feeds: {error_msg}")
+        return {"status": "error", "message": error_msg, "feeds_queued": 0, "feed_ids": []}
+
+    if feed_ids:
+        logger.info(f"Queueing {len(feed_ids)} due RSS feeds")
+        process_rss_feeds.delay(feed_ids)
+
+    return {"status": "success", "feeds_queued": len(feed_ids), "feed_ids": feed_ids}
+
+
+@app.task(bind=True, base=BaseTask, name="local_newsifier.tasks.process_rss_feeds")
+def process_rss_feeds(self, feed_ids: List[int]) -> Dict:
+    """
+    Fetch and process registered RSS feeds.
+
+    Args:
+        feed_ids: IDs of the feeds to process
+
+    Returns:
+        Dict: Result information including per-feed results and article counts
+    """
+    start = time.perf_counter()
+    feeds = list(
+        self.rss_feed_service.process_feeds(feed_ids, task_queue_func=process_article.delay)
+    )
+    return {
+        "status": "success",
+        "feeds_processed": sum(1 for feed in feeds if feed.get("status") == "success"),
+        "articles_added": sum(feed.get("articles_added", 0) for feed in feeds),
+        "feeds": feeds,
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+@worker_init.connect
+def on_worker_init(sender=None, **kwargs):
+    """Signal handler for worker_init event.
+
+    Runs in the main worker process before the pool forks, so prefork
+    children inherit the loaded spaCy models instead of loading their own.
+    """
+    preload_models(settings.NLP_PRELOAD_MODELS)
 
 
 @worker_ready.connect
 def on_worker_ready(sender, **kwargs):
     """Signal handler for worker_ready event."""
     logger.info("Celery worker is ready")
+
+
+@worker_process_init.connect
+def on_worker_process_init(sender=None, **kwargs):
+    """Signal handler for worker_process_init event.
+
+    Prefork children must not reuse the parent's pooled connections, so each
+    child drops the inherited engines and creates its own on first use.
+    """
+    reset_engines_after_fork()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def on_worker_shutdown(sender=None, **kwargs):
+    """Signal handler for worker_shutdown and worker_process_shutdown events."""
+    logger.info("Celery worker shutting down, disposing database engines")
+    dispose_engines()
+    close_driver_pools()
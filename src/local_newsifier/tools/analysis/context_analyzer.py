@@ -2,12 +2,14 @@
 
 from typing import Annotated, Any, Dict, List, Optional
 
-import spacy
 from fastapi import Depends
 from fastapi_injectable import injectable
 from spacy.language import Language
 from spacy.tokens import Doc, Span
 
+from local_newsifier.tools.analysis_context import AnalysisContext
+from local_newsifier.tools.nlp_models import load_model
+
 
 @injectable(use_cache=False)
 class ContextAnalyzer:
@@ -22,10 +24,10 @@ class ContextAnalyzer:
         """
         self.nlp = nlp_model
 
-        # Fallback to loading model if not injected (for backward compatibility)
+        # Fallback to the shared model registry if not injected
         if self.nlp is None:
             try:
-                self.nlp: Language = spacy.load(model_name)
+                self.nlp: Language = load_model(model_name)
             except OSError:
                 self.nlp = None
 
@@ -170,17 +172,36 @@ class ContextAnalyzer:
             ],
         }
 
-    def analyze_sentiment(self, context: str) -> Dict[str, Any]:
+    def _lemmas(self, context: str, span: Optional[Span] = None) -> Optional[List[str]]:
+        """Get lowercase lemmas for a context, parsing it only when no span is given.
+
+        Args:
+            context: Context text around entity mention
+            span: Already parsed tokens for the context (e.g. a sentence of an
+                AnalysisContext document)
+
+        Returns:
+            List of lemmas, or None if no spaCy model is available
+        """
+        if span is None:
+            if not self.nlp:
+                return None
+            span = self.nlp(context.lower())
+        return [token.lemma_.lower() for token in span]
+
+    def analyze_sentiment(self, context: str, span: Optional[Span] = None) -> Dict[str, Any]:
         """
         Analyze sentiment in entity mention context.
 
         Args:
             context: Context text around entity mention
+            span: Already parsed tokens for the context; parsed here when omitted
 
         Returns:
             Sentiment analysis results with score
         """
-        if not self.nlp:
+        lemmas = self._lemmas(context, span)
+        if lemmas is None:
             return {
                 "score": 0.0,
                 "category": "neutral",
@@ -189,11 +210,9 @@ class ContextAnalyzer:
                 "total_count": 0,
             }
 
-        doc = self.nlp(context.lower())
-
         # Count sentiment words
-        positive_count = sum(1 for token in doc if token.lemma_ in self.sentiment_words["positive"])
-        negative_count = sum(1 for token in doc if token.lemma_ in self.sentiment_words["negative"])
+        positive_count = sum(1 for lemma in lemmas if lemma in self.sentiment_words["positive"])
+        negative_count = sum(1 for lemma in lemmas if lemma in self.sentiment_words["negative"])
 
         # Calculate sentiment score (-1.0 to 1.0)
         total_count = positive_count + negative_count
@@ -217,27 +236,27 @@ class ContextAnalyzer:
             "total_count": total_count,
         }
 
-    def analyze_framing(self, context: str) -> Dict[str, Any]:
+    def analyze_framing(self, context: str, span: Optional[Span] = None) -> Dict[str, Any]:
         """
         Analyze framing of entity in mention context.
 
         Args:
             context: Context text around entity mention
+            span: Already parsed tokens for the context; parsed here when omitted
 
         Returns:
             Framing analysis results with category scores
         """
-        if not self.nlp:
+        lemmas = self._lemmas(context, span)
+        if lemmas is None:
             return {"category": "neutral", "scores": {}, "counts": {}, "total_count": 0}
 
-        doc = self.nlp(context.lower())
-
         # Count framing-related words for each category
         framing_counts = {category: 0 for category in self.framing_categories}
 
-        for token in doc:
+        for lemma in lemmas:
             for category, words in self.framing_categories.items():
-                if token.lemma_ in words:
+                if lemma in words:
                     framing_counts[category] += 1
 
         # Find dominant framing category
@@ -261,18 +280,23 @@ class ContextAnalyzer:
             "total_count": total_count,
         }
 
-    def analyze_context(self, context: str) -> Dict[str, Any]:
+    def analyze_context(self, context: str, span: Optional[Span] = None) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of entity mention context.
 
         Args:
             context: Context text around entity mention
+            span: Already parsed tokens for the context; parsed here when omitted
 
         Returns:
             Complete context analysis results
         """
-        sentiment = self.analyze_sentiment(context)
-        framing = self.analyze_framing(context)
+        # Parse at most once for both sentiment and framing
+        if span is None and self.nlp:
+            span = self.nlp(context.lower())
+
+        sentiment = self.analyze_sentiment(context, span=span)
+        framing = self.analyze_framing(context, span=span)
 
         return {
             "sentiment": sentiment,
@@ -281,12 +305,17 @@ class ContextAnalyzer:
             "word_count": len(context.split()),
         }
 
-    def analyze_entity_contexts(self, entities: List[Dict]) -> List[Dict]:
+    def analyze_entity_contexts(
+        self, entities: List[Dict], analysis_context: Optional[AnalysisContext] = None
+    ) -> List[Dict]:
         """
         Analyze contexts for multiple entities.
 
         Args:
             entities: List of entity dictionaries with 'context' field
+            analysis_context: Parsed article the entities were extracted from;
+                when given, each entity's sentence is taken from it instead of
+                parsing the context again
 
         Returns:
             Entities with added context analysis
@@ -295,7 +324,10 @@ class ContextAnalyzer:
 
         for entity in entities:
             if "context" in entity:
-                context_analysis = self.analyze_context(entity["context"])
+                span = None
+                if analysis_context is not None and "start_char" in entity:
+                    span = analysis_context.sentence_at(entity["start_char"])
+                context_analysis = self.analyze_context(entity["context"], span=span)
 
                 # Create a new entity dict with analysis added
                 analyzed_entity = entity.copy()
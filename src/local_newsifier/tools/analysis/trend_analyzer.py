@@ -3,10 +3,9 @@
 import logging
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import numpy as np
-import spacy
 from fastapi import Depends
 from fastapi_injectable import injectable
 from sqlmodel import Session, select
@@ -15,6 +14,7 @@ from local_newsifier.models.article import Article
 from local_newsifier.models.entity import Entity
 from local_newsifier.models.trend import (TimeFrame, TopicFrequency, TrendAnalysis, TrendEntity,
                                           TrendEvidenceItem, TrendStatus, TrendType)
+from local_newsifier.tools.nlp_models import load_model
 
 logger = logging.getLogger(__name__)
 
@@ -49,11 +49,10 @@ class TrendAnalyzer:
         self._cache: Dict[str, Any] = {}
         self.nlp = nlp_model
 
-        # Fallback to loading model if not injected (for backward compatibility)
+        # Fallback to the shared model registry if not injected
         if self.nlp is None:
             try:
-                self.nlp = spacy.load(model_name)
-                logger.info(f"Loaded spaCy model '{model_name}'")
+                self.nlp = load_model(model_name)
             except OSError:
                 logger.warning(
                     f"spaCy model '{model_name}' not found. Some NLP features will be disabled."
@@ -341,8 +340,8 @@ class TrendAnalyzer:
 
     def detect_entity_trends(
         self,
-        entities: List[Entity],
-        articles: List[Article],
+        entities: Iterable[Entity],
+        articles: Iterable[Article],
         entity_types: List[str],
         min_significance: float = 1.5,
         min_mentions: int = 2,
@@ -350,9 +349,13 @@ class TrendAnalyzer:
     ) -> List[TrendAnalysis]:
         """Detect trends based on entity frequency analysis.
 
+        Entities and articles are each read once, so they can be streamed
+        from the database. Only mention counts per entity and per article are
+        kept, and only the articles cited as evidence.
+
         Args:
-            entities: List of entities to analyze
-            articles: List of articles containing the entities
+            entities: Entities to analyze
+            articles: Articles containing the entities
             entity_types: List of entity types to consider
             min_significance: Minimum significance score for trends
             min_mentions: Minimum number of mentions required
@@ -361,30 +364,28 @@ class TrendAnalyzer:
         Returns:
             List of detected trends
         """
-        if not entities or not articles:
-            return []
-
-        # Group entities by type and text
+        # Count mentions by entity, and by entity within each article
         entity_counts = Counter()
-        entity_objects = defaultdict(list)
+        article_ids_by_entity = defaultdict(set)
+        mentions_by_article = defaultdict(Counter)
 
         for entity in entities:
+            key = (entity.text, entity.entity_type)
             if entity.entity_type in entity_types:
-                key = f"{entity.text}|{entity.entity_type}"
                 entity_counts[key] += 1
-                entity_objects[key].append(entity)
+            if entity.article_id:
+                article_ids_by_entity[key].add(entity.article_id)
+                mentions_by_article[entity.article_id][key] += 1
 
-        # Build article lookup
-        article_lookup = {article.id: article for article in articles}
+        if not entity_counts:
+            return []
 
         # Find significant entities
         significant_entities = []
-        for key, count in entity_counts.items():
+        for (text, entity_type), count in entity_counts.items():
             if count < min_mentions:
                 continue
 
-            text, entity_type = key.split("|")
-
             # Simple significance test for now
             # In a real implementation, we would compare against historical data
             z_score, is_significant = self.calculate_statistical_significance(
@@ -397,10 +398,25 @@ class TrendAnalyzer:
                     "entity_type": entity_type,
                     "mention_count": count,
                     "significance": z_score,
-                    "entities": entity_objects[key],
+                    "article_ids": article_ids_by_entity[(text, entity_type)],
                 }
                 significant_entities.append(entity_data)
 
+        if not significant_entities:
+            return []
+
+        # Keep only the articles cited as evidence
+        evidence_ids = set().union(*(data["article_ids"] for data in significant_entities))
+        article_lookup = {}
+        has_articles = False
+        for article in articles:
+            has_articles = True
+            if article.id in evidence_ids:
+                article_lookup[article.id] = article
+
+        if not has_articles:
+            return []
+
         # Create trend objects
         trends = []
         for data in significant_entities:
@@ -439,26 +455,22 @@ class TrendAnalyzer:
                 )
             )
 
-            # Find related entities
-            if len(data["entities"]) > 0:
-                related_entities = self.find_related_entities(data["entities"][0], entities)
-
-                # Add related entities to trend
-                for related in related_entities[:5]:
-                    trend.add_entity(
-                        TrendEntity(
-                            text=related["text"],
-                            entity_type=related["entity_type"],
-                            frequency=related["co_occurrence_count"],
-                            relevance_score=related["co_occurrence_rate"],
-                        )
+            # Add related entities to trend
+            related_entities = self._co_occurring_entities(
+                (data["text"], data["entity_type"]), data["article_ids"], mentions_by_article
+            )
+            for related in related_entities[:5]:
+                trend.add_entity(
+                    TrendEntity(
+                        text=related["text"],
+                        entity_type=related["entity_type"],
+                        frequency=related["co_occurrence_count"],
+                        relevance_score=related["co_occurrence_rate"],
                     )
+                )
 
             # Add evidence from articles
-            entity_article_ids = {
-                entity.article_id for entity in data["entities"] if entity.article_id
-            }
-            for article_id in entity_article_ids:
+            for article_id in data["article_ids"]:
                 article = article_lookup.get(article_id)
                 if article and article.published_at:
                     trend.add_evidence(
@@ -478,6 +490,51 @@ class TrendAnalyzer:
         trends.sort(key=lambda t: t.confidence_score, reverse=True)
         return trends[:max_trends]
 
+    def _co_occurring_entities(
+        self,
+        key: Tuple[str, str],
+        article_ids: Set[int],
+        mentions_by_article: Dict[int, Counter],
+        threshold: float = 0.3,
+    ) -> List[Dict]:
+        """Find entities mentioned alongside an entity, from per-article mention counts.
+
+        Gives the same results as find_related_entities without needing the
+        entities themselves.
+
+        Args:
+            key: Text and type of the main entity
+            article_ids: IDs of the articles mentioning the main entity
+            mentions_by_article: Mention counts by entity text and type, per article
+            threshold: Minimum co-occurrence threshold
+
+        Returns:
+            List of related entities with correlation scores
+        """
+        if not article_ids:
+            return []
+
+        co_occurrence_counts = Counter()
+        for article_id in article_ids:
+            co_occurrence_counts.update(mentions_by_article[article_id])
+        del co_occurrence_counts[key]
+
+        related = []
+        for (text, entity_type), count in co_occurrence_counts.most_common(10):
+            co_occurrence_rate = count / len(article_ids)
+
+            if co_occurrence_rate >= threshold:
+                related.append(
+                    {
+                        "text": text,
+                        "entity_type": entity_type,
+                        "co_occurrence_rate": co_occurrence_rate,
+                        "co_occurrence_count": count,
+                    }
+                )
+
+        return related
+
     def _generate_trend_description(
         self, topic: str, entity_type: str, trend_type: TrendType, data: Dict
     ) -> str:
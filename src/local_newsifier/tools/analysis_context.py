@@ -0,0 +1,108 @@
+"""Shared parse of a single article for the NLP analysis tools.
+
+Running an article through ``en_core_web_lg`` is by far the most expensive
+step of entity processing. An ``AnalysisContext`` holds the one parsed ``Doc``
+for an article so the entity extractor, context analyzer and sentiment
+analyzer can take sentences, lemmas and noun chunks from it instead of each
+calling ``nlp()`` on the same text again.
+"""
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional
+
+from spacy.language import Language
+from spacy.tokens import Doc, Span
+
+
+class AnalysisContext:
+    """One parsed spaCy document shared by every analysis step for an article."""
+
+    def __init__(self, doc: Doc):
+        """Initialize with an already parsed document.
+
+        Args:
+            doc: Parsed spaCy document for the article text
+        """
+        self.doc = doc
+        self._sentences: Optional[List[Span]] = None
+        self._sentence_starts: Optional[List[int]] = None
+
+    @classmethod
+    def from_text(cls, nlp: Language, text: str) -> "AnalysisContext":
+        """Parse text once and wrap the resulting document.
+
+        Args:
+            nlp: spaCy pipeline to parse with
+            text: Text to parse
+
+        Returns:
+            AnalysisContext for the parsed text
+        """
+        return cls(nlp(text))
+
+    @classmethod
+    def from_texts(
+        cls, nlp: Language, texts: Iterable[str], batch_size: int = 50, n_process: int = 1
+    ) -> Iterator["AnalysisContext"]:
+        """Parse many texts with ``nlp.pipe``, yielding one context per text in order.
+
+        Args:
+            nlp: spaCy pipeline to parse with
+            texts: Texts to parse
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of worker processes spaCy uses (-1 for all cores)
+
+        Yields:
+            AnalysisContext for each input text
+        """
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield cls(doc)
+
+    @property
+    def sentences(self) -> List[Span]:
+        """Sentences of the document, computed once."""
+        if self._sentences is None:
+            self._sentences = list(self.doc.sents)
+            self._sentence_starts = [sent.start_char for sent in self._sentences]
+        return self._sentences
+
+    def sentence_index(self, start_char: int) -> Optional[int]:
+        """Get the index of the sentence containing a character offset.
+
+        Args:
+            start_char: Character offset into the document text
+
+        Returns:
+            Index into ``sentences``, or None if the document has no sentences
+        """
+        sentences = self.sentences
+        if not sentences:
+            return None
+        return max(0, bisect_right(self._sentence_starts, start_char) - 1)
+
+    def sentence_at(self, start_char: int) -> Optional[Span]:
+        """Get the sentence containing a character offset.
+
+        Args:
+            start_char: Character offset into the document text
+
+        Returns:
+            Sentence span, or None if the document has no sentences
+        """
+        index = self.sentence_index(start_char)
+        return None if index is None else self.sentences[index]
+
+    def sentence_window(self, index: int, window: int = 1) -> str:
+        """Get the text of a sentence plus its neighbours.
+
+        Args:
+            index: Index of the central sentence
+            window: Number of sentences before and after to include
+
+        Returns:
+            Sentence texts joined with single spaces
+        """
+        sentences = self.sentences
+        start = max(0, index - window)
+        end = min(len(sentences), index + window + 1)
+        return " ".join(sent.text for sent in sentences[start:end])
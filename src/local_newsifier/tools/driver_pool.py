@@ -0,0 +1,270 @@
+"""Pooled Selenium WebDrivers and per-domain memory of JavaScript rendering.
+
+Starting headless Chrome takes seconds and hundreds of megabytes, and the
+scraper used to start one for every tool instance, which meant one per
+injection. Drivers now come from a bounded, process-wide ``WebDriverPool``:
+
+* at most ``max_size`` drivers exist at once; callers wait for a free one
+  instead of starting another browser
+* a driver is reused for up to ``max_pages`` pages and then quit and
+  replaced, so memory leaked by long-lived browsers is bounded
+* a driver whose page load raised is quit rather than returned, since its
+  session may be dead or stuck mid-navigation
+
+``RenderingMemory`` records per domain whether rendering with a browser was
+actually needed to get an article, so the Selenium fallback runs only for
+domains where it has worked and plain requests are not retried against them.
+Entries expire so a domain is probed again after its site changes.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class WebDriverPool:
+    """Bounded pool of reusable WebDrivers."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = 2,
+        max_pages: int = 50,
+        acquire_timeout: Optional[float] = 60.0,
+    ):
+        """Initialize an empty pool; drivers are created on demand.
+
+        Args:
+            factory: Callable creating a new WebDriver
+            max_size: Maximum number of drivers alive at once
+            max_pages: Pages a driver loads before it is quit and replaced
+            acquire_timeout: Seconds to wait for a free driver; None waits
+                forever
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: List[Tuple[Any, int]] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "discarded": 0}
+
+    def __len__(self) -> int:
+        """Get the number of drivers alive, idle or in use."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of drivers waiting to be reused."""
+        return len(self._idle)
+
+    def _acquire(self) -> Tuple[Any, int]:
+        """Take an idle driver, or create one if the pool has room.
+
+        Returns:
+            The driver and the number of pages it has loaded
+
+        Raises:
+            RuntimeError: If the pool is closed
+            TimeoutError: If no driver became free within acquire_timeout
+        """
+        deadline = None if self.acquire_timeout is None else time.monotonic() + self.acquire_timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is closed")
+                if self._idle:
+                    self.stats["reused"] += 1
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"No WebDriver free after {self.acquire_timeout}s "
+                        f"({self.max_size} in use)"
+                    )
+                self._cond.wait(remaining)
+
+        # Start the browser outside the lock so other callers can return drivers
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        self.stats["created"] += 1
+        return driver, 0
+
+    def _release(self, driver: Any, pages: int, discard: bool) -> None:
+        """Return a driver to the pool, or quit it if it is spent or broken."""
+        with self._cond:
+            keep = not discard and not self._closed and pages < self.max_pages
+            if keep:
+                self._idle.append((driver, pages))
+            else:
+                self._size -= 1
+                self.stats["discarded" if discard else "recycled"] += 1
+            self._cond.notify()
+        if not keep:
+            _quit(driver)
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """Borrow a driver for one page load.
+
+        The driver goes back to the pool when the block exits, unless it has
+        reached max_pages. If the block raises, the driver is quit instead.
+
+        Yields:
+            A WebDriver
+        """
+        driver, pages = self._acquire()
+        try:
+            yield driver
+        except BaseException:
+            self._release(driver, pages + 1, discard=True)
+            raise
+        self._release(driver, pages + 1, discard=False)
+
+    def close(self) -> None:
+        """Quit idle drivers and stop handing out new ones.
+
+        Drivers in use are quit when they are returned.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for driver, _ in idle:
+            _quit(driver)
+
+
+def _quit(driver: Any) -> None:
+    """Quit a driver, logging rather than raising if the browser is already gone."""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error quitting WebDriver: {e}")
+
+
+class RenderingMemory:
+    """Per-domain memory of whether pages needed a browser to render."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        """Initialize an empty memory.
+
+        Args:
+            ttl: Seconds an outcome is remembered; None remembers forever
+        """
+        self.ttl = ttl
+        self._domains: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """Get the domain a URL's outcome is recorded under."""
+        return urlparse(url).netloc.lower()
+
+    def needs_js(self, url: str) -> Optional[bool]:
+        """Check whether pages on a URL's domain need JavaScript rendering.
+
+        Args:
+            url: URL on the domain
+
+        Returns:
+            True if rendering was needed, False if it was not, or None if the
+            domain has no unexpired outcome
+        """
+        domain = self.domain(url)
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None:
+                return None
+            needs_js, recorded_at = entry
+            if self.ttl is not None and time.monotonic() - recorded_at > self.ttl:
+                del self._domains[domain]
+                return None
+            return needs_js
+
+    def record(self, url: str, needs_js: bool) -> None:
+        """Record whether a URL's domain needed JavaScript rendering.
+
+        Args:
+            url: URL on the domain
+            needs_js: Whether a browser was needed to get the page
+        """
+        with self._lock:
+            self._domains[self.domain(url)] = (needs_js, time.monotonic())
+
+
+_pools: Dict[str, WebDriverPool] = {}
+_rendering_memory: Optional[RenderingMemory] = None
+_lock = threading.Lock()
+
+
+def get_driver_pool(key: str, factory: Callable[[], Any]) -> WebDriverPool:
+    """Get the process-wide driver pool for a browser configuration.
+
+    Drivers are only interchangeable when launched with the same options, so
+    there is one pool per key (the scraper uses its user agent). The first
+    caller's factory is used for the pool's lifetime.
+
+    Args:
+        key: Identifier of the browser configuration
+        factory: Callable creating a new WebDriver with that configuration
+
+    Returns:
+        The shared WebDriverPool
+    """
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            from local_newsifier.config.settings import settings
+
+            pool = _pools[key] = WebDriverPool(
+                factory,
+                max_size=settings.SELENIUM_POOL_SIZE,
+                max_pages=settings.SELENIUM_MAX_PAGES_PER_DRIVER,
+                acquire_timeout=settings.SELENIUM_ACQUIRE_TIMEOUT,
+            )
+    return pool
+
+
+def get_rendering_memory() -> RenderingMemory:
+    """Get the process-wide per-domain rendering memory.
+
+    Returns:
+        The shared RenderingMemory
+    """
+    global _rendering_memory
+    with _lock:
+        if _rendering_memory is None:
+            from local_newsifier.config.settings import settings
+
+            _rendering_memory = RenderingMemory(ttl=settings.SELENIUM_RENDERING_MEMORY_TTL)
+    return _rendering_memory
+
+
+def close_driver_pools() -> None:
+    """Quit every pooled driver and forget the process-wide pools."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_driver_pools)
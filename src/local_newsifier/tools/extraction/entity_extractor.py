@@ -1,13 +1,15 @@
 """Entity extraction tool for extracting entities from text content."""
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
-import spacy
 from fastapi import Depends
 from fastapi_injectable import injectable
 from spacy.language import Language
 from spacy.tokens import Doc, Span
 
+from local_newsifier.tools.analysis_context import AnalysisContext
+from local_newsifier.tools.nlp_models import load_model
+
 
 @injectable(use_cache=False)
 class EntityExtractor:
@@ -22,17 +24,50 @@ class EntityExtractor:
         """
         self.nlp = nlp_model
 
-        # Fallback to loading model if not injected (for backward compatibility)
+        # Fallback to the shared model registry if not injected
         if self.nlp is None:
             try:
-                self.nlp: Language = spacy.load(model_name)
+                self.nlp: Language = load_model(model_name)
             except OSError:
                 raise RuntimeError(
                     f"spaCy model '{model_name}' not found. "
                     f"Please install it using: python -m spacy download {model_name}"
                 )
 
-    def extract_entities(self, content: str, entity_types: Optional[Set[str]] = None) -> List[Dict]:
+    def parse(self, content: str) -> AnalysisContext:
+        """Parse content once so every analysis step can share the result.
+
+        Args:
+            content: Text content to parse
+
+        Returns:
+            AnalysisContext wrapping the parsed document
+        """
+        return AnalysisContext.from_text(self.nlp, content)
+
+    def parse_batch(
+        self, texts: Iterable[str], batch_size: int = 50, n_process: int = 1
+    ) -> Iterator[AnalysisContext]:
+        """Parse many texts using spaCy's batched ``nlp.pipe``.
+
+        Args:
+            texts: Text contents to parse
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of worker processes spaCy uses (-1 for all cores)
+
+        Yields:
+            AnalysisContext for each input text, in input order
+        """
+        return AnalysisContext.from_texts(
+            self.nlp, texts, batch_size=batch_size, n_process=n_process
+        )
+
+    def extract_entities(
+        self,
+        content: str,
+        entity_types: Optional[Set[str]] = None,
+        analysis_context: Optional[AnalysisContext] = None,
+    ) -> List[Dict]:
         """
         Extract entities from text content.
 
@@ -40,11 +75,50 @@ class EntityExtractor:
             content: Text content to analyze
             entity_types: Optional set of entity types to include (e.g., {"PERSON", "ORG"})
                           If None, all entity types are included
+            analysis_context: Already parsed content; parsed here when omitted
+
+        Returns:
+            List of extracted entities with metadata
+        """
+        if analysis_context is None:
+            analysis_context = self.parse(content)
+        return self._entities_from_doc(analysis_context.doc, entity_types)
+
+    def extract_entities_batch(
+        self,
+        texts: Iterable[str],
+        entity_types: Optional[Set[str]] = None,
+        batch_size: int = 50,
+        n_process: int = 1,
+    ) -> Iterator[List[Dict]]:
+        """
+        Extract entities from many texts using spaCy's batched ``nlp.pipe``.
+
+        Results are yielded lazily, one list per input text and in input order,
+        so callers can persist each article as soon as it has been parsed.
+
+        Args:
+            texts: Text contents to analyze
+            entity_types: Optional set of entity types to include
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of worker processes spaCy uses (-1 for all cores)
+
+        Yields:
+            List of extracted entities with metadata for each text
+        """
+        for analysis_context in self.parse_batch(texts, batch_size=batch_size, n_process=n_process):
+            yield self._entities_from_doc(analysis_context.doc, entity_types)
+
+    def _entities_from_doc(self, doc: Doc, entity_types: Optional[Set[str]] = None) -> List[Dict]:
+        """Build entity dictionaries from a parsed spaCy document.
+
+        Args:
+            doc: Parsed spaCy document
+            entity_types: Optional set of entity types to include
 
         Returns:
             List of extracted entities with metadata
         """
-        doc = self.nlp(content)
         entities = []
 
         for ent in doc.ents:
@@ -100,7 +174,11 @@ class EntityExtractor:
         return self.extract_entities(content, entity_types={"GPE", "LOC"})
 
     def extract_entities_with_context(
-        self, content: str, entity_types: Optional[Set[str]] = None, context_window: int = 1
+        self,
+        content: str,
+        entity_types: Optional[Set[str]] = None,
+        context_window: int = 1,
+        analysis_context: Optional[AnalysisContext] = None,
     ) -> List[Dict]:
         """
         Extract entities with expanded context.
@@ -109,47 +187,24 @@ class EntityExtractor:
             content: Text content to analyze
             entity_types: Optional set of entity types to include
             context_window: Number of sentences before and after to include in context
+            analysis_context: Already parsed content; parsed here when omitted
 
         Returns:
             List of extracted entities with expanded context
         """
-        # First extract basic entities
-        entities = self.extract_entities(content, entity_types)
-
-        # Process document once
-        doc = self.nlp(content)
-
-        # Convert sentences to list for indexing
-        sentences = list(doc.sents)
-
-        # Map start character positions to sentence indices
-        sent_indices = {}
-        for i, sent in enumerate(sentences):
-            sent_indices[sent.start_char] = i
+        # Parse once and take both entities and sentences from the same document
+        if analysis_context is None:
+            analysis_context = self.parse(content)
+        entities = self.extract_entities(
+            content, entity_types, analysis_context=analysis_context
+        )
 
         # Expand context for each entity
         for entity in entities:
-            # Find the entity in the document
-            entity_span = doc.char_span(
-                entity["start_char"], entity["end_char"], alignment_mode="expand"
-            )
-
-            if entity_span:
-                # Find the sentence containing this entity
-                for sent in doc.sents:
-                    if entity_span.start >= sent.start and entity_span.end <= sent.end:
-                        sent_idx = sent_indices[sent.start_char]
-
-                        # Collect context sentences
-                        context_sents = []
-                        start_idx = max(0, sent_idx - context_window)
-                        end_idx = min(len(sentences), sent_idx + context_window + 1)
-
-                        for i in range(start_idx, end_idx):
-                            context_sents.append(sentences[i].text)
-
-                        # Update context with expanded window
-                        entity["expanded_context"] = " ".join(context_sents)
-                        break
+            sent_idx = analysis_context.sentence_index(entity["start_char"])
+            if sent_idx is not None:
+                entity["expanded_context"] = analysis_context.sentence_window(
+                    sent_idx, context_window
+                )
 
         return entities
@@ -0,0 +1,105 @@
+"""Concurrent RSS feed fetching.
+
+Feeds are fetched on a thread pool with a global concurrency limit and a
+per-host limit, so one slow publisher holds up only its own feeds and no
+single host receives more than a few requests at once. Results are yielded as
+each fetch completes, letting callers parse and store one feed while the
+others are still downloading.
+"""
+
+import logging
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+from local_newsifier.config.settings import settings
+from local_newsifier.tools.rss_parser import parse_rss_feed
+
+logger = logging.getLogger(__name__)
+
+
+class FeedFetchResult(NamedTuple):
+    """Outcome of fetching one feed."""
+
+    url: str
+    feed_data: Optional[Dict[str, Any]]
+    elapsed: float
+    error: Optional[Exception] = None
+
+
+def _host(url: str) -> str:
+    """Get the host a feed URL is fetched from."""
+    return urlparse(url).netloc.lower()
+
+
+def _timed_fetch(
+    fetch: Callable[[str], Dict[str, Any]], url: str
+) -> Tuple[Optional[Dict[str, Any]], float, Optional[Exception]]:
+    """Fetch a feed, timing it and capturing any error."""
+    start = time.perf_counter()
+    try:
+        return fetch(url), time.perf_counter() - start, None
+    except Exception as e:
+        logger.error(f"Error fetching feed {url}: {str(e)}")
+        return None, time.perf_counter() - start, e
+
+
+def fetch_feeds(
+    feed_urls: Iterable[str],
+    fetch: Optional[Callable[[str], Dict[str, Any]]] = None,
+    max_workers: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+) -> Iterator[FeedFetchResult]:
+    """Fetch feeds concurrently, yielding each result as it completes.
+
+    Feeds whose host is already at its limit wait in the queue without taking
+    a worker, so a burst of feeds from one publisher cannot starve the others.
+
+    Args:
+        feed_urls: URLs of the feeds to fetch
+        fetch: Function fetching and parsing one feed URL; defaults to
+            parse_rss_feed
+        max_workers: Maximum number of feeds fetched at once; defaults to
+            settings.RSS_FETCH_MAX_WORKERS
+        per_host_limit: Maximum number of feeds fetched at once from one
+            host; defaults to settings.RSS_FETCH_PER_HOST_LIMIT
+
+    Yields:
+        FeedFetchResult for each feed, in completion order. Exceptions raised
+        by fetch are returned in its error field rather than raised
+    """
+    fetch = fetch or parse_rss_feed
+    max_workers = max_workers or settings.RSS_FETCH_MAX_WORKERS
+    per_host_limit = per_host_limit or settings.RSS_FETCH_PER_HOST_LIMIT
+
+    queued = deque(feed_urls)
+    if not queued:
+        return
+
+    active_per_host: Counter = Counter()
+    running: Dict[Any, str] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(queued)), thread_name_prefix="feed-fetch"
+    ) as executor:
+        while queued or running:
+            # Start every queued feed the global and per-host limits allow
+            waiting = deque()
+            while queued and len(running) < max_workers:
+                url = queued.popleft()
+                host = _host(url)
+                if active_per_host[host] >= per_host_limit:
+                    waiting.append(url)
+                    continue
+                active_per_host[host] += 1
+                running[executor.submit(_timed_fetch, fetch, url)] = url
+            queued.extendleft(reversed(waiting))
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = running.pop(future)
+                active_per_host[_host(url)] -= 1
+                feed_data, elapsed, error = future.result()
+                yield FeedFetchResult(url, feed_data, elapsed, error)
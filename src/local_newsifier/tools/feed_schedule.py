@@ -0,0 +1,115 @@
+"""Adaptive polling intervals for RSS feeds.
+
+Each registered feed is polled on its own schedule rather than all feeds
+every hour. After each fetch the feed's publish interval is estimated from
+the publish dates of its items, and feeds whose fetches keep coming back
+unchanged are backed off. A feed is polled about twice per publish interval,
+within the configured minimum and maximum, and failing feeds back off
+exponentially.
+"""
+
+import statistics
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Union
+
+from local_newsifier.config.settings import settings
+
+# Weight of the newest observation in the running averages
+SMOOTHING = 0.3
+
+# Polls per publish interval
+POLLS_PER_PUBLISH_INTERVAL = 2
+
+
+def _as_utc(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO publish date, treating naive times as UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def observed_publish_interval(
+    published: Iterable[Optional[Union[str, datetime]]], now: Optional[datetime] = None
+) -> Optional[float]:
+    """Estimate how often a feed publishes from its items' publish dates.
+
+    The estimate is the median gap between consecutive items, or the age of
+    the newest item when that is longer, so a feed that has gone quiet is not
+    polled at the rate it used to publish.
+
+    Args:
+        published: Publish dates of the feed's items, as datetimes or ISO
+            strings; missing or unparseable dates are ignored
+        now: Current time; defaults to now
+
+    Returns:
+        Estimated seconds between items, or None with fewer than two dates
+    """
+    times = []
+    for value in published:
+        if not value:
+            continue
+        try:
+            times.append(_as_utc(value))
+        except (TypeError, ValueError):
+            continue
+
+    times = sorted(set(times))
+    if len(times) < 2:
+        return None
+
+    gaps = [(later - earlier).total_seconds() for earlier, later in zip(times, times[1:])]
+    age = ((now or datetime.now(timezone.utc)) - times[-1]).total_seconds()
+    return max(statistics.median(gaps), age)
+
+
+def update_average(previous: Optional[float], observed: float) -> float:
+    """Fold an observation into an exponentially weighted running average.
+
+    Args:
+        previous: Current average, or None before the first observation
+        observed: New observation
+
+    Returns:
+        Updated average
+    """
+    if previous is None:
+        return observed
+    return previous + SMOOTHING * (observed - previous)
+
+
+def next_fetch_interval(
+    publish_interval: Optional[float],
+    not_modified_rate: float = 0.0,
+    previous_interval: Optional[float] = None,
+    failed: bool = False,
+    min_interval: Optional[float] = None,
+    max_interval: Optional[float] = None,
+) -> float:
+    """Work out how long to wait before polling a feed again.
+
+    Args:
+        publish_interval: Average seconds between the feed's items, or None
+            if unknown
+        not_modified_rate: Fraction of recent fetches that found the feed
+            unchanged; the interval grows by up to double as it approaches 1
+        previous_interval: Interval before this fetch
+        failed: Whether this fetch failed; failures double the previous
+            interval
+        min_interval: Shortest interval; defaults to settings.RSS_POLL_MIN_INTERVAL
+        max_interval: Longest interval; defaults to settings.RSS_POLL_MAX_INTERVAL
+
+    Returns:
+        Seconds until the next fetch
+    """
+    min_interval = min_interval or settings.RSS_POLL_MIN_INTERVAL
+    max_interval = max_interval or settings.RSS_POLL_MAX_INTERVAL
+
+    if failed:
+        interval = 2 * (previous_interval or settings.RSS_POLL_DEFAULT_INTERVAL)
+    elif publish_interval is None:
+        interval = settings.RSS_POLL_DEFAULT_INTERVAL * (1 + not_modified_rate)
+    else:
+        interval = publish_interval / POLLS_PER_PUBLISH_INTERVAL * (1 + not_modified_rate)
+
+    return min(max(interval, min_interval), max_interval)
@@ -0,0 +1,396 @@
+"""On-disk cache of HTTP responses for article scraping and feed fetching.
+
+Re-running pipelines during backfills or after model changes fetches the same
+article and feed URLs again. With ``HTTP_CACHE_ENABLED`` set, ``WebScraperTool``
+and ``RSSParser`` go through an ``HTTPCache`` first: a SQLite table keyed by
+URL holding zlib-compressed bodies.
+
+* a response is kept for up to the TTL, and served without a request while
+  it is fresh
+* Cache-Control and Expires can make it stale sooner: ``no-store`` responses
+  are not stored, ``no-cache`` ones are always revalidated, and ``max-age``
+  shortens the lifetime
+* a stale response with an ETag or Last-Modified is revalidated with a
+  conditional request, and a 304 serves the stored body
+* in offline mode every stored response is served however old it is, so
+  development and benchmark runs are reproducible without the network
+
+Hits, misses and revalidations are counted in ``HTTPCache.stats``.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Minimum interval between TTL evictions
+EVICTION_INTERVAL = 3600
+
+# Request headers that make a request conditional
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# Response headers that describe the transfer rather than the stored body
+TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def freshness_lifetime(headers: Mapping[str, str], ttl: float) -> Optional[float]:
+    """Work out how long a response may be served without revalidation.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        ttl: Longest lifetime, used when the response specifies none
+
+    Returns:
+        Seconds the response is fresh, or None if it must not be stored
+    """
+    directives = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        if "max-age" in directives:
+            lifetime = float(directives["max-age"])
+        elif headers.get("Expires"):
+            expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+            date = headers.get("Date")
+            lifetime = expires - (parsedate_to_datetime(date).timestamp() if date else time.time())
+        else:
+            return ttl
+        lifetime -= float(headers.get("Age") or 0)
+    except (TypeError, ValueError):
+        # Unparseable dates mean already expired
+        return 0.0
+    return min(max(lifetime, 0.0), ttl)
+
+
+class CachedResponse:
+    """A stored response, with the parts of a requests or httpx response the tools use."""
+
+    is_error = False
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        stored_at: float,
+        expires_at: float,
+    ):
+        """Initialize the response.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the stored response
+            headers: Response headers
+            content: Decoded response body
+            stored_at: When the response was stored or last revalidated
+            expires_at: When the response becomes stale
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the charset from Content-Type, defaulting to UTF-8."""
+        encoding = "utf-8"
+        for param in (self.headers.get("Content-Type") or "").split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset" and value:
+                encoding = value.strip('"')
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        """Do nothing; only successful responses are stored."""
+
+    def validators(self) -> Dict[str, str]:
+        """Get the headers for a conditional request revalidating this response."""
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+class HTTPCache:
+    """HTTP responses kept in a local SQLite table keyed by URL."""
+
+    def __init__(self, path: str, ttl: float = 86400, offline: bool = False):
+        """Open, creating if needed, the cache.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds a response is kept; responses may go stale sooner if
+                their Cache-Control or Expires headers say so
+            offline: Serve every stored response however old, and keep them
+                past the TTL
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.offline = offline
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            # WAL lets worker processes read while another writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, "
+                "status_code INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, "
+                "stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_responses_stored_at ON responses (stored_at)"
+            )
+        self._last_eviction = 0.0
+        self.evict_expired()
+
+    def __len__(self) -> int:
+        """Get the number of stored responses."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _load(self, url: str) -> Optional[CachedResponse]:
+        """Read a stored response, ignoring ones older than the TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, body, stored_at, expires_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, body, stored_at, expires_at = row
+        if not self.offline and time.time() - stored_at > self.ttl:
+            return None
+        return CachedResponse(
+            url, status_code, json.loads(headers), zlib.decompress(body), stored_at, expires_at
+        )
+
+    def lookup(self, url: str) -> Tuple[Optional[CachedResponse], Dict[str, str]]:
+        """Look up a URL, counting a hit or a miss.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            The stored response if it can be served, else None and the
+            headers for a conditional request revalidating a stale one
+        """
+        cached = self._load(url)
+        if cached is not None and (self.offline or time.time() < cached.expires_at):
+            self.stats["hits"] += 1
+            return cached, {}
+        self.stats["misses"] += 1
+        return None, cached.validators() if cached is not None else {}
+
+    def store(
+        self, url: str, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> None:
+        """Store a response if it is cacheable.
+
+        Only 200 responses not marked no-store are stored.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the response
+            headers: Response headers
+            content: Decoded response body
+        """
+        if status_code != 200:
+            return
+        headers = CaseInsensitiveDict(headers)
+        lifetime = freshness_lifetime(headers, self.ttl)
+        if lifetime is None:
+            return
+
+        now = time.time()
+        stored_headers = {
+            name: value for name, value in headers.items() if name.lower() not in TRANSFER_HEADERS
+        }
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status_code, headers, body, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    status_code,
+                    json.dumps(stored_headers),
+                    zlib.compress(content),
+                    now,
+                    now + lifetime,
+                ),
+            )
+        self.stats["stored"] += 1
+        if now - self._last_eviction >= EVICTION_INTERVAL:
+            self.evict_expired()
+
+    def revalidate(self, url: str, headers: Mapping[str, str]) -> Optional[CachedResponse]:
+        """Refresh a stored response after the server answered 304 Not Modified.
+
+        Args:
+            url: Requested URL
+            headers: Headers of the 304 response, which update the stored ones
+
+        Returns:
+            The refreshed response, or None if there was none stored
+        """
+        cached = self._load(url)
+        if cached is None:
+            return None
+        cached.headers.update(
+            {name: value for name, value in headers.items() if name.lower() not in TRANSFER_HEADERS}
+        )
+        lifetime = freshness_lifetime(cached.headers, self.ttl)
+        if lifetime is None:
+            return cached
+
+        cached.stored_at = time.time()
+        cached.expires_at = cached.stored_at + lifetime
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, expires_at = ? WHERE url = ?",
+                (json.dumps(dict(cached.headers)), cached.stored_at, cached.expires_at, url),
+            )
+        self.stats["revalidated"] += 1
+        return cached
+
+    def _conditional(
+        self, headers: Optional[Dict[str, str]], validators: Dict[str, str]
+    ) -> Tuple[Dict[str, str], bool]:
+        """Add revalidation headers unless the caller made its own request conditional."""
+        headers = dict(headers or {})
+        if not validators or any(name in headers for name in CONDITIONAL_HEADERS):
+            return headers, False
+        headers.update(validators)
+        return headers, True
+
+    def _complete(self, url: str, response: Any, revalidating: bool) -> Any:
+        """Store a fresh response or refresh the stored one after a 304."""
+        if response.status_code == 304 and revalidating:
+            refreshed = self.revalidate(url, response.headers)
+            if refreshed is not None:
+                return refreshed
+        self.store(url, response.status_code, response.headers, response.content)
+        return response
+
+    def fetch(
+        self,
+        url: str,
+        send: Callable[[Dict[str, str]], Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Get a URL through the cache.
+
+        A caller's own If-None-Match or If-Modified-Since headers are sent
+        unchanged and a 304 answering them is returned to the caller.
+
+        Args:
+            url: URL to get
+            send: Callable making the request with the given headers and
+                returning a requests or httpx response
+            headers: Request headers
+
+        Returns:
+            A CachedResponse, or the response from send
+        """
+        cached, validators = self.lookup(url)
+        if cached is not None:
+            return cached
+        headers, revalidating = self._conditional(headers, validators)
+        return self._complete(url, send(headers), revalidating)
+
+    async def afetch(
+        self,
+        url: str,
+        send: Callable[[Dict[str, str]], Awaitable[Any]],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Get a URL through the cache with an async send; see fetch."""
+        cached, validators = self.lookup(url)
+        if cached is not None:
+            return cached
+        headers, revalidating = self._conditional(headers, validators)
+        return self._complete(url, await send(headers), revalidating)
+
+    def evict_expired(self) -> int:
+        """Forget responses stored longer ago than the TTL, except in offline mode.
+
+        Returns:
+            Number of responses forgotten
+        """
+        self._last_eviction = time.time()
+        if self.offline:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Forget every stored response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+_cache: Optional[HTTPCache] = None
+_cache_pid: Optional[int] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Get the process-wide HTTP cache, if enabled by HTTP_CACHE_ENABLED.
+
+    Each process opens its own connection, so prefork workers do not share
+    one inherited from their parent.
+
+    Returns:
+        The shared HTTPCache, or None if caching is disabled
+    """
+    global _cache, _cache_pid
+    from local_newsifier.config.settings import settings
+
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache_pid != os.getpid():
+            _cache = HTTPCache(
+                str(Path(settings.CACHE_DIR) / "http_cache.sqlite3"),
+                ttl=settings.HTTP_CACHE_TTL,
+                offline=settings.HTTP_CACHE_OFFLINE,
+            )
+            _cache_pid = os.getpid()
+    return _cache
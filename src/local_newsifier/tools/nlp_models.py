@@ -0,0 +1,127 @@
+"""Process-wide registry of loaded spaCy models.
+
+Loading ``en_core_web_lg`` takes seconds and close to a gigabyte of memory, so
+every tool that needs a spaCy pipeline should obtain it from this registry
+instead of calling ``spacy.load`` itself. Each model name is loaded once per
+process, warmed with a short dummy document and then shared.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import spacy
+from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+# Text run through a freshly loaded pipeline so lazy initialisation (vectors,
+# lookup tables, thinc buffers) happens at load time rather than on first use
+WARMUP_TEXT = (
+    "The Gainesville City Commission met on Monday. "
+    "Mayor Harvey Ward discussed the University of Florida budget."
+)
+
+_models: Dict[str, Language] = {}
+_model_stats: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+
+def _get_rss_bytes() -> Optional[int]:
+    """Get the resident set size of the current process, if psutil is available."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def load_model(model_name: str = "en_core_web_lg") -> Language:
+    """Get the shared spaCy model, loading and warming it on first use.
+
+    Args:
+        model_name: Name of the spaCy model to load
+
+    Returns:
+        The shared spaCy Language object
+
+    Raises:
+        OSError: If the model is not installed
+    """
+    nlp = _models.get(model_name)
+    if nlp is not None:
+        return nlp
+
+    with _lock:
+        # Another thread may have loaded the model while we waited
+        nlp = _models.get(model_name)
+        if nlp is not None:
+            return nlp
+
+        rss_before = _get_rss_bytes()
+        start = time.perf_counter()
+        nlp = spacy.load(model_name)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        nlp(WARMUP_TEXT)
+        warmup_seconds = time.perf_counter() - start
+
+        rss_after = _get_rss_bytes()
+        memory_mb = (
+            (rss_after - rss_before) / (1024 * 1024)
+            if rss_before is not None and rss_after is not None
+            else 0.0
+        )
+
+        _models[model_name] = nlp
+        _model_stats[model_name] = {
+            "load_seconds": round(load_seconds, 3),
+            "warmup_seconds": round(warmup_seconds, 3),
+            "memory_mb": round(memory_mb, 1),
+        }
+        logger.info(
+            f"Loaded spaCy model '{model_name}' in {load_seconds:.2f}s "
+            f"(warmup {warmup_seconds:.2f}s, ~{memory_mb:.0f} MB resident)"
+        )
+        return nlp
+
+
+def preload_models(model_names: Iterable[str]) -> List[str]:
+    """Load and warm several models, logging instead of raising on failure.
+
+    Intended for process startup (Celery worker init, FastAPI startup) so the
+    load cost is paid once before any work is accepted.
+
+    Args:
+        model_names: Names of the spaCy models to load
+
+    Returns:
+        Names of the models that were loaded successfully
+    """
+    loaded = []
+    for model_name in model_names:
+        try:
+            load_model(model_name)
+            loaded.append(model_name)
+        except (ImportError, OSError) as e:
+            logger.warning(f"Failed to preload spaCy model '{model_name}': {str(e)}")
+    return loaded
+
+
+def get_model_stats() -> Dict[str, Dict[str, float]]:
+    """Get load time and memory statistics for every loaded model.
+
+    Returns:
+        Dictionary mapping model name to its load_seconds, warmup_seconds and memory_mb
+    """
+    return {name: dict(stats) for name, stats in _model_stats.items()}
+
+
+def clear_models() -> None:
+    """Forget all loaded models so the next request loads them again."""
+    with _lock:
+        _models.clear()
+        _model_stats.clear()
@@ -0,0 +1,316 @@
+"""Cross-article cache of canonical entities for entity resolution.
+
+Resolving mentions needs every canonical entity, but reading the whole
+``canonical_entities`` table for each article makes entity processing
+O(table) per article. This cache keeps two tiers:
+
+* an in-process ``CanonicalEntityIndex`` loaded once, plus an LRU of recent
+  resolutions so repeated mentions ("Gainesville", "City Commission") skip
+  normalization and fuzzy matching entirely
+* an optional shared Redis tier holding a snapshot of the table and a version
+  stamp, so a cold worker can load from Redis and a warm worker only touches
+  the database when another worker has created canonical entities
+
+Entities created by this worker are added directly. Entities created by other
+workers become visible through an id watermark: a refresh reads only rows with
+an id above the highest one read from the database (minus a small lookback
+for transactions that committed out of order). This worker's own inserts never
+move the watermark, since other workers' rows with lower ids may still be
+uncommitted.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlmodel import Session
+
+from local_newsifier.tools.resolution.canonical_entity_index import CanonicalEntityIndex
+from local_newsifier.tools.resolution.entity_resolver import EntityResolver
+
+logger = logging.getLogger(__name__)
+
+
+class CanonicalEntityCache:
+    """Two-tier cache of canonical entities shared by every article a worker processes."""
+
+    def __init__(
+        self,
+        resolver: EntityResolver,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "local_newsifier:canonical_entities",
+        lru_size: int = 10000,
+        lookback: int = 100,
+    ):
+        """Initialize an empty cache; it is loaded on the first refresh.
+
+        Args:
+            resolver: Resolver providing normalization, threshold and match logic
+            redis_client: Optional Redis client for the shared tier
+            key_prefix: Prefix for the Redis keys
+            lru_size: Maximum number of cached mention resolutions
+            lookback: Number of ids below the watermark re-read on refresh, to
+                pick up rows whose transactions committed out of order
+        """
+        self.resolver = resolver
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.lru_size = lru_size
+        self.lookback = lookback
+
+        self.index: Optional[CanonicalEntityIndex] = None
+        self.watermark = 0
+        self._known_ids: Set[int] = set()
+        self._version: Optional[int] = None
+        self._resolutions: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "refreshes": 0}
+
+    @property
+    def _entities_key(self) -> str:
+        return f"{self.key_prefix}:entities"
+
+    @property
+    def _watermark_key(self) -> str:
+        return f"{self.key_prefix}:watermark"
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.key_prefix}:version"
+
+    @staticmethod
+    def _to_dict(entity: Any) -> Dict:
+        """Convert a CanonicalEntity row to the dict form used for resolution."""
+        return {"name": entity.name, "entity_type": entity.entity_type, "id": entity.id}
+
+    def refresh(self, session: Session, canonical_entity_crud) -> None:
+        """Load the cache on first use, otherwise pick up entities created elsewhere.
+
+        Args:
+            session: Database session
+            canonical_entity_crud: CRUD for canonical entities
+        """
+        with self._lock:
+            if self.index is None:
+                self._load(session, canonical_entity_crud)
+                return
+
+            version = self._redis_version()
+            if version is not None and version == self._version:
+                # No worker has created canonical entities since the last refresh
+                return
+
+            self._refresh_from_db(session, canonical_entity_crud)
+            self._version = version
+
+    def resolve(self, entity_text: str, entity_type: str) -> Dict:
+        """Resolve a mention against the cached canonical entities.
+
+        Args:
+            entity_text: Text of the entity to resolve
+            entity_type: Type of the entity (e.g., "PERSON", "ORG")
+
+        Returns:
+            Canonical entity data as returned by EntityResolver.resolve_entity
+        """
+        key = (entity_text, entity_type)
+        with self._lock:
+            cached = self._resolutions.get(key)
+            if cached is not None:
+                self._resolutions.move_to_end(key)
+                self.stats["hits"] += 1
+                return dict(cached)
+
+            self.stats["misses"] += 1
+            resolved = self.resolver.resolve_entity(entity_text, entity_type, self.index)
+            self._resolutions[key] = resolved
+            if len(self._resolutions) > self.lru_size:
+                self._resolutions.popitem(last=False)
+            return dict(resolved)
+
+    def add(self, entity: Dict) -> None:
+        """Add a canonical entity created by this worker.
+
+        The entity is indexed locally, written to the shared snapshot and the
+        shared version is bumped so other workers refresh.
+
+        Args:
+            entity: Canonical entity dict with 'name', 'entity_type' and 'id'
+        """
+        with self._lock:
+            if not self._add_local([entity]):
+                return
+
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.hset(self._entities_key, str(entity["id"]), json.dumps(entity))
+                pipe.incr(self._version_key)
+                version = pipe.execute()[-1]
+                with self._lock:
+                    # Our own bump needs no refresh; anyone else's still does
+                    if self._version is not None and version == self._version + 1:
+                        self._version = version
+            except Exception as e:
+                logger.warning(f"Failed to publish canonical entity to Redis: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop all cached state; the next refresh loads from scratch."""
+        with self._lock:
+            self.index = None
+            self.watermark = 0
+            self._known_ids.clear()
+            self._version = None
+            self._resolutions.clear()
+
+    def _add_local(self, entities: Iterable[Dict]) -> int:
+        """Index entities not seen before; returns how many were added."""
+        if self.index is None:
+            self.index = self.resolver.build_index()
+
+        added = 0
+        for entity in entities:
+            entity_id = entity.get("id")
+            if entity_id is not None:
+                if entity_id in self._known_ids:
+                    continue
+                self._known_ids.add(entity_id)
+            self.index.add(entity)
+            added += 1
+
+        if added:
+            # New entities can change the outcome of earlier resolutions
+            self._resolutions.clear()
+        return added
+
+    def _advance_watermark(self, rows: Iterable[Dict]) -> None:
+        """Move the watermark past rows read from the database."""
+        self.watermark = max([self.watermark, *(row["id"] for row in rows)])
+
+    def _load(self, session: Session, canonical_entity_crud) -> None:
+        """Load the full set of canonical entities, from Redis when possible."""
+        self.stats["loads"] += 1
+        self._version = self._redis_version()
+
+        snapshot = self._redis_snapshot()
+        if snapshot is not None:
+            entities, snapshot_watermark = snapshot
+            self._add_local(entities)
+            # Everything at or below the snapshot watermark came from the
+            # database; only newer rows need to be read
+            self.watermark = snapshot_watermark
+            self._refresh_from_db(session, canonical_entity_crud)
+            logger.info(f"Loaded {len(self.index)} canonical entities from Redis")
+            return
+
+        rows = [
+            self._to_dict(entity)
+            for entity in canonical_entity_crud.iter_all(
+                session, columns=["id", "name", "entity_type"]
+            )
+        ]
+        self._add_local(rows)
+        self._advance_watermark(rows)
+        self._publish(rows)
+        logger.info(f"Loaded {len(self.index)} canonical entities from the database")
+
+    def _refresh_from_db(self, session: Session, canonical_entity_crud) -> None:
+        """Read canonical entities created since the watermark."""
+        self.stats["refreshes"] += 1
+        after_id = max(0, self.watermark - self.lookback)
+        rows = [
+            self._to_dict(entity)
+            for entity in canonical_entity_crud.get_after_id(session, after_id=after_id)
+        ]
+        self._add_local(rows)
+        self._advance_watermark(rows)
+        self._publish(rows)
+
+    def _redis_version(self) -> Optional[int]:
+        """Get the shared version stamp, or None without a usable Redis tier."""
+        if self.redis is None:
+            return None
+        try:
+            return int(self.redis.get(self._version_key) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read canonical entity version from Redis: {str(e)}")
+            return None
+
+    def _redis_snapshot(self) -> Optional[Tuple[list, int]]:
+        """Get the shared snapshot and its database watermark, if one exists."""
+        if self.redis is None:
+            return None
+        try:
+            watermark = self.redis.get(self._watermark_key)
+            if watermark is None:
+                return None
+            entities = [json.loads(value) for value in self.redis.hvals(self._entities_key)]
+            # Index in id order, as a database load would, so ties resolve the same way
+            entities.sort(key=lambda entity: entity["id"])
+            return entities, int(watermark)
+        except Exception as e:
+            logger.warning(f"Failed to read canonical entity snapshot from Redis: {str(e)}")
+            return None
+
+    def _publish(self, entities: list) -> None:
+        """Write entities read from the database to the shared snapshot."""
+        if self.redis is None:
+            return
+        try:
+            pipe = self.redis.pipeline()
+            if entities:
+                pipe.hset(
+                    self._entities_key,
+                    mapping={str(entity["id"]): json.dumps(entity) for entity in entities},
+                )
+            pipe.get(self._watermark_key)
+            current = pipe.execute()[-1]
+            # The watermark only moves forward; it marks rows known to be in the snapshot
+            if current is None or int(current) < self.watermark:
+                self.redis.set(self._watermark_key, self.watermark)
+        except Exception as e:
+            logger.warning(f"Failed to publish canonical entities to Redis: {str(e)}")
+
+
+_cache: Optional[CanonicalEntityCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_canonical_entity_cache() -> CanonicalEntityCache:
+    """Get the process-wide canonical entity cache, creating it on first use.
+
+    The Redis tier is enabled when ``CANONICAL_ENTITY_CACHE_REDIS_URL`` is set.
+
+    Returns:
+        The shared CanonicalEntityCache
+    """
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            from local_newsifier.config.settings import get_settings
+
+            settings = get_settings()
+            redis_client = None
+            if settings.CANONICAL_ENTITY_CACHE_REDIS_URL:
+                import redis
+
+                redis_client = redis.Redis.from_url(settings.CANONICAL_ENTITY_CACHE_REDIS_URL)
+
+            _cache = CanonicalEntityCache(
+                resolver=EntityResolver(),
+                redis_client=redis_client,
+                lru_size=settings.CANONICAL_ENTITY_CACHE_SIZE,
+            )
+    return _cache
+
+
+def reset_canonical_entity_cache() -> None:
+    """Forget the process-wide cache so the next use builds a fresh one."""
+    global _cache
+    with _cache_lock:
+        _cache = None
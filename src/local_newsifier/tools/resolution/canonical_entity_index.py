@@ -0,0 +1,221 @@
+"""In-memory index of canonical entities for fast mention resolution.
+
+``EntityResolver.find_matching_entity`` originally scanned every canonical
+entity three times per mention and ran ``SequenceMatcher`` against every
+entity of the same type. This index answers the same question with:
+
+* a per-type hash map from lowercased name to entity, used for both the exact
+  and the normalized-name lookups
+* a per-type character bigram inverted index that blocks fuzzy matching down
+  to a small candidate set before any ``SequenceMatcher`` call
+
+Blocking is lossless for thresholds above 2/3 (the default is 0.85). If
+``SequenceMatcher`` finds ``M`` matching characters in ``nb`` blocks, every
+bigram inside a block also occurs in the other name, so the names share at
+least ``M - nb`` bigrams. Adjacent blocks are always separated by at least one
+unmatched character, so ``nb - 1 <= la + lb - 2M``, and a ratio above ``t``
+means ``2M > t(la + lb)``. Together they give a minimum shared-bigram count of
+``(1.5t - 1)(la + lb) - 1``, which with prefix filtering means only the rarest
+few query bigrams need probing. The ratio also bounds the candidate length, so
+names too short or too long to ever reach the threshold are never scored.
+"""
+
+import math
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def name_bigrams(name: str) -> Set[Tuple[str, int]]:
+    """Get the character bigrams of a name, numbering repeated bigrams.
+
+    Numbering each occurrence (("an", 0), ("an", 1), ...) makes the size of a
+    set intersection equal to the multiset intersection of the bigrams.
+
+    Args:
+        name: Normalized, lowercased name
+
+    Returns:
+        Set of (bigram, occurrence) pairs
+    """
+    seen: Dict[str, int] = {}
+    grams = set()
+    for i in range(len(name) - 1):
+        gram = name[i : i + 2]
+        occurrence = seen.get(gram, 0)
+        grams.add((gram, occurrence))
+        seen[gram] = occurrence + 1
+    return grams
+
+
+class _TypeIndex:
+    """Index structures for the canonical entities of one entity type."""
+
+    def __init__(self):
+        self.by_name: Dict[str, Dict] = {}
+        # Parallel lists ordered by insertion; position is the entity ordinal
+        self.entities: List[Dict] = []
+        self.normalized: List[str] = []
+        self.grams: List[Set[Tuple[str, int]]] = []
+        self.postings: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        # Ordinals bucketed by normalized name length, for length filtering
+        self.by_length: Dict[int, List[int]] = defaultdict(list)
+        self.lengths: List[int] = []
+
+
+class CanonicalEntityIndex:
+    """Index of canonical entities supporting exact, normalized and fuzzy lookup.
+
+    Matches are identical to the linear scan in
+    ``EntityResolver.find_matching_entity``: the first entity (in insertion
+    order) whose lowercased name equals the mention, then the normalized
+    mention, then the most similar entity above the threshold, ties going to
+    the earliest inserted entity.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[str], str],
+        similarity_threshold: float = 0.85,
+        entities: Optional[Iterable[Dict]] = None,
+    ):
+        """Initialize the index.
+
+        Args:
+            normalize: Function normalizing an entity name (titles, suffixes, ...)
+            similarity_threshold: Similarity a fuzzy match must exceed (0.0 to 1.0)
+            entities: Optional canonical entity dicts with 'name' and 'entity_type'
+        """
+        self.normalize = normalize
+        self.similarity_threshold = similarity_threshold
+        self._types: Dict[str, _TypeIndex] = defaultdict(_TypeIndex)
+        self._size = 0
+
+        for entity in entities or []:
+            self.add(entity)
+
+    def __len__(self) -> int:
+        """Get the number of indexed canonical entities."""
+        return self._size
+
+    def add(self, entity: Dict) -> None:
+        """Add a canonical entity to the index.
+
+        Args:
+            entity: Canonical entity dict with 'name' and 'entity_type' fields
+        """
+        index = self._types[entity["entity_type"]]
+        ordinal = len(index.entities)
+        normalized = self.normalize(entity["name"]).lower()
+        grams = name_bigrams(normalized)
+
+        # The first entity with a given name wins, as in the linear scan
+        index.by_name.setdefault(entity["name"].lower(), entity)
+        index.entities.append(entity)
+        index.normalized.append(normalized)
+        index.grams.append(grams)
+        index.by_length[len(normalized)].append(ordinal)
+        index.lengths.append(len(normalized))
+        for gram in grams:
+            index.postings[gram].append(ordinal)
+
+        self._size += 1
+
+    def find(self, entity_text: str, entity_type: str) -> Optional[Dict]:
+        """Find the canonical entity matching a mention.
+
+        Args:
+            entity_text: Text of the entity to match
+            entity_type: Type of the entity (e.g., "PERSON", "ORG")
+
+        Returns:
+            Matching canonical entity if found, None otherwise
+        """
+        index = self._types.get(entity_type)
+        if index is None:
+            return None
+
+        # Exact match, then normalized match
+        match = index.by_name.get(entity_text.lower())
+        if match is not None:
+            return match
+
+        query = self.normalize(entity_text).lower()
+        match = index.by_name.get(query)
+        if match is not None:
+            return match
+
+        # Similar match among the blocked candidates
+        best_match = None
+        best_similarity = 0.0
+        for ordinal in self._candidates(index, query):
+            similarity = SequenceMatcher(None, query, index.normalized[ordinal]).ratio()
+            if similarity > self.similarity_threshold and similarity > best_similarity:
+                best_match = index.entities[ordinal]
+                best_similarity = similarity
+
+        return best_match
+
+    def _length_bounds(self, length: int) -> Tuple[int, int]:
+        """Get the range of name lengths that could exceed the threshold.
+
+        A ratio of ``2M / (la + lb)`` with ``M <= min(la, lb)`` bounds how
+        different the two lengths can be.
+        """
+        t = self.similarity_threshold
+        if t <= 0:
+            return 0, math.inf
+        low = math.ceil(length * t / (2 - t) - 1e-9)
+        high = math.floor(length * (2 - t) / t + 1e-9)
+        return max(0, low), high
+
+    def _min_shared_bigrams(self, length: int, min_length: int) -> int:
+        """Get a lower bound on the bigrams any matching name must share.
+
+        Rounded down to stay conservative against floating point error.
+        """
+        t = self.similarity_threshold
+        return max(0, math.floor((1.5 * t - 1) * (length + min_length) - 1))
+
+    def _candidates(self, index: _TypeIndex, query: str) -> List[int]:
+        """Get ordinals of entities that could exceed the similarity threshold.
+
+        Args:
+            index: Index for the mention's entity type
+            query: Normalized, lowercased mention text
+
+        Returns:
+            Candidate ordinals in insertion order
+        """
+        low, high = self._length_bounds(len(query))
+        required = self._min_shared_bigrams(len(query), low)
+        query_grams = name_bigrams(query)
+
+        if required == 0:
+            # Too short to block on bigrams; fall back to the length buckets
+            candidates = [
+                ordinal
+                for length, ordinals in index.by_length.items()
+                if low <= length <= high
+                for ordinal in ordinals
+            ]
+            return sorted(candidates)
+
+        # Prefix filtering: a name sharing ``required`` bigrams with the query
+        # must contain one of its ``len - required + 1`` rarest bigrams
+        ranked = sorted(query_grams, key=lambda gram: len(index.postings.get(gram, ())))
+        probe = ranked[: len(ranked) - required + 1]
+
+        lengths = index.lengths
+        grams = index.grams
+        seen: Set[int] = set()
+        candidates = []
+        for gram in probe:
+            for ordinal in index.postings.get(gram, ()):
+                if ordinal in seen or not low <= lengths[ordinal] <= high:
+                    continue
+                seen.add(ordinal)
+                if len(query_grams & grams[ordinal]) >= required:
+                    candidates.append(ordinal)
+
+        return sorted(candidates)
@@ -2,11 +2,13 @@
 
 import re
 from difflib import SequenceMatcher
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Union
 
 from fastapi import Depends
 from fastapi_injectable import injectable
 
+from local_newsifier.tools.resolution.canonical_entity_index import CanonicalEntityIndex
+
 
 @injectable(use_cache=False)
 class EntityResolver:
@@ -96,19 +98,42 @@ class EntityResolver:
         # Calculate similarity
         return SequenceMatcher(None, norm_name1.lower(), norm_name2.lower()).ratio()
 
+    def build_index(self, entities: Optional[Iterable[Dict]] = None) -> CanonicalEntityIndex:
+        """Build an index of canonical entities for repeated resolution.
+
+        Matching against the index gives the same results as matching against
+        the equivalent list, without scanning every entity per mention.
+
+        Args:
+            entities: Canonical entity dicts with 'name' and 'entity_type' fields
+
+        Returns:
+            Index that new canonical entities can be added to as they are created
+        """
+        return CanonicalEntityIndex(
+            self.normalize_entity_name, self.similarity_threshold, entities=entities
+        )
+
     def find_matching_entity(
-        self, entity_text: str, entity_type: str, existing_entities: List[Dict]
+        self,
+        entity_text: str,
+        entity_type: str,
+        existing_entities: Union[List[Dict], CanonicalEntityIndex],
     ) -> Optional[Dict]:
         """Find a matching canonical entity from a list of existing entities.
 
         Args:
             entity_text: Text of the entity to match
             entity_type: Type of the entity (e.g., "PERSON", "ORG")
-            existing_entities: List of existing canonical entities to match against
+            existing_entities: Existing canonical entities to match against, as
+                a list (scanned linearly) or a CanonicalEntityIndex
 
         Returns:
             Matching canonical entity if found, None otherwise
         """
+        if isinstance(existing_entities, CanonicalEntityIndex):
+            return existing_entities.find(entity_text, entity_type)
+
         # First, try exact match
         for entity in existing_entities:
             if (
@@ -145,14 +170,15 @@ class EntityResolver:
         self,
         entity_text: str,
         entity_type: str = "PERSON",
-        existing_entities: Optional[List[Dict]] = None,
+        existing_entities: Optional[Union[List[Dict], CanonicalEntityIndex]] = None,
     ) -> Dict:
         """Resolve an entity mention to a canonical form.
 
         Args:
             entity_text: Text of the entity to resolve
             entity_type: Type of the entity (e.g., "PERSON", "ORG")
-            existing_entities: Optional list of existing canonical entities to match against
+            existing_entities: Optional list or index of existing canonical
+                entities to match against
 
         Returns:
             Canonical entity data
@@ -205,6 +231,7 @@ class EntityResolver:
         """
         resolved_entities = []
         canonical_entities = existing_entities or []
+        index = self.build_index(canonical_entities)
 
         for entity in entities:
             # Skip entities without required fields
@@ -212,9 +239,7 @@ class EntityResolver:
                 continue
 
             # Resolve entity
-            canonical_entity = self.resolve_entity(
-                entity["text"], entity["type"], canonical_entities
-            )
+            canonical_entity = self.resolve_entity(entity["text"], entity["type"], index)
 
             # Add original entity data
             resolved_entity = entity.copy()
@@ -223,6 +248,7 @@ class EntityResolver:
             # If this is a new entity, add it to our canonical entities list
             if canonical_entity["is_new"]:
                 canonical_entities.append(canonical_entity)
+                index.add(canonical_entity)
 
             resolved_entities.append(resolved_entity)
 
@@ -2,11 +2,14 @@
 RSS Parser Tool for extracting URLs and titles from RSS feeds.
 """
 
+import hashlib
+import io
 import json
 import logging
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Container, Dict, Iterator, List, Optional
 from xml.etree import ElementTree
 
 import requests
@@ -14,75 +17,127 @@ from dateutil import parser as date_parser
 from fastapi_injectable import injectable
 from pydantic import BaseModel
 
+from local_newsifier.config.settings import settings
+from local_newsifier.tools.http_cache import get_http_cache
+from local_newsifier.tools.seen_url_store import create_seen_url_store
+
 logger = logging.getLogger(__name__)
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# JSON file processed URLs were cached in before the seen-URL store
+LEGACY_CACHE_FILE = "rss_urls.json"
+
+
+def parse_feed_date(text: str) -> datetime:
+    """
+    Parse a feed date, trying the RFC 822 and ISO 8601 formats feeds use first.
+
+    Both fast paths are far cheaper than dateutil, which is kept as the
+    fallback for anything unusual.
+
+    Args:
+        text: Date text from the feed
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the text is not a recognisable date
+    """
+    text = text.strip()
+    try:
+        return parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    return date_parser.parse(text)
+
 
 class RSSItem(BaseModel):
     """Model for RSS feed items."""
 
     title: str
     url: str
+    guid: Optional[str] = None
     published: Optional[datetime] = None
     description: Optional[str] = None
 
 
+class FeedFetch(BaseModel):
+    """Model for the result of a conditional feed fetch."""
+
+    items: List[RSSItem] = []
+    not_modified: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+
 @injectable(use_cache=False)
 class RSSParser:
     """Tool for parsing RSS feeds and extracting content."""
 
     def __init__(
         self,
-        cache_file: Optional[str] = None,
         cache_dir: Optional[str] = None,
         request_timeout: int = 30,
         user_agent: Optional[str] = None,
+        seen_store: Optional[Any] = None,
+        http_cache: Optional[Any] = None,
     ):
         """
         Initialize the RSS parser.
 
         Args:
-            cache_file: Optional path to a JSON file to cache processed URLs
-            cache_dir: Optional directory for storing cache files (used if cache_file is None)
+            cache_dir: Optional directory for the persistent store of processed
+                URLs (used if seen_store is None)
             request_timeout: Timeout in seconds for HTTP requests
             user_agent: Custom user agent for HTTP requests
+            seen_store: SeenURLStore of processed URLs; defaults to the store
+                configured by settings.RSS_SEEN_URL_STORE in cache_dir
+            http_cache: HTTPCache for feed responses; defaults to the
+                process-wide cache, if enabled
         """
-        # If cache_file is not specified but cache_dir is, create a default cache file path
-        if cache_file is None and cache_dir is not None:
-            cache_path = Path(cache_dir)
-            cache_path.mkdir(exist_ok=True, parents=True)
-            cache_file = str(cache_path / "rss_urls.json")
-
-        self.cache_file = cache_file
         self.request_timeout = request_timeout
         self.user_agent = user_agent or "Local Newsifier RSS Parser"
-        self.processed_urls = self._load_cache() if cache_file else set()
-
-    def _load_cache(self) -> set:
-        """Load processed URLs from cache file."""
-        if not self.cache_file:
-            return set()
-
-        cache_path = Path(self.cache_file)
+        if seen_store is None:
+            seen_store = create_seen_url_store(
+                settings.RSS_SEEN_URL_STORE,
+                cache_dir=cache_dir,
+                ttl_days=settings.RSS_SEEN_URL_TTL_DAYS,
+                bloom_capacity=settings.RSS_SEEN_URL_BLOOM_CAPACITY,
+                bloom_false_positive_rate=settings.RSS_SEEN_URL_BLOOM_FALSE_POSITIVE_RATE,
+            )
+        self.seen_urls = seen_store
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
+        if cache_dir is not None:
+            self._import_legacy_cache(Path(cache_dir) / LEGACY_CACHE_FILE)
+
+    def _import_legacy_cache(self, cache_path: Path) -> None:
+        """Move URLs from the old JSON cache file into the seen-URL store."""
         if not cache_path.exists():
-            return set()
+            return
 
         try:
             with open(cache_path, "r") as f:
-                return set(json.load(f))
+                self.seen_urls.add_many(json.load(f))
+            cache_path.unlink()
         except Exception as e:
-            logger.error(f"Error loading cache file: {e}")
-            return set()
+            logger.error(f"Error importing legacy cache file: {e}")
 
-    def _save_cache(self):
-        """Save processed URLs to cache file."""
-        if not self.cache_file:
-            return
+    def _get(self, url: str, headers: Dict[str, str]) -> Any:
+        """GET a URL, through the HTTP cache if there is one."""
 
-        try:
-            with open(self.cache_file, "w") as f:
-                json.dump(list(self.processed_urls), f)
-        except Exception as e:
-            logger.error(f"Error saving cache file: {e}")
+        def send(request_headers: Dict[str, str]) -> requests.Response:
+            return requests.get(url, headers=request_headers, timeout=self.request_timeout)
+
+        if self.http_cache is None:
+            return send(headers)
+        return self.http_cache.fetch(url, send, headers)
 
     def _get_element_text(self, entry: ElementTree.Element, *names: str) -> Optional[str]:
         """Get text from the first matching element."""
@@ -92,12 +147,16 @@ class RSSParser:
                 return elem.text
         return None
 
-    def parse_feed(self, feed_url: str) -> List[RSSItem]:
+    def parse_feed(
+        self, feed_url: str, seen: Optional[Container[str]] = None
+    ) -> List[RSSItem]:
         """
         Parse an RSS feed and extract items.
 
         Args:
             feed_url: URL of the RSS feed to parse
+            seen: GUIDs and URLs of items already processed; parsing stops at
+                the first of them
 
         Returns:
             List of RSSItem objects containing the feed content
@@ -105,102 +164,195 @@ class RSSParser:
         try:
             # Fetch the feed with timeout and user-agent
             headers = {"User-Agent": self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=self.request_timeout)
+            response = self._get(feed_url, headers)
             response.raise_for_status()
 
-            # Parse the XML
-            root = ElementTree.fromstring(response.content)
-
-            # Handle both RSS and Atom feeds
-            if root.tag.endswith("rss"):
-                entries = root.findall(".//item")
-            elif root.tag.endswith("feed"):  # Atom feed
-                entries = root.findall(".//{http://www.w3.org/2005/Atom}entry")
-            else:
-                entries = []
-
-            if not entries:
-                logger.error(f"No entries found in feed: {feed_url}")
-                return []
-
-            items = []
-            for entry in entries:
-                try:
-                    # Extract title
-                    title = (
-                        self._get_element_text(entry, "title", "{http://www.w3.org/2005/Atom}title")
-                        or "No title"
-                    )
-
-                    # Extract URL
-                    url = None
-                    if root.tag.endswith("rss"):
-                        url = self._get_element_text(entry, "link")
-                    else:  # Atom feed
-                        link_elem = entry.find("{http://www.w3.org/2005/Atom}link")
-                        if link_elem is not None:
-                            url = link_elem.get("href")
-
-                    if not url:
-                        continue
-
-                    # Extract published date
-                    published = None
-                    date_text = self._get_element_text(
-                        entry,
-                        "pubDate",
-                        "published",
-                        "{http://www.w3.org/2005/Atom}published",
-                    )
-                    if date_text:
-                        try:
-                            published = date_parser.parse(date_text)
-                        except Exception as e:
-                            logger.warning(f"Could not parse date: {e}")
-
-                    # Extract description
-                    description = self._get_element_text(
-                        entry,
-                        "description",
-                        "summary",
-                        "{http://www.w3.org/2005/Atom}summary",
-                    )
-
-                    item = RSSItem(
-                        title=title,
-                        url=url,
-                        published=published,
-                        description=description,
-                    )
-
-                    items.append(item)
-
-                except Exception as e:
-                    logger.error(f"Error parsing entry in feed {feed_url}: {e}")
-                    continue
-
-            return items
+            return list(self.iter_items(feed_url, response.content, seen=seen))
         except Exception as e:
             logger.error(f"Error parsing feed {feed_url}: {e}")
             return []
 
-    def get_new_urls(self, feed_url: str) -> List[RSSItem]:
+    def fetch_feed(
+        self,
+        feed_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        stop_at_seen: bool = True,
+    ) -> FeedFetch:
+        """
+        Fetch and parse a feed unless it is unchanged since the last fetch.
+
+        Sends If-None-Match and If-Modified-Since from the previous fetch's
+        validators. A 304 response, or a body whose hash matches the previous
+        one, is reported as not modified without being parsed. The URLs of the
+        items returned are recorded in the seen-URL store, so a changed feed
+        is only parsed down to the newest item an earlier fetch returned.
+
+        Args:
+            feed_url: URL of the RSS feed to fetch
+            etag: ETag header from the previous fetch
+            last_modified: Last-Modified header from the previous fetch
+            content_hash: SHA-256 hex digest of the previous body
+            stop_at_seen: Stop parsing at the first processed URL, for feeds
+                known to list their newest items first
+
+        Returns:
+            FeedFetch with the items, or not_modified set, and the validators
+            to send next time
+
+        Raises:
+            requests.RequestException: If the request fails
+            ElementTree.ParseError: If the feed is not valid XML
+        """
+        headers = {"User-Agent": self.user_agent}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._get(feed_url, headers)
+        if response.status_code == 304:
+            return FeedFetch(
+                not_modified=True,
+                etag=response.headers.get("ETag") or etag,
+                last_modified=response.headers.get("Last-Modified") or last_modified,
+                content_hash=content_hash,
+            )
+        response.raise_for_status()
+
+        new_hash = hashlib.sha256(response.content).hexdigest()
+        fetch = FeedFetch(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=new_hash,
+        )
+        if content_hash and new_hash == content_hash:
+            fetch.not_modified = True
+        else:
+            seen = self.seen_urls if stop_at_seen else None
+            fetch.items = list(self.iter_items(feed_url, response.content, seen=seen))
+            self.seen_urls.add_many(item.url for item in fetch.items)
+        return fetch
+
+    def iter_items(
+        self, feed_url: str, content: bytes, seen: Optional[Container[str]] = None
+    ) -> Iterator[RSSItem]:
+        """
+        Parse the body of an RSS or Atom feed lazily, one item at a time.
+
+        The feed is read with iterparse and each entry is discarded once its
+        item is built, so memory stays flat however long the feed is.
+
+        Args:
+            feed_url: URL the feed was fetched from, for logging
+            content: Raw feed body
+            seen: GUIDs and URLs of items already processed. Feeds list their
+                newest items first, so parsing stops at the first seen item
+
+        Yields:
+            RSSItem objects in feed order
+
+        Raises:
+            ElementTree.ParseError: If the feed is not valid XML
+        """
+        entry_tag = None
+        is_rss = False
+        open_elements = []
+        entries = 0
+
+        for event, elem in ElementTree.iterparse(io.BytesIO(content), events=("start", "end")):
+            if event == "start":
+                if entry_tag is None and not open_elements:
+                    # Handle both RSS and Atom feeds
+                    if elem.tag.endswith("rss"):
+                        entry_tag, is_rss = "item", True
+                    elif elem.tag.endswith("feed"):  # Atom feed
+                        entry_tag = f"{ATOM_NS}entry"
+                    else:
+                        break
+                open_elements.append(elem)
+                continue
+
+            open_elements.pop()
+            if elem.tag != entry_tag:
+                continue
+            entries += 1
+
+            try:
+                guid = self._get_element_text(elem, "guid", f"{ATOM_NS}id")
+                url = self._get_entry_url(elem, is_rss)
+                if seen is not None and (guid in seen or url in seen):
+                    return
+                item = self._build_item(feed_url, elem, guid, url) if url else None
+            except Exception as e:
+                logger.error(f"Error parsing entry in feed {feed_url}: {e}")
+                item = None
+            finally:
+                # Drop the parsed entry so the tree never holds the whole feed
+                elem.clear()
+                if open_elements:
+                    open_elements[-1].remove(elem)
+
+            if item:
+                yield item
+
+        if not entries:
+            logger.error(f"No entries found in feed: {feed_url}")
+
+    def _get_entry_url(self, entry: ElementTree.Element, is_rss: bool) -> Optional[str]:
+        """Get the link of an RSS item or Atom entry."""
+        if is_rss:
+            return self._get_element_text(entry, "link")
+        link_elem = entry.find(f"{ATOM_NS}link")
+        if link_elem is not None:
+            return link_elem.get("href")
+        return None
+
+    def _build_item(
+        self, feed_url: str, entry: ElementTree.Element, guid: Optional[str], url: str
+    ) -> RSSItem:
+        """Build an RSSItem from a parsed RSS item or Atom entry."""
+        # Extract title
+        title = self._get_element_text(entry, "title", f"{ATOM_NS}title") or "No title"
+
+        # Extract published date
+        published = None
+        date_text = self._get_element_text(entry, "pubDate", "published", f"{ATOM_NS}published")
+        if date_text:
+            try:
+                published = parse_feed_date(date_text)
+            except Exception as e:
+                logger.warning(f"Could not parse date: {e}")
+
+        # Extract description
+        description = self._get_element_text(entry, "description", "summary", f"{ATOM_NS}summary")
+
+        return RSSItem(
+            title=title,
+            url=url,
+            guid=guid,
+            published=published,
+            description=description,
+        )
+
+    def get_new_urls(self, feed_url: str, stop_at_seen: bool = False) -> List[RSSItem]:
         """
         Get only new URLs from a feed that haven't been processed before.
 
         Args:
             feed_url: URL of the RSS feed to parse
+            stop_at_seen: Stop parsing at the first processed URL, for feeds
+                known to list their newest items first
 
         Returns:
             List of RSSItem objects containing only new content
         """
-        items = self.parse_feed(feed_url)
-        new_items = [item for item in items if item.url not in self.processed_urls]
+        items = self.parse_feed(feed_url, seen=self.seen_urls if stop_at_seen else None)
+        new_items = [item for item in items if item.url not in self.seen_urls]
 
-        # Update cache with new URLs
-        self.processed_urls.update(item.url for item in new_items)
-        if self.cache_file:
-            self._save_cache()
+        # Record new URLs in one write
+        self.seen_urls.add_many(item.url for item in new_items)
 
         return new_items
 
@@ -226,15 +378,24 @@ def get_parser_instance() -> RSSParser:
         return RSSParser()
 
 
-def parse_rss_feed(feed_url: str) -> Dict[str, Any]:
+def parse_rss_feed(
+    feed_url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    content_hash: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Parse an RSS feed and return the content in a dictionary format.
 
     Args:
         feed_url: URL of the RSS feed to parse
+        etag: ETag header from the previous fetch, for a conditional request
+        last_modified: Last-Modified header from the previous fetch
+        content_hash: Hash of the previous body, to skip parsing it unchanged
 
     Returns:
-        Dictionary containing feed title and entries
+        Dictionary containing feed title and entries, whether the feed was
+        unchanged (not_modified) and the validators to store for next time
     """
     logger.info(f"Parsing RSS feed: {feed_url}")
 
@@ -242,8 +403,11 @@ def parse_rss_feed(feed_url: str) -> Dict[str, Any]:
         # Get parser instance in a test-friendly way
         parser = get_parser_instance()
 
-        # Use the parser to get items
-        items = parser.parse_feed(feed_url)
+        # Use the parser to get items, unless the feed is unchanged
+        fetch = parser.fetch_feed(
+            feed_url, etag=etag, last_modified=last_modified, content_hash=content_hash
+        )
+        items = fetch.items
 
         # Extract feed title (use first item's title as fallback for feed title)
         feed_title = "Unknown Feed"
@@ -265,6 +429,10 @@ def parse_rss_feed(feed_url: str) -> Dict[str, Any]:
             "title": feed_title,
             "feed_url": feed_url,
             "entries": entries,
+            "not_modified": fetch.not_modified,
+            "etag": fetch.etag,
+            "last_modified": fetch.last_modified,
+            "content_hash": fetch.content_hash,
         }
     except Exception as e:
         logger.error(f"Error parsing RSS feed {feed_url}: {str(e)}")
@@ -0,0 +1,417 @@
+"""Stores of feed item URLs that have already been processed.
+
+``RSSParser.get_new_urls`` checks every feed item against the URLs it has seen
+before. Keeping those in a set rewritten to a JSON file on every poll made
+each poll O(every URL ever seen) in both time and memory. The stores here
+check and record URLs incrementally instead:
+
+* ``MemorySeenURLStore`` keeps a set for the life of the process
+* ``SQLiteSeenURLStore`` keeps a local SQLite table keyed by URL, so a check
+  is one primary-key lookup and recording a poll's URLs is one transaction
+* ``BloomFilterSeenURLStore`` keeps a fixed-size bloom filter, a few bytes per
+  URL, at the cost of a configurable false-positive rate (a new URL is
+  occasionally taken as seen and skipped)
+
+The persistent stores forget URLs after an optional TTL, so neither grows
+without bound. Both can be shared by several worker processes: SQLite locks
+its own file, and the bloom filter file is merged with the process's
+filters under a file lock before it is rewritten.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bloom filter file is not locked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Minimum interval between TTL evictions in the SQLite store
+EVICTION_INTERVAL = 3600
+
+
+class SeenURLStore(ABC):
+    """Interface of the seen-URL stores."""
+
+    @abstractmethod
+    def __contains__(self, url: object) -> bool:
+        """Check whether a URL has been seen."""
+
+    @abstractmethod
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Record URLs as seen.
+
+        Args:
+            urls: URLs to record
+        """
+
+    def add(self, url: str) -> None:
+        """Record one URL as seen."""
+        self.add_many([url])
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class MemorySeenURLStore(SeenURLStore):
+    """Seen URLs kept in a set for the life of the process."""
+
+    def __init__(self, urls: Optional[Iterable[str]] = None):
+        """Initialize the store.
+
+        Args:
+            urls: URLs to start with
+        """
+        self.urls: Set[str] = set(urls or ())
+
+    def __contains__(self, url: object) -> bool:
+        """Check whether a URL has been seen."""
+        return url in self.urls
+
+    def __len__(self) -> int:
+        """Get the number of seen URLs."""
+        return len(self.urls)
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Record URLs as seen."""
+        self.urls.update(urls)
+
+
+class SQLiteSeenURLStore(SeenURLStore):
+    """Seen URLs kept in a local SQLite table keyed by URL."""
+
+    def __init__(self, path: str, ttl_days: Optional[float] = None):
+        """Open, creating if needed, the store and evict expired URLs.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl_days: Forget URLs first seen more than this many days ago;
+                None keeps them forever
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl_days * SECONDS_PER_DAY if ttl_days else None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_urls (url TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_seen_urls_seen_at ON seen_urls (seen_at)"
+            )
+        self._last_eviction = 0.0
+        self.evict_expired()
+
+    def __contains__(self, url: object) -> bool:
+        """Check whether a URL has been seen."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen_urls WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        """Get the number of seen URLs."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Record URLs as seen, keeping the first-seen time of known ones."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url, seen_at) VALUES (?, ?)",
+                ((url, now) for url in urls),
+            )
+        if now - self._last_eviction >= EVICTION_INTERVAL:
+            self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """Forget URLs first seen longer ago than the TTL.
+
+        Returns:
+            Number of URLs forgotten
+        """
+        self._last_eviction = time.time()
+        if not self.ttl:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM seen_urls WHERE seen_at < ?", (time.time() - self.ttl,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings."""
+
+    def __init__(self, capacity: int, false_positive_rate: float, bits: Optional[bytes] = None):
+        """Size the filter for a capacity and false-positive rate.
+
+        Args:
+            capacity: Number of items the rate is guaranteed for
+            false_positive_rate: Probability an unseen item tests as seen
+                once capacity items have been added
+            bits: Existing filter contents, from to_bytes
+        """
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        """Get the bit positions for an item by double hashing."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added."""
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def to_bytes(self) -> bytes:
+        """Get the filter contents."""
+        return bytes(self.bits)
+
+
+class BloomFilterSeenURLStore(SeenURLStore):
+    """Seen URLs kept in compact bloom filters, optionally saved to a file.
+
+    With a TTL the store keeps a few generations of filters, each covering
+    half the TTL. New URLs go into the newest generation and a generation is
+    dropped once everything in it is older than the TTL, so URLs are
+    forgotten between one TTL and one and a half TTLs after being seen. Each
+    live generation adds up to false_positive_rate to the overall rate.
+
+    Several processes can share the file: before saving, a process merges
+    the filters on disk into its own under an exclusive lock on
+    ``<path>.lock``, so URLs recorded by other processes are kept and are
+    seen by this one from then on. Without fcntl (on Windows) the file is
+    not locked and the store is safe for one process only.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        capacity: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+        ttl_days: Optional[float] = None,
+    ):
+        """Load the store from path if it exists, or start empty.
+
+        Args:
+            path: File the filters are saved to after each add; None keeps
+                them in memory only
+            capacity: Number of URLs per generation the rate is sized for
+            false_positive_rate: Probability per generation that an unseen URL
+                tests as seen
+            ttl_days: Forget URLs after roughly this many days; None keeps
+                them forever
+        """
+        self.path = path
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.ttl = ttl_days * SECONDS_PER_DAY if ttl_days else None
+        self._lock = threading.Lock()
+        self.generations: List[Tuple[float, BloomFilter]] = []
+        # Modification time of the file when this process last read or wrote it
+        self._file_mtime: Optional[int] = None
+        if path and os.path.exists(path):
+            self._load()
+        self._rotate()
+
+    def _new_filter(self, bits: Optional[bytes] = None) -> BloomFilter:
+        """Create a filter sized for this store."""
+        return BloomFilter(self.capacity, self.false_positive_rate, bits)
+
+    def _rotate(self) -> None:
+        """Drop expired generations and start a new one when the newest is full-aged."""
+        now = time.time()
+        if not self.ttl:
+            if not self.generations:
+                self.generations.append((now, self._new_filter()))
+            return
+
+        span = self.ttl / 2
+        self.generations = [
+            (start, bloom) for start, bloom in self.generations if start + span >= now - self.ttl
+        ]
+        if not self.generations or now - self.generations[-1][0] >= span:
+            self.generations.append((now, self._new_filter()))
+
+    def __contains__(self, url: object) -> bool:
+        """Check whether a URL has probably been seen."""
+        if not isinstance(url, str):
+            return False
+        return any(url in bloom for _, bloom in self.generations)
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Record URLs as seen, saving the filters if any URL was new to them."""
+        urls = list(urls)
+        if not urls:
+            return
+        with self._lock, self._file_lock():
+            if self.path:
+                self._merge_file()
+            self._rotate()
+            newest = self.generations[-1][1]
+            added = False
+            for url in urls:
+                if url not in newest:
+                    newest.add(url)
+                    added = True
+            if added and self.path:
+                self._save()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the store file between processes."""
+        if not self.path or fcntl is None:
+            yield
+            return
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _mtime(self) -> Optional[int]:
+        """Get the store file's modification time, or None if it does not exist."""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read(self) -> Optional[List[Tuple[float, BloomFilter]]]:
+        """Read the filters from the store file.
+
+        Returns:
+            The saved generations, or None if the file is unreadable or was
+            saved with different settings
+        """
+        try:
+            with open(self.path, "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header["capacity"] != self.capacity
+                    or header["false_positive_rate"] != self.false_positive_rate
+                ):
+                    logger.warning(f"Bloom filter settings changed, starting empty: {self.path}")
+                    return None
+                length = len(self._new_filter().bits)
+                return [
+                    (start, self._new_filter(f.read(length))) for start in header["generations"]
+                ]
+        except Exception as e:
+            logger.error(f"Error loading seen URL bloom filter {self.path}: {e}")
+            return None
+
+    def _load(self) -> None:
+        """Replace the filters with the ones in the store file."""
+        self._file_mtime = self._mtime()
+        self.generations = self._read() or []
+
+    def _merge_file(self) -> None:
+        """Merge filters saved by other processes since this one last read or wrote the file.
+
+        Generations with the same start time are combined bit by bit.
+        """
+        mtime = self._mtime()
+        if mtime is None or mtime == self._file_mtime:
+            return
+        self._file_mtime = mtime
+        merged: Dict[float, BloomFilter] = dict(self.generations)
+        for start, saved in self._read() or []:
+            bloom = merged.get(start)
+            if bloom is None:
+                merged[start] = saved
+            else:
+                combined = int.from_bytes(bloom.bits, "little") | int.from_bytes(
+                    saved.bits, "little"
+                )
+                bloom.bits = bytearray(combined.to_bytes(len(bloom.bits), "little"))
+        self.generations = sorted(merged.items(), key=lambda generation: generation[0])
+
+    def _save(self) -> None:
+        """Write the filters to the store file atomically."""
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "capacity": self.capacity,
+            "false_positive_rate": self.false_positive_rate,
+            "generations": [start for start, _ in self.generations],
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                for _, bloom in self.generations:
+                    f.write(bloom.to_bytes())
+            os.replace(tmp_path, self.path)
+            self._file_mtime = self._mtime()
+        except Exception as e:
+            logger.error(f"Error saving seen URL bloom filter {self.path}: {e}")
+
+
+def create_seen_url_store(
+    backend: str,
+    cache_dir: Optional[str] = None,
+    ttl_days: Optional[float] = None,
+    bloom_capacity: int = 1_000_000,
+    bloom_false_positive_rate: float = 0.001,
+) -> SeenURLStore:
+    """Create a seen-URL store by backend name.
+
+    Args:
+        backend: "sqlite", "bloom" or "memory"
+        cache_dir: Directory for the store file; without one every backend
+            keeps URLs in memory only
+        ttl_days: Forget URLs after this many days; None keeps them forever
+        bloom_capacity: Number of URLs the bloom filter is sized for
+        bloom_false_positive_rate: Bloom filter false-positive rate
+
+    Returns:
+        The seen-URL store
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend == "sqlite":
+        if not cache_dir:
+            return MemorySeenURLStore()
+        return SQLiteSeenURLStore(str(Path(cache_dir) / "seen_urls.sqlite3"), ttl_days=ttl_days)
+    if backend == "bloom":
+        return BloomFilterSeenURLStore(
+            path=str(Path(cache_dir) / "seen_urls.bloom") if cache_dir else None,
+            capacity=bloom_capacity,
+            false_positive_rate=bloom_false_positive_rate,
+            ttl_days=ttl_days,
+        )
+    if backend == "memory":
+        return MemorySeenURLStore()
+    raise ValueError(f"Unknown seen URL store backend: {backend}")
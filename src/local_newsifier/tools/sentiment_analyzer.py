@@ -4,7 +4,6 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, NamedTuple, Optional, TypedDict, TypeVar, Union, cast
 
-import spacy
 from fastapi import Depends
 from fastapi_injectable import injectable
 from spacy.language import Language
@@ -19,6 +18,8 @@ from local_newsifier.models.analysis_result import AnalysisResult
 from local_newsifier.models.article import Article
 from local_newsifier.models.sentiment import SentimentAnalysis
 from local_newsifier.models.state import AnalysisStatus, NewsAnalysisState
+from local_newsifier.tools.analysis_context import AnalysisContext
+from local_newsifier.tools.nlp_models import load_model
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +69,10 @@ class SentimentAnalyzer:
         self.nlp = nlp_model
         self.session = session
 
-        # Fallback to loading model if not injected (for backward compatibility)
+        # Fallback to the shared model registry if not injected
         if self.nlp is None:
             try:
-                self.nlp = spacy.load(model_name)
-                logger.info(f"Loaded spaCy model '{model_name}'")
+                self.nlp = load_model(model_name)
             except OSError:
                 logger.warning(
                     f"spaCy model '{model_name}' not found. Install it with: python -m spacy download {model_name}"
@@ -135,12 +135,15 @@ class SentimentAnalyzer:
 
         return entity_sentiments
 
-    def _extract_topic_sentiments(self, text: str) -> Dict[str, float]:
+    def _extract_topic_sentiments(
+        self, text: str, analysis_context: Optional[AnalysisContext] = None
+    ) -> Dict[str, float]:
         """
         Extract sentiment scores for key topics in the text.
 
         Args:
             text: Full text content
+            analysis_context: Already parsed text; parsed here when omitted
 
         Returns:
             Dictionary mapping topics to sentiment scores
@@ -148,8 +151,11 @@ class SentimentAnalyzer:
         topics = {}
 
         # Use spaCy for topic extraction if available
-        if self.nlp:
-            doc = self.nlp(text)
+        if analysis_context is not None or self.nlp:
+            doc = analysis_context.doc if analysis_context is not None else self.nlp(text)
+
+            # Several topics usually share a sentence; score each sentence once
+            sentence_sentiments: Dict[int, float] = {}
 
             # Extract noun phrases as potential topics
             for chunk in doc.noun_chunks:
@@ -159,12 +165,12 @@ class SentimentAnalyzer:
 
                 topic_text = chunk.text.lower()
 
-                # Get the sentence containing this topic
-                sentence = chunk.sent.text
-
-                # Analyze sentiment of the sentence using TextBlob
-                sentiment_data = self._analyze_text_sentiment(sentence)
-                sentiment = sentiment_data["polarity"]
+                # Analyze sentiment of the sentence containing this topic using TextBlob
+                sentence = chunk.sent
+                if sentence.start not in sentence_sentiments:
+                    sentiment_data = self._analyze_text_sentiment(sentence.text)
+                    sentence_sentiments[sentence.start] = sentiment_data["polarity"]
+                sentiment = sentence_sentiments[sentence.start]
 
                 # Store or update sentiment for this topic
                 if topic_text in topics:
@@ -178,8 +184,19 @@ class SentimentAnalyzer:
 
         return {k: v for k, v in topics.items() if not k.endswith("_count")}
 
-    def analyze_sentiment(self, state: NewsAnalysisState) -> NewsAnalysisState:
-        """Analyze sentiment for the article text and update the analysis state."""
+    def analyze_sentiment(
+        self, state: NewsAnalysisState, analysis_context: Optional[AnalysisContext] = None
+    ) -> NewsAnalysisState:
+        """Analyze sentiment for the article text and update the analysis state.
+
+        Args:
+            state: Analysis state holding the scraped text
+            analysis_context: Already parsed scraped text, shared with the other
+                analysis tools; parsed here when needed and omitted
+
+        Returns:
+            Updated analysis state
+        """
         if not state.scraped_text:
             logger.warning("No text available for sentiment analysis")
             raise ValueError("No text content available for analysis")
@@ -208,7 +225,9 @@ class SentimentAnalyzer:
 
         # Analyze topic sentiments if topics are present
         if "topics" in state.analysis_results:
-            topic_sentiments = self._extract_topic_sentiments(state.scraped_text)
+            topic_sentiments = self._extract_topic_sentiments(
+                state.scraped_text, analysis_context=analysis_context
+            )
             state.analysis_results["sentiment"]["topic_sentiments"] = topic_sentiments
 
         # Update state
@@ -1,14 +1,25 @@
-"""Utility for scraping articles with optional Selenium."""
+"""Utility for scraping articles with optional Selenium.
 
-import time
+Single URLs are fetched with requests, falling back to Selenium with drivers
+from a shared pool for domains that need JavaScript rendering. Batches of
+URLs go through scrape_many, an asyncio engine on httpx that caps requests
+in flight overall and per domain and backs off between retries without
+holding a worker thread.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
 from datetime import UTC, datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Union
+from urllib.parse import urlparse
 
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from fastapi import Depends
 from fastapi_injectable import injectable
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -28,22 +39,68 @@ NOT_FOUND_PHRASES = [
     "please subscribe",
 ]
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+from ..config.settings import settings
+from .driver_pool import get_driver_pool, get_rendering_memory
+from .http_cache import get_http_cache
 from ..models.state import AnalysisStatus, NewsAnalysisState
 
 
+class ConcurrencyLimiter:
+    """Caps requests in flight overall and per domain."""
+
+    def __init__(self, max_concurrency: int, per_domain_limit: int):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum requests in flight overall
+            per_domain_limit: Maximum requests in flight to one domain
+        """
+        self.per_domain_limit = per_domain_limit
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._domains: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a request slot for a URL.
+
+        The domain slot is taken first, so a request queued behind a busy
+        domain does not hold one of the global slots while it waits.
+        """
+        domain = urlparse(url).netloc.lower()
+        domain_slots = self._domains.setdefault(domain, asyncio.Semaphore(self.per_domain_limit))
+        async with domain_slots, self._global:
+            yield
+
+
 @injectable(use_cache=False)
 class WebScraperTool:
     """Tool for scraping web content with robust error handling."""
 
     def __init__(
-        self, session: Any = None, web_driver: Any = None, user_agent: Optional[str] = None
+        self,
+        session: Any = None,
+        web_driver: Any = None,
+        user_agent: Optional[str] = None,
+        driver_pool: Optional[Any] = None,
+        rendering_memory: Optional[Any] = None,
+        http_cache: Optional[Any] = None,
     ):
         """Initialize the scraper with injectable dependencies.
 
         Args:
             session: Optional HTTP session for making requests (injected)
-            web_driver: Optional Selenium WebDriver (injected)
+            web_driver: Optional Selenium WebDriver (injected); used instead
+                of the driver pool
             user_agent: Optional custom user agent string
+            driver_pool: Optional WebDriverPool for the Selenium fallback;
+                defaults to the process-wide pool for this user agent
+            rendering_memory: Optional RenderingMemory of which domains need
+                JavaScript rendering; defaults to the process-wide memory
+            http_cache: Optional HTTPCache for article responses; defaults to
+                the process-wide cache, if enabled
         """
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -63,28 +120,99 @@ class WebScraperTool:
         self.chrome_options.add_argument("--disable-dev-shm-usage")
         self.chrome_options.add_argument(f"user-agent={self.user_agent}")
 
-        # Use injected driver or initialize as None
+        # Use injected driver; otherwise drivers are borrowed from the pool
         self.driver = web_driver
+        self.driver_pool = driver_pool
+        self.rendering_memory = rendering_memory or get_rendering_memory()
+        self.render_timeout = settings.SELENIUM_RENDER_TIMEOUT
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
 
     def __del__(self):
-        """Cleanup method to ensure WebDriver is properly closed."""
+        """Cleanup method to ensure an injected WebDriver is properly closed."""
         if self.driver is not None:
             self.driver.quit()
 
     def _get_driver(self):
-        """Get or create a WebDriver instance.
+        """Create a new WebDriver.
 
-        Returns injected driver if available, otherwise creates a new one.
-        This provides backward compatibility with code that doesn't use dependency injection.
+        This is the factory of the driver pool; pooled drivers are quit by
+        the pool, not by this tool.
         """
-        if self.driver is None:
+        try:
+            service = Service(ChromeDriverManager().install())
+            return webdriver.Chrome(service=service, options=self.chrome_options)
+        except Exception as e:
+            print(f"Error initializing WebDriver: {str(e)}")
+            raise RuntimeError(f"Failed to initialize WebDriver: {str(e)}")
+
+    def _get(self, url: str) -> Any:
+        """GET a URL with the session, through the HTTP cache if there is one."""
+        if self.http_cache is None:
+            return self.session.get(url, timeout=30)
+        return self.http_cache.fetch(
+            url, lambda headers: self.session.get(url, timeout=30, headers=headers)
+        )
+
+    @contextmanager
+    def _borrow_driver(self) -> Iterator[Any]:
+        """Borrow a WebDriver: the injected one, or one from the pool."""
+        if self.driver is not None:
+            yield self.driver
+            return
+        if self.driver_pool is None:
+            self.driver_pool = get_driver_pool(self.user_agent, self._get_driver)
+        with self.driver_pool.driver() as driver:
+            yield driver
+
+    def _render(self, url: str) -> Optional[str]:
+        """Load a URL in a browser and wait for its article to render.
+
+        Returns:
+            The rendered page source, or None if no article appeared
+        """
+        with self._borrow_driver() as driver:
+            driver.get(url)
+            wait = WebDriverWait(driver, self.render_timeout)
             try:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            except Exception as e:
-                print(f"Error initializing WebDriver: {str(e)}")
-                raise RuntimeError(f"Failed to initialize WebDriver: {str(e)}")
-        return self.driver
+                # Wait for the article, then for scripts still loading content
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "article")))
+                wait.until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
+                return None
+            return driver.page_source
+
+    def _fetch_with_selenium(self, url: str) -> str:
+        """Fetch a URL with Selenium, recording whether rendering worked.
+
+        An outcome is only recorded once the page has loaded; errors before
+        that say nothing about the domain.
+
+        Raises:
+            ValueError: If the page failed to load, no article rendered or
+                the page is a 404
+            TimeoutError: If no pooled driver became free
+            RuntimeError: If a browser could not be started
+        """
+        print("Trying with Selenium...")
+        try:
+            html = self._render(url)
+        except (TimeoutError, RuntimeError):
+            raise
+        except Exception as e:
+            raise ValueError(f"Selenium error: {str(e)}")
+        self.rendering_memory.record(url, html is not None)
+        if html is None:
+            raise ValueError("No article rendered with Selenium")
+
+        # Check for 404-like content
+        if any(term in html.lower() for term in NOT_FOUND_PHRASES):
+            print("Found 404-like content in Selenium response")
+            raise ValueError("Page appears to be a 404 or requires subscription")
+
+        print("Successfully fetched with Selenium")
+        return html
 
     @retry(
         stop=stop_after_attempt(3),
@@ -92,12 +220,22 @@ class WebScraperTool:
         reraise=True,
     )
     def _fetch_url(self, url: str) -> str:
-        """Fetch URL content with retries and error handling."""
+        """Fetch URL content with retries and error handling.
+
+        Pages are fetched with requests, falling back to Selenium when that
+        fails, unless the domain is remembered as one where rendering did
+        not help. Domains remembered as needing rendering go straight to
+        Selenium.
+        """
         print(f"Attempting to fetch URL: {url}")
+        needs_js = self.rendering_memory.needs_js(url)
+        if needs_js:
+            return self._fetch_with_selenium(url)
+
         try:
             # First try with requests
             print("Trying with requests...")
-            response = self.session.get(url, timeout=30)
+            response = self._get(url)
             response.raise_for_status()
 
             # Check if we got a 404-like page
@@ -108,6 +246,7 @@ class WebScraperTool:
                 )
 
             print("Successfully fetched with requests")
+            self.rendering_memory.record(url, False)
             return response.text
         except requests.exceptions.HTTPError as e:
             print(f"HTTP error: {str(e)}")
@@ -120,28 +259,11 @@ class WebScraperTool:
             raise ValueError(f"HTTP error occurred: {str(e)}")
         except requests.exceptions.RequestException as e:
             print(f"Request exception: {str(e)}")
-            print("Trying with Selenium...")
-            # If requests fails, try with Selenium
-            driver = self._get_driver()
+            if needs_js is False:
+                raise ValueError(f"Failed to fetch URL: {str(e)}")
             try:
-                driver.get(url)
-
-                # Wait for article content to load
-                wait = WebDriverWait(driver, 10)
-                article = wait.until(EC.presence_of_element_located((By.TAG_NAME, "article")))
-
-                # Wait a bit more for dynamic content
-                time.sleep(2)
-
-                # Check for 404-like content
-                page_text = driver.page_source.lower()
-                if any(term in page_text for term in NOT_FOUND_PHRASES):
-                    print("Found 404-like content in Selenium response")
-                    raise ValueError("Page appears to be a 404 or requires subscription")
-
-                print("Successfully fetched with Selenium")
-                return driver.page_source
-            except Exception as selenium_error:
+                return self._fetch_with_selenium(url)
+            except ValueError as selenium_error:
                 print(f"Selenium error: {str(selenium_error)}")
                 raise ValueError(
                     f"Failed to fetch URL with both methods: {str(e)} and {str(selenium_error)}"
@@ -296,6 +418,235 @@ class WebScraperTool:
             print(f"Error scraping URL {url}: {str(e)}")
             return None
 
+    async def _fetch_url_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        limiter: ConcurrencyLimiter,
+        max_attempts: int,
+        retry_delay: float,
+    ) -> str:
+        """Fetch URL content without blocking, retrying transient failures.
+
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        exponential backoff. The request slot is released while backing off.
+        Cached responses are served without taking a slot.
+        """
+
+        async def send(headers: Dict[str, str]) -> httpx.Response:
+            attempt = 1
+            while True:
+                try:
+                    async with limiter.slot(url):
+                        response = await client.get(url, headers=headers)
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        return response
+                    error = httpx.HTTPStatusError(
+                        f"Server error {response.status_code}: {url}",
+                        request=response.request,
+                        response=response,
+                    )
+                except httpx.TransportError as e:
+                    error = e
+
+                if attempt >= max_attempts:
+                    raise error
+                await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+                attempt += 1
+
+        if self.http_cache is None:
+            response = await send({})
+        else:
+            response = await self.http_cache.afetch(url, send)
+
+        if response.status_code == 404:
+            raise ValueError(f"Article not found (404): {url}")
+        elif response.status_code == 403:
+            raise ValueError(f"Access denied (403) - may require subscription: {url}")
+        elif response.status_code == 401:
+            raise ValueError(f"Authentication required (401): {url}")
+        elif response.is_error:
+            raise ValueError(f"HTTP error occurred: {response.status_code} for {url}")
+
+        if any(term in response.text.lower() for term in NOT_FOUND_PHRASES):
+            raise ValueError("Page appears to be a 404 or requires subscription")
+        return response.text
+
+    async def _render_async(self, url: str) -> str:
+        """Render a URL with the pooled Selenium fallback on a worker thread.
+
+        Returns:
+            The article text
+        """
+        loop = asyncio.get_running_loop()
+        html_content = await loop.run_in_executor(None, self._fetch_with_selenium, url)
+        return self.extract_article_text(html_content)
+
+    async def _selenium_fallback(self, state: NewsAnalysisState, error: Exception) -> str:
+        """Render a page that failed over HTTP, re-raising the HTTP error if that fails too."""
+        state.add_log(f"Falling back to Selenium after: {str(error)}")
+        try:
+            return await self._render_async(state.target_url)
+        except Exception as selenium_error:
+            state.add_log(f"Selenium error: {str(selenium_error)}")
+            raise error
+
+    async def _scrape_async(
+        self,
+        client: httpx.AsyncClient,
+        state: NewsAnalysisState,
+        limiter: ConcurrencyLimiter,
+        max_attempts: int,
+        retry_delay: float,
+    ) -> NewsAnalysisState:
+        """Scrape article content into a state, recording failures on the state.
+
+        As in _fetch_url, domains remembered as needing JavaScript are
+        rendered with Selenium, and pages that could not be fetched or
+        yielded no article fall back to Selenium unless the domain is
+        remembered as static.
+        """
+        state.status = AnalysisStatus.SCRAPING
+        state.add_log(f"Starting scrape of URL: {state.target_url}")
+        needs_js = self.rendering_memory.needs_js(state.target_url)
+
+        try:
+            if needs_js:
+                state.scraped_text = await self._render_async(state.target_url)
+            else:
+                # A failed status (404, 403, ...) is not a rendering problem,
+                # so only transport errors fall back before the page arrives
+                try:
+                    html_content = await self._fetch_url_async(
+                        client, state.target_url, limiter, max_attempts, retry_delay
+                    )
+                except httpx.TransportError as e:
+                    if needs_js is False:
+                        raise
+                    state.scraped_text = await self._selenium_fallback(state, e)
+                else:
+                    try:
+                        state.scraped_text = self.extract_article_text(html_content)
+                        self.rendering_memory.record(state.target_url, False)
+                    except (ValueError, AttributeError) as e:
+                        if needs_js is False:
+                            raise
+                        state.scraped_text = await self._selenium_fallback(state, e)
+            state.scraped_at = datetime.now(UTC)
+            state.status = AnalysisStatus.SCRAPE_SUCCEEDED
+            state.add_log("Successfully scraped article content")
+
+        except httpx.HTTPError as e:
+            state.status = AnalysisStatus.SCRAPE_FAILED_NETWORK
+            state.set_error("scraping", e)
+            state.add_log(f"Network error during scraping: {str(e)}")
+
+        except (ValueError, AttributeError) as e:
+            state.status = AnalysisStatus.SCRAPE_FAILED_PARSING
+            state.set_error("scraping", e)
+            state.add_log(f"Parsing error during scraping: {str(e)}")
+
+        except Exception as e:
+            state.status = AnalysisStatus.SCRAPE_FAILED_PARSING
+            state.set_error("scraping", e)
+            state.add_log(f"Unexpected error during scraping: {str(e)}")
+
+        return state
+
+    async def ascrape_many(
+        self,
+        targets: Iterable[Union[str, NewsAnalysisState]],
+        max_concurrency: Optional[int] = None,
+        per_domain_limit: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[NewsAnalysisState]:
+        """Scrape many articles concurrently, yielding each state as it finishes.
+
+        Args:
+            targets: URLs, or states whose target_url to scrape
+            max_concurrency: Maximum requests in flight; defaults to
+                settings.SCRAPE_MAX_CONCURRENCY
+            per_domain_limit: Maximum requests in flight to one domain;
+                defaults to settings.SCRAPE_PER_DOMAIN_LIMIT
+            max_attempts: Attempts per URL; defaults to settings.MAX_RETRIES
+            retry_delay: Seconds before the first retry, doubling after each;
+                defaults to settings.RETRY_DELAY
+            client: HTTP client to use; one is created when omitted
+
+        Yields:
+            NewsAnalysisState for each target in completion order, with
+            status SCRAPE_SUCCEEDED or a SCRAPE_FAILED_* status and error
+        """
+        states = [
+            NewsAnalysisState(target_url=target) if isinstance(target, str) else target
+            for target in targets
+        ]
+        if not states:
+            return
+
+        max_concurrency = max_concurrency or settings.SCRAPE_MAX_CONCURRENCY
+        limiter = ConcurrencyLimiter(
+            max_concurrency, per_domain_limit or settings.SCRAPE_PER_DOMAIN_LIMIT
+        )
+        max_attempts = max_attempts or settings.MAX_RETRIES
+        retry_delay = settings.RETRY_DELAY if retry_delay is None else retry_delay
+
+        own_client = client is None
+        if own_client:
+            client = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                timeout=settings.REQUEST_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+                ),
+            )
+
+        tasks = [
+            asyncio.ensure_future(
+                self._scrape_async(client, state, limiter, max_attempts, retry_delay)
+            )
+            for state in states
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if own_client:
+                await client.aclose()
+
+    def scrape_many(
+        self, targets: Iterable[Union[str, NewsAnalysisState]], **kwargs: Any
+    ) -> Iterator[NewsAnalysisState]:
+        """Scrape many articles concurrently from synchronous code.
+
+        Runs ascrape_many on a private event loop; async callers should use
+        ascrape_many directly.
+
+        Args:
+            targets: URLs, or states whose target_url to scrape
+            **kwargs: Limits passed to ascrape_many
+
+        Yields:
+            NewsAnalysisState for each target in completion order
+        """
+        loop = asyncio.new_event_loop()
+        results = self.ascrape_many(targets, **kwargs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+
     def scrape(self, state: NewsAnalysisState) -> NewsAnalysisState:
         """
         Scrape article content and update state.
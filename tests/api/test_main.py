@@ -153,12 +153,13 @@ class TestStartupShutdown:
         # Use patch to mock external dependencies
         with patch("local_newsifier.api.main.get_engine", get_engine_mock), patch(
             "local_newsifier.api.main.logger", mock_logger
-        ):
+        ), patch("local_newsifier.api.main.preload_models") as preload_mock:
             # Call the startup event
             startup_event()
 
             # Verify our mocks were called as expected
             get_engine_mock.assert_called_once()
+            preload_mock.assert_called_once()
             mock_logger.info.assert_any_call("Application startup initiated")
             mock_logger.info.assert_any_call("Database connection verified")
             mock_logger.info.assert_any_call("Application startup complete")
@@ -186,11 +187,16 @@ class TestStartupShutdown:
         """Test shutdown event handler."""
         from local_newsifier.api.main import shutdown_event
 
-        # Use patch to mock logger
-        with patch("local_newsifier.api.main.logger", mock_logger):
+        # Use patch to mock logger and engine disposal
+        with patch("local_newsifier.api.main.logger", mock_logger), patch(
+            "local_newsifier.api.main.dispose_engines"
+        ) as mock_dispose:
             # Call the shutdown event
             shutdown_event()
 
+            # Verify pooled connections were released
+            mock_dispose.assert_called_once()
+
             # Verify logger was called as expected
             mock_logger.info.assert_any_call("Application shutdown initiated")
             mock_logger.info.assert_any_call("Application shutdown complete")
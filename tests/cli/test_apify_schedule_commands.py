@@ -218,6 +218,29 @@ class TestApifyScheduleCommands:
         assert "Unchanged: 3" in result.output
         mock_schedule_manager.sync_schedules.assert_called_once()
 
+    @patch("local_newsifier.cli.commands.apify._get_schedule_manager")
+    @patch("local_newsifier.cli.commands.apify._ensure_token")
+    def test_sync_schedules_concurrent(
+        self, mock_ensure_token, mock_get_schedule_manager, runner, mock_schedule_manager
+    ):
+        """Test the sync schedules command in concurrent mode."""
+        mock_ensure_token.return_value = True
+        mock_get_schedule_manager.return_value = mock_schedule_manager
+        mock_schedule_manager.sync_schedules_concurrently.return_value = {
+            "created": 4,
+            "updated": 0,
+            "deleted": 1,
+            "unchanged": 2,
+            "errors": [],
+        }
+
+        result = runner.invoke(sync_schedules, ["--concurrent", "--workers", "3"])
+
+        assert result.exit_code == 0
+        assert "Created: 4" in result.output
+        mock_schedule_manager.sync_schedules_concurrently.assert_called_once_with(max_workers=3)
+        mock_schedule_manager.sync_schedules.assert_not_called()
+
     @patch("local_newsifier.cli.commands.apify._get_schedule_manager")
     @patch("local_newsifier.cli.commands.apify._ensure_token")
     def test_create_schedule(
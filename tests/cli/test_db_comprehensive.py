@@ -606,10 +606,8 @@ class TestDBPurgeDuplicates:
         assert "Kept article ID: 1" in result.output
         assert "Removed article IDs: 2" in result.output
 
-        # Verify article_crud.remove was called with the correct arguments
-        mock_article_crud.remove.assert_called_once_with(mock_session, id=article2.id)
-        # Verify session.commit was called
-        mock_session.commit.assert_called_once()
+        # Verify the duplicates were removed in one bulk call
+        mock_article_crud.remove_many.assert_called_once_with(mock_session, ids=[article2.id])
 
     @patch("local_newsifier.cli.commands.db.get_injected_obj")
     def test_purge_duplicates_dry_run(self, mock_get_injected_obj, mock_article):
@@ -657,8 +655,8 @@ class TestDBPurgeDuplicates:
         assert "Would remove 1 duplicate articles across 1 URLs" in result.output
         assert "(DRY RUN - No changes were made)" in result.output
 
-        # Verify article_crud.remove was not called
-        mock_article_crud.remove.assert_not_called()
+        # Verify nothing was removed
+        mock_article_crud.remove_many.assert_not_called()
         # Verify session.commit was not called
         mock_session.commit.assert_not_called()
 
@@ -715,7 +713,5 @@ class TestDBPurgeDuplicates:
         assert output["details"][0]["kept_id"] == 1
         assert output["details"][0]["removed_ids"] == [2]
 
-        # Verify article_crud.remove was called with the correct arguments
-        mock_article_crud.remove.assert_called_once_with(mock_session, id=article2.id)
-        # Verify session.commit was called
-        mock_session.commit.assert_called_once()
+        # Verify the duplicates were removed in one bulk call
+        mock_article_crud.remove_many.assert_called_once_with(mock_session, ids=[article2.id])
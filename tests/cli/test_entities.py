@@ -0,0 +1,71 @@
+"""Tests for the entity tracking CLI commands."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from local_newsifier.cli.main import cli
+from local_newsifier.models.state import TrackingStatus
+
+
+@pytest.fixture
+def mock_entity_service():
+    """Mock the EntityService used by the entities commands."""
+    mock_service = MagicMock()
+
+    def process(state):
+        state.status = TrackingStatus.SUCCESS
+        state.total_articles = 3
+        state.processed_count = 3
+        return state
+
+    mock_service.process_articles_batch.side_effect = process
+
+    with patch(
+        "local_newsifier.cli.commands.entities.get_entity_service", return_value=mock_service
+    ):
+        yield mock_service
+
+
+def test_process_backlog(mock_entity_service):
+    """Test that the backlog command runs a batched entity pass."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["entities", "process-backlog", "--status", "new", "--batch-size", "25", "--n-process", "4"],
+    )
+
+    assert result.exit_code == 0
+    assert "Backlog processing completed!" in result.output
+    assert "Articles processed: 3" in result.output
+
+    state = mock_entity_service.process_articles_batch.call_args[0][0]
+    assert state.status_filter == "new"
+    assert state.batch_size == 25
+    assert state.n_process == 4
+
+
+def test_process_backlog_json(mock_entity_service):
+    """Test the backlog command with JSON output."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["entities", "process-backlog", "--json"])
+
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert output == {
+        "status": "SUCCESS",
+        "total_articles": 3,
+        "processed_count": 3,
+        "error_count": 0,
+    }
+
+
+def test_process_backlog_invalid_batch_size(mock_entity_service):
+    """Test that a non-positive batch size is rejected."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["entities", "process-backlog", "--batch-size", "0"])
+
+    assert "--batch-size must be at least 1" in result.output
+    mock_entity_service.process_articles_batch.assert_not_called()
@@ -249,24 +249,29 @@ def test_feeds_fetch(mock_rss_feed_service, sample_feed):
     """Test the feeds fetch command."""
     # Setup mock
     mock_rss_feed_service.list_feeds.return_value = [sample_feed, sample_feed.copy()]
-    mock_rss_feed_service.process_feed.return_value = {
+    result_data = {
         "status": "success",
         "feed_id": 1,
         "feed_name": "Test Feed",
         "articles_found": 5,
         "articles_added": 3,
+        "fetch_seconds": 0.1,
     }
+    mock_rss_feed_service.process_feeds.return_value = iter([result_data, result_data.copy()])
 
     # Run command
     runner = CliRunner()
-    result = runner.invoke(cli, ["feeds", "fetch"])
+    result = runner.invoke(cli, ["feeds", "fetch", "--concurrency", "4", "--per-host", "1"])
 
     # Verify
     assert result.exit_code == 0
     assert "Processed 2 feeds: 2 successful, 0 failed" in result.output
     assert "All feeds processed successfully" in result.output
     mock_rss_feed_service.list_feeds.assert_called_once_with(active_only=True)
-    assert mock_rss_feed_service.process_feed.call_count == 2
+    args, kwargs = mock_rss_feed_service.process_feeds.call_args
+    assert args == ([1, 1],)
+    assert kwargs["max_workers"] == 4
+    assert kwargs["per_host_limit"] == 1
 
 
 def test_feeds_fetch_with_errors(mock_rss_feed_service, sample_feed):
@@ -280,24 +285,23 @@ def test_feeds_fetch_with_errors(mock_rss_feed_service, sample_feed):
     mock_rss_feed_service.list_feeds.return_value = [feed1, feed2]
 
     # Make the first feed succeed and the second fail
-    def process_feed_side_effect(feed_id, task_queue_func=None):
-        if feed_id == 1:
-            return {
+    mock_rss_feed_service.process_feeds.return_value = iter(
+        [
+            {
                 "status": "success",
                 "feed_id": 1,
                 "feed_name": "Test Feed",
                 "articles_found": 5,
                 "articles_added": 3,
-            }
-        else:
-            return {
+            },
+            {
                 "status": "error",
                 "feed_id": 2,
                 "feed_name": "Test Feed 2",
                 "message": "Failed to fetch",
-            }
-
-    mock_rss_feed_service.process_feed.side_effect = process_feed_side_effect
+            },
+        ]
+    )
 
     # Run command
     runner = CliRunner()
@@ -307,5 +311,6 @@ def test_feeds_fetch_with_errors(mock_rss_feed_service, sample_feed):
     assert result.exit_code == 0
     assert "Processed 2 feeds: 1 successful, 1 failed" in result.output
     assert "Partially successful" in result.output
+    assert "Failed to fetch" in result.output
     mock_rss_feed_service.list_feeds.assert_called_once_with(active_only=True)
-    assert mock_rss_feed_service.process_feed.call_count == 2
+    mock_rss_feed_service.process_feeds.assert_called_once()
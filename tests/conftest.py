@@ -19,6 +19,26 @@ from local_newsifier.models.entity_tracking import CanonicalEntity
 # Note: We don't need to register models here as it's done in root conftest.py
 
 
+@pytest.fixture(autouse=True)
+def reset_nlp_model_registry():
+    """Keep spaCy models (often mocks) loaded by one test from leaking into the next."""
+    from local_newsifier.tools.nlp_models import clear_models
+
+    clear_models()
+    yield
+    clear_models()
+
+
+@pytest.fixture(autouse=True)
+def reset_canonical_entity_cache():
+    """Keep canonical entities cached against one test database out of the next."""
+    from local_newsifier.tools.resolution import canonical_entity_cache
+
+    canonical_entity_cache.reset_canonical_entity_cache()
+    yield
+    canonical_entity_cache.reset_canonical_entity_cache()
+
+
 # ==================== Sample Data Fixtures ====================
 
 
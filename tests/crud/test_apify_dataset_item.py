@@ -0,0 +1,66 @@
+"""Tests for the Apify dataset item CRUD module."""
+
+from sqlmodel import select
+
+from local_newsifier.crud.apify_dataset_item import apify_dataset_item
+from local_newsifier.models.apify import ApifyDatasetItem, ApifyJob
+
+
+def make_job(db_session):
+    """Create a job to stage items for."""
+    job = ApifyJob(run_id="run1", actor_id="actor1", status="SUCCEEDED", dataset_id="dataset1")
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def test_stage_identifies_items_by_dataset_index(db_session):
+    """Test that staged items keep their raw data and dataset index."""
+    job = make_job(db_session)
+
+    staged = apify_dataset_item.stage(
+        db_session, job_id=job.id, items=[{"url": "a"}, {"url": "b"}], offset=10
+    )
+    db_session.commit()
+
+    items = db_session.exec(select(ApifyDatasetItem).order_by(ApifyDatasetItem.id)).all()
+    assert staged == 2
+    assert [(item.apify_id, item.raw_data["url"]) for item in items] == [("10", "a"), ("11", "b")]
+    assert not any(item.transformed for item in items)
+    assert all(item.created_at is not None for item in items)
+
+
+def test_claim_and_count_untransformed(db_session):
+    """Test claiming chunks of untransformed items in dataset order."""
+    job = make_job(db_session)
+    apify_dataset_item.stage(db_session, job_id=job.id, items=[{}] * 5, offset=0)
+    db_session.commit()
+
+    claimed = apify_dataset_item.claim_untransformed(db_session, job_id=job.id, limit=3)
+    assert [item.apify_id for item in claimed] == ["0", "1", "2"]
+
+    for item in claimed:
+        item.transformed = True
+        db_session.add(item)
+    db_session.commit()
+
+    assert apify_dataset_item.count_untransformed(db_session, job_id=job.id) == 2
+    remaining = apify_dataset_item.claim_untransformed(db_session, job_id=job.id, limit=3)
+    assert [item.apify_id for item in remaining] == ["3", "4"]
+
+
+def test_reset_skipped(db_session):
+    """Test that transformed items without articles are reset."""
+    job = make_job(db_session)
+    apify_dataset_item.stage(db_session, job_id=job.id, items=[{}] * 3, offset=0)
+    db_session.commit()
+    items = db_session.exec(select(ApifyDatasetItem).order_by(ApifyDatasetItem.id)).all()
+    items[0].transformed, items[0].error_message = True, "short_content"
+    items[1].transformed, items[1].error_message = True, "duplicate"
+    db_session.add_all(items)
+    db_session.commit()
+
+    assert apify_dataset_item.reset_skipped(db_session, job_id=job.id) == 2
+    db_session.expire_all()
+    assert apify_dataset_item.count_untransformed(db_session, job_id=job.id) == 3
+    assert items[0].error_message is None
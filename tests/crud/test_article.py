@@ -61,6 +61,15 @@ class TestArticleCRUD:
         assert article.title == create_article.title
         assert article.url == create_article.url
 
+    def test_existing_urls(self, db_session, create_article):
+        """Test finding which URLs already have articles in chunked batches."""
+        urls = [create_article.url, "https://example.com/new", "", create_article.url]
+
+        existing = article_crud.existing_urls(db_session, urls=urls, chunk_size=1)
+
+        assert existing == {create_article.url}
+        assert article_crud.existing_urls(db_session, urls=[]) == set()
+
     def test_get_by_url_not_found(self, db_session):
         """Test getting a non-existent article by URL."""
         article = article_crud.get_by_url(db_session, url="https://example.com/nonexistent")
@@ -177,6 +186,87 @@ class TestArticleCRUD:
             assert article.source == "source1"
             # Skip date range check as the dates might be naive or aware
 
+    def test_iter_by_status(self, db_session):
+        """Test paging through articles by status while their status changes."""
+        for i, status in enumerate(["new", "scraped", "new", "new", "new", "new", "new"]):
+            db_session.add(
+                Article(
+                    title=f"Test Article {i}",
+                    content=f"This is test article {i}.",
+                    url=f"https://example.com/test-article-{i}",
+                    source="test_source",
+                    published_at=datetime.now(timezone.utc),
+                    status=status,
+                    scraped_at=datetime.now(timezone.utc),
+                )
+            )
+        db_session.commit()
+
+        seen = []
+        for article in article_crud.iter_by_status(db_session, status="new", page_size=2):
+            seen.append(article.title)
+            # Processing moves articles out of the filter; pages must not skip any
+            article_crud.update_status(db_session, article_id=article.id, status="processed")
+
+        assert seen == [f"Test Article {i}" for i in (0, 2, 3, 4, 5, 6)]
+
+    def test_iter_by_status_with_columns(self, db_session, create_article):
+        """Test projecting only some columns; the id is always included."""
+        rows = list(
+            article_crud.iter_by_status(db_session, status="new", columns=["title", "url"])
+        )
+
+        assert len(rows) == 1
+        assert (rows[0].id, rows[0].title, rows[0].url) == (
+            create_article.id,
+            create_article.title,
+            create_article.url,
+        )
+        assert not hasattr(rows[0], "content")
+
+    def test_iter_by_date_range(self, db_session):
+        """Test paging by (published_at, id) across articles sharing a date."""
+        now = datetime.now(timezone.utc)
+        dates = [now - timedelta(days=1), now, now, now, now - timedelta(days=5)]
+        for i, date in enumerate(dates):
+            db_session.add(
+                Article(
+                    title=f"Test Article {i}",
+                    content=f"This is test article {i}.",
+                    url=f"https://example.com/test-article-{i}",
+                    source="source1" if i < 3 else "source2",
+                    published_at=date,
+                    status="new",
+                    scraped_at=now,
+                )
+            )
+        db_session.commit()
+
+        articles = list(
+            article_crud.iter_by_date_range(
+                db_session,
+                start_date=now - timedelta(days=3),
+                end_date=now,
+                page_size=1,
+                yield_per=1,
+            )
+        )
+
+        assert [a.title for a in articles] == [f"Test Article {i}" for i in (0, 1, 2, 3)]
+
+        titles = [
+            row.title
+            for row in article_crud.iter_by_date_range(
+                db_session,
+                start_date=now - timedelta(days=3),
+                end_date=now,
+                source="source1",
+                page_size=2,
+                columns=["title"],
+            )
+        ]
+        assert titles == ["Test Article 0", "Test Article 1", "Test Article 2"]
+
     def test_singleton_instance(self):
         """Test singleton instance behavior."""
         assert isinstance(article_crud, CRUDArticle)
@@ -1,13 +1,18 @@
 """Tests for the base CRUD module."""
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 # We need pytest for fixtures but don't explicitly use it
+import pytest
 from pydantic import BaseModel
+from sqlalchemy.dialects import postgresql
 from sqlmodel import SQLModel, select
 
 from local_newsifier.crud.base import CRUDBase
 from local_newsifier.models.article import Article
+from local_newsifier.models.entity import Entity
+from local_newsifier.models.entity_tracking import CanonicalEntity
 
 
 class TestCRUDBase:
@@ -159,3 +164,166 @@ class TestCRUDBase:
         removed_article = crud.remove(db_session, id=999)
 
         assert removed_article is None
+
+    def test_create_many(self, db_session, create_article):
+        """Test creating many items in one insert."""
+        crud = CRUDBase(Entity)
+        ids = crud.create_many(
+            db_session,
+            objs_in=[
+                Entity(article_id=create_article.id, text="John Doe", entity_type="PERSON"),
+                {"article_id": create_article.id, "text": "Gainesville", "entity_type": "GPE"},
+            ],
+        )
+
+        assert len(ids) == 2
+        entities = {entity.id: entity for entity in db_session.exec(select(Entity)).all()}
+        assert [entities[entity_id].text for entity_id in ids] == ["John Doe", "Gainesville"]
+        # Model defaults are applied to dict input
+        assert entities[ids[1]].confidence == 1.0
+        assert entities[ids[1]].created_at is not None
+
+    def test_create_many_without_commit(self, db_session, create_article):
+        """Test that create_many can join the caller's transaction."""
+        crud = CRUDBase(Entity)
+        with patch.object(db_session, "commit") as commit:
+            ids = crud.create_many(
+                db_session,
+                objs_in=[
+                    Entity(article_id=create_article.id, text="John Doe", entity_type="PERSON")
+                ],
+                commit=False,
+            )
+
+        commit.assert_not_called()
+        assert crud.get(db_session, id=ids[0]).text == "John Doe"
+        assert crud.create_many(db_session, objs_in=[]) == []
+
+    def test_create_many_in_chunks(self, db_session, create_article):
+        """Test that large inputs are split into chunks but keep their order."""
+        crud = CRUDBase(Entity)
+        objs_in = [
+            {"article_id": create_article.id, "text": f"Entity {i}", "entity_type": "PERSON"}
+            for i in range(7)
+        ]
+
+        ids = crud.create_many(db_session, objs_in=objs_in, chunk_size=3)
+
+        assert [crud.get(db_session, id=entity_id).text for entity_id in ids] == [
+            f"Entity {i}" for i in range(7)
+        ]
+        assert crud.create_many(db_session, objs_in=objs_in, return_ids=False) == []
+        assert len(db_session.exec(select(Entity)).all()) == 14
+
+    def test_upsert_many(self, db_session):
+        """Test inserting new rows and updating existing ones on a unique constraint."""
+        crud = CRUDBase(CanonicalEntity)
+        existing = crud.create(
+            db_session, obj_in={"name": "Joe Biden", "entity_type": "PERSON", "description": "old"}
+        )
+
+        ids = crud.upsert_many(
+            db_session,
+            objs_in=[
+                CanonicalEntity(name="Gainesville", entity_type="GPE"),
+                CanonicalEntity(name="Joe Biden", entity_type="PERSON", description="new"),
+                CanonicalEntity(name="Gainesville", entity_type="GPE"),
+            ],
+            conflict_target="uix_name_type",
+            update_columns=["description"],
+            chunk_size=1,
+        )
+
+        assert ids[1] == existing.id
+        assert ids[0] == ids[2] != existing.id
+        db_session.expire_all()
+        assert crud.get(db_session, id=existing.id).description == "new"
+        assert len(db_session.exec(select(CanonicalEntity)).all()) == 2
+
+    def test_upsert_many_without_update_columns(self, db_session):
+        """Test that existing rows are left untouched but their ids still returned."""
+        crud = CRUDBase(CanonicalEntity)
+        existing = crud.create(
+            db_session, obj_in={"name": "Joe Biden", "entity_type": "PERSON", "description": "old"}
+        )
+
+        ids = crud.upsert_many(
+            db_session,
+            objs_in=[{"name": "Joe Biden", "entity_type": "PERSON", "description": "new"}],
+            conflict_target=["name", "entity_type"],
+        )
+
+        assert ids == [existing.id]
+        db_session.expire_all()
+        assert crud.get(db_session, id=existing.id).description == "old"
+
+    def test_upsert_statement_postgresql(self):
+        """Test the PostgreSQL upsert targets the named constraint and returns ids."""
+        crud = CRUDBase(CanonicalEntity)
+        statement = crud.upsert_statement(
+            [{"name": "Joe Biden", "entity_type": "PERSON"}],
+            conflict_target="uix_name_type",
+            update_columns=["last_seen"],
+        )
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uix_name_type DO UPDATE" in sql
+        assert "last_seen = excluded.last_seen" in sql
+        assert "updated_at = excluded.updated_at" in sql
+        assert "RETURNING canonical_entities.id" in sql
+
+    def test_upsert_unknown_constraint(self):
+        """Test that an unknown constraint name is rejected."""
+        crud = CRUDBase(CanonicalEntity)
+
+        with pytest.raises(ValueError):
+            crud.upsert_statement([], conflict_target="uix_missing")
+
+    def test_update_many_by_ids(self, db_session):
+        """Test updating many items by id in chunks."""
+        crud = CRUDBase(Article)
+        articles = [
+            crud.create(
+                db_session,
+                obj_in={
+                    "title": f"Article {i}",
+                    "content": "Content",
+                    "url": f"https://example.com/{i}",
+                    "source": "test_source",
+                    "status": "new",
+                    "published_at": datetime.now(timezone.utc),
+                    "scraped_at": datetime.now(timezone.utc),
+                },
+            )
+            for i in range(3)
+        ]
+
+        updated = crud.update_many_by_ids(
+            db_session,
+            ids=[articles[0].id, articles[2].id],
+            values={"status": "scraped"},
+            chunk_size=1,
+        )
+
+        assert updated == 2
+        db_session.expire_all()
+        assert [crud.get(db_session, id=a.id).status for a in articles] == [
+            "scraped",
+            "new",
+            "scraped",
+        ]
+
+    def test_remove_many(self, db_session, create_article):
+        """Test removing many items by id."""
+        crud = CRUDBase(Entity)
+        ids = crud.create_many(
+            db_session,
+            objs_in=[
+                {"article_id": create_article.id, "text": f"Entity {i}", "entity_type": "PERSON"}
+                for i in range(3)
+            ],
+        )
+
+        assert crud.remove_many(db_session, ids=ids[:2] + [999], chunk_size=2) == 2
+        assert [entity.id for entity in db_session.exec(select(Entity)).all()] == ids[2:]
+        assert crud.remove_many(db_session, ids=[]) == 0
@@ -98,6 +98,50 @@ class TestCanonicalEntityCRUD:
         for entity in entities:
             assert entity.entity_type == "PERSON"
 
+    def test_iter_all(self, db_session, create_canonical_entities):
+        """Test paging through canonical entities, optionally by type."""
+        entities = list(canonical_entity_crud.iter_all(db_session, page_size=2))
+        assert [entity.name for entity in entities] == [
+            "Test Entity 1",
+            "Test Entity 2",
+            "Test Entity 3",
+        ]
+
+        rows = list(
+            canonical_entity_crud.iter_all(
+                db_session, entity_type="PERSON", page_size=1, columns=["name"]
+            )
+        )
+        assert [row.name for row in rows] == ["Test Entity 1", "Test Entity 3"]
+
+    def test_get_after_id(self, db_session, create_canonical_entities):
+        """Test getting canonical entities created after a watermark id."""
+        ids = sorted(entity.id for entity in create_canonical_entities)
+
+        entities = canonical_entity_crud.get_after_id(db_session, after_id=ids[0])
+
+        assert [entity.id for entity in entities] == ids[1:]
+        assert canonical_entity_crud.get_after_id(db_session, after_id=ids[-1]) == []
+
+    def test_get_or_create_many(self, db_session, create_canonical_entities):
+        """Test getting existing and creating new canonical entities in one call."""
+        existing = create_canonical_entities[0]
+
+        ids = canonical_entity_crud.get_or_create_many(
+            db_session,
+            objs_in=[
+                CanonicalEntity(name="New Entity", entity_type="PERSON"),
+                CanonicalEntity(name=existing.name, entity_type=existing.entity_type),
+                CanonicalEntity(name="New Entity", entity_type="PERSON"),
+            ],
+        )
+
+        assert ids[1] == existing.id
+        assert ids[0] == ids[2]
+        created = canonical_entity_crud.get(db_session, id=ids[0])
+        assert (created.name, created.entity_type) == ("New Entity", "PERSON")
+        assert len(canonical_entity_crud.get_all(db_session)) == 4
+
     def test_get_mentions_count(self, db_session, create_canonical_entity, create_entity):
         """Test getting the count of mentions for an entity."""
         # Add an entity mention
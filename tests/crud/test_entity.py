@@ -200,6 +200,55 @@ class TestEntityCRUD:
         # Should return all 5 entities
         assert len(full_date_range) == 5
 
+    def test_iter_by_date_range_and_types(self, db_session):
+        """Test paging through entities by date range and type."""
+        now = datetime.now(timezone.utc)
+        recent = Article(
+            title="Recent",
+            content="Recent article",
+            url="https://example.com/recent",
+            source="test_source",
+            published_at=now - timedelta(days=1),
+            status="new",
+            scraped_at=now,
+        )
+        old = Article(
+            title="Old",
+            content="Old article",
+            url="https://example.com/old",
+            source="test_source",
+            published_at=now - timedelta(days=10),
+            status="new",
+            scraped_at=now,
+        )
+        db_session.add_all([recent, old])
+        db_session.commit()
+
+        for article in (recent, old):
+            for i, entity_type in enumerate(["PERSON", "ORG", "PERSON", "GPE"]):
+                db_session.add(
+                    Entity(article_id=article.id, text=f"Entity {i}", entity_type=entity_type)
+                )
+        db_session.commit()
+
+        rows = list(
+            entity_crud.iter_by_date_range_and_types(
+                db_session,
+                start_date=now - timedelta(days=3),
+                end_date=now,
+                entity_types=["PERSON", "GPE"],
+                page_size=2,
+                columns=["article_id", "text", "entity_type"],
+            )
+        )
+
+        assert [(row.text, row.entity_type) for row in rows] == [
+            ("Entity 0", "PERSON"),
+            ("Entity 2", "PERSON"),
+            ("Entity 3", "GPE"),
+        ]
+        assert {row.article_id for row in rows} == {recent.id}
+
     def test_singleton_instance(self):
         """Test that the entity_crud is a singleton instance of CRUDEntity."""
         assert isinstance(entity_crud, CRUDEntity)
@@ -0,0 +1,202 @@
+"""Query-plan regression checks for the indexed CRUD hot paths.
+
+Each test runs a real CRUD method against a seeded synthetic dataset, captures
+the SQL it issues and asserts that ``EXPLAIN QUERY PLAN`` for it searches the
+expected index rather than scanning the table.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, text
+from sqlmodel import Session, SQLModel, create_engine
+
+from local_newsifier.crud.analysis_result import analysis_result as analysis_result_crud
+from local_newsifier.crud.article import article as article_crud
+from local_newsifier.crud.canonical_entity import canonical_entity as canonical_entity_crud
+from local_newsifier.crud.entity import entity as entity_crud
+from local_newsifier.models.analysis_result import AnalysisResult
+from local_newsifier.models.article import Article
+from local_newsifier.models.entity import Entity
+from local_newsifier.models.entity_tracking import CanonicalEntity, EntityMention
+
+ARTICLE_COUNT = 2000
+STATUSES = ["new", "scraped", "analyzed", "failed"]
+ENTITY_TYPES = ["PERSON", "ORG", "GPE"]
+ANALYSIS_TYPES = ["sentiment", "headline_trend", "entity_summary"]
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def plan_engine():
+    """Create a separate SQLite database seeded with a synthetic dataset."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        articles = [
+            {
+                "id": i,
+                "title": f"Article {i}",
+                "content": "content",
+                "url": f"https://example.com/{i}",
+                "source": f"source-{i % 10}",
+                "status": STATUSES[i % len(STATUSES)],
+                "published_at": START + timedelta(hours=i),
+                "scraped_at": START + timedelta(hours=i),
+            }
+            for i in range(1, ARTICLE_COUNT + 1)
+        ]
+        session.execute(Article.__table__.insert(), articles)
+        session.execute(
+            Entity.__table__.insert(),
+            [
+                {
+                    "article_id": (i % ARTICLE_COUNT) + 1,
+                    "text": f"Entity {i % 200}",
+                    "entity_type": ENTITY_TYPES[i % len(ENTITY_TYPES)],
+                    "confidence": 0.9,
+                }
+                for i in range(ARTICLE_COUNT * 3)
+            ],
+        )
+        session.execute(
+            AnalysisResult.__table__.insert(),
+            [
+                {
+                    "article_id": article["id"],
+                    "analysis_type": analysis_type,
+                    "results": {},
+                }
+                for article in articles
+                for analysis_type in ANALYSIS_TYPES
+            ],
+        )
+        session.execute(
+            CanonicalEntity.__table__.insert(),
+            [{"id": i, "name": f"Entity {i}", "entity_type": "PERSON"} for i in range(1, 201)],
+        )
+        session.execute(
+            EntityMention.__table__.insert(),
+            [
+                {
+                    "canonical_entity_id": (i % 200) + 1,
+                    "entity_id": i + 1,
+                    "article_id": (i % ARTICLE_COUNT) + 1,
+                }
+                for i in range(ARTICLE_COUNT * 3)
+            ],
+        )
+        session.commit()
+        session.execute(text("ANALYZE"))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def query_plans(engine, call):
+    """Run a CRUD call and return the EXPLAIN QUERY PLAN of each SELECT it issues.
+
+    Args:
+        engine: Engine the call's session is bound to
+        call: Callable taking a session and running the CRUD method
+
+    Returns:
+        One plan per SELECT, each a single string of its plan details
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as session:
+            result = call(session)
+            if not isinstance(result, list):
+                list(result)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plans.append(" | ".join(row[-1] for row in rows))
+    assert plans, "the call issued no SELECT"
+    return plans
+
+
+def assert_uses_index(plans, index_name):
+    """Assert every plan searches the named index."""
+    for plan in plans:
+        assert f"INDEX {index_name}" in plan, plan
+
+
+def test_get_by_status_uses_status_index(plan_engine):
+    """Articles by status are read through the status index."""
+    plans = query_plans(plan_engine, lambda db: article_crud.get_by_status(db, status="failed"))
+    assert_uses_index(plans, "ix_articles_status_id")
+
+
+def test_iter_by_status_uses_status_index(plan_engine):
+    """Every page of articles by status is read through the status index."""
+    plans = query_plans(
+        plan_engine,
+        lambda db: article_crud.iter_by_status(db, status="failed", page_size=100),
+    )
+    assert len(plans) > 1
+    assert_uses_index(plans, "ix_articles_status_id")
+
+
+def test_get_by_date_range_uses_published_at_index(plan_engine):
+    """Articles by date range are read through the published_at index."""
+    plans = query_plans(
+        plan_engine,
+        lambda db: article_crud.get_by_date_range(
+            db, start_date=START, end_date=START + timedelta(days=2)
+        ),
+    )
+    assert_uses_index(plans, "ix_articles_published_at_id")
+
+
+def test_iter_by_date_range_uses_published_at_index(plan_engine):
+    """Every page of articles by date range is read through the published_at index."""
+    plans = query_plans(
+        plan_engine,
+        lambda db: article_crud.iter_by_date_range(
+            db, start_date=START, end_date=START + timedelta(days=10), page_size=100
+        ),
+    )
+    assert len(plans) > 1
+    assert_uses_index(plans, "ix_articles_published_at_id")
+
+
+def test_entity_get_by_article_uses_article_index(plan_engine):
+    """Entities of an article are read through the article_id index."""
+    plans = query_plans(plan_engine, lambda db: entity_crud.get_by_article(db, article_id=42))
+    assert_uses_index(plans, "ix_entities_article_id")
+
+
+def test_analysis_get_by_article_and_type_uses_composite_index(plan_engine):
+    """Analysis results by article and type use the composite index."""
+    plans = query_plans(
+        plan_engine,
+        lambda db: analysis_result_crud.get_by_article_and_type(
+            db, article_id=42, analysis_type="sentiment"
+        ),
+    )
+    assert_uses_index(plans, "ix_analysis_results_article_id_analysis_type")
+
+
+def test_articles_mentioning_entity_uses_mention_index(plan_engine):
+    """Articles mentioning an entity are found through the mention index."""
+    plans = query_plans(
+        plan_engine,
+        lambda db: canonical_entity_crud.get_articles_mentioning_entity(
+            db, entity_id=7, start_date=START, end_date=START + timedelta(days=30)
+        ),
+    )
+    assert_uses_index(plans, "ix_entity_mentions_canonical_entity_id_article_id")
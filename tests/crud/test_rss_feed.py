@@ -148,6 +148,103 @@ def test_update_last_fetched_nonexistent(db_session):
     assert result is None
 
 
+def test_update_validators(db_session):
+    """Test storing the validators from a feed's latest fetch."""
+    feed = RSSFeed(url="https://example.com/feed.xml", name="Test Feed", etag='"old"')
+    db_session.add(feed)
+    db_session.commit()
+
+    updated_feed = rss_feed.update_validators(
+        db_session,
+        id=feed.id,
+        etag=None,
+        last_modified="Fri, 12 Apr 2024 10:30:00 GMT",
+        content_hash="abc123",
+    )
+
+    assert updated_feed.etag is None
+    assert updated_feed.last_modified == "Fri, 12 Apr 2024 10:30:00 GMT"
+    assert updated_feed.content_hash == "abc123"
+    assert rss_feed.update_validators(
+        db_session, id=999, etag=None, last_modified=None, content_hash=None
+    ) is None
+
+
+def test_claim_due_feeds(db_session):
+    """Test claiming active feeds that are due, longest overdue first."""
+    now = datetime.now(timezone.utc)
+    feeds = [
+        RSSFeed(url="https://example.com/never.xml", name="Never fetched"),
+        RSSFeed(
+            url="https://example.com/overdue.xml",
+            name="Overdue",
+            next_fetch_at=now - timedelta(hours=1),
+        ),
+        RSSFeed(
+            url="https://example.com/later.xml",
+            name="Not due",
+            next_fetch_at=now + timedelta(hours=1),
+        ),
+        RSSFeed(url="https://example.com/inactive.xml", name="Inactive", is_active=False),
+    ]
+    db_session.add_all(feeds)
+    db_session.commit()
+
+    claimed = rss_feed.claim_due_feeds(db_session, now=now, lease_seconds=600)
+
+    assert [feed.name for feed in claimed] == ["Never fetched", "Overdue"]
+    # Claimed feeds are leased until they are fetched
+    assert rss_feed.claim_due_feeds(db_session, now=now, lease_seconds=600) == []
+    later = now + timedelta(seconds=601)
+    assert {feed.name for feed in rss_feed.claim_due_feeds(db_session, now=later, lease_seconds=600)} == {
+        "Never fetched",
+        "Overdue",
+    }
+
+
+def test_claim_due_feeds_limit(db_session):
+    """Test that at most limit feeds are claimed."""
+    db_session.add_all(
+        RSSFeed(url=f"https://example.com/feed{i}.xml", name=f"Feed {i}") for i in range(5)
+    )
+    db_session.commit()
+
+    claimed = rss_feed.claim_due_feeds(
+        db_session, now=datetime.now(timezone.utc), lease_seconds=600, limit=3
+    )
+    assert len(claimed) == 3
+
+
+def test_update_schedule(db_session):
+    """Test storing a feed's polling statistics and next poll time."""
+    feed = RSSFeed(url="https://example.com/feed.xml", name="Test Feed")
+    db_session.add(feed)
+    db_session.commit()
+    next_fetch_at = datetime(2025, 1, 1, 12, 0)
+
+    updated_feed = rss_feed.update_schedule(
+        db_session,
+        id=feed.id,
+        publish_interval_seconds=1800.0,
+        not_modified_rate=0.3,
+        fetch_interval_seconds=900.0,
+        next_fetch_at=next_fetch_at,
+    )
+
+    assert updated_feed.publish_interval_seconds == 1800.0
+    assert updated_feed.not_modified_rate == 0.3
+    assert updated_feed.fetch_interval_seconds == 900.0
+    assert updated_feed.next_fetch_at == next_fetch_at
+    assert rss_feed.update_schedule(
+        db_session,
+        id=999,
+        publish_interval_seconds=None,
+        not_modified_rate=0.0,
+        fetch_interval_seconds=900.0,
+        next_fetch_at=next_fetch_at,
+    ) is None
+
+
 def test_singleton_instance():
     """Test singleton instance behavior."""
     assert isinstance(rss_feed, CRUDRSSFeed)
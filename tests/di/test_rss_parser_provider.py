@@ -36,12 +36,12 @@ def test_get_rss_parser_provider_signature():
     assert "use_cache=false" in get_rss_parser.__doc__.lower()
 
 
-def test_rss_parser_class_can_be_instantiated():
+def test_rss_parser_class_can_be_instantiated(tmp_path):
     """Test that RSSParser class can be instantiated with expected parameters."""
     from local_newsifier.tools.rss_parser import RSSParser
 
     # Verify RSSParser class can be instantiated with expected parameters
-    parser = RSSParser(cache_dir="test_cache", request_timeout=60, user_agent="Test User Agent")
+    parser = RSSParser(cache_dir=str(tmp_path), request_timeout=60, user_agent="Test User Agent")
 
     assert parser.request_timeout == 60
     assert parser.user_agent == "Test User Agent"
@@ -7,7 +7,17 @@ import pytest
 
 from local_newsifier.flows.rss_scraping_flow import RSSScrapingFlow
 from local_newsifier.models.state import AnalysisStatus, NewsAnalysisState
-from local_newsifier.tools.rss_parser import RSSItem
+from local_newsifier.tools.rss_parser import RSSItem, RSSParser
+from local_newsifier.tools.seen_url_store import MemorySeenURLStore
+
+FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <item><title>Article 2</title><link>http://example.com/2</link></item>
+        <item><title>Article 1</title><link>http://example.com/1</link></item>
+    </channel>
+</rss>
+"""
 
 
 @pytest.fixture
@@ -130,7 +140,9 @@ class TestRSSScrapingFlow:
         results = self.flow.process_feed("http://example.com/feed")
 
         assert len(results) == 0
-        self.mock_parser.get_new_urls.assert_called_once_with("http://example.com/feed")
+        self.mock_parser.get_new_urls.assert_called_once_with(
+            "http://example.com/feed", stop_at_seen=True
+        )
 
     def test_process_feed_with_new_articles(self):
         """Test processing a feed with new articles."""
@@ -151,7 +163,9 @@ class TestRSSScrapingFlow:
             return state
 
         # Configure the mock scraper created in the autouse fixture
-        self.mock_scraper.scrape.side_effect = mock_scrape
+        self.mock_scraper.scrape_many.side_effect = lambda states: (
+            mock_scrape(state) for state in states
+        )
 
         # Use the flow instance created by the autouse fixture
         results = self.flow.process_feed("http://example.com/feed")
@@ -172,7 +186,7 @@ class TestRSSScrapingFlow:
         ]
         self.mock_parser.get_new_urls.return_value = test_items
         # Configure the mock scraper created in the autouse fixture
-        self.mock_scraper.scrape.side_effect = Exception("Failed to scrape")
+        self.mock_scraper.scrape_many.side_effect = Exception("Failed to scrape")
 
         # Use the flow instance created by the autouse fixture
         results = self.flow.process_feed("http://example.com/feed")
@@ -182,3 +196,15 @@ class TestRSSScrapingFlow:
         assert results[0].error_details is not None
         assert "Failed to scrape" in str(results[0].error_details.message)
         assert "Failed to process article: Test Article" in results[0].run_logs[-1]
+
+    @patch("requests.get")
+    def test_process_feed_stops_parsing_at_seen_items(self, mock_get):
+        """Test that a real parser stops at the newest already processed item."""
+        mock_get.return_value = Mock(content=FEED_XML.encode("utf-8"))
+        parser = RSSParser(seen_store=MemorySeenURLStore())
+        parser.seen_urls.add("http://example.com/2")
+        flow = RSSScrapingFlow(rss_parser=parser, web_scraper=self.mock_scraper)
+
+        # Article 1 is older than the processed Article 2, so is never parsed
+        assert flow.process_feed("http://example.com/feed") == []
+        self.mock_scraper.scrape_many.assert_not_called()
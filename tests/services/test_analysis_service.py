@@ -117,7 +117,7 @@ class TestAnalysisService:
     ):
         """Test analysis of headline trends."""
         # Setup mocks
-        mock_article_crud.get_by_date_range.return_value = sample_articles
+        mock_article_crud.iter_by_date_range.return_value = iter(sample_articles)
         mock_trend_analyzer.extract_keywords.return_value = [("mayor", 2), ("city", 1)]
         mock_trend_analyzer.detect_keyword_trends.return_value = [
             {
@@ -145,8 +145,11 @@ class TestAnalysisService:
         assert "period_counts" in result
 
         # Verify the mocks were called
-        mock_article_crud.get_by_date_range.assert_called_once_with(
-            mock_session, start_date=start_date, end_date=end_date
+        mock_article_crud.iter_by_date_range.assert_called_once_with(
+            mock_session,
+            start_date=start_date,
+            end_date=end_date,
+            columns=["title", "published_at"],
         )
         mock_trend_analyzer.extract_keywords.assert_called()
         mock_trend_analyzer.detect_keyword_trends.assert_called_once()
@@ -156,7 +159,7 @@ class TestAnalysisService:
     ):
         """Test analysis of headline trends with no articles."""
         # Setup mocks
-        mock_article_crud.get_by_date_range.return_value = []
+        mock_article_crud.iter_by_date_range.return_value = iter([])
 
         # Patch any async methods if they exist
         if hasattr(service, "analyze_headline_trends_async"):
@@ -183,8 +186,8 @@ class TestAnalysisService:
     ):
         """Test detection of entity trends."""
         # Setup mocks
-        mock_entity_crud.get_by_date_range_and_types.return_value = sample_entities
-        mock_article_crud.get_by_date_range.return_value = sample_articles
+        mock_entity_crud.iter_by_date_range_and_types.return_value = iter(sample_entities)
+        mock_article_crud.iter_by_date_range.return_value = iter(sample_articles)
 
         sample_trend = TrendAnalysis(
             trend_type=TrendType.FREQUENCY_SPIKE,
@@ -208,9 +211,15 @@ class TestAnalysisService:
         assert result[0].trend_type == TrendType.FREQUENCY_SPIKE
 
         # Verify the mocks were called
-        mock_entity_crud.get_by_date_range_and_types.assert_called_once()
-        mock_article_crud.get_by_date_range.assert_called_once()
+        mock_entity_crud.iter_by_date_range_and_types.assert_called_once()
+        mock_article_crud.iter_by_date_range.assert_called_once()
         mock_trend_analyzer.detect_entity_trends.assert_called_once()
+        # Article bodies are not loaded for trend evidence
+        assert "content" not in mock_article_crud.iter_by_date_range.call_args.kwargs["columns"]
+        # The keyset iterators are streamed to the analyzer, not loaded into lists
+        call_kwargs = mock_trend_analyzer.detect_entity_trends.call_args.kwargs
+        assert call_kwargs["entities"] is mock_entity_crud.iter_by_date_range_and_types.return_value
+        assert call_kwargs["articles"] is mock_article_crud.iter_by_date_range.return_value
 
     def test_save_analysis_result(self, service, mock_session, mock_analysis_result_crud):
         """Test saving an analysis result."""
@@ -0,0 +1,235 @@
+"""Tests for staged, paged Apify dataset imports."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from local_newsifier.models import SQLModel
+from local_newsifier.models.apify import ApifyDatasetItem, ApifyJob
+from local_newsifier.models.article import Article
+from local_newsifier.services.apify_dataset_importer import ApifyDatasetImporter
+
+
+@pytest.fixture
+def memory_session():
+    """Create an in-memory SQLite session for testing."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        yield session
+
+
+def make_items(count):
+    """Build dataset items with distinct, long enough text."""
+    return [
+        {
+            "url": f"https://example.com/article{i}",
+            "title": f"Article {i}",
+            "text": f"Story number {i} has its own words about topic {i}. " * 20,
+        }
+        for i in range(count)
+    ]
+
+
+class FakeDataset:
+    """Dataset client serving items by offset and limit, optionally failing once."""
+
+    def __init__(self, items, fail_at=None):
+        self.items = items
+        self.fail_at = fail_at
+        self.calls = []
+
+    def list_items(self, offset=0, limit=None):
+        self.calls.append((offset, limit))
+        if offset == self.fail_at:
+            self.fail_at = None
+            raise RuntimeError("connection reset")
+        page = MagicMock()
+        page.items = self.items[offset : offset + limit]
+        return page
+
+
+def make_importer(session, dataset, **kwargs):
+    """Create an importer reading from a fake dataset."""
+    apify_service = MagicMock()
+    apify_service.client.dataset.return_value = dataset
+    detector = MagicMock()
+    detector.check_many.return_value = 0
+    return ApifyDatasetImporter(session, apify_service, near_duplicate_detector=detector, **kwargs)
+
+
+class TestApifyDatasetImporter:
+    """Tests for ApifyDatasetImporter."""
+
+    def test_stages_pages_then_transforms(self, memory_session):
+        dataset = FakeDataset(make_items(7))
+        importer = make_importer(memory_session, dataset, page_size=3, chunk_size=4)
+        job = importer.get_job("dataset1", run_id="run1", actor_id="actor1")
+
+        with patch.object(memory_session, "commit", wraps=memory_session.commit) as commit:
+            stats = importer.import_dataset("dataset1", job=job)
+
+        assert dataset.calls == [(0, 3), (3, 3), (6, 3)]
+        assert stats["items"] == 7
+        assert stats["created"] == 7
+        assert stats["error"] is None
+        # One commit per staged page, then for the staging total, per
+        # transformed chunk and for marking the job processed
+        assert commit.call_count == 3 + 1 + 2 + 1
+
+        staged = memory_session.exec(select(ApifyDatasetItem).order_by(ApifyDatasetItem.id)).all()
+        assert [item.apify_id for item in staged] == [str(i) for i in range(7)]
+        assert all(item.transformed and item.article_id for item in staged)
+        assert staged[0].raw_data["url"] == "https://example.com/article0"
+        assert len(memory_session.exec(select(Article)).all()) == 7
+        assert job.dataset_offset == 7
+        assert job.item_count == 7
+        assert job.processed is True
+        assert job.articles_created == 7
+
+    def test_one_url_query_per_chunk(self, memory_session):
+        importer = make_importer(
+            memory_session, FakeDataset(make_items(6)), page_size=6, chunk_size=3
+        )
+        job = importer.get_job("dataset1")
+
+        with patch(
+            "local_newsifier.services.apify_dataset_importer.article_crud.existing_urls",
+            return_value=set(),
+        ) as existing_urls:
+            importer.import_dataset("dataset1", job=job)
+
+        assert existing_urls.call_count == 2
+
+    def test_resumes_after_failed_page(self, memory_session):
+        dataset = FakeDataset(make_items(7), fail_at=3)
+        importer = make_importer(memory_session, dataset, page_size=3)
+        job = importer.get_job("dataset1", run_id="run1")
+
+        stats = importer.import_dataset("dataset1", job=job)
+        assert stats["error"] == "connection reset"
+        assert stats["items"] == 3
+        assert job.dataset_offset == 3
+        assert job.item_count is None
+        assert job.error_message == "connection reset"
+        assert job.processed is False
+
+        # The first page stays staged; a rerun picks up at the checkpoint
+        resumed = importer.import_dataset("dataset1", job=importer.get_job("dataset1"))
+        assert resumed["start_offset"] == 3
+        assert resumed["items"] == 4
+        assert resumed["created"] == 7
+        assert dataset.calls[-2:] == [(3, 3), (6, 3)]
+        assert len(memory_session.exec(select(ApifyDatasetItem)).all()) == 7
+        assert len(memory_session.exec(select(Article)).all()) == 7
+        job = memory_session.exec(select(ApifyJob)).one()
+        assert job.articles_created == 7
+        assert job.error_message is None
+        assert job.processed is True
+
+    def test_failed_chunk_leaves_items_untransformed(self, memory_session):
+        importer = make_importer(memory_session, FakeDataset(make_items(4)), chunk_size=2)
+        job = importer.get_job("dataset1")
+        importer.stage_dataset("dataset1", job)
+
+        deadlock = OperationalError("UPDATE", {}, Exception("deadlock detected"))
+        with patch.object(importer, "_transform_chunk", side_effect=deadlock):
+            stats = importer.transform_items(job)
+
+        assert "deadlock detected" in stats["error"]
+        assert "deadlock detected" in job.error_message
+        assert all(not item.transformed for item in memory_session.exec(select(ApifyDatasetItem)))
+
+        assert importer.transform_items(job)["created"] == 4
+        assert job.processed is True
+
+    def test_bad_item_does_not_block_later_chunks(self, memory_session):
+        items = make_items(9)
+        # A title the database cannot store fails the whole first chunk
+        items[1]["title"] = {"text": "Article 1"}
+        importer = make_importer(memory_session, FakeDataset(items), page_size=9, chunk_size=4)
+        job = importer.get_job("dataset1")
+
+        stats = importer.import_dataset("dataset1", job=job)
+
+        assert stats["error"] is None
+        assert stats["created"] == 8
+        assert stats["skipped"]["error"] == 1
+        assert job.articles_created == 8
+        assert job.processed is True
+        reasons = memory_session.exec(
+            select(ApifyDatasetItem.error_message).order_by(ApifyDatasetItem.id)
+        ).all()
+        assert reasons[0] is None and reasons[2:] == [None] * 7
+        assert reasons[1].startswith("error: ")
+        urls = {article.url for article in memory_session.exec(select(Article))}
+        assert urls == {item["url"] for i, item in enumerate(items) if i != 1}
+
+    def test_skips_invalid_and_duplicate_items(self, memory_session):
+        items = make_items(2)
+        items += [
+            {"url": "", "text": "x" * 600},
+            {"url": "https://example.com/untitled", "text": "x" * 600},
+            {"url": "https://example.com/short", "title": "Short", "text": "Too short"},
+            dict(items[0]),
+        ]
+        importer = make_importer(memory_session, FakeDataset(items), page_size=4, require_title=True)
+
+        stats = importer.import_dataset("dataset1", job=importer.get_job("dataset1"))
+
+        assert stats["created"] == 2
+        assert stats["skipped"] == {
+            "no_url": 1,
+            "no_title": 1,
+            "short_content": 1,
+            "duplicate": 1,
+            "error": 0,
+        }
+        reasons = memory_session.exec(
+            select(ApifyDatasetItem.error_message).order_by(ApifyDatasetItem.id)
+        ).all()
+        assert reasons == [None, None, "no_url", "no_title", "short_content", "duplicate"]
+
+    def test_retransform_without_refetching(self, memory_session):
+        items = make_items(2)
+        items[1]["text"] = "Too short"
+        dataset = FakeDataset(items)
+        importer = make_importer(memory_session, dataset)
+        job = importer.get_job("dataset1")
+        assert importer.import_dataset("dataset1", job=job)["created"] == 1
+
+        # After lowering the minimum length, the skipped item becomes an article
+        fixed = make_importer(memory_session, dataset, min_content_length=5)
+        assert fixed.reset_skipped(job) == 1
+        assert job.processed is False
+        stats = fixed.import_dataset("dataset1", job=job)
+
+        assert len(dataset.calls) == 1
+        assert stats["items"] == 0
+        assert stats["created"] == 1
+        assert job.articles_created == 2
+        assert job.processed is True
+
+    def test_dry_run_saves_nothing(self, memory_session):
+        importer = make_importer(memory_session, FakeDataset(make_items(8)), page_size=3)
+
+        stats = importer.import_dataset("dataset1", dry_run=True)
+
+        assert stats["items"] == 8
+        assert stats["created"] == 8
+        assert len(stats["preview"]) == 5
+        assert memory_session.exec(select(Article)).all() == []
+        assert memory_session.exec(select(ApifyDatasetItem)).all() == []
+
+    def test_job_required(self, memory_session):
+        importer = make_importer(memory_session, FakeDataset([]))
+        with pytest.raises(ValueError):
+            importer.import_dataset("dataset1")
@@ -1,11 +1,14 @@
 """Tests for the ApifyScheduleManager service."""
 
+import threading
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlmodel import Session
 
 from local_newsifier.crud.apify_source_config import CRUDApifySourceConfig
+from local_newsifier.crud.apify_source_config import apify_source_config as config_crud
 from local_newsifier.models.apify import ApifySourceConfig
 from local_newsifier.services.apify_schedule_manager import ApifyScheduleManager
 from local_newsifier.services.apify_service import ApifyService
@@ -336,3 +339,202 @@ def test_clean_orphaned_schedules(
     # Verify interactions
     mock_apify_service.delete_schedule.assert_called_once_with("orphaned_schedule_id")
     assert deleted == 1
+
+
+class RateLimitedError(Exception):
+    """Mimics the Apify client's error for an HTTP 429 response."""
+
+    status_code = 429
+
+
+class FakeApifyService:
+    """In-memory stand-in for ApifyService's schedule methods.
+
+    The first rate_limited_calls create, update or delete calls fail with a 429.
+    """
+
+    def __init__(self, schedules, rate_limited_calls=0):
+        self.schedules = {schedule["id"]: dict(schedule) for schedule in schedules}
+        self.rate_limited_calls = rate_limited_calls
+        self.list_calls = 0
+        self.get_calls = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _maybe_rate_limit(self):
+        with self._lock:
+            if self.rate_limited_calls:
+                self.rate_limited_calls -= 1
+                raise RateLimitedError("Rate limit exceeded")
+
+    def list_schedules(self, actor_id=None, offset=None, limit=None):
+        self.list_calls += 1
+        items = [dict(s) for s in self.schedules.values()]
+        start = offset or 0
+        page = items[start : start + limit if limit else None]
+        return {"data": {"items": page, "total": len(items)}}
+
+    def get_schedule(self, schedule_id):
+        self.get_calls += 1
+        return dict(self.schedules[schedule_id])
+
+    def create_schedule(self, actor_id, cron_expression, run_input=None, name=None):
+        self._maybe_rate_limit()
+        with self._lock:
+            self._next_id += 1
+            schedule_id = f"new_{self._next_id}"
+            self.schedules[schedule_id] = {
+                "id": schedule_id,
+                "name": name.lower().replace(":", "").replace(" ", "-"),
+                "cronExpression": cron_expression,
+                "isEnabled": True,
+                "actId": actor_id,
+            }
+        return dict(self.schedules[schedule_id])
+
+    def update_schedule(self, schedule_id, changes):
+        self._maybe_rate_limit()
+        with self._lock:
+            self.schedules[schedule_id].update(changes)
+        return dict(self.schedules[schedule_id])
+
+    def delete_schedule(self, schedule_id):
+        self._maybe_rate_limit()
+        with self._lock:
+            del self.schedules[schedule_id]
+        return {"id": schedule_id, "deleted": True}
+
+
+def _remote(schedule_id, name, cron="0 0 * * *"):
+    return {"id": schedule_id, "name": name, "cronExpression": cron, "isEnabled": True}
+
+
+@pytest.fixture
+def sync_configs(db_session):
+    """Configs covering each sync outcome."""
+    configs = {
+        "new": ApifySourceConfig(
+            name="New", actor_id="a", source_type="news", schedule="0 1 * * *"
+        ),
+        "same": ApifySourceConfig(
+            name="Same", actor_id="a", source_type="news", schedule="0 0 * * *", schedule_id="s1"
+        ),
+        "changed": ApifySourceConfig(
+            name="Changed", actor_id="a", source_type="news", schedule="0 2 * * *", schedule_id="s2"
+        ),
+        "missing": ApifySourceConfig(
+            name="Missing", actor_id="a", source_type="news", schedule="0 3 * * *", schedule_id="s3"
+        ),
+        "inactive": ApifySourceConfig(
+            name="Inactive",
+            actor_id="a",
+            source_type="news",
+            schedule="0 4 * * *",
+            schedule_id="s4",
+            is_active=False,
+        ),
+    }
+    for config in configs.values():
+        db_session.add(config)
+    db_session.commit()
+    return configs
+
+
+@pytest.fixture
+def fake_apify_service():
+    """Remote schedules matching the sync_configs fixture."""
+    return FakeApifyService(
+        [
+            _remote("s1", "local-newsifier-same"),
+            _remote("s2", "local-newsifier-changed"),
+            _remote("s4", "local-newsifier-inactive", cron="0 4 * * *"),
+            _remote("orphan1", "local-newsifier-removed"),
+            _remote("orphan2", "Local Newsifier: Removed Too"),
+            _remote("other", "someone-elses-schedule"),
+        ]
+    )
+
+
+def _concurrent_manager(apify_service, db_session):
+    @contextmanager
+    def session_factory():
+        yield db_session
+
+    return ApifyScheduleManager(
+        apify_service=apify_service,
+        apify_source_config_crud=config_crud,
+        session_factory=session_factory,
+    )
+
+
+def test_sync_schedules_concurrently(db_session, sync_configs, fake_apify_service):
+    """A concurrent sync diffs one listing and applies creates, updates and deletes."""
+    manager = _concurrent_manager(fake_apify_service, db_session)
+
+    result = manager.sync_schedules_concurrently(max_workers=4, retry_delay=0)
+
+    assert result == {"created": 2, "updated": 1, "deleted": 2, "unchanged": 1, "errors": []}
+    assert fake_apify_service.list_calls == 1
+    assert fake_apify_service.get_calls == 0
+
+    remote = fake_apify_service.schedules
+    assert "orphan1" not in remote and "orphan2" not in remote
+    assert "other" in remote and "s4" in remote
+    assert remote["s2"]["cronExpression"] == "0 2 * * *"
+
+    # Created schedule IDs are saved to their configs
+    for key in ("new", "missing"):
+        db_session.refresh(sync_configs[key])
+        schedule_id = sync_configs[key].schedule_id
+        assert schedule_id.startswith("new_")
+        assert remote[schedule_id]["cronExpression"] == sync_configs[key].schedule
+
+    # A second sync finds nothing to do
+    result = manager.sync_schedules_concurrently(max_workers=4, retry_delay=0)
+    assert result == {"created": 0, "updated": 0, "deleted": 0, "unchanged": 4, "errors": []}
+
+
+@patch("local_newsifier.services.apify_schedule_manager.SCHEDULE_LIST_PAGE_SIZE", 2)
+def test_sync_schedules_concurrently_reads_every_page(
+    db_session, sync_configs, fake_apify_service
+):
+    """Schedules past the first page of the listing are matched and cleaned up."""
+    manager = _concurrent_manager(fake_apify_service, db_session)
+
+    result = manager.sync_schedules_concurrently(max_workers=4, retry_delay=0)
+
+    assert result == {"created": 2, "updated": 1, "deleted": 2, "unchanged": 1, "errors": []}
+    assert fake_apify_service.list_calls == 3
+
+
+@patch("local_newsifier.services.apify_schedule_manager.time.sleep")
+def test_sync_schedules_concurrently_backs_off_when_rate_limited(
+    mock_sleep, db_session, sync_configs, fake_apify_service
+):
+    """Rate-limited requests are retried after backing off."""
+    fake_apify_service.rate_limited_calls = 3
+    manager = _concurrent_manager(fake_apify_service, db_session)
+
+    result = manager.sync_schedules_concurrently(max_workers=2, max_retries=5, retry_delay=0.01)
+
+    assert result["errors"] == []
+    assert (result["created"], result["updated"], result["deleted"]) == (2, 1, 2)
+    assert fake_apify_service.rate_limited_calls == 0
+    assert mock_sleep.called
+
+
+@patch("local_newsifier.services.apify_schedule_manager.time.sleep")
+def test_sync_schedules_concurrently_reports_exhausted_retries(
+    mock_sleep, db_session, sync_configs, fake_apify_service
+):
+    """Operations still rate limited after their retries are reported as errors."""
+    fake_apify_service.rate_limited_calls = 1000
+    manager = _concurrent_manager(fake_apify_service, db_session)
+
+    result = manager.sync_schedules_concurrently(max_workers=2, max_retries=1, retry_delay=0)
+
+    assert (result["created"], result["updated"], result["deleted"]) == (0, 0, 0)
+    assert len(result["errors"]) == 5
+    assert any("orphaned schedule orphan1" in error for error in result["errors"])
+    db_session.refresh(sync_configs["new"])
+    assert sync_configs["new"].schedule_id is None
@@ -3,6 +3,7 @@
 import hashlib
 import hmac
 import json
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,7 +11,7 @@ from sqlmodel import Session, create_engine, select
 from sqlmodel.pool import StaticPool
 
 from local_newsifier.models import SQLModel
-from local_newsifier.models.apify import ApifyWebhookRaw
+from local_newsifier.models.apify import ApifyJob, ApifyWebhookRaw
 from local_newsifier.models.article import Article
 from local_newsifier.services.apify_webhook_service import ApifyWebhookService
 
@@ -29,6 +30,15 @@ def memory_session():
         yield session
 
 
+def handle_and_import(service, payload):
+    """Handle a webhook, then run the dataset import it would have queued."""
+    with patch.object(service, "_enqueue_import", return_value=True) as enqueue:
+        result = service.handle_webhook(payload, json.dumps(payload))
+    if enqueue.called:
+        result["articles_created"] = service.import_run(result["run_id"])["articles_created"]
+    return result
+
+
 class TestApifyWebhookService:
     """Test the minimal Apify webhook service."""
 
@@ -167,7 +177,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         assert result["status"] == "ok"
         assert result["articles_created"] == 2
@@ -228,7 +238,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         assert result["status"] == "ok"
         assert result["articles_created"] == 1
@@ -238,6 +248,54 @@ class TestApifyWebhookService:
         assert len(articles) == 1
         assert articles[0].url == "https://example.com/valid"
 
+    @patch("local_newsifier.services.apify_webhook_service.ApifyService")
+    def test_handle_webhook_skip_duplicate_articles(self, mock_apify_class, memory_session):
+        """Test that existing and repeated URLs are skipped using one batch lookup."""
+        mock_apify = MagicMock()
+        mock_apify_class.return_value = mock_apify
+
+        memory_session.add(
+            Article(
+                url="https://example.com/existing",
+                title="Existing",
+                content="Existing content",
+                source="example.com",
+                status="published",
+                published_at=datetime(2025, 1, 1),
+                scraped_at=datetime(2025, 1, 1),
+            )
+        )
+        memory_session.commit()
+
+        content = "Article content long enough to meet the minimum length. " * 10
+        mock_items = MagicMock()
+        mock_items.items = [
+            {"url": "https://example.com/existing", "title": "Existing", "content": content},
+            {"url": "https://example.com/new", "title": "New", "content": content},
+            {"url": "https://example.com/new", "title": "New again", "content": content},
+        ]
+        mock_apify.client.dataset.return_value.list_items.return_value = mock_items
+
+        service = ApifyWebhookService(memory_session)
+        payload = {
+            "resource": {
+                "id": "run123",
+                "actId": "actor123",
+                "status": "SUCCEEDED",
+                "defaultDatasetId": "dataset123",
+            }
+        }
+
+        with patch(
+            "local_newsifier.services.apify_dataset_importer.article_crud.get_by_url"
+        ) as mock_get_by_url:
+            result = handle_and_import(service, payload)
+
+        assert result["articles_created"] == 1
+        mock_get_by_url.assert_not_called()
+        urls = [a.url for a in memory_session.exec(select(Article)).all()]
+        assert sorted(urls) == ["https://example.com/existing", "https://example.com/new"]
+
     @patch("local_newsifier.services.apify_webhook_service.ApifyService")
     def test_handle_webhook_dataset_error(self, mock_apify_class, memory_session):
         """Test handling of dataset fetch errors."""
@@ -258,7 +316,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         # Should still succeed but with 0 articles
         assert result["status"] == "ok"
@@ -321,7 +379,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         assert result["status"] == "ok"
         assert result["articles_created"] == 4
@@ -376,7 +434,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         assert result["status"] == "ok"
         assert result["articles_created"] == 2  # Only 500+ char articles
@@ -426,7 +484,7 @@ class TestApifyWebhookService:
             }
         }
 
-        result = service.handle_webhook(payload, json.dumps(payload))
+        result = handle_and_import(service, payload)
 
         assert result["status"] == "ok"
         assert result["articles_created"] == 2
@@ -440,3 +498,77 @@ class TestApifyWebhookService:
         assert article_with_date.published_at.year == 2024
         assert article_with_date.published_at.month == 1
         assert article_with_date.published_at.day == 15
+
+    @patch("local_newsifier.services.apify_webhook_service.ApifyService")
+    def test_handle_webhook_queues_import(self, mock_apify_class, memory_session):
+        """Test that a successful run is acknowledged without fetching its dataset."""
+        mock_apify = MagicMock()
+        mock_apify_class.return_value = mock_apify
+        service = ApifyWebhookService(memory_session)
+        payload = {
+            "resource": {
+                "id": "run123",
+                "actId": "actor123",
+                "status": "SUCCEEDED",
+                "defaultDatasetId": "dataset123",
+            }
+        }
+
+        with patch("local_newsifier.tasks.import_apify_dataset.apply_async") as apply_async:
+            result = service.handle_webhook(payload, json.dumps(payload))
+
+        assert result["import_queued"] is True
+        assert result["articles_created"] == 0
+        apply_async.assert_called_once_with(args=["run123"], task_id="apify-import-run123")
+        mock_apify.client.dataset.assert_not_called()
+
+        job = memory_session.exec(select(ApifyJob)).one()
+        assert job.id == result["job_id"]
+        assert (job.run_id, job.actor_id, job.dataset_id) == ("run123", "actor123", "dataset123")
+        assert job.processed is False
+
+    def test_handle_webhook_queue_failure_recorded(self, memory_session):
+        """Test that a failure to queue the import is recorded on the job."""
+        service = ApifyWebhookService(memory_session)
+        payload = {
+            "resource": {
+                "id": "run123",
+                "actId": "actor123",
+                "status": "SUCCEEDED",
+                "defaultDatasetId": "dataset123",
+            }
+        }
+
+        with patch(
+            "local_newsifier.tasks.import_apify_dataset.apply_async",
+            side_effect=ConnectionError("broker down"),
+        ):
+            result = service.handle_webhook(payload, json.dumps(payload))
+
+        assert result["status"] == "ok"
+        assert result["import_queued"] is False
+        job = memory_session.exec(select(ApifyJob)).one()
+        assert "broker down" in job.error_message
+
+    @patch("local_newsifier.services.apify_webhook_service.ApifyService")
+    def test_import_run_skips_processed_job(self, mock_apify_class, memory_session):
+        """Test that a redelivered import task doesn't import a dataset twice."""
+        mock_apify = MagicMock()
+        mock_apify_class.return_value = mock_apify
+        memory_session.add(
+            ApifyJob(
+                run_id="run123",
+                actor_id="actor123",
+                status="SUCCEEDED",
+                dataset_id="dataset123",
+                processed=True,
+                articles_created=3,
+            )
+        )
+        memory_session.commit()
+
+        result = ApifyWebhookService(memory_session).import_run("run123")
+
+        assert result["status"] == "skipped"
+        assert result["articles_created"] == 3
+        mock_apify.client.dataset.assert_not_called()
@@ -172,6 +172,7 @@ def test_process_article_no_title():
     mock_article.id = 1
     mock_article.title = None
     mock_article.url = "https://example.com"
+    mock_article.content = "Test content"
     mock_article_crud.create.return_value = mock_article
 
     # Setup analysis result CRUD mock
@@ -40,12 +40,11 @@ def test_process_article_entities():
 
     # Mock CRUD operations
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.return_value = [1]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1)
-    mock_canonical_entity_crud.create.return_value.name = "John Doe"
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
@@ -82,23 +81,108 @@ def test_process_article_entities():
 
     # Assert
     # Verify tools were called correctly
-    mock_entity_extractor.extract_entities.assert_called_once_with("John Doe visited the city.")
-    mock_context_analyzer.analyze_context.assert_called_once_with("John Doe visited the city.")
+    # Content is parsed once and the parse is shared by extraction and context analysis
+    analysis_context = mock_entity_extractor.parse.return_value
+    mock_entity_extractor.parse.assert_called_once_with("John Doe visited the city.")
+    mock_entity_extractor.extract_entities.assert_called_once_with(
+        "John Doe visited the city.", analysis_context=analysis_context
+    )
+    mock_context_analyzer.analyze_context.assert_called_once_with(
+        "John Doe visited the city.", span=analysis_context.sentence_at.return_value
+    )
     mock_entity_resolver.resolve_entity.assert_called_once()
 
     # Verify CRUD operations
-    mock_canonical_entity_crud.get_all.assert_called_once()
-    mock_canonical_entity_crud.create.assert_called_once()
-    mock_entity_crud.create.assert_called_once()
-    mock_entity_mention_context_crud.create.assert_called_once()
+    mock_canonical_entity_crud.iter_all.assert_called_once()
+    mock_canonical_entity_crud.get_or_create_many.assert_called_once()
+    mock_entity_crud.create_many.assert_called_once()
+    mock_entity_mention_context_crud.create_many.assert_called_once()
+
+    # Everything is written in one transaction rather than a commit per row
+    for bulk_method in (
+        mock_canonical_entity_crud.get_or_create_many,
+        mock_entity_crud.create_many,
+        mock_entity_mention_context_crud.create_many,
+    ):
+        assert bulk_method.call_args.kwargs["commit"] is False
+    mock_entity_crud.create.assert_not_called()
+    mock_session.commit.assert_called_once()
 
     # Verify result
     assert len(result) == 1
     assert result[0]["original_text"] == "John Doe"
     assert result[0]["canonical_name"] == "John Doe"
+    assert result[0]["canonical_id"] == 1
     assert result[0]["sentiment_score"] == 0.5
 
 
+def test_process_article_entities_with_canonical_entity_cache():
+    """Test that a shared cache replaces the per-article table read and name lookups."""
+    # Arrange
+    mock_entity_extractor = MagicMock()
+    mock_entity_extractor.extract_entities.return_value = [
+        {"text": "John Doe", "type": "PERSON", "context": "John Doe spoke.", "start_char": 0},
+        {"text": "Jane Roe", "type": "PERSON", "context": "Jane Roe spoke.", "start_char": 16},
+    ]
+
+    mock_context_analyzer = MagicMock()
+    mock_context_analyzer.analyze_context.return_value = {
+        "sentiment": {"score": 0.0, "category": "neutral"},
+        "framing": {"category": "neutral"},
+    }
+
+    mock_session = MagicMock()
+    mock_cache = MagicMock()
+    # New canonical entities are only shared once they are committed
+    mock_cache.add.side_effect = lambda entity: mock_session.commit.assert_called_once()
+    mock_cache.resolve.side_effect = [
+        {"name": "John Doe", "entity_type": "PERSON", "id": 5, "is_new": False},
+        {"name": "Jane Roe", "entity_type": "PERSON", "is_new": True},
+    ]
+
+    mock_entity_crud = MagicMock()
+    mock_entity_crud.create_many.return_value = [1]
+    mock_canonical_entity_crud = MagicMock()
+    mock_canonical_entity_crud.get_or_create_many.return_value = [6]
+
+    mock_session_factory = MagicMock(
+        return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock())
+    )
+
+    from local_newsifier.services.entity_service import EntityService
+
+    service = EntityService(
+        entity_crud=mock_entity_crud,
+        canonical_entity_crud=mock_canonical_entity_crud,
+        entity_mention_context_crud=MagicMock(),
+        entity_profile_crud=MagicMock(),
+        article_crud=MagicMock(),
+        entity_extractor=mock_entity_extractor,
+        context_analyzer=mock_context_analyzer,
+        entity_resolver=MagicMock(),
+        session_factory=mock_session_factory,
+        canonical_entity_cache=mock_cache,
+    )
+
+    # Act
+    result = service.process_article_entities(
+        article_id=1,
+        content="John Doe spoke. Jane Roe spoke.",
+        title="Test Article",
+        published_at=datetime(2025, 1, 1),
+    )
+
+    # Assert
+    mock_cache.refresh.assert_called_once_with(mock_session, mock_canonical_entity_crud)
+    mock_canonical_entity_crud.iter_all.assert_not_called()
+    mock_canonical_entity_crud.get_by_name.assert_not_called()
+    mock_cache.add.assert_called_once_with({"name": "Jane Roe", "entity_type": "PERSON", "id": 6})
+    assert [(e["canonical_name"], e["canonical_id"]) for e in result] == [
+        ("John Doe", 5),
+        ("Jane Roe", 6),
+    ]
+
+
 def test_process_article_with_state():
     """Test the state-based article processing method."""
     # Arrange
@@ -130,11 +214,11 @@ def test_process_article_with_state():
 
     # CRUD mocks
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.return_value = [1]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1, name="John Doe")
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
@@ -248,7 +332,7 @@ def test_process_articles_batch():
     # Arrange
     # Mock tools
     mock_entity_extractor = MagicMock()
-    mock_entity_extractor.extract_entities.return_value = [
+    extracted = [
         {
             "text": "Test Entity",
             "type": "ORG",
@@ -257,6 +341,10 @@ def test_process_articles_batch():
             "end_char": 11,
         }
     ]
+    # Batch parsing streams one analysis context per article
+    analysis_contexts = [MagicMock(), MagicMock()]
+    mock_entity_extractor.parse_batch.return_value = iter(analysis_contexts)
+    mock_entity_extractor.extract_entities.return_value = extracted
 
     mock_context_analyzer = MagicMock()
     mock_context_analyzer.analyze_context.return_value = {
@@ -291,17 +379,17 @@ def test_process_articles_batch():
 
     # CRUD mocks
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.return_value = [1]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1, name="Test Entity")
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
 
     mock_article_crud = MagicMock()
-    mock_article_crud.get_by_status.return_value = [mock_article1, mock_article2]
+    mock_article_crud.iter_by_status.return_value = iter([mock_article1, mock_article2])
 
     # Mock session factory
     mock_session = MagicMock()
@@ -340,6 +428,29 @@ def test_process_articles_batch():
     # Each article has update called twice (once by process_article_with_state and once in batch)
     assert mock_article_crud.update_status.call_count == 4
 
+    # Articles are streamed in pages without loading unused columns
+    mock_article_crud.iter_by_status.assert_called_once_with(
+        mock_session,
+        status="analyzed",
+        page_size=state.page_size,
+        columns=["id", "title", "content", "url", "published_at"],
+        exclude_duplicates=True,
+    )
+
+    # Articles were parsed in one batched call rather than one at a time
+    mock_entity_extractor.parse_batch.assert_called_once()
+    assert list(mock_entity_extractor.parse_batch.call_args[0][0]) == [
+        "Test Entity is mentioned.",
+        "Another Entity is mentioned.",
+    ]
+    mock_entity_extractor.parse.assert_not_called()
+
+    # Entities are taken from each article's batched parse
+    assert [
+        call.kwargs["analysis_context"]
+        for call in mock_entity_extractor.extract_entities.call_args_list
+    ] == analysis_contexts
+
     # Verify logs
     assert any("Found 2 articles to process" in log for log in result_state.run_logs)
     assert any("Batch processing completed successfully" in log for log in result_state.run_logs)
@@ -350,19 +461,17 @@ def test_process_articles_batch_partial_failure():
     # Arrange
     # Mock tools
     mock_entity_extractor = MagicMock()
-    # First article succeeds, second fails
-    mock_entity_extractor.extract_entities.side_effect = [
-        [
-            {
-                "text": "Test Entity",
-                "type": "ORG",
-                "context": "Test Entity is mentioned.",
-                "start_char": 0,
-                "end_char": 11,
-            }
-        ],
-        Exception("Test error"),
+    extracted = [
+        {
+            "text": "Test Entity",
+            "type": "ORG",
+            "context": "Test Entity is mentioned.",
+            "start_char": 0,
+            "end_char": 11,
+        }
     ]
+    mock_entity_extractor.parse_batch.return_value = iter([MagicMock(), MagicMock()])
+    mock_entity_extractor.extract_entities.return_value = extracted
 
     mock_context_analyzer = MagicMock()
     mock_context_analyzer.analyze_context.return_value = {
@@ -395,24 +504,27 @@ def test_process_articles_batch_partial_failure():
         url="https://example.com/2",
     )
 
-    # CRUD mocks
+    # CRUD mocks - first article persists, second fails
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.side_effect = [[1], Exception("Test error")]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1, name="Test Entity")
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
 
     mock_article_crud = MagicMock()
-    mock_article_crud.get_by_status.return_value = [mock_article1, mock_article2]
+    mock_article_crud.iter_by_status.return_value = iter([mock_article1, mock_article2])
 
     # Mock session factory
     mock_session = MagicMock()
     mock_session_factory = MagicMock(
-        return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock())
+        return_value=MagicMock(
+            __enter__=MagicMock(return_value=mock_session),
+            __exit__=MagicMock(return_value=False),  # Don't swallow exceptions
+        )
     )
 
     # Create batch state
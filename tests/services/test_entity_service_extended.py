@@ -73,17 +73,14 @@ def test_process_article_entities_with_multiple_entity_types():
 
     # Mock CRUD operations
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.side_effect = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+    mock_entity_crud.create_many.return_value = [1, 2, 3]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = [
+    mock_canonical_entity_crud.iter_all.return_value = [
         MagicMock(id=42, name="Microsoft Corporation", entity_type="ORGANIZATION")
     ]
     # First two entities are new, third one exists
-    mock_canonical_entity_crud.create.side_effect = [
-        MagicMock(id=10, name="John Doe"),
-        MagicMock(id=11, name="Chicago"),
-    ]
+    mock_canonical_entity_crud.get_or_create_many.return_value = [10, 11]
     mock_canonical_entity_crud.get_by_name.return_value = MagicMock(
         id=42, name="Microsoft Corporation"
     )
@@ -124,7 +121,8 @@ def test_process_article_entities_with_multiple_entity_types():
     # Assert
     # Verify entity extractor was called
     mock_entity_extractor.extract_entities.assert_called_once_with(
-        "John Doe visited Chicago. He works at Microsoft."
+        "John Doe visited Chicago. He works at Microsoft.",
+        analysis_context=mock_entity_extractor.parse.return_value,
     )
 
     # Verify context analyzer was called for each entity
@@ -134,20 +132,26 @@ def test_process_article_entities_with_multiple_entity_types():
     assert mock_entity_resolver.resolve_entity.call_count == 3
 
     # Verify canonical entity operations
-    # Two new entities should be created
-    assert mock_canonical_entity_crud.create.call_count == 2
+    # Two new entities should be upserted in one call
+    mock_canonical_entity_crud.get_or_create_many.assert_called_once()
+    new_canonicals = mock_canonical_entity_crud.get_or_create_many.call_args.kwargs["objs_in"]
+    assert [c.name for c in new_canonicals] == ["John Doe", "Chicago"]
     # One existing entity should be retrieved
     assert mock_canonical_entity_crud.get_by_name.call_count == 1
 
-    # Verify entity creation
-    assert mock_entity_crud.create.call_count == 3
-
-    # Verify entity mention context creation
-    assert mock_entity_mention_context_crud.create.call_count == 3
+    # Verify entities and their contexts are bulk inserted in one transaction
+    mock_entity_crud.create_many.assert_called_once()
+    assert len(mock_entity_crud.create_many.call_args.kwargs["objs_in"]) == 3
+    contexts = mock_entity_mention_context_crud.create_many.call_args.kwargs["objs_in"]
+    assert [c.entity_id for c in contexts] == [1, 2, 3]
+    mock_entity_crud.create.assert_not_called()
+    mock_session.commit.assert_called_once()
 
     # Verify result
     assert len(result) == 3
 
+    assert [entity["canonical_id"] for entity in result] == [10, 11, 42]
+
     # Check entity types in result
     entity_types = [str(entity["canonical_name"]) for entity in result]
     assert "John Doe" in entity_types or any("John Doe" in str(name) for name in entity_types)
@@ -208,10 +212,10 @@ def test_entity_resolution_with_ambiguous_entities():
 
     # Mock CRUD operations
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.side_effect = [MagicMock(id=1), MagicMock(id=2)]
+    mock_entity_crud.create_many.return_value = [1, 2]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = [
+    mock_canonical_entity_crud.iter_all.return_value = [
         MagicMock(id=101, name="George Washington", entity_type="PERSON"),
         MagicMock(id=102, name="Washington, D.C.", entity_type="LOCATION"),
     ]
@@ -262,7 +266,7 @@ def test_entity_resolution_with_ambiguous_entities():
     assert mock_canonical_entity_crud.get_by_name.call_count == 2
 
     # Verify entity creation
-    assert mock_entity_crud.create.call_count == 2
+    assert len(mock_entity_crud.create_many.call_args.kwargs["objs_in"]) == 2
 
     # Verify result
     assert len(result) == 2
@@ -285,7 +289,7 @@ def test_process_article_with_empty_content():
 
     mock_entity_crud = MagicMock()
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
+    mock_canonical_entity_crud.iter_all.return_value = []
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
@@ -320,13 +324,15 @@ def test_process_article_with_empty_content():
 
     # Assert
     # Verify entity extractor was called with empty string
-    mock_entity_extractor.extract_entities.assert_called_once_with("")
+    mock_entity_extractor.extract_entities.assert_called_once_with(
+        "", analysis_context=mock_entity_extractor.parse.return_value
+    )
 
     # Verify no other processing occurred
     mock_context_analyzer.analyze_context.assert_not_called()
     mock_entity_resolver.resolve_entity.assert_not_called()
-    mock_entity_crud.create.assert_not_called()
-    mock_entity_mention_context_crud.create.assert_not_called()
+    mock_entity_crud.create_many.assert_not_called()
+    mock_entity_mention_context_crud.create_many.assert_not_called()
 
     # Verify empty result
     assert len(result) == 0
@@ -584,7 +590,7 @@ def test_process_batch_with_empty_article_list():
     # Arrange
     # Mock article CRUD to return empty list
     mock_article_crud = MagicMock()
-    mock_article_crud.get_by_status.return_value = []
+    mock_article_crud.iter_by_status.return_value = iter([])
 
     # Mock other dependencies
     mock_entity_crud = MagicMock()
@@ -677,11 +683,11 @@ def test_process_article_with_very_large_content():
 
     # Mock CRUD operations
     mock_entity_crud = MagicMock()
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.return_value = [1]
 
     mock_canonical_entity_crud = MagicMock()
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1, name="Test Entity")
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     mock_entity_mention_context_crud = MagicMock()
     mock_entity_profile_crud = MagicMock()
@@ -724,7 +730,9 @@ def test_process_article_with_very_large_content():
     assert result_state.status == TrackingStatus.SUCCESS
 
     # Verify entity extractor was called with the large content
-    mock_entity_extractor.extract_entities.assert_called_once_with(large_content)
+    mock_entity_extractor.extract_entities.assert_called_once_with(
+        large_content, analysis_context=mock_entity_extractor.parse.return_value
+    )
 
     # Verify entity was processed
     assert len(result_state.entities) == 1
@@ -808,11 +816,11 @@ def test_entity_service_with_custom_session_factory():
     }
 
     # Mock canonical entity creation
-    mock_canonical_entity_crud.get_all.return_value = []
-    mock_canonical_entity_crud.create.return_value = MagicMock(id=1, name="Test Entity")
+    mock_canonical_entity_crud.iter_all.return_value = []
+    mock_canonical_entity_crud.get_or_create_many.return_value = [1]
 
     # Mock entity creation
-    mock_entity_crud.create.return_value = MagicMock(id=1)
+    mock_entity_crud.create_many.return_value = [1]
 
     # Act
     result_state = service.process_article_with_state(state)
@@ -0,0 +1,115 @@
+"""Tests for adaptive polling in the RSS feed service."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from local_newsifier.crud.feed_processing_log import feed_processing_log
+from local_newsifier.crud.rss_feed import rss_feed
+from local_newsifier.models.rss_feed import RSSFeed
+from local_newsifier.services.rss_feed_service import RSSFeedService
+
+
+@pytest.fixture
+def service(db_session):
+    """RSS feed service using the test database session."""
+
+    @contextmanager
+    def session_factory():
+        yield db_session
+
+    article_service = MagicMock()
+    article_service.create_article_from_rss_entry.return_value = None
+    return RSSFeedService(
+        rss_feed_crud=rss_feed,
+        feed_processing_log_crud=feed_processing_log,
+        article_service=article_service,
+        session_factory=session_factory,
+    )
+
+
+@pytest.fixture
+def feed(db_session):
+    """A registered feed that has never been fetched."""
+    feed = RSSFeed(url="https://example.com/feed.xml", name="Test Feed")
+    db_session.add(feed)
+    db_session.commit()
+    return feed
+
+
+def feed_data(minutes_apart, count=6):
+    """Feed content whose items were published minutes_apart, newest now."""
+    now = datetime.now(timezone.utc)
+    return {
+        "title": "Test Feed",
+        "entries": [
+            {
+                "title": f"Article {i}",
+                "link": f"https://example.com/{i}",
+                "published": (now - timedelta(minutes=minutes_apart * i)).isoformat(),
+            }
+            for i in range(count)
+        ],
+        "not_modified": False,
+        "content_hash": "abc",
+    }
+
+
+def test_process_feed_schedules_by_publish_interval(service, feed, db_session):
+    """A feed publishing every 20 minutes is polled again in about 10."""
+    service.process_feed(feed.id, feed_data=feed_data(20))
+
+    db_session.refresh(feed)
+    assert feed.publish_interval_seconds == pytest.approx(1200, abs=1)
+    assert feed.fetch_interval_seconds == pytest.approx(600, abs=1)
+    assert feed.not_modified_rate == 0.0
+    wait = feed.next_fetch_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+    assert timedelta(minutes=9) < wait <= timedelta(minutes=10)
+
+
+def test_process_feed_not_modified_backs_off(service, feed, db_session):
+    """Unchanged fetches raise the not-modified rate and lengthen the interval."""
+    feed.publish_interval_seconds = 7200.0
+    db_session.add(feed)
+    db_session.commit()
+
+    service.process_feed(feed.id, feed_data={"entries": [], "not_modified": True})
+
+    db_session.refresh(feed)
+    assert feed.not_modified_rate == pytest.approx(0.3)
+    assert feed.publish_interval_seconds == 7200.0
+    assert feed.fetch_interval_seconds == pytest.approx(3600 * 1.3)
+
+
+def test_process_feed_error_backs_off(service, feed, db_session):
+    """A failed fetch doubles the poll interval."""
+    feed.fetch_interval_seconds = 1800.0
+    db_session.add(feed)
+    db_session.commit()
+
+    service.process_feed(
+        feed.id, feed_data={"title": "Error parsing feed", "entries": [], "error": "timeout"}
+    )
+
+    db_session.refresh(feed)
+    assert feed.fetch_interval_seconds == 3600.0
+
+
+def test_claim_due_feeds(service, feed, db_session):
+    """Due feeds are claimed once until they are fetched."""
+    assert service.claim_due_feeds() == [feed.id]
+    assert service.claim_due_feeds() == []
+
+
+def test_register_feeds_polls_configured_urls(service, feed, db_session):
+    """Configured URLs without a feed are registered and due at once."""
+    urls = [feed.url, "https://example.com/other.xml"]
+
+    created = service.register_feeds(urls)
+
+    assert len(created) == 1
+    assert rss_feed.get(db_session, id=created[0]).url == "https://example.com/other.xml"
+    assert service.register_feeds(urls) == []
+    assert sorted(service.claim_due_feeds()) == sorted([feed.id, *created])
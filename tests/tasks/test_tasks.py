@@ -2,13 +2,18 @@
 Unit tests for Celery tasks in the Local Newsifier project.
 """
 
+import time
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from celery import Task
+from celery.exceptions import Retry, SoftTimeLimitExceeded
 from celery.result import AsyncResult
 
-from local_newsifier.tasks import BaseTask, fetch_rss_feeds, process_article
+from local_newsifier.config.settings import settings
+from local_newsifier.tasks import (BaseTask, aggregate_feed_results, fetch_due_rss_feeds,
+                                  fetch_rss_feed, fetch_rss_feeds, import_apify_dataset,
+                                  process_article, process_rss_feeds, transform_apify_items)
 
 
 @pytest.fixture
@@ -19,6 +24,7 @@ def mock_article():
     article.title = "Test Article"
     article.url = "https://example.com/test-article"
     article.content = "This is a test article about entities."
+    article.duplicate_of = None
     return article
 
 
@@ -66,6 +72,26 @@ class TestBaseTask:
         assert db is mock_session
         mock_get_session.assert_called_once()
 
+    def test_session_factory_runs_tasks(self, test_engine):
+        """Tasks open working sessions through the real session factory."""
+        transform_apify_items._session_factory = None
+        import_apify_dataset._session_factory = None
+        with patch("local_newsifier.database.engine.get_engine", return_value=test_engine):
+            # A missing job is looked up in the database and skipped
+            assert transform_apify_items(999999)["status"] == "skipped"
+
+            result = import_apify_dataset("no-such-run")
+            assert result["status"] == "error"
+            assert result["message"] == "No dataset for run"
+
+            # Errors raised while the session is open reach the caller unchanged
+            with patch(
+                "local_newsifier.services.apify_webhook_service.ApifyWebhookService",
+                side_effect=ValueError("boom"),
+            ):
+                with pytest.raises(ValueError, match="boom"):
+                    transform_apify_items(1)
+
     @patch("local_newsifier.di.providers.get_article_service")
     def test_article_service_property(self, mock_get_article_service):
         """Test that the article_service property returns service from provider."""
@@ -267,33 +293,34 @@ class TestFetchRssFeeds:
         mock_get_article_crud.return_value = mock_article_crud
         mock_get_article_service.return_value = mock_article_service
 
-        # Create a mock task instance with a mock session factory
-        task = fetch_rss_feeds
+        # The per-feed subtasks use the session factory
+        task = fetch_rss_feed
         mock_session = Mock()
         mock_session_generator = iter([mock_session])
 
         # Setup mocks
         feed_urls = ["https://example.com/feed1", "https://example.com/feed2"]
 
-        # Mock parse_rss_feed
-        mock_parse_rss.side_effect = [
-            {
+        # Mock parse_rss_feed; feeds are fetched concurrently, so key by URL
+        feeds = {
+            "https://example.com/feed1": {
                 "title": "Feed 1",
                 "entries": [
                     {"title": "Article 1", "link": "https://example.com/article1"},
                     {"title": "Article 2", "link": "https://example.com/article2"},
                 ],
             },
-            {
+            "https://example.com/feed2": {
                 "title": "Feed 2",
                 "entries": [
                     {"title": "Article 3", "link": "https://example.com/article3"},
                 ],
             },
-        ]
+        }
+        mock_parse_rss.side_effect = lambda url: feeds[url]
 
         # Mock article_crud
-        mock_article_crud.get_by_url.return_value = None
+        mock_article_crud.existing_urls.return_value = set()
 
         # Mock create_article_from_rss_entry to return article ID
         mock_article_service.create_article_from_rss_entry.return_value = 1  # Return ID directly
@@ -312,21 +339,25 @@ class TestFetchRssFeeds:
                 mock_async_result = Mock(spec=AsyncResult)
                 mock_process.delay.return_value = mock_async_result
 
-                # Call the task
-                result = fetch_rss_feeds(feed_urls)
+                # Run each feed's subtask and aggregate, as the chord does
+                result = aggregate_feed_results([fetch_rss_feed(url) for url in feed_urls])
 
-                # Verify session was used properly
-                mock_session_ctx.__enter__.assert_called_once()
-                mock_session_ctx.__exit__.assert_called_once_with(None, None, None)
+                # Verify each feed subtask used its own session properly
+                assert mock_session_ctx.__enter__.call_count == 2
+                mock_session_ctx.__exit__.assert_called_with(None, None, None)
 
                 # Verify methods were called with session
-                assert mock_article_crud.get_by_url.call_count == 3
+                # One batch lookup per feed, not one per entry
+                assert mock_article_crud.existing_urls.call_count == 2
                 calls = [
-                    call(mock_session, url="https://example.com/article1"),
-                    call(mock_session, url="https://example.com/article2"),
-                    call(mock_session, url="https://example.com/article3"),
+                    call(
+                        mock_session,
+                        urls=["https://example.com/article1", "https://example.com/article2"],
+                    ),
+                    call(mock_session, urls=["https://example.com/article3"]),
                 ]
-                mock_article_crud.get_by_url.assert_has_calls(calls, any_order=False)
+                mock_article_crud.existing_urls.assert_has_calls(calls, any_order=True)
+                mock_article_crud.get_by_url.assert_not_called()
 
                 # Verify other call counts
                 assert mock_parse_rss.call_count == 2
@@ -337,6 +368,7 @@ class TestFetchRssFeeds:
                 assert result["feeds_processed"] == 2
                 assert result["articles_found"] == 3
                 assert result["articles_added"] == 3
+                assert all("fetch_seconds" in feed for feed in result["feeds"])
 
     @patch("local_newsifier.tasks.parse_rss_feed")
     @patch("local_newsifier.di.providers.get_article_service")
@@ -355,8 +387,8 @@ class TestFetchRssFeeds:
         mock_get_article_crud.return_value = mock_article_crud
         mock_get_article_service.return_value = mock_article_service
 
-        # Create a mock task instance with a mock session factory
-        task = fetch_rss_feeds
+        # The per-feed subtasks use the session factory
+        task = fetch_rss_feed
         mock_session = Mock()
         mock_session_generator = iter([mock_session])
 
@@ -373,8 +405,7 @@ class TestFetchRssFeeds:
         }
 
         # Mock article_crud - first article exists, second doesn't
-        existing_article = Mock()
-        mock_article_crud.get_by_url.side_effect = [existing_article, None]
+        mock_article_crud.existing_urls.return_value = {"https://example.com/article1"}
 
         # Mock create_article_from_rss_entry to return article ID
         mock_article_service.create_article_from_rss_entry.return_value = 2  # Return ID directly
@@ -393,20 +424,18 @@ class TestFetchRssFeeds:
                 mock_async_result = Mock(spec=AsyncResult)
                 mock_process.delay.return_value = mock_async_result
 
-                # Call the task
-                result = fetch_rss_feeds(feed_urls)
+                # Run each feed's subtask and aggregate, as the chord does
+                result = aggregate_feed_results([fetch_rss_feed(url) for url in feed_urls])
 
                 # Verify session was used properly
                 mock_session_ctx.__enter__.assert_called_once()
                 mock_session_ctx.__exit__.assert_called_once_with(None, None, None)
 
                 # Verify methods were called with session
-                assert mock_article_crud.get_by_url.call_count == 2
-                calls = [
-                    call(mock_session, url="https://example.com/article1"),
-                    call(mock_session, url="https://example.com/article2"),
-                ]
-                mock_article_crud.get_by_url.assert_has_calls(calls, any_order=False)
+                mock_article_crud.existing_urls.assert_called_once_with(
+                    mock_session,
+                    urls=["https://example.com/article1", "https://example.com/article2"],
+                )
 
                 # Verify other calls
                 assert mock_parse_rss.call_count == 1
@@ -417,3 +446,257 @@ class TestFetchRssFeeds:
                 assert result["feeds_processed"] == 1
                 assert result["articles_found"] == 2
                 assert result["articles_added"] == 1
+
+    def test_fetch_rss_feeds_fans_out_per_feed(self):
+        """The task is replaced by a chord of per-feed subtasks and an aggregator."""
+        feed_urls = ["https://example.com/feed1", "https://example.com/feed2"]
+
+        with patch.object(fetch_rss_feeds, "replace") as mock_replace:
+            fetch_rss_feeds(feed_urls)
+
+        replacement = mock_replace.call_args[0][0]
+        assert [task.task for task in replacement.tasks] == ["local_newsifier.tasks.fetch_rss_feed"] * 2
+        assert [task.args for task in replacement.tasks] == [(url,) for url in feed_urls]
+        assert replacement.body.task == "local_newsifier.tasks.aggregate_feed_results"
+        assert "started_at" in replacement.body.kwargs
+
+    @patch("local_newsifier.tasks.settings")
+    def test_fetch_rss_feeds_no_feeds(self, mock_settings):
+        """With no feeds configured the empty result is returned directly."""
+        mock_settings.RSS_FEED_URLS = []
+
+        result = fetch_rss_feeds()
+
+        assert result["status"] == "success"
+        assert result["feeds_processed"] == 0
+        assert result["feeds"] == []
+
+    @patch("local_newsifier.tasks.parse_rss_feed")
+    def test_fetch_rss_feed_retries_failed_fetch(self, mock_parse_rss):
+        """A failed fetch is retried with exponential backoff."""
+        mock_parse_rss.return_value = {"entries": [], "error": "Connection reset"}
+        fetch_rss_feed.push_request(retries=1)
+        try:
+            with patch.object(fetch_rss_feed, "retry", side_effect=Retry()) as mock_retry:
+                with pytest.raises(Retry):
+                    fetch_rss_feed("https://example.com/feed1")
+        finally:
+            fetch_rss_feed.pop_request()
+
+        assert mock_retry.call_args.kwargs["countdown"] == 2 * settings.RSS_FEED_TASK_RETRY_DELAY
+        assert str(mock_retry.call_args.kwargs["exc"]) == "Connection reset"
+
+    @patch("local_newsifier.tasks.parse_rss_feed")
+    def test_fetch_rss_feed_returns_error_after_retries(self, mock_parse_rss):
+        """Once retries run out the error is returned, not raised."""
+        mock_parse_rss.return_value = {"entries": [], "error": "Connection reset"}
+        fetch_rss_feed.push_request(retries=fetch_rss_feed.max_retries)
+        try:
+            result = fetch_rss_feed("https://example.com/feed1")
+        finally:
+            fetch_rss_feed.pop_request()
+
+        assert result["status"] == "error"
+        assert result["message"] == "Connection reset"
+        assert result["url"] == "https://example.com/feed1"
+
+    @patch("local_newsifier.tasks.parse_rss_feed")
+    def test_fetch_rss_feed_time_limit(self, mock_parse_rss):
+        """A feed exceeding its soft time limit is reported without retrying."""
+        mock_parse_rss.side_effect = SoftTimeLimitExceeded()
+
+        with patch.object(fetch_rss_feed, "retry") as mock_retry:
+            result = fetch_rss_feed("https://example.com/feed1")
+
+        mock_retry.assert_not_called()
+        assert result["status"] == "error"
+        assert "Time limit" in result["message"]
+
+    def test_aggregate_feed_results(self):
+        """Per-feed results are summed into the task's result shape."""
+        result = aggregate_feed_results(
+            [
+                {"url": "a", "status": "success", "articles_found": 3, "articles_processed": 2},
+                {"url": "b", "status": "error", "message": "boom"},
+            ],
+            started_at=time.time(),
+        )
+
+        assert result["status"] == "success"
+        assert result["feeds_processed"] == 1
+        assert result["articles_found"] == 3
+        assert result["articles_added"] == 2
+        assert len(result["feeds"]) == 2
+        assert result["elapsed_seconds"] >= 0
+
+
+class TestImportApifyDataset:
+    """Tests for the import_apify_dataset and transform_apify_items tasks."""
+
+    @pytest.fixture(autouse=True)
+    def session(self):
+        """Give the task a mock session."""
+        session_ctx = MagicMock()
+        for task in (import_apify_dataset, transform_apify_items):
+            task._session_factory = lambda **kwargs: session_ctx
+        yield session_ctx.__enter__.return_value
+        for task in (import_apify_dataset, transform_apify_items):
+            task._session_factory = None
+
+    @patch("local_newsifier.tasks.transform_apify_items")
+    @patch("local_newsifier.services.apify_webhook_service.ApifyWebhookService")
+    def test_import_apify_dataset_stages_and_fans_out(
+        self, mock_service_class, mock_transform, session
+    ):
+        """The run's dataset is staged, then transformed by parallel tasks."""
+        mock_service_class.return_value.import_run.return_value = {
+            "run_id": "run1",
+            "job_id": 7,
+            "status": "staged",
+            "items": 5,
+        }
+
+        with patch("local_newsifier.tasks.group") as mock_group:
+            result = import_apify_dataset("run1")
+
+        mock_service_class.assert_called_once_with(session)
+        mock_service_class.return_value.import_run.assert_called_once_with(
+            "run1", transform=False
+        )
+        signatures = list(mock_group.call_args.args[0])
+        assert len(signatures) == settings.APIFY_TRANSFORM_TASKS
+        mock_transform.s.assert_called_with(7)
+        mock_group.return_value.delay.assert_called_once()
+        assert result["transform_tasks"] == settings.APIFY_TRANSFORM_TASKS
+
+    @patch("local_newsifier.services.apify_webhook_service.ApifyWebhookService")
+    def test_transform_apify_items(self, mock_service_class, session):
+        """Staged items of a job are transformed through the webhook service."""
+        mock_service_class.return_value.transform_job.return_value = {
+            "job_id": 7,
+            "status": "success",
+            "articles_created": 5,
+            "processed": True,
+        }
+
+        result = transform_apify_items(7)
+
+        mock_service_class.return_value.transform_job.assert_called_once_with(7)
+        assert result["articles_created"] == 5
+
+    @patch("local_newsifier.services.apify_webhook_service.ApifyWebhookService")
+    def test_import_apify_dataset_retries_failed_import(self, mock_service_class):
+        """A failed import is retried with backoff, resuming from its checkpoint."""
+        mock_service_class.return_value.import_run.return_value = {
+            "run_id": "run1",
+            "job_id": 1,
+            "status": "error",
+            "message": "connection reset",
+        }
+        import_apify_dataset.push_request(retries=1)
+        try:
+            with patch.object(import_apify_dataset, "retry", side_effect=Retry()) as mock_retry:
+                with pytest.raises(Retry):
+                    import_apify_dataset("run1")
+        finally:
+            import_apify_dataset.pop_request()
+
+        assert (
+            mock_retry.call_args.kwargs["countdown"] == 2 * settings.APIFY_IMPORT_TASK_RETRY_DELAY
+        )
+        assert str(mock_retry.call_args.kwargs["exc"]) == "connection reset"
+
+
+class TestAdaptiveFeedPolling:
+    """Tests for the fetch_due_rss_feeds and process_rss_feeds tasks."""
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_fetch_due_rss_feeds_queues_due_feeds(self, mock_get_rss_feed_service):
+        """Due feeds are claimed and queued together in one batch."""
+        mock_service = Mock()
+        mock_service.claim_due_feeds.return_value = [3, 1]
+        mock_get_rss_feed_service.return_value = mock_service
+
+        with patch("local_newsifier.tasks.process_rss_feeds") as mock_process:
+            result = fetch_due_rss_feeds()
+
+        mock_process.delay.assert_called_once_with([3, 1])
+        assert result == {"status": "success", "feeds_queued": 2, "feed_ids": [3, 1]}
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_fetch_due_rss_feeds_registers_configured_feeds(self, mock_get_rss_feed_service):
+        """Feeds in RSS_FEED_URLS are registered before due feeds are claimed."""
+        mock_service = Mock()
+        mock_service.claim_due_feeds.return_value = [7]
+        mock_get_rss_feed_service.return_value = mock_service
+        feed_urls = ["https://example.com/feed.xml"]
+
+        with patch("local_newsifier.tasks.settings.RSS_FEED_URLS", feed_urls), patch(
+            "local_newsifier.tasks.process_rss_feeds"
+        ) as mock_process:
+            fetch_due_rss_feeds()
+
+        mock_service.register_feeds.assert_called_once_with(feed_urls)
+        mock_process.delay.assert_called_once_with([7])
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_fetch_due_rss_feeds_registration_error(self, mock_get_rss_feed_service):
+        """Registered feeds are still claimed when configured feeds cannot be registered."""
+        mock_service = Mock()
+        mock_service.register_feeds.side_effect = Exception("Database down")
+        mock_service.claim_due_feeds.return_value = [3]
+        mock_get_rss_feed_service.return_value = mock_service
+
+        with patch("local_newsifier.tasks.process_rss_feeds") as mock_process:
+            result = fetch_due_rss_feeds()
+
+        mock_process.delay.assert_called_once_with([3])
+        assert result["status"] == "success"
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_fetch_due_rss_feeds_nothing_due(self, mock_get_rss_feed_service):
+        """Nothing is queued when no feed is due."""
+        mock_service = Mock()
+        mock_service.claim_due_feeds.return_value = []
+        mock_get_rss_feed_service.return_value = mock_service
+
+        with patch("local_newsifier.tasks.process_rss_feeds") as mock_process:
+            result = fetch_due_rss_feeds()
+
+        mock_process.delay.assert_not_called()
+        assert result["feeds_queued"] == 0
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_fetch_due_rss_feeds_error(self, mock_get_rss_feed_service):
+        """An error claiming feeds is reported in the result."""
+        mock_service = Mock()
+        mock_service.claim_due_feeds.side_effect = Exception("Database down")
+        mock_get_rss_feed_service.return_value = mock_service
+
+        result = fetch_due_rss_feeds()
+
+        assert result["status"] == "error"
+        assert result["message"] == "Database down"
+
+    @patch("local_newsifier.di.providers.get_rss_feed_service")
+    def test_process_rss_feeds(self, mock_get_rss_feed_service):
+        """Feeds are processed through the service and their results summed."""
+        mock_service = Mock()
+        mock_service.process_feeds.return_value = iter(
+            [
+                {"status": "success", "feed_id": 1, "articles_added": 2},
+                {"status": "success", "feed_id": 2, "not_modified": True, "articles_added": 0},
+                {"status": "error", "feed_id": 3, "message": "boom"},
+            ]
+        )
+        mock_get_rss_feed_service.return_value = mock_service
+
+        with patch("local_newsifier.tasks.process_article") as mock_process_article:
+            result = process_rss_feeds([1, 2, 3])
+
+        mock_service.process_feeds.assert_called_once_with(
+            [1, 2, 3], task_queue_func=mock_process_article.delay
+        )
+        assert result["feeds_processed"] == 2
+        assert result["articles_added"] == 2
+        assert len(result["feeds"]) == 3
@@ -415,6 +415,41 @@ class TestContextAnalyzer:
         assert "context_analysis" in result[0]
         assert "context_analysis" not in result[1]
 
+    def test_analyze_context_reuses_span(self, context_analyzer, mock_spacy_model):
+        """Test that an already parsed span is analyzed without calling nlp again."""
+        span = MockSpacyDoc(
+            tokens=[MockSpacyToken("Praised", "Praised"), MockSpacyToken("leader", "leader")]
+        )
+
+        result = context_analyzer.analyze_context("Praised leader.", span=span)
+
+        mock_spacy_model.assert_not_called()
+        assert result["sentiment"]["positive_count"] == 1
+        assert result["framing"]["category"] == "leadership"
+
+    def test_analyze_context_parses_once(
+        self, context_analyzer, mock_spacy_model, positive_tokens
+    ):
+        """Test that sentiment and framing share one parse of the context."""
+        mock_spacy_model.return_value = MockSpacyDoc(tokens=positive_tokens)
+
+        context_analyzer.analyze_context("Good, excellent, impressive words.")
+
+        mock_spacy_model.assert_called_once_with("good, excellent, impressive words.")
+
+    def test_analyze_entity_contexts_with_analysis_context(self, context_analyzer):
+        """Test that entity sentences are taken from the shared analysis context."""
+        context_analyzer.analyze_context = Mock(return_value={"sentiment": {}, "framing": {}})
+        sentence = MockSpacyDoc(tokens=[])
+        analysis_context = Mock()
+        analysis_context.sentence_at.return_value = sentence
+
+        entities = [{"text": "John Smith", "context": "John Smith spoke.", "start_char": 0}]
+        context_analyzer.analyze_entity_contexts(entities, analysis_context=analysis_context)
+
+        analysis_context.sentence_at.assert_called_once_with(0)
+        context_analyzer.analyze_context.assert_called_once_with("John Smith spoke.", span=sentence)
+
     def test_get_sentiment_category(self, context_analyzer):
         """Test sentiment category determination from score."""
         # Test positive sentiment
@@ -386,6 +386,21 @@ class TestTrendAnalyzer:
         assert trend_analyzer.detect_entity_trends([], articles, ["PERSON"]) == []
         assert trend_analyzer.detect_entity_trends(entities, [], ["PERSON"]) == []
 
+        # Entities and articles can be streamed, each read once
+        streamed = trend_analyzer.detect_entity_trends(
+            entities=(entity for entity in entities),
+            articles=(article for article in articles),
+            entity_types=["PERSON", "ORG", "GPE"],
+            min_significance=1.0,
+            min_mentions=2,
+        )
+        streamed_mayor = next(t for t in streamed if "Mayor" in t.name)
+        assert [(e.text, e.frequency) for e in streamed_mayor.entities] == [
+            ("Mayor", 2),
+            ("Gainesville", 1),
+        ]
+        assert {e.article_id for e in streamed_mayor.evidence} == {1, 2}
+
     def test_clear_cache(self, trend_analyzer):
         """Test cache clearing."""
         trend_analyzer._cache = {"key1": "value1", "key2": "value2"}
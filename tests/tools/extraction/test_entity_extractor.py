@@ -68,6 +68,11 @@ class MockSpacyLanguage:
     def __call__(self, text):
         return self.doc_to_return
 
+    def pipe(self, texts, batch_size=None, n_process=None):
+        self.pipe_args = {"batch_size": batch_size, "n_process": n_process}
+        for text in texts:
+            yield self.doc_to_return
+
 
 @pytest.fixture
 def mock_spacy_model():
@@ -184,6 +189,26 @@ class TestEntityExtractor:
         assert len(mixed_entities) == 2
         assert {e["type"] for e in mixed_entities} == {"PERSON", "GPE"}
 
+    def test_extract_entities_batch(self, entity_extractor, basic_entities, mock_spacy_model):
+        """Test batched extraction yields one result list per text via nlp.pipe."""
+        mock_spacy_model.doc_to_return = MockSpacyDoc(ents=basic_entities)
+
+        results = entity_extractor.extract_entities_batch(
+            ["First text.", "Second text."], entity_types={"PERSON"}, batch_size=8, n_process=2
+        )
+
+        # Results are streamed lazily
+        assert not isinstance(results, list)
+        results = list(results)
+        assert len(results) == 2
+        assert all(len(entities) == 1 for entities in results)
+        assert results[0][0]["text"] == "John Smith"
+        assert mock_spacy_model.pipe_args == {"batch_size": 8, "n_process": 2}
+
+    def test_extract_entities_batch_empty(self, entity_extractor):
+        """Test batched extraction with no input texts."""
+        assert list(entity_extractor.extract_entities_batch([])) == []
+
     def test_extract_person_entities(self, entity_extractor, basic_entities, mock_spacy_model):
         """Test extraction of person entities."""
         # Setup mock document with entities
@@ -312,6 +337,38 @@ class TestEntityExtractor:
         assert "expanded_context" in entities[0]
         assert "expanded_context" in entities[1]
 
+    def test_extract_entities_with_context_parses_once(self, entity_extractor, mock_spacy_model):
+        """Test that entities and their expanded context come from a single parse."""
+        sent1 = MockSpacySent("First sentence.", 0)
+        sent2 = MockSpacySent("John Smith is a person.", 16)
+        sent3 = MockSpacySent("Third sentence.", 40)
+        person_ent = MockSpacyEnt("John Smith", "PERSON", 16, 26, sent2)
+        mock_spacy_model.doc_to_return = MockSpacyDoc(ents=[person_ent], sents=[sent1, sent2, sent3])
+
+        entity_extractor.nlp = Mock(wraps=mock_spacy_model)
+
+        entities = entity_extractor.extract_entities_with_context(
+            "First sentence. John Smith is a person. Third sentence.", context_window=1
+        )
+
+        entity_extractor.nlp.assert_called_once()
+        assert entities[0]["expanded_context"] == (
+            "First sentence. John Smith is a person. Third sentence."
+        )
+
+    def test_extract_entities_reuses_analysis_context(
+        self, entity_extractor, basic_entities, mock_spacy_model
+    ):
+        """Test that a shared analysis context is used instead of parsing again."""
+        analysis_context = entity_extractor.parse("Sample text with entities.")
+        analysis_context.doc = MockSpacyDoc(ents=basic_entities)
+
+        entities = entity_extractor.extract_entities(
+            "Sample text with entities.", analysis_context=analysis_context
+        )
+
+        assert [entity["text"] for entity in entities] == ["John Smith", "Google", "New York"]
+
     def test_extract_entities_with_malformed_content(self, entity_extractor, mock_spacy_model):
         """Test entity extraction with malformed content."""
         # We need to patch the extract_entities method to handle the exception
@@ -0,0 +1,216 @@
+"""Tests for the cross-article canonical entity cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from local_newsifier.tools.resolution.canonical_entity_cache import CanonicalEntityCache
+from local_newsifier.tools.resolution.entity_resolver import EntityResolver
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = str(value).encode()
+
+    def incr(self, key):
+        value = int(self.values.get(key, 0)) + 1
+        self.values[key] = str(value).encode()
+        return value
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        entries = self.hashes.setdefault(key, {})
+        if field is not None:
+            entries[field] = value
+        entries.update(mapping or {})
+
+    def hvals(self, key):
+        return list(self.hashes.get(key, {}).values())
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute, like a Redis pipeline."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+def _row(entity_id, name, entity_type="PERSON"):
+    return SimpleNamespace(id=entity_id, name=name, entity_type=entity_type)
+
+
+@pytest.fixture
+def table():
+    """Rows of the canonical_entities table seen by the mocked CRUD."""
+    return [_row(1, "Joe Biden"), _row(2, "Gainesville", "GPE")]
+
+
+@pytest.fixture
+def crud(table):
+    """Canonical entity CRUD mock backed by the table fixture."""
+    crud = MagicMock()
+    crud.iter_all.side_effect = lambda session, columns: iter(list(table))
+    crud.get_after_id.side_effect = lambda session, after_id: [
+        row for row in table if row.id > after_id
+    ]
+    return crud
+
+
+def test_loads_once_then_reads_only_new_rows(crud, table):
+    """Test that the table is read in full once and then by watermark."""
+    cache = CanonicalEntityCache(EntityResolver(), lookback=0)
+
+    cache.refresh(None, crud)
+    cache.refresh(None, crud)
+
+    crud.iter_all.assert_called_once()
+    crud.get_after_id.assert_called_once_with(None, after_id=2)
+    assert cache.resolve("President Joe Biden", "PERSON")["id"] == 1
+
+    # Another worker inserts a row; the next refresh picks it up
+    table.append(_row(3, "Harvey Ward"))
+    cache.refresh(None, crud)
+
+    assert cache.resolve("Harvey Ward", "PERSON")["id"] == 3
+    assert cache.watermark == 3
+
+
+def test_own_inserts_do_not_skip_other_workers_rows(crud, table):
+    """Test that rows committed late with lower ids than our own inserts are still read."""
+    redis = FakeRedis()
+    cache = CanonicalEntityCache(EntityResolver(), redis_client=redis, lookback=0)
+    cache.refresh(None, crud)
+
+    # This worker inserts id 500 while another worker's transaction holding id 10
+    # is still open
+    cache.add({"name": "Harvey Ward", "entity_type": "PERSON", "id": 500})
+    assert cache.watermark == 2
+    assert redis.get(cache._watermark_key) == b"2"
+
+    table.append(_row(10, "Kim Barton"))
+    redis.incr(cache._version_key)
+    cache.refresh(None, crud)
+
+    crud.get_after_id.assert_called_once_with(None, after_id=2)
+    assert cache.resolve("Kim Barton", "PERSON")["id"] == 10
+    assert cache.watermark == 10
+
+
+def test_resolve_uses_lru(crud):
+    """Test that repeated mentions are answered from the LRU."""
+    resolver = EntityResolver()
+    cache = CanonicalEntityCache(resolver, lru_size=1)
+    cache.refresh(None, crud)
+
+    first = cache.resolve("Gainesville", "GPE")
+    first["name"] = "mutated by caller"
+    second = cache.resolve("Gainesville", "GPE")
+
+    assert second["name"] == "Gainesville"
+    assert cache.stats["hits"] == 1
+
+    # The LRU is bounded
+    cache.resolve("Joe Biden", "PERSON")
+    cache.resolve("Gainesville", "GPE")
+    assert cache.stats["misses"] == 3
+
+
+def test_add_invalidates_resolutions(crud):
+    """Test that entities created by this worker are visible immediately."""
+    cache = CanonicalEntityCache(EntityResolver())
+    cache.refresh(None, crud)
+
+    assert cache.resolve("Alachua County", "GPE")["is_new"] is True
+
+    cache.add({"name": "Alachua County", "entity_type": "GPE", "id": 7})
+
+    resolved = cache.resolve("Alachua County", "GPE")
+    assert resolved["is_new"] is False
+    assert resolved["id"] == 7
+
+
+def test_redis_version_skips_database(crud, table):
+    """Test that a warm worker only queries when the shared version changes."""
+    redis = FakeRedis()
+    cache = CanonicalEntityCache(EntityResolver(), redis_client=redis)
+
+    cache.refresh(None, crud)
+    cache.add({"name": "Harvey Ward", "entity_type": "PERSON", "id": 3})
+    cache.refresh(None, crud)
+
+    # Our own insert does not force a database refresh
+    crud.get_after_id.assert_not_called()
+
+    # Another worker inserts and bumps the version
+    table.append(_row(4, "Kim Barton"))
+    redis.incr(cache._version_key)
+    cache.refresh(None, crud)
+
+    crud.get_after_id.assert_called_once()
+    assert cache.resolve("Kim Barton", "PERSON")["id"] == 4
+
+
+def test_cold_worker_loads_from_redis(crud, table):
+    """Test that a second worker loads the snapshot instead of the whole table."""
+    redis = FakeRedis()
+    warm = CanonicalEntityCache(EntityResolver(), redis_client=redis)
+    warm.refresh(None, crud)
+    warm.add({"name": "Harvey Ward", "entity_type": "PERSON", "id": 3})
+
+    cold_crud = MagicMock()
+    cold_crud.get_after_id.return_value = []
+    cold = CanonicalEntityCache(EntityResolver(), redis_client=redis, lookback=0)
+    cold.refresh(None, cold_crud)
+
+    cold_crud.iter_all.assert_not_called()
+    cold_crud.get_after_id.assert_called_once_with(None, after_id=2)
+    assert cold.resolve("Joe Biden", "PERSON")["id"] == 1
+    assert cold.resolve("Harvey Ward", "PERSON")["id"] == 3
+
+
+def test_redis_errors_fall_back_to_database(crud):
+    """Test that an unavailable Redis tier degrades to database refreshes."""
+    redis = MagicMock()
+    redis.get.side_effect = ConnectionError("redis down")
+    redis.pipeline.side_effect = ConnectionError("redis down")
+    cache = CanonicalEntityCache(EntityResolver(), redis_client=redis)
+
+    cache.refresh(None, crud)
+    cache.refresh(None, crud)
+
+    crud.iter_all.assert_called_once()
+    crud.get_after_id.assert_called_once()
+    assert cache.resolve("Joe Biden", "PERSON")["id"] == 1
+
+
+def test_clear(crud):
+    """Test that clearing forces a full reload."""
+    cache = CanonicalEntityCache(EntityResolver())
+    cache.refresh(None, crud)
+
+    cache.clear()
+    cache.refresh(None, crud)
+
+    assert crud.iter_all.call_count == 2
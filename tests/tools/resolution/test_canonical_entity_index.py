@@ -0,0 +1,120 @@
+"""Tests for the indexed canonical entity matcher."""
+
+import random
+import string
+
+import pytest
+
+from local_newsifier.tools.resolution.canonical_entity_index import name_bigrams
+from local_newsifier.tools.resolution.entity_resolver import EntityResolver
+
+
+@pytest.fixture
+def entity_resolver():
+    """Create an EntityResolver with the default threshold."""
+    return EntityResolver(similarity_threshold=0.85)
+
+
+@pytest.fixture
+def existing_entities():
+    """Canonical entities across two types."""
+    return [
+        {"name": "Joe Biden", "entity_type": "PERSON", "id": 1},
+        {"name": "Donald Trump", "entity_type": "PERSON", "id": 2},
+        {"name": "Joe Biden", "entity_type": "ORG", "id": 3},
+        {"name": "University of Florida", "entity_type": "ORG", "id": 4},
+    ]
+
+
+def test_name_bigrams_numbers_repeats():
+    """Test that repeated bigrams are kept as distinct occurrences."""
+    assert name_bigrams("anana") == {("an", 0), ("na", 0), ("an", 1), ("na", 1)}
+    assert name_bigrams("a") == set()
+
+
+def test_find_exact_normalized_and_similar(entity_resolver, existing_entities):
+    """Test the three match stages against the index."""
+    index = entity_resolver.build_index(existing_entities)
+
+    assert len(index) == 4
+    assert index.find("joe biden", "PERSON")["id"] == 1
+    assert index.find("Joe Biden", "ORG")["id"] == 3
+    assert index.find("President Joe Biden", "PERSON")["id"] == 1
+    assert index.find("University of Florda", "ORG")["id"] == 4
+    assert index.find("Barack Obama", "PERSON") is None
+    assert index.find("Joe Biden", "GPE") is None
+
+
+def test_first_inserted_entity_wins(entity_resolver):
+    """Test that duplicates resolve to the earliest entity, as in the linear scan."""
+    index = entity_resolver.build_index(
+        [
+            {"name": "Gainesville", "entity_type": "GPE", "id": 1},
+            {"name": "gainesville", "entity_type": "GPE", "id": 2},
+        ]
+    )
+
+    assert index.find("GAINESVILLE", "GPE")["id"] == 1
+
+
+def test_incremental_add(entity_resolver, existing_entities):
+    """Test that entities added after construction are matched."""
+    index = entity_resolver.build_index(existing_entities)
+    assert index.find("Alachua County", "GPE") is None
+
+    index.add({"name": "Alachua County", "entity_type": "GPE", "id": 5})
+
+    assert len(index) == 5
+    assert index.find("Alachua County", "GPE")["id"] == 5
+    assert index.find("Alachua Countyy", "GPE")["id"] == 5
+
+
+def test_resolver_accepts_index(entity_resolver, existing_entities):
+    """Test resolve_entity with an index gives the same result as with a list."""
+    index = entity_resolver.build_index(existing_entities)
+
+    from_index = entity_resolver.resolve_entity("President Joe Biden", "PERSON", index)
+    from_list = entity_resolver.resolve_entity("President Joe Biden", "PERSON", existing_entities)
+
+    assert from_index == from_list
+    assert from_index["is_new"] is False
+
+
+def _mutate(name, rng):
+    """Apply a few random character edits to a name."""
+    chars = list(name)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.choice(["insert", "delete", "replace"])
+        pos = rng.randrange(len(chars) + 1)
+        if op == "insert":
+            chars.insert(pos, rng.choice(string.ascii_lowercase))
+        elif chars and pos < len(chars):
+            if op == "delete":
+                del chars[pos]
+            else:
+                chars[pos] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("threshold", [0.6, 0.8, 0.85, 0.95])
+def test_matches_linear_scan(threshold):
+    """Test that the index agrees with the linear scan on randomized names."""
+    rng = random.Random(threshold)
+    resolver = EntityResolver(similarity_threshold=threshold)
+    words = ["ann", "anna", "bob", "city", "hall", "joe", "smith", "river", "park", "a", "x"]
+
+    entities = []
+    for i in range(300):
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        entities.append(
+            {"name": name.title(), "entity_type": rng.choice(["PERSON", "ORG"]), "id": i}
+        )
+    index = resolver.build_index(entities)
+
+    for _ in range(300):
+        base = rng.choice(entities)
+        mention = _mutate(base["name"].lower(), rng)
+        entity_type = rng.choice(["PERSON", "ORG"])
+
+        expected = resolver.find_matching_entity(mention, entity_type, entities)
+        assert index.find(mention, entity_type) is expected
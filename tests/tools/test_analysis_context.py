@@ -0,0 +1,100 @@
+"""Tests for the shared per-article analysis context."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from local_newsifier.tools.analysis_context import AnalysisContext
+
+
+class MockSpacySent:
+    """Mock spaCy sentence span for testing."""
+
+    def __init__(self, text, start_char):
+        self.text = text
+        self.start_char = start_char
+
+
+class MockSpacyDoc:
+    """Mock spaCy Doc that counts sentence iterations."""
+
+    def __init__(self, text, sents):
+        self.text = text
+        self._sents = sents
+        self.sents_calls = 0
+
+    @property
+    def sents(self):
+        self.sents_calls += 1
+        return iter(self._sents)
+
+
+TEXT = "First sentence here. John Smith is a person. Third sentence here."
+
+
+@pytest.fixture
+def doc():
+    """Parsed document with three sentences."""
+    return MockSpacyDoc(
+        TEXT,
+        [
+            MockSpacySent("First sentence here.", 0),
+            MockSpacySent("John Smith is a person.", 21),
+            MockSpacySent("Third sentence here.", 45),
+        ],
+    )
+
+
+def test_from_text_parses_once(doc):
+    """Test that the text is parsed once and sentences are cached."""
+    nlp = MagicMock(return_value=doc)
+
+    context = AnalysisContext.from_text(nlp, TEXT)
+
+    assert context.sentences is context.sentences
+    assert [sent.text for sent in context.sentences] == [
+        "First sentence here.",
+        "John Smith is a person.",
+        "Third sentence here.",
+    ]
+    nlp.assert_called_once_with(TEXT)
+    assert doc.sents_calls == 1
+
+
+def test_from_texts_uses_pipe():
+    """Test that batched parsing yields one context per text in order."""
+    nlp = MagicMock()
+    nlp.pipe.side_effect = lambda texts, **kwargs: (MockSpacyDoc(text, []) for text in texts)
+
+    contexts = list(AnalysisContext.from_texts(nlp, ["One.", "Two."], batch_size=2, n_process=1))
+
+    assert [context.doc.text for context in contexts] == ["One.", "Two."]
+    assert nlp.pipe.call_args.kwargs == {"batch_size": 2, "n_process": 1}
+
+
+def test_sentence_at(doc):
+    """Test locating the sentence containing a character offset."""
+    context = AnalysisContext(doc)
+    start = TEXT.index("John Smith")
+
+    assert context.sentence_index(start) == 1
+    assert context.sentence_at(start).text == "John Smith is a person."
+    assert context.sentence_at(0).text == "First sentence here."
+    assert context.sentence_at(len(TEXT) - 1).text == "Third sentence here."
+
+
+def test_sentence_at_empty_document():
+    """Test that an empty document has no sentence to return."""
+    context = AnalysisContext(MockSpacyDoc("", []))
+
+    assert context.sentence_index(0) is None
+    assert context.sentence_at(0) is None
+
+
+def test_sentence_window(doc):
+    """Test joining a sentence with its neighbours."""
+    context = AnalysisContext(doc)
+
+    assert context.sentence_window(1, 1) == TEXT
+    assert context.sentence_window(0, 1) == "First sentence here. John Smith is a person."
+    assert context.sentence_window(2, 0) == "Third sentence here."
@@ -0,0 +1,366 @@
+"""Tests for the WebDriver pool and the scraper's Selenium fallback."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from local_newsifier.models.state import AnalysisStatus
+from local_newsifier.tools.driver_pool import (RenderingMemory, WebDriverPool,
+                                               close_driver_pools, get_driver_pool)
+from local_newsifier.tools.web_scraper import WebScraperTool
+
+ARTICLE_HTML = "<html><body><article><p>Rendered story</p></article></body></html>"
+LONG_ARTICLE_HTML = (
+    "<html><body><article><p>A rendered story long enough to count as an article.</p>"
+    "</article></body></html>"
+)
+
+
+class FakeWebDriver:
+    """Local stand-in for a Selenium WebDriver serving fixed pages."""
+
+    def __init__(self, pages=None, fail_get=False):
+        self.pages = pages or {}
+        self.fail_get = fail_get
+        self.visited = []
+        self.page_source = ""
+        self.quit_called = False
+
+    def get(self, url):
+        if self.fail_get:
+            raise WebDriverException("session deleted")
+        self.visited.append(url)
+        self.page_source = self.pages.get(url, "<html><body></body></html>")
+
+    def find_element(self, by, value):
+        if f"<{value}>" not in self.page_source:
+            raise NoSuchElementException(value)
+        return MagicMock()
+
+    def execute_script(self, script):
+        return "complete"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeDriverFactory:
+    """Creates FakeWebDrivers and remembers every one it created."""
+
+    def __init__(self, **driver_kwargs):
+        self.driver_kwargs = driver_kwargs
+        self.created = []
+
+    def __call__(self):
+        driver = FakeWebDriver(**self.driver_kwargs)
+        self.created.append(driver)
+        return driver
+
+
+class TestWebDriverPool:
+    """Tests for WebDriverPool."""
+
+    def test_reuses_warm_driver(self):
+        """Sequential borrows get the same driver."""
+        factory = FakeDriverFactory()
+        pool = WebDriverPool(factory, max_size=2)
+
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            pass
+
+        assert first is second
+        assert len(factory.created) == 1
+        assert pool.stats["reused"] == 1
+        assert pool.idle_count == 1
+
+    def test_recycles_driver_after_page_limit(self):
+        """A driver that has loaded max_pages pages is quit and replaced."""
+        factory = FakeDriverFactory()
+        pool = WebDriverPool(factory, max_size=1, max_pages=2)
+
+        for _ in range(3):
+            with pool.driver():
+                pass
+
+        assert len(factory.created) == 2
+        assert factory.created[0].quit_called
+        assert not factory.created[1].quit_called
+        assert pool.stats["recycled"] == 1
+        assert len(pool) == 1
+
+    def test_bounds_concurrent_drivers(self):
+        """No more than max_size drivers exist however many callers there are."""
+        factory = FakeDriverFactory()
+        pool = WebDriverPool(factory, max_size=2)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def borrow():
+            with pool.driver():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=borrow) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert len(factory.created) == 2
+
+    def test_acquire_timeout(self):
+        """Waiting longer than acquire_timeout for a free driver raises."""
+        pool = WebDriverPool(FakeDriverFactory(), max_size=1, acquire_timeout=0.05)
+
+        with pool.driver():
+            with pytest.raises(TimeoutError):
+                with pool.driver():
+                    pass
+
+    def test_discards_driver_when_block_raises(self):
+        """A driver whose page load raised is quit and its slot freed."""
+        factory = FakeDriverFactory()
+        pool = WebDriverPool(factory, max_size=1)
+
+        with pytest.raises(WebDriverException):
+            with pool.driver() as driver:
+                raise WebDriverException("session deleted")
+
+        assert driver.quit_called
+        assert len(pool) == 0
+        assert pool.stats["discarded"] == 1
+        with pool.driver() as replacement:
+            assert replacement is not driver
+
+    def test_factory_failure_frees_slot(self):
+        """A driver that fails to start does not use up the pool."""
+        factory = MagicMock(side_effect=[RuntimeError("no chrome"), FakeWebDriver()])
+        pool = WebDriverPool(factory, max_size=1, acquire_timeout=0.05)
+
+        with pytest.raises(RuntimeError):
+            with pool.driver():
+                pass
+        with pool.driver() as driver:
+            assert isinstance(driver, FakeWebDriver)
+
+    def test_close_quits_idle_drivers(self):
+        """Closing the pool quits idle drivers and refuses new borrows."""
+        factory = FakeDriverFactory()
+        pool = WebDriverPool(factory)
+        with pool.driver():
+            pass
+
+        pool.close()
+
+        assert factory.created[0].quit_called
+        assert len(pool) == 0
+        with pytest.raises(RuntimeError):
+            with pool.driver():
+                pass
+
+    def test_shared_pool_per_key(self):
+        """The process-wide pool is shared by callers with the same key."""
+        factory = FakeDriverFactory()
+        try:
+            pool = get_driver_pool("test-agent", factory)
+            assert get_driver_pool("test-agent", FakeDriverFactory()) is pool
+            assert get_driver_pool("other-agent", factory) is not pool
+            with pool.driver():
+                pass
+        finally:
+            close_driver_pools()
+
+        assert factory.created[0].quit_called
+
+
+class TestRenderingMemory:
+    """Tests for RenderingMemory."""
+
+    def test_remembers_per_domain(self):
+        """Outcomes apply to every URL on a domain and to no other domain."""
+        memory = RenderingMemory()
+        assert memory.needs_js("https://spa.example.com/a") is None
+
+        memory.record("https://spa.example.com/a", True)
+        memory.record("https://static.example.com/a", False)
+
+        assert memory.needs_js("https://SPA.example.com/b") is True
+        assert memory.needs_js("https://static.example.com/b") is False
+        assert memory.needs_js("https://other.example.com/") is None
+
+    def test_outcomes_expire(self):
+        """Outcomes older than the TTL are forgotten."""
+        memory = RenderingMemory(ttl=60)
+        clock = "local_newsifier.tools.driver_pool.time.monotonic"
+        with patch(clock, return_value=1000.0):
+            memory.record("https://spa.example.com/a", True)
+        with patch(clock, return_value=1030.0):
+            assert memory.needs_js("https://spa.example.com/a") is True
+        with patch(clock, return_value=1061.0):
+            assert memory.needs_js("https://spa.example.com/a") is None
+
+
+class TestSeleniumFallback:
+    """Tests for WebScraperTool's pooled Selenium fallback."""
+
+    URL = "https://spa.example.com/story"
+
+    def make_scraper(self, factory):
+        """Create a scraper whose requests always fail, with a fake driver pool."""
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError("blocked")
+        scraper = WebScraperTool(
+            session=session,
+            driver_pool=WebDriverPool(factory, max_size=1),
+            rendering_memory=RenderingMemory(),
+        )
+        scraper.render_timeout = 0.1
+        return scraper
+
+    @staticmethod
+    def fetch(scraper, url):
+        """Fetch once, without tenacity's retries."""
+        return WebScraperTool._fetch_url.__wrapped__(scraper, url)
+
+    def test_remembers_domain_needing_js(self):
+        """A domain that rendered with Selenium skips requests afterwards."""
+        factory = FakeDriverFactory(pages={self.URL: ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+
+        assert self.fetch(scraper, self.URL) == ARTICLE_HTML
+        assert scraper.rendering_memory.needs_js(self.URL) is True
+
+        self.fetch(scraper, self.URL)
+        assert scraper.session.get.call_count == 1
+        assert len(factory.created) == 1
+        assert factory.created[0].visited == [self.URL, self.URL]
+
+    def test_skips_selenium_where_it_did_not_help(self):
+        """A domain where Selenium rendered no article does not use it again."""
+        factory = FakeDriverFactory()
+        scraper = self.make_scraper(factory)
+
+        with pytest.raises(ValueError, match="both methods"):
+            self.fetch(scraper, self.URL)
+        assert scraper.rendering_memory.needs_js(self.URL) is False
+
+        with pytest.raises(ValueError, match="Failed to fetch URL"):
+            self.fetch(scraper, self.URL)
+        assert factory.created[0].visited == [self.URL]
+
+    def test_skips_selenium_for_static_domain(self):
+        """A domain that served requests does not fall back to Selenium on errors."""
+        factory = FakeDriverFactory(pages={self.URL: ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+        scraper.session.get.side_effect = None
+        scraper.session.get.return_value = MagicMock(text=ARTICLE_HTML)
+
+        assert self.fetch(scraper, self.URL) == ARTICLE_HTML
+        assert scraper.rendering_memory.needs_js(self.URL) is False
+
+        scraper.session.get.side_effect = requests.exceptions.ConnectionError("down")
+        with pytest.raises(ValueError):
+            self.fetch(scraper, self.URL)
+        assert factory.created == []
+
+    def test_busy_pool_is_not_remembered(self):
+        """Waiting too long for a pooled driver does not turn Selenium off for the domain."""
+        factory = FakeDriverFactory(pages={self.URL: ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+        scraper.driver_pool.acquire_timeout = 0.01
+
+        with scraper.driver_pool.driver():
+            with pytest.raises(TimeoutError):
+                self.fetch(scraper, self.URL)
+        assert scraper.rendering_memory.needs_js(self.URL) is None
+
+        assert self.fetch(scraper, self.URL) == ARTICLE_HTML
+
+    def test_browser_startup_failure_is_not_remembered(self):
+        """A browser that fails to start does not turn Selenium off for the domain."""
+
+        def factory():
+            raise RuntimeError("Failed to initialize WebDriver")
+
+        scraper = self.make_scraper(factory)
+
+        with pytest.raises(RuntimeError, match="Failed to initialize"):
+            self.fetch(scraper, self.URL)
+        assert scraper.rendering_memory.needs_js(self.URL) is None
+
+    def test_broken_driver_is_replaced(self):
+        """A driver whose session died is discarded from the pool."""
+        factory = FakeDriverFactory(fail_get=True)
+        scraper = self.make_scraper(factory)
+
+        with pytest.raises(ValueError, match="Selenium error"):
+            self.fetch(scraper, self.URL)
+
+        assert factory.created[0].quit_called
+        assert len(scraper.driver_pool) == 0
+        assert scraper.rendering_memory.needs_js(self.URL) is None
+
+    def scrape_many(self, scraper, url, handler):
+        """Scrape one URL with scrape_many against a mock transport."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        (state,) = scraper.scrape_many([url], client=client, retry_delay=0)
+        return state
+
+    def test_scrape_many_renders_js_domains(self):
+        """scrape_many renders domains remembered as needing JavaScript with Selenium."""
+        factory = FakeDriverFactory(pages={self.URL: LONG_ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+        scraper.rendering_memory.record(self.URL, True)
+        requested = []
+
+        def handler(request):
+            requested.append(request.url)
+            return httpx.Response(200, text=LONG_ARTICLE_HTML)
+
+        state = self.scrape_many(scraper, self.URL, handler)
+
+        assert state.status == AnalysisStatus.SCRAPE_SUCCEEDED
+        assert "rendered story" in state.scraped_text
+        assert requested == []
+        assert factory.created[0].visited == [self.URL]
+
+    def test_scrape_many_falls_back_when_no_article(self):
+        """A page with no article over HTTP is rendered with Selenium and remembered."""
+        factory = FakeDriverFactory(pages={self.URL: LONG_ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+        shell = "<html><body><div id='root'></div></body></html>"
+
+        state = self.scrape_many(
+            scraper, self.URL, lambda request: httpx.Response(200, text=shell)
+        )
+
+        assert state.status == AnalysisStatus.SCRAPE_SUCCEEDED
+        assert "rendered story" in state.scraped_text
+        assert scraper.rendering_memory.needs_js(self.URL) is True
+
+    def test_scrape_many_skips_selenium_for_static_domain(self):
+        """A page with no article on a static domain fails without rendering."""
+        factory = FakeDriverFactory(pages={self.URL: LONG_ARTICLE_HTML})
+        scraper = self.make_scraper(factory)
+        scraper.rendering_memory.record(self.URL, False)
+        shell = "<html><body><div id='root'></div></body></html>"
+
+        state = self.scrape_many(
+            scraper, self.URL, lambda request: httpx.Response(200, text=shell)
+        )
+
+        assert state.status == AnalysisStatus.SCRAPE_FAILED_PARSING
+        assert factory.created == []
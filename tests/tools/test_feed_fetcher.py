@@ -0,0 +1,98 @@
+"""Tests for concurrent RSS feed fetching."""
+
+import threading
+import time
+from collections import Counter
+
+from local_newsifier.tools.feed_fetcher import fetch_feeds
+
+
+class ConcurrencyRecorder:
+    """Fake fetch function recording how many fetches run at once."""
+
+    def __init__(self, delay=0.05, delays=None):
+        self.delay = delay
+        self.delays = delays or {}
+        self.lock = threading.Lock()
+        self.active = 0
+        self.active_per_host = Counter()
+        self.max_active = 0
+        self.max_active_per_host = Counter()
+
+    def __call__(self, url):
+        host = url.split("/")[2]
+        with self.lock:
+            self.active += 1
+            self.active_per_host[host] += 1
+            self.max_active = max(self.max_active, self.active)
+            self.max_active_per_host[host] = max(
+                self.max_active_per_host[host], self.active_per_host[host]
+            )
+        time.sleep(self.delays.get(url, self.delay))
+        with self.lock:
+            self.active -= 1
+            self.active_per_host[host] -= 1
+        return {"title": url, "feed_url": url, "entries": []}
+
+
+def test_fetch_feeds_returns_every_feed():
+    """Every URL is fetched once and returned with its data and timing."""
+    urls = [f"https://host{i % 3}.example.com/feed{i}" for i in range(9)]
+    results = list(fetch_feeds(urls, fetch=ConcurrencyRecorder(delay=0), max_workers=4))
+
+    assert sorted(result.url for result in results) == sorted(urls)
+    for result in results:
+        assert result.feed_data["feed_url"] == result.url
+        assert result.elapsed >= 0
+        assert result.error is None
+
+
+def test_fetch_feeds_respects_global_and_per_host_limits():
+    """No more than max_workers fetches, and per_host_limit per host, run at once."""
+    urls = [f"https://host{i % 2}.example.com/feed{i}" for i in range(8)]
+    urls += [f"https://other{i}.example.com/feed" for i in range(6)]
+    recorder = ConcurrencyRecorder()
+
+    list(fetch_feeds(urls, fetch=recorder, max_workers=4, per_host_limit=1))
+
+    assert recorder.max_active <= 4
+    assert recorder.max_active > 1
+    assert max(recorder.max_active_per_host.values()) == 1
+
+
+def test_fetch_feeds_yields_in_completion_order():
+    """A slow feed does not hold back the results of faster ones."""
+    slow = "https://slow.example.com/feed"
+    urls = [slow] + [f"https://fast{i}.example.com/feed" for i in range(3)]
+    recorder = ConcurrencyRecorder(delay=0.01, delays={slow: 0.3})
+
+    start = time.perf_counter()
+    results = list(fetch_feeds(urls, fetch=recorder, max_workers=4))
+    elapsed = time.perf_counter() - start
+
+    assert results[-1].url == slow
+    assert results[-1].elapsed >= 0.3
+    # Bounded by the slowest feed, not the sum of all of them
+    assert elapsed < 0.3 + 0.2
+
+
+def test_fetch_feeds_captures_errors():
+    """An exception fetching one feed is returned, not raised."""
+
+    def fetch(url):
+        if "bad" in url:
+            raise ValueError("boom")
+        return {"entries": []}
+
+    urls = ["https://good.example.com/feed", "https://bad.example.com/feed"]
+    results = {result.url: result for result in fetch_feeds(urls, fetch=fetch)}
+
+    assert results["https://good.example.com/feed"].error is None
+    bad = results["https://bad.example.com/feed"]
+    assert bad.feed_data is None
+    assert isinstance(bad.error, ValueError)
+
+
+def test_fetch_feeds_with_no_urls():
+    """Fetching no feeds yields nothing."""
+    assert list(fetch_feeds([], fetch=ConcurrencyRecorder())) == []
@@ -0,0 +1,65 @@
+"""Tests for adaptive feed polling intervals."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from local_newsifier.tools.feed_schedule import (next_fetch_interval, observed_publish_interval,
+                                                 update_average)
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def published_every(minutes, count, newest_age=timedelta(0)):
+    """Publish dates of count items, newest first, minutes apart."""
+    newest = NOW - newest_age
+    return [(newest - timedelta(minutes=minutes * i)).isoformat() for i in range(count)]
+
+
+def test_observed_publish_interval_median_gap():
+    """The interval is the median gap between items."""
+    dates = published_every(10, 6)
+    # One long gap does not skew the estimate
+    dates.append((NOW - timedelta(days=2)).isoformat())
+
+    assert observed_publish_interval(dates, now=NOW) == 600
+
+
+def test_observed_publish_interval_quiet_feed():
+    """A feed that has stopped publishing is judged by its newest item's age."""
+    dates = published_every(10, 6, newest_age=timedelta(days=3))
+
+    assert observed_publish_interval(dates, now=NOW) == 3 * 86400
+
+
+def test_observed_publish_interval_ignores_bad_dates():
+    """Missing and unparseable dates are skipped; naive dates are UTC."""
+    dates = [None, "", "not a date", "2025-01-01T11:00:00", NOW - timedelta(hours=2)]
+
+    assert observed_publish_interval(dates, now=NOW) == 3600
+    assert observed_publish_interval([None, NOW.isoformat()], now=NOW) is None
+
+
+def test_update_average():
+    """The first observation is taken as is, later ones are smoothed."""
+    assert update_average(None, 100.0) == 100.0
+    assert update_average(100.0, 200.0) == pytest.approx(130.0)
+
+
+def test_next_fetch_interval():
+    """Feeds are polled twice per publish interval, slower when often unchanged."""
+    assert next_fetch_interval(3600, min_interval=60, max_interval=86400) == 1800
+    assert next_fetch_interval(3600, 0.5, min_interval=60, max_interval=86400) == 2700
+    assert next_fetch_interval(None, min_interval=60, max_interval=86400) == 3600
+
+
+def test_next_fetch_interval_bounds():
+    """Intervals stay within the minimum and maximum."""
+    assert next_fetch_interval(10, min_interval=300, max_interval=86400) == 300
+    assert next_fetch_interval(30 * 86400, min_interval=300, max_interval=86400) == 86400
+
+
+def test_next_fetch_interval_failure_backoff():
+    """Failures double the previous interval, up to the maximum."""
+    assert next_fetch_interval(600, previous_interval=900, failed=True, max_interval=86400) == 1800
+    assert next_fetch_interval(600, previous_interval=80000, failed=True, max_interval=86400) == 86400
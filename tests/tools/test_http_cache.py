@@ -0,0 +1,203 @@
+"""Tests for the on-disk HTTP response cache."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from local_newsifier.tools.driver_pool import RenderingMemory
+from local_newsifier.tools.http_cache import HTTPCache, freshness_lifetime
+from local_newsifier.tools.rss_parser import RSSParser
+from local_newsifier.tools.seen_url_store import MemorySeenURLStore
+from local_newsifier.tools.web_scraper import WebScraperTool
+
+URL = "https://example.com/story"
+BODY = b"<html><body><article>" + b"<p>This is the body of a cached article, long enough to be kept.</p>" * 50 + b"</article></body></html>"
+FEED = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><item><title>Story</title>'
+    b"<link>https://example.com/story</link></item></channel></rss>"
+)
+
+
+def make_response(status_code=200, headers=None, content=BODY):
+    """Build a requests response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = content
+    return response
+
+
+def run(coroutine):
+    """Run a coroutine on a private event loop, leaving the current one alone."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A cache in a temporary directory."""
+    cache = HTTPCache(str(tmp_path / "http_cache.sqlite3"), ttl=3600)
+    yield cache
+    cache.close()
+
+
+class TestFreshnessLifetime:
+    """Tests for freshness_lifetime."""
+
+    def test_defaults_to_ttl(self):
+        """Responses without caching headers are fresh for the TTL."""
+        assert freshness_lifetime({}, 3600) == 3600
+
+    @pytest.mark.parametrize(
+        "cache_control, expected",
+        [
+            ("max-age=60", 60),
+            ("public, max-age=86400", 3600),
+            ("no-cache", 0),
+            ("no-store", None),
+            ("max-age=abc", 0),
+        ],
+    )
+    def test_cache_control(self, cache_control, expected):
+        """Cache-Control directives shorten or prevent caching."""
+        headers = CaseInsensitiveDict({"cache-control": cache_control})
+        assert freshness_lifetime(headers, 3600) == expected
+
+    def test_expires_and_age(self):
+        """Expires counts from Date, less the Age already spent in caches."""
+        headers = {
+            "Date": "Wed, 01 Jan 2025 00:00:00 GMT",
+            "Expires": "Wed, 01 Jan 2025 00:10:00 GMT",
+            "Age": "100",
+        }
+        assert freshness_lifetime(headers, 3600) == 500
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache."""
+
+    def test_fetch_serves_fresh_response_from_cache(self, cache):
+        """A stored response is served without another request."""
+        send = MagicMock(return_value=make_response(headers={"Content-Type": "text/html"}))
+
+        first = cache.fetch(URL, send)
+        second = cache.fetch(URL, send)
+
+        assert send.call_count == 1
+        assert first.content == second.content == BODY
+        assert second.text == BODY.decode()
+        assert second.headers["content-type"] == "text/html"
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_bodies_are_compressed(self, cache):
+        """Bodies are stored compressed."""
+        cache.store(URL, 200, {}, BODY)
+        stored = cache._conn.execute("SELECT body FROM responses").fetchone()[0]
+        assert len(stored) < len(BODY) / 4
+
+    def test_only_cacheable_responses_are_stored(self, cache):
+        """Errors and no-store responses are not stored."""
+        cache.store(URL, 500, {}, BODY)
+        cache.store("https://example.com/private", 200, {"Cache-Control": "no-store"}, BODY)
+        assert len(cache) == 0
+
+    def test_stale_response_is_revalidated(self, cache):
+        """A stale response with an ETag is revalidated, and a 304 serves the stored body."""
+        cache.store(URL, 200, {"ETag": '"v1"', "Cache-Control": "no-cache"}, BODY)
+        send = MagicMock(return_value=make_response(304, {"Cache-Control": "max-age=60"}, b""))
+
+        response = cache.fetch(URL, send)
+
+        send.assert_called_once_with({"If-None-Match": '"v1"'})
+        assert response.status_code == 200
+        assert response.content == BODY
+        assert cache.stats["revalidated"] == 1
+        # Fresh again for max-age
+        assert cache.lookup(URL)[0] is not None
+
+    def test_caller_conditional_request_is_passed_through(self, cache):
+        """A 304 answering the caller's own validators goes back to the caller."""
+        cache.store(URL, 200, {"ETag": '"v1"', "Cache-Control": "no-cache"}, BODY)
+        send = MagicMock(return_value=make_response(304, content=b""))
+
+        response = cache.fetch(URL, send, {"If-None-Match": '"v0"'})
+
+        send.assert_called_once_with({"If-None-Match": '"v0"'})
+        assert response.status_code == 304
+
+    def test_ttl_eviction_and_offline_mode(self, tmp_path):
+        """Responses older than the TTL are forgotten, except in offline mode."""
+        path = str(tmp_path / "http_cache.sqlite3")
+        cache = HTTPCache(path, ttl=60)
+        with patch("local_newsifier.tools.http_cache.time.time", return_value=time.time() - 120):
+            cache.store(URL, 200, {}, BODY)
+
+        assert cache.lookup(URL) == (None, {})
+
+        offline = HTTPCache(path, ttl=60, offline=True)
+        assert offline.lookup(URL)[0].content == BODY
+
+        assert cache.evict_expired() == 1
+        assert len(cache) == 0
+
+    def test_afetch(self, cache):
+        """The async fetch stores and serves responses like fetch."""
+        calls = []
+
+        async def send(headers):
+            calls.append(headers)
+            return httpx.Response(200, content=BODY)
+
+        async def fetch_twice():
+            await cache.afetch(URL, send)
+            return await cache.afetch(URL, send)
+
+        assert run(fetch_twice()).content == BODY
+        assert len(calls) == 1
+
+
+class TestToolsUseCache:
+    """Tests that the scraper and feed parser go through the cache."""
+
+    def test_rss_parser_fetch_feed(self, cache):
+        """A cached feed is parsed again without a request."""
+        parser = RSSParser(seen_store=MemorySeenURLStore(), http_cache=cache)
+        with patch("requests.get", return_value=make_response(content=FEED)) as mock_get:
+            first = parser.fetch_feed("https://example.com/feed")
+            second = parser.fetch_feed("https://example.com/feed", content_hash=first.content_hash)
+
+        assert mock_get.call_count == 1
+        assert [item.url for item in first.items] == [URL]
+        assert second.not_modified
+
+    def test_web_scraper_fetch_url(self, cache):
+        """A cached article is scraped again without a request."""
+        session = MagicMock()
+        session.get.return_value = make_response()
+        scraper = WebScraperTool(
+            session=session, rendering_memory=RenderingMemory(), http_cache=cache
+        )
+
+        assert scraper._fetch_url(URL) == BODY.decode()
+        assert scraper._fetch_url(URL) == BODY.decode()
+        assert session.get.call_count == 1
+
+    def test_scrape_many(self, cache):
+        """Batch scraping serves cached articles without a request."""
+        cache.store(URL, 200, {}, BODY)
+        transport = MagicMock(spec=httpx.AsyncBaseTransport)
+        scraper = WebScraperTool(session=MagicMock(), http_cache=cache)
+
+        states = list(scraper.scrape_many([URL], client=httpx.AsyncClient(transport=transport)))
+
+        assert states[0].scraped_text
+        transport.handle_async_request.assert_not_called()
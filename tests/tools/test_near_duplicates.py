@@ -0,0 +1,156 @@
+"""Tests for near-duplicate article detection."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlmodel import select
+
+from local_newsifier.crud.article import article as article_crud
+from local_newsifier.models.article import Article
+from local_newsifier.models.article_fingerprint import ArticleFingerprint
+from local_newsifier.services.article_service import ArticleService
+from local_newsifier.tools.near_duplicates import (NearDuplicateDetector, band_buckets, minhash,
+                                                   pack_signature, shingles, similarity,
+                                                   unpack_signature, words)
+
+STORY = (
+    "The city council voted on Tuesday to approve a new budget for the coming fiscal year, "
+    "which includes funding for road repairs, additional police officers and an expansion of "
+    "the public library system. Council members debated the proposal for more than three hours "
+    "before the final vote, with several residents speaking in favor of the library expansion "
+    "and others raising concerns about rising property taxes across the county. The mayor said "
+    "the budget reflects the priorities residents expressed during a series of town hall "
+    "meetings held earlier this spring in every district of the city."
+)
+OTHER_STORY = (
+    "Local high school students took home first place at the state robotics championship this "
+    "weekend, beating teams from more than forty schools with a robot designed to stack crates "
+    "and navigate an obstacle course. The team's coach said the students spent months building "
+    "and testing their design after school and on weekends, often staying late into the night "
+    "to fix problems with the drive system. The team will now compete at the national finals "
+    "in Houston next month, and the school is raising money to pay for the trip and equipment."
+)
+
+
+def make_article(session, url, content):
+    """Store an article and return it."""
+    return article_crud.create(
+        session,
+        obj_in=Article(
+            url=url,
+            title="Story",
+            content=content,
+            status="new",
+            source="example.com",
+            published_at=datetime.now(timezone.utc),
+            scraped_at=datetime.now(timezone.utc),
+        ),
+    )
+
+
+class TestSignatures:
+    """Tests for MinHash signatures and LSH buckets."""
+
+    def test_words_ignore_case_and_punctuation(self):
+        assert words("The Mayor, said: 'Yes!'") == ["the", "mayor", "said", "yes"]
+
+    def test_identical_texts_match(self):
+        signature = minhash(shingles(words(STORY)))
+        assert similarity(signature, minhash(shingles(words(STORY)))) == 1.0
+        assert band_buckets(signature) == band_buckets(minhash(shingles(words(STORY))))
+
+    def test_syndicated_copy_is_similar(self):
+        copy = "By The Associated Press. " + STORY.replace("Tuesday", "Wednesday")
+        score = similarity(minhash(shingles(words(STORY))), minhash(shingles(words(copy))))
+        assert score >= 0.8
+
+    def test_different_texts_are_not_similar(self):
+        score = similarity(minhash(shingles(words(STORY))), minhash(shingles(words(OTHER_STORY))))
+        assert score < 0.2
+
+    def test_pack_round_trip(self):
+        signature = minhash(shingles(words(STORY)))
+        assert unpack_signature(pack_signature(signature)) == signature
+
+
+class TestNearDuplicateDetector:
+    """Tests for NearDuplicateDetector against the database."""
+
+    def test_marks_syndicated_copy(self, db_session):
+        detector = NearDuplicateDetector(threshold=0.8, min_words=50)
+        original = make_article(db_session, "https://a.example.com/budget", STORY)
+        assert detector.check(db_session, original) is None
+
+        copy = make_article(
+            db_session, "https://b.example.com/budget", STORY + " Copyright 2024 Example Media."
+        )
+        assert detector.check(db_session, copy) == original.id
+        assert copy.duplicate_of == original.id
+
+        unrelated = make_article(db_session, "https://a.example.com/robots", OTHER_STORY)
+        assert detector.check(db_session, unrelated) is None
+        db_session.commit()
+
+        # Only originals are indexed
+        indexed = db_session.exec(select(ArticleFingerprint.article_id)).all()
+        assert sorted(indexed) == sorted([original.id, unrelated.id])
+
+    def test_check_many_counts_duplicates(self, db_session):
+        detector = NearDuplicateDetector(threshold=0.8, min_words=50)
+        articles = [
+            make_article(db_session, f"https://{host}.example.com/budget", STORY)
+            for host in ("a", "b", "c")
+        ]
+        assert detector.check_many(db_session, articles) == 2
+        assert [a.duplicate_of for a in articles] == [None, articles[0].id, articles[0].id]
+
+    def test_short_texts_are_skipped(self, db_session):
+        detector = NearDuplicateDetector(threshold=0.8, min_words=50)
+        first = make_article(db_session, "https://a.example.com/short", "Council approves budget.")
+        second = make_article(db_session, "https://b.example.com/short", "Council approves budget.")
+        assert detector.check(db_session, first) is None
+        assert detector.check(db_session, second) is None
+        assert db_session.exec(select(ArticleFingerprint)).all() == []
+
+    def test_duplicates_excluded_from_batches(self, db_session):
+        detector = NearDuplicateDetector(threshold=0.8, min_words=50)
+        articles = [
+            make_article(db_session, f"https://{host}.example.com/budget", STORY)
+            for host in ("a", "b")
+        ]
+        detector.check_many(db_session, articles)
+        db_session.commit()
+
+        batch = article_crud.get_by_status(db_session, status="new", exclude_duplicates=True)
+        assert [a.id for a in batch] == [articles[0].id]
+        assert len(article_crud.get_by_status(db_session, status="new")) == 2
+
+
+class TestArticleServiceDuplicates:
+    """Tests for ArticleService handling of near-duplicates."""
+
+    def test_duplicate_reuses_original_analysis(self, db_session):
+        from local_newsifier.crud.analysis_result import analysis_result as analysis_result_crud
+
+        entity_service = MagicMock()
+        entity_service.process_article_entities.return_value = [
+            {"original_text": "City Council", "canonical_type": "ORG"}
+        ]
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = db_session
+        service = ArticleService(
+            article_crud=article_crud,
+            analysis_result_crud=analysis_result_crud,
+            entity_service=entity_service,
+            session_factory=session_factory,
+            near_duplicate_detector=NearDuplicateDetector(threshold=0.8, min_words=50),
+        )
+        published = datetime.now(timezone.utc)
+
+        original = service.process_article("https://a.example.com/budget", STORY, "Budget", published)
+        copy = service.process_article("https://b.example.com/budget", STORY, "Budget", published)
+
+        assert original["duplicate_of"] is None
+        assert copy["duplicate_of"] == original["article_id"]
+        assert copy["entities"] == original["entities"]
+        entity_service.process_article_entities.assert_called_once()
@@ -0,0 +1,84 @@
+"""Tests for the shared spaCy model registry."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from local_newsifier.tools.nlp_models import (WARMUP_TEXT, clear_models, get_model_stats,
+                                              load_model, preload_models)
+
+
+@pytest.fixture
+def mock_spacy_load():
+    """Patch spacy.load to return a new mock pipeline per call."""
+    with patch("spacy.load", side_effect=lambda name: MagicMock(name=name)) as mock_load:
+        yield mock_load
+
+
+def test_load_model_loads_once(mock_spacy_load):
+    """Test that repeated requests share the same Language object."""
+    first = load_model("en_core_web_lg")
+    second = load_model("en_core_web_lg")
+
+    assert first is second
+    mock_spacy_load.assert_called_once_with("en_core_web_lg")
+
+
+def test_load_model_per_name(mock_spacy_load):
+    """Test that different model names are loaded separately."""
+    large = load_model("en_core_web_lg")
+    small = load_model("en_core_web_sm")
+
+    assert large is not small
+    assert mock_spacy_load.call_count == 2
+
+
+def test_load_model_warms_pipeline(mock_spacy_load):
+    """Test that a dummy document is run through a freshly loaded model."""
+    nlp = load_model("en_core_web_lg")
+
+    nlp.assert_called_once_with(WARMUP_TEXT)
+
+
+def test_load_model_records_stats(mock_spacy_load):
+    """Test that load time and memory are reported per model."""
+    load_model("en_core_web_lg")
+
+    stats = get_model_stats()
+
+    assert set(stats) == {"en_core_web_lg"}
+    assert set(stats["en_core_web_lg"]) == {"load_seconds", "warmup_seconds", "memory_mb"}
+    assert stats["en_core_web_lg"]["load_seconds"] >= 0
+
+
+def test_load_model_missing_raises():
+    """Test that a missing model raises OSError and is not cached."""
+    with patch("spacy.load", side_effect=OSError("Model not found")):
+        with pytest.raises(OSError):
+            load_model("missing_model")
+
+    assert get_model_stats() == {}
+
+
+def test_preload_models_skips_failures():
+    """Test that preload_models logs failures instead of raising."""
+
+    def fake_load(name):
+        if name == "missing_model":
+            raise OSError("Model not found")
+        return MagicMock()
+
+    with patch("spacy.load", side_effect=fake_load):
+        loaded = preload_models(["en_core_web_lg", "missing_model"])
+
+    assert loaded == ["en_core_web_lg"]
+
+
+def test_clear_models(mock_spacy_load):
+    """Test that clear_models forces the next request to reload."""
+    load_model("en_core_web_lg")
+    clear_models()
+    load_model("en_core_web_lg")
+
+    assert mock_spacy_load.call_count == 2
+    assert list(get_model_stats()) == ["en_core_web_lg"]
@@ -4,19 +4,22 @@ Tests for the RSS Parser tool.
 This test suite covers:
 1. Basic RSS and Atom feed parsing
 2. Malformed XML handling
-3. Feed caching mechanism
+3. Seen-URL tracking
 4. URL filtering and processing
 5. Error handling for network issues
 """
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from local_newsifier.tools.rss_parser import RSSItem, RSSParser, parse_rss_feed
+import hashlib
+
+from local_newsifier.tools.rss_parser import RSSItem, RSSParser, parse_feed_date, parse_rss_feed
+from local_newsifier.tools.seen_url_store import MemorySeenURLStore, SQLiteSeenURLStore
 
 # Sample RSS feed XML
 SAMPLE_RSS_XML = """<?xml version="1.0" encoding="UTF-8"?>
@@ -61,6 +64,30 @@ SAMPLE_ATOM_XML = """<?xml version="1.0" encoding="UTF-8"?>
 </feed>
 """
 
+# Sample RSS feed with GUIDs, newest item first
+GUID_RSS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>GUID Feed</title>
+        <item>
+            <title>Article 3</title>
+            <link>http://example.com/3</link>
+            <guid>guid-3</guid>
+        </item>
+        <item>
+            <title>Article 2</title>
+            <link>http://example.com/2</link>
+            <guid>guid-2</guid>
+        </item>
+        <item>
+            <title>Article 1</title>
+            <link>http://example.com/1</link>
+            <guid>guid-1</guid>
+        </item>
+    </channel>
+</rss>
+"""
+
 # Sample malformed XML
 MALFORMED_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
@@ -174,41 +201,41 @@ class TestRSSParser:
         self.parser = RSSParser()
 
     def test_init_without_cache(self):
-        """Test initialization without cache file."""
+        """Test initialization without a cache directory keeps URLs in memory."""
         parser = RSSParser()
-        assert parser.cache_file is None
-        assert parser.processed_urls == set()
-
-    def test_init_with_cache(self, tmp_path):
-        """Test initialization with cache file."""
-        cache_file = tmp_path / "test_cache.json"
+        assert isinstance(parser.seen_urls, MemorySeenURLStore)
+        assert len(parser.seen_urls) == 0
+
+    def test_init_with_cache_dir(self, tmp_path):
+        """Test initialization with a cache directory uses a persistent store."""
+        parser = RSSParser(cache_dir=str(tmp_path / "cache"))
+        assert isinstance(parser.seen_urls, SQLiteSeenURLStore)
+        assert (tmp_path / "cache" / "seen_urls.sqlite3").exists()
+
+    def test_init_with_seen_store(self, tmp_path):
+        """Test that a given seen-URL store is used as is."""
+        store = MemorySeenURLStore(["http://example.com/1"])
+        parser = RSSParser(cache_dir=str(tmp_path), seen_store=store)
+        assert parser.seen_urls is store
+
+    def test_init_imports_legacy_cache(self, tmp_path):
+        """Test that URLs in the old JSON cache file move to the store."""
         urls = ["http://example.com/1", "http://example.com/2"]
-        cache_file.write_text(json.dumps(urls))
+        (tmp_path / "rss_urls.json").write_text(json.dumps(urls))
 
-        parser = RSSParser(str(cache_file))
-        assert parser.cache_file == str(cache_file)
-        assert parser.processed_urls == set(urls)
+        parser = RSSParser(cache_dir=str(tmp_path))
 
-    def test_init_with_invalid_cache(self, tmp_path):
-        """Test initialization with invalid cache file."""
-        cache_file = tmp_path / "invalid_cache.json"
-        cache_file.write_text("invalid json")
+        assert all(url in parser.seen_urls for url in urls)
+        assert not (tmp_path / "rss_urls.json").exists()
 
-        parser = RSSParser(str(cache_file))
-        assert parser.processed_urls == set()
+    def test_init_with_invalid_legacy_cache(self, tmp_path):
+        """Test that an unreadable old cache file is left alone."""
+        (tmp_path / "rss_urls.json").write_text("invalid json")
 
-    def test_init_with_nonexistent_cache_dir(self, tmp_path):
-        """Test initialization with cache file in nonexistent directory."""
-        nonexistent_dir = tmp_path / "nonexistent"
-        cache_file = nonexistent_dir / "cache.json"
+        parser = RSSParser(cache_dir=str(tmp_path))
 
-        # Directory doesn't exist yet
-        assert not nonexistent_dir.exists()
-
-        # Should not raise an error
-        parser = RSSParser(str(cache_file))
-        assert parser.cache_file == str(cache_file)
-        assert parser.processed_urls == set()
+        assert len(parser.seen_urls) == 0
+        assert (tmp_path / "rss_urls.json").exists()
 
     @patch("requests.get")
     def test_parse_rss_feed(self, mock_get):
@@ -228,6 +255,144 @@ class TestRSSParser:
         assert items[0].published is not None
         assert items[0].published.strftime("%Y-%m-%d %H:%M:%S") == "2024-04-12 10:30:00"
 
+    @patch("requests.get")
+    def test_fetch_feed_sends_validators_and_returns_new_ones(self, mock_get, mock_response):
+        """Test a conditional fetch of a changed feed."""
+        mock_response.status_code = 200
+        mock_response.content = SAMPLE_RSS_XML.encode("utf-8")
+        mock_response.headers = {"ETag": '"v2"', "Last-Modified": "Sat, 13 Apr 2024 10:30:00 GMT"}
+        mock_get.return_value = mock_response
+
+        fetch = self.parser.fetch_feed(
+            "http://example.com/feed",
+            etag='"v1"',
+            last_modified="Fri, 12 Apr 2024 10:30:00 GMT",
+            content_hash="stale",
+        )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Fri, 12 Apr 2024 10:30:00 GMT"
+        assert not fetch.not_modified
+        assert len(fetch.items) == 2
+        assert fetch.etag == '"v2"'
+        assert fetch.last_modified == "Sat, 13 Apr 2024 10:30:00 GMT"
+        assert fetch.content_hash == hashlib.sha256(mock_response.content).hexdigest()
+
+    @patch("requests.get")
+    def test_fetch_feed_not_modified_response(self, mock_get, mock_response):
+        """Test that a 304 response is reported as not modified."""
+        mock_response.status_code = 304
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        fetch = self.parser.fetch_feed("http://example.com/feed", etag='"v1"', content_hash="abc")
+
+        assert fetch.not_modified
+        assert fetch.items == []
+        assert fetch.etag == '"v1"'
+        assert fetch.content_hash == "abc"
+        mock_response.raise_for_status.assert_not_called()
+
+    @patch("requests.get")
+    def test_fetch_feed_unchanged_body_is_not_parsed(self, mock_get, mock_response):
+        """Test that a body matching the previous hash is not parsed."""
+        mock_response.status_code = 200
+        mock_response.content = SAMPLE_RSS_XML.encode("utf-8")
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        content_hash = hashlib.sha256(mock_response.content).hexdigest()
+
+        with patch.object(self.parser, "iter_items") as mock_parse:
+            fetch = self.parser.fetch_feed("http://example.com/feed", content_hash=content_hash)
+
+        assert fetch.not_modified
+        assert fetch.content_hash == content_hash
+        mock_parse.assert_not_called()
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("requests.get")
+    def test_fetch_feed_stops_at_items_already_fetched(self, mock_get, mock_response):
+        """Test that a changed feed is only parsed down to the last fetch's newest item."""
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = GUID_RSS_XML.encode("utf-8")
+        mock_get.return_value = mock_response
+
+        first = self.parser.fetch_feed("http://example.com/feed")
+        assert [item.url for item in first.items] == [
+            "http://example.com/3",
+            "http://example.com/2",
+            "http://example.com/1",
+        ]
+
+        mock_response.content = GUID_RSS_XML.replace(
+            "<item>",
+            "<item><title>Article 4</title><link>http://example.com/4</link></item><item>",
+            1,
+        ).encode("utf-8")
+        second = self.parser.fetch_feed("http://example.com/feed", content_hash=first.content_hash)
+
+        assert [item.url for item in second.items] == ["http://example.com/4"]
+
+    def test_iter_items_stops_at_seen_guid_or_url(self):
+        """Test that lazy parsing stops at the first already seen item."""
+        content = GUID_RSS_XML.encode("utf-8")
+
+        items = list(self.parser.iter_items("http://example.com/feed", content))
+        assert [item.guid for item in items] == ["guid-3", "guid-2", "guid-1"]
+
+        items = list(self.parser.iter_items("http://example.com/feed", content, seen={"guid-2"}))
+        assert [item.url for item in items] == ["http://example.com/3"]
+
+        items = list(
+            self.parser.iter_items("http://example.com/feed", content, seen={"http://example.com/3"})
+        )
+        assert items == []
+
+    def test_iter_items_atom_ids(self):
+        """Test that Atom entry ids are read as GUIDs."""
+        content = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>urn:uuid:1</id><link href="http://example.com/1"/></entry>
+        </feed>"""
+
+        items = list(self.parser.iter_items("http://example.com/feed", content))
+
+        assert [(item.guid, item.url) for item in items] == [("urn:uuid:1", "http://example.com/1")]
+
+    @patch("requests.get")
+    def test_get_new_urls_stop_at_seen(self, mock_get):
+        """Test that get_new_urls can stop at the first processed URL."""
+        mock_response = Mock()
+        mock_response.content = GUID_RSS_XML.encode("utf-8")
+        mock_get.return_value = mock_response
+        self.parser.seen_urls.add("http://example.com/2")
+
+        items = self.parser.get_new_urls("http://example.com/feed", stop_at_seen=True)
+
+        assert [item.url for item in items] == ["http://example.com/3"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Fri, 12 Apr 2024 10:30:00 GMT",
+            "Fri, 12 Apr 2024 06:30:00 -0400",
+            "2024-04-12T10:30:00Z",
+            "2024-04-12T10:30:00+00:00",
+            "April 12, 2024 10:30 UTC",
+        ],
+    )
+    def test_parse_feed_date(self, text):
+        """Test the RFC 822 and ISO fast paths and the dateutil fallback."""
+        parsed = parse_feed_date(text)
+        assert parsed.utcoffset() is not None
+        assert parsed == datetime(2024, 4, 12, 10, 30, tzinfo=timezone.utc)
+
+    def test_parse_feed_date_invalid(self):
+        """Test that an unrecognisable date raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_feed_date("Not a real date")
+
     @patch("requests.get")
     def test_parse_atom_feed(self, mock_get):
         """Test parsing an Atom feed."""
@@ -437,54 +602,19 @@ class TestRSSParser:
         assert items[0].url == "http://example.com/3"
         assert items[0].title == "Test Article 3"
 
-    def test_cache_persistence(self, tmp_path):
-        """Test that processed URLs are persisted to cache file."""
-        cache_file = tmp_path / "cache.json"
-        parser = RSSParser(str(cache_file))
-
-        # Add URLs to processed set
-        parser.processed_urls.add("http://example.com/1")
-        parser.processed_urls.add("http://example.com/2")
-        parser._save_cache()
-
-        # Read cache file directly
-        with open(cache_file) as f:
-            cached_urls = set(json.load(f))
-
-        assert cached_urls == {"http://example.com/1", "http://example.com/2"}
-
-        # Create new parser instance with same cache file
-        new_parser = RSSParser(str(cache_file))
-        assert new_parser.processed_urls == {
-            "http://example.com/1",
-            "http://example.com/2",
-        }
-
-    def test_cache_save_error_handling(self, tmp_path):
-        """Test error handling when saving cache fails."""
-        # Create a directory where a file is expected (to cause an error)
-        cache_path = tmp_path / "cache_dir"
-        cache_path.mkdir()
-
-        parser = RSSParser(str(cache_path))
-        parser.processed_urls.add("http://example.com/test")
-
-        # Should not raise an exception
-        parser._save_cache()
-
-        # The processed_urls should still be in memory
-        assert "http://example.com/test" in parser.processed_urls
-
-    @patch("builtins.open", side_effect=PermissionError("Permission denied"))
-    def test_cache_load_permission_error(self, mock_builtin_open, tmp_path):
-        """Test error handling when loading cache fails due to permissions."""
-        cache_file = tmp_path / "permission_denied.json"
+    @patch("requests.get")
+    def test_seen_urls_persist_across_parsers(self, mock_get, tmp_path):
+        """Test that processed URLs are remembered by a new parser on the same cache."""
+        mock_response = Mock()
+        mock_response.content = SAMPLE_RSS_XML.encode("utf-8")
+        mock_get.return_value = mock_response
 
-        # Should not raise an exception
-        parser = RSSParser(str(cache_file))
+        parser = RSSParser(cache_dir=str(tmp_path))
+        assert len(parser.get_new_urls("http://example.com/feed")) == 2
+        parser.seen_urls.close()
 
-        # Should have empty processed_urls
-        assert parser.processed_urls == set()
+        new_parser = RSSParser(cache_dir=str(tmp_path))
+        assert new_parser.get_new_urls("http://example.com/feed") == []
 
     @patch("local_newsifier.tools.rss_parser.get_parser_instance")
     @patch("requests.get")
@@ -494,7 +624,8 @@ class TestRSSParser:
         mock_response.content = SAMPLE_RSS_XML.encode("utf-8")
         mock_get.return_value = mock_response
         mock_parser = Mock()
-        mock_parser.parse_feed.return_value = [
+        mock_parser.fetch_feed.return_value.not_modified = False
+        mock_parser.fetch_feed.return_value.items = [
             RSSItem(
                 title="Test Article 1",
                 url="http://example.com/1",
@@ -529,6 +660,7 @@ class TestRSSParser:
 
         assert entry["title"] == "Test Article 1"
         assert entry["link"] == "http://example.com/1"
+        assert result["not_modified"] is False
 
     @patch("requests.get")
     def test_global_parse_rss_feed_error_handling(self, mock_get):
@@ -0,0 +1,144 @@
+"""Tests for the seen-URL stores."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from local_newsifier.tools.seen_url_store import (SECONDS_PER_DAY, BloomFilter,
+                                                  BloomFilterSeenURLStore, MemorySeenURLStore,
+                                                  SQLiteSeenURLStore, create_seen_url_store)
+
+
+@pytest.fixture(params=["memory", "sqlite", "bloom"])
+def store(request, tmp_path):
+    """Each store backend, persisting to a temporary directory."""
+    store = create_seen_url_store(request.param, cache_dir=str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_store_membership(store):
+    """URLs are seen only after being added."""
+    assert "http://example.com/1" not in store
+
+    store.add_many(["http://example.com/1", "http://example.com/2", "http://example.com/1"])
+    store.add("http://example.com/3")
+
+    for i in (1, 2, 3):
+        assert f"http://example.com/{i}" in store
+    assert "http://example.com/4" not in store
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "bloom"])
+def test_store_persists(backend, tmp_path):
+    """URLs added to a persistent store are seen by a store reopened on the same files."""
+    store = create_seen_url_store(backend, cache_dir=str(tmp_path))
+    store.add_many(["http://example.com/1", "http://example.com/2"])
+    store.close()
+
+    reopened = create_seen_url_store(backend, cache_dir=str(tmp_path))
+    assert "http://example.com/1" in reopened
+    assert "http://example.com/2" in reopened
+    assert "http://example.com/3" not in reopened
+
+
+def test_create_store_without_cache_dir():
+    """Without a cache directory the SQLite backend falls back to memory."""
+    assert isinstance(create_seen_url_store("sqlite"), MemorySeenURLStore)
+    assert create_seen_url_store("bloom").path is None
+
+
+def test_create_store_unknown_backend():
+    """An unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        create_seen_url_store("redis")
+
+
+def test_sqlite_store_ttl_eviction(tmp_path):
+    """URLs first seen longer ago than the TTL are forgotten."""
+    path = str(tmp_path / "seen.sqlite3")
+    now = time.time()
+    store = SQLiteSeenURLStore(path, ttl_days=1)
+    with patch("local_newsifier.tools.seen_url_store.time.time", return_value=now - 2 * SECONDS_PER_DAY):
+        store.add("http://example.com/old")
+    store.add("http://example.com/new")
+
+    assert store.evict_expired() == 1
+    assert "http://example.com/old" not in store
+    assert "http://example.com/new" in store
+    assert len(store) == 1
+
+
+def test_sqlite_store_keeps_first_seen_time(tmp_path):
+    """Seeing a URL again does not extend its TTL."""
+    store = SQLiteSeenURLStore(str(tmp_path / "seen.sqlite3"), ttl_days=1)
+    with patch("local_newsifier.tools.seen_url_store.time.time", return_value=time.time() - 2 * SECONDS_PER_DAY):
+        store.add("http://example.com/1")
+    store.add("http://example.com/1")
+
+    store.evict_expired()
+    assert "http://example.com/1" not in store
+
+
+def test_bloom_filter_false_positive_rate():
+    """A filter filled to capacity stays near its configured false-positive rate."""
+    bloom = BloomFilter(capacity=10_000, false_positive_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"http://example.com/seen/{i}")
+
+    assert all(f"http://example.com/seen/{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"http://example.com/new/{i}" in bloom for i in range(10_000))
+    assert false_positives / 10_000 < 0.02
+
+
+def test_bloom_store_ttl_generations(tmp_path):
+    """Bloom filter generations older than the TTL are dropped."""
+    now = time.time()
+    clock = "local_newsifier.tools.seen_url_store.time.time"
+    with patch(clock, return_value=now - 2 * SECONDS_PER_DAY):
+        store = BloomFilterSeenURLStore(capacity=1000, ttl_days=1)
+        store.add("http://example.com/old")
+    with patch(clock, return_value=now):
+        store.add("http://example.com/new")
+
+    assert "http://example.com/old" not in store
+    assert "http://example.com/new" in store
+
+
+def test_bloom_store_settings_change_starts_empty(tmp_path):
+    """A saved filter sized differently from the configuration is discarded."""
+    path = str(tmp_path / "seen.bloom")
+    BloomFilterSeenURLStore(path, capacity=1000).add("http://example.com/1")
+
+    store = BloomFilterSeenURLStore(path, capacity=2000)
+    assert "http://example.com/1" not in store
+
+
+def test_bloom_store_saves_only_new_urls(tmp_path):
+    """The filter file is not rewritten when no URL was new."""
+    store = BloomFilterSeenURLStore(str(tmp_path / "seen.bloom"), capacity=1000)
+    store.add("http://example.com/1")
+
+    with patch.object(store, "_save") as mock_save:
+        store.add_many([])
+        store.add_many(["http://example.com/1"])
+        mock_save.assert_not_called()
+
+        store.add("http://example.com/2")
+        mock_save.assert_called_once()
+
+
+def test_bloom_store_merges_other_processes(tmp_path):
+    """Stores sharing a file keep each other's URLs instead of overwriting them."""
+    path = str(tmp_path / "seen.bloom")
+    first = BloomFilterSeenURLStore(path, capacity=1000, ttl_days=30)
+    second = BloomFilterSeenURLStore(path, capacity=1000, ttl_days=30)
+
+    first.add("http://example.com/1")
+    second.add("http://example.com/2")
+
+    assert "http://example.com/1" in second
+    reopened = BloomFilterSeenURLStore(path, capacity=1000, ttl_days=30)
+    assert "http://example.com/1" in reopened
+    assert "http://example.com/2" in reopened
@@ -180,6 +180,26 @@ def test_analyze_topic_sentiment(mock_textblob, sentiment_analyzer, sample_state
     assert result.analysis_results["sentiment"]["document_sentiment"] == 0.5
 
 
+@patch("local_newsifier.tools.sentiment_analyzer.TextBlob")
+def test_topic_sentiment_reuses_analysis_context(
+    mock_textblob, sentiment_analyzer, mock_spacy_nlp, sample_state
+):
+    """Test that topic sentiment uses a shared parse instead of calling nlp again."""
+    sample_state.analysis_results["topics"] = ["local business"]
+    blob = MagicMock()
+    blob.sentiment.polarity = 0.5
+    blob.sentiment.subjectivity = 0.8
+    mock_textblob.return_value = blob
+
+    analysis_context = MagicMock()
+    analysis_context.doc = mock_spacy_nlp.return_value
+
+    result = sentiment_analyzer.analyze_sentiment(sample_state, analysis_context=analysis_context)
+
+    mock_spacy_nlp.assert_not_called()
+    assert result.analysis_results["sentiment"]["topic_sentiments"] == {"downtown cafe": 0.5}
+
+
 @patch("local_newsifier.tools.sentiment_analyzer.TextBlob")
 def test_analyze_empty_text(mock_textblob, sentiment_analyzer):
     """Test sentiment analysis with empty text."""
@@ -7,11 +7,15 @@ This test suite covers:
 3. Paywall detection and handling
 4. Extraction from dynamic content
 5. Injectable dependency usage and provider functions
+6. Concurrent scraping with scrape_many
 """
 
+import asyncio
 import time
+from collections import Counter
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 import requests
 from requests.exceptions import HTTPError, RequestException
@@ -23,6 +27,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from local_newsifier.di.providers import get_web_scraper_tool
 from local_newsifier.models.state import AnalysisStatus, NewsAnalysisState
+from local_newsifier.tools.driver_pool import RenderingMemory
 # Import the class for tests
 from local_newsifier.tools.web_scraper import WebScraperTool as WebScraperToolClass
 
@@ -289,7 +294,10 @@ class TestWebScraper:
 
             # Create scraper with injectable dependencies
             self.scraper = WebScraperToolClass(
-                session=mock_session, web_driver=mock_webdriver, user_agent="Test User Agent"
+                session=mock_session,
+                web_driver=mock_webdriver,
+                user_agent="Test User Agent",
+                rendering_memory=RenderingMemory(),
             )
 
     def test_extract_article(self, sample_html):
@@ -778,10 +786,14 @@ class TestWebScraper:
         mock_session.get.return_value = mock_response
 
         mock_driver.page_source = "<html><body><p>Injected driver content</p></body></html>"
+        mock_driver.execute_script.return_value = "complete"
 
         # Create scraper with injected dependencies
         scraper = WebScraperToolClass(
-            session=mock_session, web_driver=mock_driver, user_agent="Injectable Test Agent"
+            session=mock_session,
+            web_driver=mock_driver,
+            user_agent="Injectable Test Agent",
+            rendering_memory=RenderingMemory(),
         )
 
         # Test that injected session is used
@@ -824,3 +836,183 @@ class TestWebScraper:
         except Exception:
             # If the test still fails, we can skip it for now
             pytest.skip("Still having issues with event loop or injection")
+
+
+ARTICLE_HTML = (
+    "<html><head><title>Article</title></head><body><article>"
+    "<p>This is the body of a scraped article, long enough to be kept.</p>"
+    "</article></body></html>"
+)
+
+
+class ConcurrencyRecordingTransport(httpx.AsyncBaseTransport):
+    """Mock transport recording how many requests are in flight at once."""
+
+    def __init__(self, responses=None, delay=0.02):
+        self.responses = responses or {}
+        self.delay = delay
+        self.calls = Counter()
+        self.active = 0
+        self.active_per_host = Counter()
+        self.max_active = 0
+        self.max_active_per_host = Counter()
+
+    async def handle_async_request(self, request):
+        url = str(request.url)
+        host = request.url.host
+        self.calls[url] += 1
+        self.active += 1
+        self.active_per_host[host] += 1
+        self.max_active = max(self.max_active, self.active)
+        self.max_active_per_host[host] = max(
+            self.max_active_per_host[host], self.active_per_host[host]
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            response = self.responses.get(url, 200)
+            if callable(response):
+                response = response(self.calls[url])
+            if isinstance(response, Exception):
+                raise response
+            return httpx.Response(response, text=ARTICLE_HTML, request=request)
+        finally:
+            self.active -= 1
+            self.active_per_host[host] -= 1
+
+
+class TestScrapeMany:
+    """Tests for concurrent scraping with scrape_many."""
+
+    @pytest.fixture(autouse=True)
+    def setup_scraper(self):
+        """Create a scraper without network or browser dependencies."""
+        driver = MagicMock()
+        driver.get.side_effect = RuntimeError("No browser in tests")
+        self.scraper = WebScraperToolClass(
+            session=MagicMock(), web_driver=driver, rendering_memory=RenderingMemory()
+        )
+
+    def scrape_many(self, targets, transport, **kwargs):
+        """Run scrape_many against a mock transport."""
+        kwargs.setdefault("retry_delay", 0)
+        client = httpx.AsyncClient(transport=transport)
+        return list(self.scraper.scrape_many(targets, client=client, **kwargs))
+
+    def test_scrape_many_success(self):
+        """Each URL is scraped into a state with its article text."""
+        urls = [f"https://news{i % 3}.example.com/article/{i}" for i in range(9)]
+
+        states = self.scrape_many(urls, ConcurrencyRecordingTransport())
+
+        assert sorted(state.target_url for state in states) == sorted(urls)
+        for state in states:
+            assert state.status == AnalysisStatus.SCRAPE_SUCCEEDED
+            assert "body of a scraped article" in state.scraped_text
+            assert state.scraped_at is not None
+
+    def test_scrape_many_respects_concurrency_limits(self):
+        """No more than max_concurrency requests, and per_domain_limit per domain, at once."""
+        urls = [f"https://busy.example.com/article/{i}" for i in range(10)]
+        urls += [f"https://news{i}.example.com/article" for i in range(20)]
+        transport = ConcurrencyRecordingTransport()
+
+        states = self.scrape_many(urls, transport, max_concurrency=8, per_domain_limit=2)
+
+        assert len(states) == 30
+        assert 1 < transport.max_active <= 8
+        assert max(transport.max_active_per_host.values()) == 2
+
+    def test_scrape_many_is_concurrent(self):
+        """Many slow requests finish in about the time of one."""
+        urls = [f"https://news{i}.example.com/article" for i in range(100)]
+        transport = ConcurrencyRecordingTransport(delay=0.2)
+
+        start = time.perf_counter()
+        states = self.scrape_many(urls, transport, max_concurrency=100)
+
+        assert len(states) == 100
+        assert time.perf_counter() - start < 2
+
+    def test_scrape_many_streams_in_completion_order(self):
+        """A slow URL does not hold back the results of faster ones."""
+        transport = ConcurrencyRecordingTransport(delay=0.01)
+        original = transport.handle_async_request
+
+        async def handle(request):
+            if request.url.host == "slow.example.com":
+                await asyncio.sleep(0.2)
+            return await original(request)
+
+        transport.handle_async_request = handle
+        urls = [
+            "https://slow.example.com/a",
+            "https://fast.example.com/a",
+            "https://fast.example.com/b",
+        ]
+
+        states = self.scrape_many(urls, transport)
+
+        assert states[-1].target_url == "https://slow.example.com/a"
+
+    def test_scrape_many_retries_transient_failures(self):
+        """5xx responses and connection errors are retried before succeeding."""
+        transport = ConcurrencyRecordingTransport(
+            responses={
+                "https://example.com/flaky": lambda attempt: 503 if attempt < 3 else 200,
+                "https://example.com/reset": lambda attempt: (
+                    httpx.ConnectError("reset") if attempt < 2 else 200
+                ),
+            }
+        )
+
+        states = self.scrape_many(
+            ["https://example.com/flaky", "https://example.com/reset"], transport, max_attempts=3
+        )
+
+        assert all(state.status == AnalysisStatus.SCRAPE_SUCCEEDED for state in states)
+        assert transport.calls["https://example.com/flaky"] == 3
+        assert transport.calls["https://example.com/reset"] == 2
+
+    def test_scrape_many_records_failures_on_states(self):
+        """Failures are recorded on each state instead of being raised."""
+        transport = ConcurrencyRecordingTransport(
+            responses={
+                "https://example.com/missing": 404,
+                "https://example.com/down": httpx.ConnectError("refused"),
+                "https://example.com/overloaded": 503,
+            }
+        )
+        urls = [
+            "https://example.com/ok",
+            "https://example.com/missing",
+            "https://example.com/down",
+            "https://example.com/overloaded",
+        ]
+
+        states = {
+            state.target_url: state
+            for state in self.scrape_many(urls, transport, max_attempts=2)
+        }
+
+        assert states["https://example.com/ok"].status == AnalysisStatus.SCRAPE_SUCCEEDED
+        assert states["https://example.com/missing"].status == AnalysisStatus.SCRAPE_FAILED_PARSING
+        assert "404" in states["https://example.com/missing"].error_details.message
+        assert states["https://example.com/down"].status == AnalysisStatus.SCRAPE_FAILED_NETWORK
+        assert states["https://example.com/overloaded"].status == AnalysisStatus.SCRAPE_FAILED_NETWORK
+        assert transport.calls["https://example.com/down"] == 2
+        assert transport.calls["https://example.com/missing"] == 1
+
+    def test_scrape_many_updates_given_states(self):
+        """States passed in are updated in place, keeping their logs."""
+        state = NewsAnalysisState(target_url="https://example.com/article")
+        state.add_log("Processing article: Example")
+
+        (result,) = self.scrape_many([state], ConcurrencyRecordingTransport())
+
+        assert result is state
+        assert state.status == AnalysisStatus.SCRAPE_SUCCEEDED
+        assert "Processing article: Example" in state.run_logs[0]
+
+    def test_scrape_many_no_targets(self):
+        """Scraping no URLs yields nothing."""
+        assert self.scrape_many([], ConcurrencyRecordingTransport()) == []